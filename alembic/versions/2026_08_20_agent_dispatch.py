@@ -0,0 +1,41 @@
+"""Add agent_dispatch for SKIP LOCKED evaluation claims
+
+/validator/request-evaluation used to serialize every validator (and each
+screener stage) behind a process-global asyncio.Lock, which neither scales
+with validators nor holds across several API workers. Each agent now gets one
+dispatch row that a validator claims with SELECT ... FOR UPDATE SKIP LOCKED
+and holds as a short lease while its evaluation is created.
+
+dispatch_version is bumped every time a claim is released, so a claimer whose
+candidate list was computed before another validator's evaluation committed
+can detect that its view is stale and skip the agent.
+
+Revision ID: 8e2c4b7a91d3
+Revises: 622a36d5146f
+Create Date: 2026-08-20
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "8e2c4b7a91d3"
+down_revision: Union[str, Sequence[str], None] = "622a36d5146f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS agent_dispatch (
+            agent_id UUID PRIMARY KEY REFERENCES agents(agent_id) ON DELETE CASCADE,
+            dispatch_version BIGINT NOT NULL DEFAULT 0,
+            claimed_by TEXT,
+            claimed_until TIMESTAMPTZ
+        );
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS agent_dispatch;")
@@ -0,0 +1,35 @@
+"""Add ttl_cache_entries for the shared ttl_cache backend
+
+API workers that enable TTL_CACHE_SHARED_BACKEND_ENABLED publish the results
+of ttl_cache(shared=True) functions here, so one worker's calculation serves
+every worker. The table is UNLOGGED: it only holds recomputable cache data,
+and skipping the WAL keeps writes cheap.
+
+Revision ID: 3f9d6a1c5e27
+Revises: 8e2c4b7a91d3
+Create Date: 2026-08-24
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "3f9d6a1c5e27"
+down_revision: Union[str, Sequence[str], None] = "8e2c4b7a91d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE UNLOGGED TABLE IF NOT EXISTS ttl_cache_entries (
+            key TEXT PRIMARY KEY,
+            value BYTEA NOT NULL,
+            expires_at TIMESTAMPTZ NOT NULL
+        );
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ttl_cache_entries;")
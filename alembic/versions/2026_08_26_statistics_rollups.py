@@ -0,0 +1,51 @@
+"""Add incremental rollups for the perfectly-solved-over-time statistic
+
+get_perfectly_solved_over_time() used to rescan every finished evaluation
+run since Problem Set 6, through the evaluation_runs_hydrated view, on every
+refresh. agent_problem_solve_rollup instead keeps one row per (agent,
+problem), holding its run and solve counts and the time of its first run.
+The row is updated once per evaluation when the evaluation finishes.
+statistics_rolled_up_evaluations records which evaluations have been
+folded in, so a finished evaluation is never counted twice.
+
+Existing history is loaded with `make statistics-rollups-backfill`.
+
+Revision ID: 5a8e1f3d7c64
+Revises: 3f9d6a1c5e27
+Create Date: 2026-08-26
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "5a8e1f3d7c64"
+down_revision: Union[str, Sequence[str], None] = "3f9d6a1c5e27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS agent_problem_solve_rollup (
+            agent_id UUID NOT NULL REFERENCES agents(agent_id) ON DELETE CASCADE,
+            benchmark_family TEXT NOT NULL,
+            problem_name TEXT NOT NULL,
+            num_runs INTEGER NOT NULL,
+            num_solved INTEGER NOT NULL,
+            first_run_at TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (agent_id, benchmark_family, problem_name)
+        );
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS statistics_rolled_up_evaluations (
+            evaluation_id UUID PRIMARY KEY REFERENCES evaluations(evaluation_id) ON DELETE CASCADE,
+            rolled_up_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS statistics_rolled_up_evaluations;")
+    op.execute("DROP TABLE IF EXISTS agent_problem_solve_rollup;")
@@ -0,0 +1,39 @@
+"""Add evaluation_run_log_chunks for incremental log shipping
+
+Validators tail an evaluation run's log files while it is in flight and post
+the new bytes as offset-tracked chunks. The (run, attempt, source, offset)
+key makes retried chunks idempotent, and a source's log so far is its chunks
+in offset order.
+
+Revision ID: 7c2e9b4f1a36
+Revises: 5a8e1f3d7c64
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "7c2e9b4f1a36"
+down_revision: Union[str, Sequence[str], None] = "5a8e1f3d7c64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS evaluation_run_log_chunks (
+            evaluation_run_id UUID NOT NULL,
+            attempt_number INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            "offset" BIGINT NOT NULL,
+            logs TEXT NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (evaluation_run_id, attempt_number, source, "offset")
+        );
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS evaluation_run_log_chunks;")
@@ -0,0 +1,36 @@
+"""Add ttl_cache_generation to version shared ttl_cache invalidation
+
+invalidate_all_ttl_caches() bumps this single row as it deletes every
+ttl_cache_entries row. A calculation reads the generation when it starts and
+only publishes its result while the generation is unchanged, so a worker whose
+calculation was in flight during another worker's invalidation (e.g. a coldkey
+ban) can't republish its pre-invalidation value.
+
+Revision ID: 9b4d2f7e6a18
+Revises: 7c2e9b4f1a36
+Create Date: 2026-10-17
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "9b4d2f7e6a18"
+down_revision: Union[str, Sequence[str], None] = "7c2e9b4f1a36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS ttl_cache_generation (
+            id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+            generation BIGINT NOT NULL
+        );
+    """)
+    op.execute("INSERT INTO ttl_cache_generation (id, generation) VALUES (TRUE, 0) ON CONFLICT DO NOTHING;")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ttl_cache_generation;")
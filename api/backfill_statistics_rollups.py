@@ -0,0 +1,41 @@
+"""Rebuild the statistics rollup tables from every finished evaluation.
+
+The rollups are kept up to date as evaluations finish. Run this once after the
+migration that introduces them, or whenever they need repairing:
+
+    uv run python -m api.backfill_statistics_rollups
+
+It reads its database settings from the same .env as the API.
+"""
+
+import asyncio
+import logging
+import time
+
+import api.config as config
+from queries.statistics import backfill_statistics_rollups
+from utils.database import deinitialize_database, initialize_database
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    await initialize_database(
+        username=config.DATABASE_USERNAME,
+        password=config.DATABASE_PASSWORD,
+        host=config.DATABASE_HOST,
+        port=config.DATABASE_PORT,
+        name=config.DATABASE_NAME,
+    )
+    try:
+        started_at = time.monotonic()
+        num_evaluations = await backfill_statistics_rollups()
+        logger.info(
+            f"Rolled up {num_evaluations} finished evaluation(s) in {time.monotonic() - started_at:.1f} second(s)"
+        )
+    finally:
+        await deinitialize_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -24,6 +24,10 @@ if not PORT:
     logger.fatal("PORT is not set in .env")
 PORT = int(PORT)
 
+# Kept longer than the validators' pooled-connection idle expiry, so a kept-alive
+# connection is never closed by the server while a validator is about to reuse it
+KEEP_ALIVE_TIMEOUT_SECONDS = int(os.getenv("KEEP_ALIVE_TIMEOUT_SECONDS", "75"))
+
 
 # Load Bittensor configuration
 NETUID = int(os.getenv("NETUID") or "62")
@@ -215,6 +219,12 @@ NUM_EVALS_PER_AGENT = int(NUM_EVALS_PER_AGENT)
 
 MAX_ATTEMPTS_PER_EVALUATION_RUN = int(os.getenv("MAX_ATTEMPTS_PER_EVALUATION_RUN", "3"))
 
+# /validator/request-evaluation claims agents through agent_dispatch with FOR UPDATE SKIP LOCKED.
+# A claim is a lease that lasts until the evaluation is created, or until this timeout if the API dies first.
+# The candidate limit is how many queued agents a claim considers before concluding that all are taken.
+VALIDATOR_DISPATCH_CLAIM_TIMEOUT_SECONDS = int(os.getenv("VALIDATOR_DISPATCH_CLAIM_TIMEOUT_SECONDS", "120"))
+VALIDATOR_DISPATCH_CANDIDATE_LIMIT = int(os.getenv("VALIDATOR_DISPATCH_CANDIDATE_LIMIT", "16"))
+
 AGENT_UUID_NAMESPACE = os.getenv("AGENT_UUID_NAMESPACE")
 if not AGENT_UUID_NAMESPACE:
     logger.fatal("AGENT_UUID_NAMESPACE is not set in .env")
@@ -273,6 +283,9 @@ INCENTIVE_TIME_MULTIPLIER_SCALE_HOURS = _positive_float_setting("INCENTIVE_TIME_
 CODE_HIDE_TOP_AGENT_COUNT = int(os.getenv("CODE_HIDE_TOP_AGENT_COUNT", "10"))
 CODE_HIDE_TOP_SCORE_COUNT = int(os.getenv("CODE_HIDE_TOP_SCORE_COUNT", "3"))
 
+# When enabled, ttl_cache(shared=True) results are published to Postgres so every API worker reuses one calculation
+TTL_CACHE_SHARED_BACKEND_ENABLED = os.getenv("TTL_CACHE_SHARED_BACKEND_ENABLED", "false").lower() == "true"
+
 SENTRY_DSN = os.getenv("SENTRY_DSN")
 if not SENTRY_DSN:
     logger.warning("SENTRY_DSN is not set, Sentry will not be configured.")
@@ -323,11 +336,14 @@ logger.info(f"Validator Running Agent Timeout: {VALIDATOR_RUNNING_AGENT_TIMEOUT_
 logger.info(f"Validator Running Evaluation Timeout: {VALIDATOR_RUNNING_EVAL_TIMEOUT_SECONDS} second(s)")
 logger.info(f"Validator Max Evaluation Run Log Size: {VALIDATOR_MAX_EVALUATION_RUN_LOG_SIZE_BYTES} byte(s)")
 logger.info(f"Validator Environment Build Timeout Multiplier: {VALIDATOR_ENVIRONMENT_BUILD_TIMEOUT_MULTIPLIER}x")
+logger.info(f"Validator Dispatch Claim Timeout: {VALIDATOR_DISPATCH_CLAIM_TIMEOUT_SECONDS} second(s)")
+logger.info(f"Validator Dispatch Candidate Limit: {VALIDATOR_DISPATCH_CANDIDATE_LIMIT}")
 logger.info("-------------------------")
 
 logger.info(f"Miner Agent Upload Rate Limit: {MINER_AGENT_UPLOAD_RATE_LIMIT_SECONDS} second(s)")
 logger.info(f"Number of Evaluations per Agent: {NUM_EVALS_PER_AGENT}")
 logger.info(f"Pre-Screening Judge Enabled: {PRE_SCREENING_JUDGE_ENABLED}")
+logger.info(f"Shared TTL Cache Backend Enabled: {TTL_CACHE_SHARED_BACKEND_ENABLED}")
 logger.info(f"Pre-Screening Projector Loop Enabled: {PRE_SCREENING_PROJECTOR_RUN_LOOP}")
 logger.info(f"Pre-Screening Projector Poll Interval: {PRE_SCREENING_PROJECTOR_POLL_INTERVAL_SECONDS} second(s)")
 logger.info(f"Auto Approval Enabled: {AUTO_APPROVAL_ENABLED}")
@@ -15,7 +15,7 @@ from queries.banned_coldkey import ban_coldkey, unban_coldkey
 from queries.internal_flag import add_hotkey_to_blacklist, remove_hotkey_from_blacklist, set_internal_flag
 from queries.upload_credit import grant_upload_credit
 from utils.debug_lock import DebugLock
-from utils.ttl import clear_all_ttl_caches
+from utils.ttl import invalidate_all_ttl_caches
 
 router = APIRouter(tags=["admin"])
 admin_bearer = HTTPBearer(auto_error=False)
@@ -91,7 +91,7 @@ async def post_upload_credit(request: UploadCreditGrantRequest) -> UploadCredit:
 async def put_banned_coldkey(miner_coldkey: str, request: ColdkeyBanRequest) -> BannedColdkey:
     validate_coldkey(miner_coldkey)
     banned_coldkey = await ban_coldkey(miner_coldkey, request.reason)
-    clear_all_ttl_caches()
+    await invalidate_all_ttl_caches()
     return banned_coldkey
 
 
@@ -103,7 +103,7 @@ async def put_banned_coldkey(miner_coldkey: str, request: ColdkeyBanRequest) ->
 async def delete_banned_coldkey(miner_coldkey: str) -> Response:
     validate_coldkey(miner_coldkey)
     await unban_coldkey(miner_coldkey)
-    clear_all_ttl_caches()
+    await invalidate_all_ttl_caches()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
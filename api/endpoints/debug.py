@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from utils.database import get_debug_query_info
 from utils.debug_lock import get_debug_lock_info
+from utils.ttl import get_ttl_cache_stats
 
 router = APIRouter()
 
@@ -16,3 +17,9 @@ async def debug_lock_info():
 @router.get("/query-info")
 async def debug_query_info():
     return get_debug_query_info()
+
+
+# /debug/ttl-cache-info
+@router.get("/ttl-cache-info")
+async def debug_ttl_cache_info():
+    return get_ttl_cache_stats()
@@ -1,10 +1,12 @@
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
 
-from models.evaluation_run import EvaluationRunDetail, EvaluationRunLogType
+from models.evaluation_run import EvaluationRunDetail, EvaluationRunLogChunk, EvaluationRunLogType
 from queries.evaluation_run import (
     get_evaluation_run_by_id,
+    get_evaluation_run_log_chunks_by_id,
     get_evaluation_run_logs_by_id,
     get_evaluation_run_metrics_by_id,
 )
@@ -50,3 +52,15 @@ async def evaluation_run_get_logs_by_id(evaluation_run_id: UUID, type: Evaluatio
         )
 
     return logs
+
+
+# /evaluation-run/get-log-chunks-by-id?evaluation_run_id=&source=&after_offset=
+@router.get("/get-log-chunks-by-id")
+async def evaluation_run_get_log_chunks_by_id(
+    evaluation_run_id: UUID, source: Optional[str] = None, after_offset: int = -1
+) -> List[EvaluationRunLogChunk]:
+    """Logs shipped while the run's latest attempt is in flight, as chunks in (source, offset) order.
+
+    To tail a source, poll with after_offset set to the offset of the last chunk received.
+    """
+    return await get_evaluation_run_log_chunks_by_id(evaluation_run_id, source, after_offset)
@@ -241,7 +241,7 @@ async def _build_detail(set_id: int) -> EvaluationSetDetail:
     )
 
 
-_cached_build_detail = ttl_cache(ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS)(_build_detail)
+_cached_build_detail = ttl_cache(ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS, shared=True)(_build_detail)
 
 
 @router.get("/{set_id}")
@@ -303,8 +303,12 @@ async def _build_overview(set_id: int) -> EvaluationSetOverview:
     )
 
 
-_cached_build_live_overview = ttl_cache(ttl_seconds=CACHE_LIVE_SET_OVERVIEW_TTL_SECONDS)(_build_overview)
-_cached_build_past_overview = ttl_cache(ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS)(_build_overview)
+_cached_build_live_overview = ttl_cache(ttl_seconds=CACHE_LIVE_SET_OVERVIEW_TTL_SECONDS, name="live_set_overview")(
+    _build_overview
+)
+_cached_build_past_overview = ttl_cache(
+    ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS, shared=True, name="past_set_overview"
+)(_build_overview)
 
 
 @router.get("/{set_id}/overview")
@@ -325,7 +329,7 @@ async def _build_leaderboard(set_id: int) -> list[PublicAgent]:
     return [PublicAgent(**dict(row), set_id=set_id) for row in agent_rows]
 
 
-_cached_build_leaderboard = ttl_cache(ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS)(_build_leaderboard)
+_cached_build_leaderboard = ttl_cache(ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS, shared=True)(_build_leaderboard)
 
 
 @router.get("/{set_id}/leaderboard")
@@ -358,7 +362,9 @@ async def _build_approved_agents(
     ]
 
 
-_cached_build_approved_agents = ttl_cache(ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS)(_build_approved_agents)
+_cached_build_approved_agents = ttl_cache(ttl_seconds=CACHE_PAST_SET_DATA_TTL_SECONDS, shared=True)(
+    _build_approved_agents
+)
 
 
 async def _add_onchain_approved_agent_data(
@@ -142,11 +142,13 @@ async def _code_hiding_score_cutoff(set_id: int) -> Optional[float]:
     )
 
 
-_cached_code_hiding_score_cutoff = ttl_cache(ttl_seconds=60)(_code_hiding_score_cutoff)
+_cached_code_hiding_score_cutoff = ttl_cache(ttl_seconds=60, name="code_hiding_score_cutoff")(_code_hiding_score_cutoff)
 
 # Past-competition scores never change once the competition ends, so a long TTL is safe and
 # avoids recomputing the cutoff on every request for popular old agents.
-_cached_past_code_hiding_score_cutoff = ttl_cache(ttl_seconds=24 * 60 * 60)(_code_hiding_score_cutoff)
+_cached_past_code_hiding_score_cutoff = ttl_cache(
+    ttl_seconds=24 * 60 * 60, shared=True, name="past_code_hiding_score_cutoff"
+)(_code_hiding_score_cutoff)
 
 
 # /retrieval/agent-code?agent_id=
@@ -187,7 +189,7 @@ async def agent_code(agent_id: UUID) -> str:
 
 # /retrieval/top-scores-over-time
 @router.get("/top-scores-over-time")
-@ttl_cache(ttl_seconds=60 * 15)  # 15 minutes
+@ttl_cache(ttl_seconds=60 * 15, shared=True)  # 15 minutes
 async def top_scores_over_time() -> List[TopScoreOverTime]:
     return await get_top_scores_over_time()
 
@@ -199,7 +201,7 @@ class PerfectlySolvedOverTimeResponse(BaseModel):
 
 
 @router.get("/perfectly-solved-over-time")
-@ttl_cache(ttl_seconds=60 * 15)  # 15 minutes
+@ttl_cache(ttl_seconds=60 * 15, shared=True)  # 15 minutes
 async def perfectly_solved_over_time() -> PerfectlySolvedOverTimeResponse:
     return PerfectlySolvedOverTimeResponse(
         perfectly_solved_over_times=await get_perfectly_solved_over_time(),
@@ -21,7 +21,7 @@ class ProblemStatisticsResponse(BaseModel):
 
 
 @router.get("/problem-statistics")
-@ttl_cache(ttl_seconds=15 * 60)  # 15 mins
+@ttl_cache(ttl_seconds=15 * 60, shared=True)  # 15 mins
 async def problem_statistics(set_id: Optional[int] = None) -> ProblemStatisticsResponse:
     max_problem_set_id = await get_latest_set_id()
     if max_problem_set_id is None:
@@ -1,12 +1,15 @@
 import asyncio
+import base64
+import binascii
 import logging
 import re
 import time
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from functools import wraps
 from http import HTTPStatus
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 from weakref import WeakValueDictionary
 
@@ -16,8 +19,13 @@ from pydantic import BaseModel
 
 import api.config as config
 from api.endpoints.validator_models import (
+    MAX_EVALUATION_RUN_LOG_CHUNK_BYTES,
+    MAX_EVALUATION_RUN_LOG_CHUNKS_PER_BATCH,
+    MAX_EVALUATION_RUN_UPDATES_PER_BATCH,
     ScreenerRegistrationRequest,
     ScreenerRegistrationResponse,
+    ValidatorAppendEvaluationRunLogChunksRequest,
+    ValidatorAppendEvaluationRunLogChunksResponse,
     ValidatorCancelCurrentEvaluationRequest,
     ValidatorCancelCurrentEvaluationResponse,
     ValidatorCheckCancellationRequest,
@@ -35,8 +43,11 @@ from api.endpoints.validator_models import (
     ValidatorRequestEvaluationResponseEvaluationRun,
     ValidatorTaskDownloadUrlRequest,
     ValidatorTaskDownloadUrlResponse,
+    ValidatorUpdateEvaluationRunGroupResult,
     ValidatorUpdateEvaluationRunRequest,
     ValidatorUpdateEvaluationRunResponse,
+    ValidatorUpdateEvaluationRunsRequest,
+    ValidatorUpdateEvaluationRunsResponse,
 )
 from db.models import InternalFlagName
 from models.agent import Agent, AgentStatus, PublicAgent
@@ -53,10 +64,11 @@ from models.harbor_task import read_execution_spec_metadata
 from models.openrouter import OpenRouterRuntimeConfig
 from models.validator import ConnectedValidatorInfo, ValidatorStatus
 from queries.agent import (
+    claim_next_agent_id_awaiting_evaluation_for_validator_hotkey,
     get_agent_by_id,
-    get_next_agent_id_awaiting_evaluation_for_validator_hotkey,
     get_openrouter_secrets_for_agent_id,
     get_top_agents,
+    release_agent_dispatch_claim,
 )
 from queries.approval import finish_agent_and_enqueue_approval
 from queries.banned_coldkey import is_agent_coldkey_banned
@@ -77,6 +89,7 @@ from queries.evaluation import (
 from queries.evaluation_run import (
     check_if_evaluation_run_logs_exist,
     create_evaluation_run_log,
+    create_evaluation_run_log_chunks,
     get_all_evaluation_runs_in_evaluation_id,
     get_evaluation_run_by_id,
     update_evaluation_run_by_id,
@@ -86,17 +99,24 @@ from queries.evaluation_run_attempt import (
     get_attempt_count_for_evaluation_run,
 )
 from queries.internal_flag import get_internal_flags_parsed
+from queries.problem_statistics import get_problem_average_times
+from queries.statistics import record_evaluation_in_statistics_rollups
 from utils.agent_secrets import AgentKeyDecryptError, AgentKeyEncryptionConfigError, sha256_hex
 from utils.bittensor import validate_signed_timestamp
+from utils.database import db_transaction
 from utils.debug_lock import DebugLock
 from utils.git import COMMIT_HASH
 from utils.incentives import calculate_relative_improvement
 from utils.s3 import download_text_file_from_s3, generate_presigned_upload_url, generate_presigned_url
 from utils.system_metrics import SystemMetrics
+from utils.ttl import ttl_cache
 from utils.validator_hotkeys import is_validator_hotkey_whitelisted, validator_hotkey_to_name
 
 logger = logging.getLogger(__name__)
 
+# Expected run durations sent with each assignment, so validators can start the longest runs first
+_get_problem_average_times = ttl_cache(ttl_seconds=15 * 60, shared=True)(get_problem_average_times)
+
 
 # A validator
 class Validator(BaseModel):
@@ -379,9 +399,6 @@ async def validator_register_as_screener(
 
 
 # /validator/request-evaluation
-validator_request_evaluation_lock = asyncio.Lock()
-screener_1_request_evaluation_lock = asyncio.Lock()
-screener_2_request_evaluation_lock = asyncio.Lock()
 
 
 @router.post("/request-evaluation")
@@ -413,65 +430,50 @@ async def validator_request_evaluation(
         logger.info(f"Validator '{validator.name}' blocked by {InternalFlagName.BLACKLISTED_VALIDATORS.value} flag")
         return None
 
-    # Choose the appropriate lock based on the validator's hotkey
-    if validator.hotkey.startswith("screener-1"):
-        lock = screener_1_request_evaluation_lock
-        lock_name = "screener_1_request_evaluation_lock"
-    elif validator.hotkey.startswith("screener-2"):
-        lock = screener_2_request_evaluation_lock
-        lock_name = "screener_2_request_evaluation_lock"
-    else:
-        lock = validator_request_evaluation_lock
-        lock_name = "validator_request_evaluation_lock"
-
-    # Try to acquire the lock, but don't hang forever
-    # TODO: .env
-    try:
-        async with DebugLock(lock, f"{validator.name} ({validator.hotkey}) for {lock_name}", timeout=60):
-            # Find the next agent awaiting an evaluation from this validator
-            agent_id = await get_next_agent_id_awaiting_evaluation_for_validator_hotkey(validator.hotkey)
-            if agent_id is None:
-                return None
+    # Claim the next agent awaiting an evaluation from this validator. Claims go through the database with
+    # FOR UPDATE SKIP LOCKED, so concurrent validators and screeners (on any API worker) never wait on each
+    # other, and two of them can never be handed the same agent at the same time.
+    agent_id = await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(validator.hotkey)
+    if agent_id is None:
+        return None
 
-            agent = await get_agent_by_id(agent_id)
-            try:
-                agent_code = await download_text_file_from_s3(f"{agent_id}/agent.py")
-            except Exception as exc:
-                logger.error(f"Failed to download agent code for {agent_id}: {exc}")
-                return None
+    try:
+        agent = await get_agent_by_id(agent_id)
+        try:
+            agent_code = await download_text_file_from_s3(f"{agent_id}/agent.py")
+        except Exception as exc:
+            logger.error(f"Failed to download agent code for {agent_id}: {exc}")
+            return None
 
-            openrouter_config = None
+        openrouter_config = None
 
-            try:
-                openrouter_secrets = await get_openrouter_secrets_for_agent_id(agent_id)
-            except AgentKeyEncryptionConfigError as exc:
-                logger.error(
-                    f"OpenRouter secret decryption is unavailable for agent {agent_id} due to encryption "
-                    f"configuration: {exc}"
+        try:
+            openrouter_secrets = await get_openrouter_secrets_for_agent_id(agent_id)
+        except AgentKeyEncryptionConfigError as exc:
+            logger.error(
+                f"OpenRouter secret decryption is unavailable for agent {agent_id} due to encryption "
+                f"configuration: {exc}"
+            )
+            return None
+        except AgentKeyDecryptError as exc:
+            logger.error(f"OpenRouter secret unreadable for agent {agent_id}: {exc}")
+            return None
+        else:
+            if openrouter_secrets is not None:
+                openrouter_config = OpenRouterRuntimeConfig(
+                    api_key=openrouter_secrets.runtime_api_key,
+                    management_key=openrouter_secrets.management_api_key,
+                    workspace_id=openrouter_secrets.workspace_id,
+                    expected_api_key_sha256=sha256_hex(openrouter_secrets.runtime_api_key),
                 )
-                return None
-            except AgentKeyDecryptError as exc:
-                logger.error(f"OpenRouter secret unreadable for agent {agent_id}: {exc}")
-                return None
-            else:
-                if openrouter_secrets is not None:
-                    openrouter_config = OpenRouterRuntimeConfig(
-                        api_key=openrouter_secrets.runtime_api_key,
-                        management_key=openrouter_secrets.management_api_key,
-                        workspace_id=openrouter_secrets.workspace_id,
-                        expected_api_key_sha256=sha256_hex(openrouter_secrets.runtime_api_key),
-                    )
 
-            # Create a new evaluation and evaluation runs for this agent & validator
-            evaluation_bundle = await create_new_evaluation_and_evaluation_runs(agent_id, validator.hotkey)
-            if evaluation_bundle is None:
-                return None
-            evaluation, evaluation_runs = evaluation_bundle
-    except asyncio.TimeoutError:
-        # We couldn't acquire the lock, just act as though there are no evaluations available
-        # The validator will automatically retry in a few seconds
-        # This should prevent a ridiculous amount of lock contention
-        return None
+        # Create a new evaluation and evaluation runs for this agent & validator
+        evaluation_bundle = await create_new_evaluation_and_evaluation_runs(agent_id, validator.hotkey)
+        if evaluation_bundle is None:
+            return None
+        evaluation, evaluation_runs = evaluation_bundle
+    finally:
+        await release_agent_dispatch_claim(agent_id, validator.hotkey)
 
     validator.current_evaluation_id = evaluation.evaluation_id
     validator.current_evaluation = evaluation
@@ -482,6 +484,12 @@ async def validator_request_evaluation(
     logger.info(f"  Evaluation ID: {evaluation.evaluation_id}")
     logger.info(f"  # of Evaluation Runs: {len(evaluation_runs)}")
 
+    try:
+        problem_average_times = await _get_problem_average_times(evaluation.set_id)
+    except Exception as exc:
+        logger.warning(f"Failed to get problem average times for set {evaluation.set_id}: {exc}")
+        problem_average_times = {}
+
     response_runs: list[ValidatorRequestEvaluationResponseEvaluationRun] = []
     for evaluation_run in evaluation_runs:
         execution_metadata = read_execution_spec_metadata(
@@ -497,6 +505,7 @@ async def validator_request_evaluation(
                     execution_metadata.benchmark_family if execution_metadata else evaluation_run.benchmark_family
                 ),
                 execution_spec=evaluation_run.execution_spec,
+                expected_duration_seconds=problem_average_times.get(evaluation_run.problem_name),
             )
         )
 
@@ -873,15 +882,13 @@ async def validator_cancel_current_evaluation(
     return ValidatorCancelCurrentEvaluationResponse()
 
 
-# /validator/update-evaluation-run
-@router.post("/update-evaluation-run")
-@handle_validator_http_exceptions
-async def validator_update_evaluation_run(
-    request: ValidatorUpdateEvaluationRunRequest, validator: Validator = Depends(get_request_validator_with_lock)
-) -> ValidatorUpdateEvaluationRunResponse:
+async def _apply_evaluation_run_update(
+    validator: Validator, request: ValidatorUpdateEvaluationRunRequest
+) -> Optional[EvaluationRun]:
+    """Validate one status transition against the evaluation run's current state and persist it.
 
-    # Record a heartbeat for the validator
-    record_validator_heartbeat(validator)
+    Returns the updated evaluation run, or None for a stale update that was safely ignored.
+    """
 
     # Get the evaluation run with the provided evaluation_run_id
     evaluation_run = await get_evaluation_run_by_id(request.evaluation_run_id)
@@ -895,7 +902,7 @@ async def validator_update_evaluation_run(
     if validator.current_evaluation_id is None:
         if await _is_stale_update_for_score_stopped_evaluation(validator, evaluation_run):
             _log_ignored_stale_score_stopped_update(validator, request, evaluation_run)
-            return ValidatorUpdateEvaluationRunResponse()
+            return None
 
         raise HTTPException(
             status_code=409,
@@ -906,7 +913,7 @@ async def validator_update_evaluation_run(
     if evaluation_run.evaluation_id != validator.current_evaluation_id:
         if await _is_stale_update_for_score_stopped_evaluation(validator, evaluation_run):
             _log_ignored_stale_score_stopped_update(validator, request, evaluation_run)
-            return ValidatorUpdateEvaluationRunResponse()
+            return None
 
         raise HTTPException(
             status_code=403,
@@ -1100,7 +1107,16 @@ async def validator_update_evaluation_run(
 
     await update_evaluation_run_by_id(evaluation_run)
 
-    if request.updated_status in (EvaluationRunStatus.finished, EvaluationRunStatus.error):
+    return evaluation_run
+
+
+async def _respond_to_evaluation_run_updates(
+    validator: Validator, applied_updates: List[Tuple[ValidatorUpdateEvaluationRunRequest, Optional[EvaluationRun]]]
+) -> List[ValidatorUpdateEvaluationRunResponse]:
+    """Run the follow-ups of applied updates (score-bound pruning, retry grants) and build their responses."""
+
+    updated_statuses = {request.updated_status for request, evaluation_run in applied_updates if evaluation_run}
+    if updated_statuses & {EvaluationRunStatus.finished, EvaluationRunStatus.error}:
         if validator.current_evaluation is not None:
             current_evaluation = validator.current_evaluation
             try:
@@ -1112,19 +1128,155 @@ async def validator_update_evaluation_run(
                     exc_info=True,
                 )
 
-    response = ValidatorUpdateEvaluationRunResponse()
-    if request.updated_status == EvaluationRunStatus.error:
-        retry_directive = await _maybe_grant_retry(validator, evaluation_run)
-        if retry_directive is not None:
-            response = retry_directive
+    responses = []
+    for request, evaluation_run in applied_updates:
+        response = ValidatorUpdateEvaluationRunResponse()
+        if evaluation_run is not None:
+            if request.updated_status == EvaluationRunStatus.error:
+                retry_directive = await _maybe_grant_retry(validator, evaluation_run)
+                if retry_directive is not None:
+                    response = retry_directive
 
-    logger.info(f"Validator '{validator.name}' updated an evaluation run")
-    logger.info(f"  Evaluation run ID: {request.evaluation_run_id}")
-    logger.info(f"  Updated status: {request.updated_status}")
+            logger.info(f"Validator '{validator.name}' updated an evaluation run")
+            logger.info(f"  Evaluation run ID: {request.evaluation_run_id}")
+            logger.info(f"  Updated status: {request.updated_status}")
+        responses.append(response)
+
+    return responses
+
+
+# /validator/update-evaluation-run
+@router.post("/update-evaluation-run")
+@handle_validator_http_exceptions
+async def validator_update_evaluation_run(
+    request: ValidatorUpdateEvaluationRunRequest, validator: Validator = Depends(get_request_validator_with_lock)
+) -> ValidatorUpdateEvaluationRunResponse:
+
+    # Record a heartbeat for the validator
+    record_validator_heartbeat(validator)
 
+    evaluation_run = await _apply_evaluation_run_update(validator, request)
+    [response] = await _respond_to_evaluation_run_updates(validator, [(request, evaluation_run)])
     return response
 
 
+# /validator/update-evaluation-runs
+@router.post("/update-evaluation-runs")
+@handle_validator_http_exceptions
+async def validator_update_evaluation_runs(
+    request: ValidatorUpdateEvaluationRunsRequest, validator: Validator = Depends(get_request_validator_with_lock)
+) -> ValidatorUpdateEvaluationRunsResponse:
+    """Apply an ordered batch of evaluation run updates, for one or many runs, in a single transaction.
+
+    The updates are split into groups (see ValidatorUpdateEvaluationRunsRequest.group_sizes), each applied in
+    its own savepoint. Each update is validated exactly like /validator/update-evaluation-run, against the state
+    left by the updates before it. If any update of a group is invalid, none of that group's updates are applied
+    and the group's result carries the error instead; the other groups are unaffected. The response has one
+    result per group, in order.
+    """
+
+    # Record a heartbeat for the validator
+    record_validator_heartbeat(validator)
+
+    if not 1 <= len(request.updates) <= MAX_EVALUATION_RUN_UPDATES_PER_BATCH:
+        raise HTTPException(
+            status_code=422,
+            detail=f"A batch must contain between 1 and {MAX_EVALUATION_RUN_UPDATES_PER_BATCH} evaluation run updates.",
+        )
+
+    group_sizes = request.group_sizes if request.group_sizes is not None else [len(request.updates)]
+    if any(size < 1 for size in group_sizes) or sum(group_sizes) != len(request.updates):
+        raise HTTPException(
+            status_code=422,
+            detail=f"The group sizes {group_sizes} do not split the {len(request.updates)} evaluation run updates.",
+        )
+
+    # Per group, the applied updates, or the HTTPException that rejected the group
+    applied_groups: List[List[Tuple[ValidatorUpdateEvaluationRunRequest, Optional[EvaluationRun]]] | HTTPException] = []
+    async with db_transaction():
+        offset = 0
+        for size in group_sizes:
+            applied_updates = []
+            try:
+                async with db_transaction():
+                    for index in range(offset, offset + size):
+                        update = request.updates[index]
+                        try:
+                            applied_updates.append((update, await _apply_evaluation_run_update(validator, update)))
+                        except HTTPException as e:
+                            raise HTTPException(
+                                status_code=e.status_code,
+                                detail=f"Update {index} ({update.evaluation_run_id} to {update.updated_status.value}): {e.detail}",
+                            ) from e
+                applied_groups.append(applied_updates)
+            except HTTPException as e:
+                logger.warning(
+                    f"Validator '{validator.name}' sent a rejected evaluation run update: {e.status_code} {e.detail}"
+                )
+                applied_groups.append(e)
+            offset += size
+
+    responses = await _respond_to_evaluation_run_updates(
+        validator, [applied for group in applied_groups if isinstance(group, list) for applied in group]
+    )
+    results = []
+    for group in applied_groups:
+        if isinstance(group, HTTPException):
+            results.append(
+                ValidatorUpdateEvaluationRunGroupResult(status_code=group.status_code, error=str(group.detail))
+            )
+        else:
+            results.append(ValidatorUpdateEvaluationRunGroupResult(results=responses[: len(group)]))
+            responses = responses[len(group) :]
+
+    return ValidatorUpdateEvaluationRunsResponse(results=results)
+
+
+def _decompress_log_chunk(data: str) -> str:
+    try:
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        chunk = decompressor.decompress(base64.b64decode(data, validate=True), MAX_EVALUATION_RUN_LOG_CHUNK_BYTES)
+    except (binascii.Error, zlib.error) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid log chunk data: {e}")
+    if decompressor.unconsumed_tail:
+        raise HTTPException(
+            status_code=413, detail=f"A log chunk may not exceed {MAX_EVALUATION_RUN_LOG_CHUNK_BYTES} bytes."
+        )
+    return chunk.decode("utf-8", errors="replace")
+
+
+# /validator/append-evaluation-run-log-chunks
+@router.post("/append-evaluation-run-log-chunks")
+async def validator_append_evaluation_run_log_chunks(
+    request: ValidatorAppendEvaluationRunLogChunksRequest, validator: Validator = Depends(get_request_validator)
+) -> ValidatorAppendEvaluationRunLogChunksResponse:
+    """Store log chunks of in-flight evaluation runs, so their logs can be tailed live.
+
+    Best-effort for the validator: a rejected batch never disconnects it. Chunks of runs outside the
+    validator's current evaluation, and chunks already stored, are skipped.
+    """
+
+    if validator.current_evaluation_id is None:
+        raise HTTPException(
+            status_code=409,
+            detail="This validator is not currently running an evaluation, and therefore cannot append logs.",
+        )
+
+    if not 1 <= len(request.chunks) <= MAX_EVALUATION_RUN_LOG_CHUNKS_PER_BATCH:
+        raise HTTPException(
+            status_code=422,
+            detail=f"A batch must contain between 1 and {MAX_EVALUATION_RUN_LOG_CHUNKS_PER_BATCH} log chunks.",
+        )
+
+    chunks = [
+        (chunk.evaluation_run_id, chunk.attempt_number, chunk.source, chunk.offset, _decompress_log_chunk(chunk.data))
+        for chunk in request.chunks
+    ]
+    num_stored = await create_evaluation_run_log_chunks(validator.current_evaluation_id, chunks)
+
+    return ValidatorAppendEvaluationRunLogChunksResponse(num_stored=num_stored)
+
+
 # /validator/disconnect
 @router.post("/disconnect")
 async def validator_disconnect(
@@ -1227,6 +1379,12 @@ async def handle_evaluation_if_finished(evaluation_id: UUID) -> None:
     """
     await update_evaluation_finished_at(evaluation_id)
 
+    # Best-effort: a failed rollup only delays the dashboards until the next backfill
+    try:
+        await record_evaluation_in_statistics_rollups(evaluation_id)
+    except Exception as exc:
+        logger.error(f"Failed to record evaluation {evaluation_id} in statistics rollups: {exc}")
+
     hydrated_evaluation = await get_hydrated_evaluation_by_id(evaluation_id)
 
     # Transition agent state if this evaluation was successful
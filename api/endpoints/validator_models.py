@@ -48,6 +48,8 @@ class ValidatorRequestEvaluationResponseEvaluationRun(BaseModel):  # :(
     problem_suite_name: str | None = None
     benchmark_family: str | None = None
     execution_spec: dict[str, Any] | None = None
+    # Historical average run time of the problem, None when it has no runs yet
+    expected_duration_seconds: float | None = None
 
 
 class ValidatorRequestEvaluationResponse(BaseModel):
@@ -119,6 +121,56 @@ class ValidatorUpdateEvaluationRunResponse(BaseModel):
     artifact_upload_url: Optional[str] = None
 
 
+# Largest batch accepted by /validator/update-evaluation-runs
+MAX_EVALUATION_RUN_UPDATES_PER_BATCH = 50
+
+
+class ValidatorUpdateEvaluationRunsRequest(BaseModel):
+    # Applied in order; an update sees the effect of the updates before it
+    updates: List[ValidatorUpdateEvaluationRunRequest]
+    # Sizes of the consecutive groups the updates are split into. Each group is applied
+    # or rejected as a whole, independently of the others. Omitted means one group.
+    group_sizes: Optional[List[int]] = None
+
+
+class ValidatorUpdateEvaluationRunGroupResult(BaseModel):
+    # One result per update of the group, in request order, or None if the group was rejected
+    results: Optional[List[ValidatorUpdateEvaluationRunResponse]] = None
+    # Why the group was rejected, as /validator/update-evaluation-run would have responded
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ValidatorUpdateEvaluationRunsResponse(BaseModel):
+    # One result per group, in request order
+    results: List[ValidatorUpdateEvaluationRunGroupResult]
+
+
+# Largest batch accepted by /validator/append-evaluation-run-log-chunks, and the most
+# bytes a single chunk may decompress to
+MAX_EVALUATION_RUN_LOG_CHUNKS_PER_BATCH = 100
+MAX_EVALUATION_RUN_LOG_CHUNK_BYTES = 1024 * 1024
+
+
+class ValidatorEvaluationRunLogChunk(BaseModel):
+    evaluation_run_id: UUID
+    attempt_number: int = 1
+    # Log file the chunk was read from, relative to the trial directory (e.g. agent/run.log)
+    source: str
+    # Byte offset of the chunk in that file
+    offset: int
+    # The chunk's bytes, gzip-compressed and base64-encoded
+    data: str
+
+
+class ValidatorAppendEvaluationRunLogChunksRequest(BaseModel):
+    chunks: List[ValidatorEvaluationRunLogChunk]
+
+
+class ValidatorAppendEvaluationRunLogChunksResponse(BaseModel):
+    num_stored: int = 0
+
+
 class ValidatorDisconnectRequest(BaseModel):
     reason: str
 
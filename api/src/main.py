@@ -30,10 +30,12 @@ from api.src.endpoints.upload import router as upload_router
 from api.src.middleware.request_interceptor import RequestInterceptorMiddleware
 from api.src.utils.sentry import initialize_sentry
 from queries.evaluation import set_all_unfinished_evaluation_runs_to_errored
+from queries.ttl_cache import DatabaseTTLCacheBackend
 from utils.bittensor import subtensor_client
 from utils.database import deinitialize_database, initialize_database
 from utils.logger import setup_logging
 from utils.s3 import deinitialize_s3, initialize_s3
+from utils.ttl import set_shared_ttl_cache_backend
 
 logger = logging.getLogger("api")
 
@@ -78,6 +80,9 @@ async def lifespan(app: FastAPI):
     )
     await subtensor_client.initialize()
 
+    if config.TTL_CACHE_SHARED_BACKEND_ENABLED:
+        set_shared_ttl_cache_backend(DatabaseTTLCacheBackend())
+
     if config.SHOULD_RUN_LOOPS:
         _start_background_task(
             background_tasks,
@@ -103,6 +108,7 @@ async def lifespan(app: FastAPI):
         background_task.cancel()
     await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
 
+    set_shared_ttl_cache_backend(None)
     await deinitialize_database()
     await deinitialize_s3()
     await subtensor_client.close()
@@ -139,4 +145,11 @@ app.include_router(scaling_router, prefix="/scaling")
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host=config.HOST, port=config.PORT, proxy_headers=True, forwarded_allow_ips="*")
+    uvicorn.run(
+        app,
+        host=config.HOST,
+        port=config.PORT,
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        timeout_keep_alive=config.KEEP_ALIVE_TIMEOUT_SECONDS,
+    )
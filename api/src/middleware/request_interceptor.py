@@ -30,6 +30,11 @@ _COMPACT_BODY_KEYS_BY_PATH = {
     ),
 }
 
+# Batched bodies whose list items are compacted like the matching single-item path
+_COMPACT_BODY_LIST_KEYS_BY_PATH = {
+    "/validator/update-evaluation-runs": ("updates", _COMPACT_BODY_KEYS_BY_PATH["/validator/update-evaluation-run"]),
+}
+
 
 def _redact(obj: Any) -> Any:
     if isinstance(obj, dict):
@@ -43,6 +48,14 @@ def _body_for_log(path: str, parsed: Any) -> Any:
     keys = _COMPACT_BODY_KEYS_BY_PATH.get(path)
     if keys and isinstance(parsed, dict):
         return {key: _redact(parsed.get(key)) for key in keys}
+    list_key, item_keys = _COMPACT_BODY_LIST_KEYS_BY_PATH.get(path, (None, None))
+    if list_key and isinstance(parsed, dict) and isinstance(parsed.get(list_key), list):
+        return {
+            list_key: [
+                {key: _redact(item.get(key)) for key in item_keys} if isinstance(item, dict) else _redact(item)
+                for item in parsed[list_key]
+            ]
+        }
     return _redact(parsed)
 
 
@@ -1,5 +1,6 @@
 from db.models.agent import (
     Agent,
+    AgentDispatch,
     AgentOpenRouterSecret,
     AgentScore,
     BannedColdkey,
@@ -14,7 +15,7 @@ from db.models.approval import (
 )
 from db.models.competition import Competition
 from db.models.evaluation import ApprovedAgent, Evaluation
-from db.models.evaluation_run import EvaluationRun, EvaluationRunLog
+from db.models.evaluation_run import EvaluationRun, EvaluationRunLog, EvaluationRunLogChunk
 from db.models.evaluation_set import EvaluationSet
 from db.models.inference import Embedding, Inference
 from db.models.internal_flag import (
@@ -24,12 +25,16 @@ from db.models.internal_flag import (
 from db.models.payment import EvaluationPayment, UploadPaymentQuote
 from db.models.pre_screening_judge import PreScreeningJob, PreScreeningResult
 from db.models.refund import FailedUploadRefund
+from db.models.statistics import AgentProblemSolveRollup, StatisticsRolledUpEvaluation
+from db.models.ttl_cache import TtlCacheEntry, TtlCacheGeneration
 from db.models.upload import UploadAttempt
 from db.models.upload_credit import UploadCredit
 
 __all__ = [
     "Agent",
     "AgentApprovalState",
+    "AgentDispatch",
+    "AgentProblemSolveRollup",
     "AgentOpenRouterSecret",
     "ApprovalJob",
     "ApprovalJobRound",
@@ -45,10 +50,14 @@ __all__ = [
     "EvaluationPayment",
     "EvaluationRun",
     "EvaluationRunLog",
+    "EvaluationRunLogChunk",
     "EvaluationSet",
     "FailedUploadRefund",
     "Inference",
     "InternalFlag",
+    "StatisticsRolledUpEvaluation",
+    "TtlCacheEntry",
+    "TtlCacheGeneration",
     "UnapprovedAgentId",
     "UploadAttempt",
     "UploadCredit",
@@ -141,3 +141,22 @@ class AgentOpenRouterSecret(Base):
         nullable=False,
         server_default=sa.text("NOW()"),
     )
+
+
+class AgentDispatch(Base):
+    """An agent's evaluation-claim lease, taken with SELECT ... FOR UPDATE SKIP LOCKED.
+
+    dispatch_version is bumped whenever a claim is released, so a claimer with a stale
+    view of the agent's evaluations can detect it and skip the agent.
+    """
+
+    __tablename__ = "agent_dispatch"
+
+    agent_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        sa.ForeignKey("agents.agent_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    dispatch_version: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, server_default="0")
+    claimed_by: Mapped[Optional[str]] = mapped_column(sa.Text)
+    claimed_until: Mapped[Optional[datetime]] = mapped_column(sa.TIMESTAMP(timezone=True))
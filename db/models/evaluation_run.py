@@ -83,3 +83,24 @@ class EvaluationRunLog(Base):
     )
 
     __table_args__ = (sa.PrimaryKeyConstraint("evaluation_run_id", "attempt_number", "type"),)
+
+
+class EvaluationRunLogChunk(Base):
+    """Log bytes shipped by a validator while an evaluation run attempt is in flight.
+
+    Chunks are keyed by their byte offset in the source file, so retried chunks are
+    idempotent and a source's log is its chunks concatenated in offset order.
+    """
+
+    __tablename__ = "evaluation_run_log_chunks"
+
+    evaluation_run_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    attempt_number: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    source: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    offset: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    logs: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.func.now()
+    )
+
+    __table_args__ = (sa.PrimaryKeyConstraint("evaluation_run_id", "attempt_number", "source", "offset"),)
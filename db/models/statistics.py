@@ -0,0 +1,42 @@
+from datetime import datetime
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class AgentProblemSolveRollup(Base):
+    """Per (agent, problem) run and solve counts, folded in once per finished evaluation."""
+
+    __tablename__ = "agent_problem_solve_rollup"
+
+    agent_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        sa.ForeignKey("agents.agent_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    benchmark_family: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    problem_name: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    num_runs: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    num_solved: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    first_run_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True), nullable=False)
+
+
+class StatisticsRolledUpEvaluation(Base):
+    """An evaluation already folded into agent_problem_solve_rollup, so it is never counted twice."""
+
+    __tablename__ = "statistics_rolled_up_evaluations"
+
+    evaluation_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        sa.ForeignKey("evaluations.evaluation_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rolled_up_at: Mapped[datetime] = mapped_column(
+        sa.TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=sa.text("NOW()"),
+    )
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class TtlCacheEntry(Base):
+    """A result of a ttl_cache(shared=True) function, published for every API worker.
+
+    The table is UNLOGGED: it only holds recomputable cache data.
+    """
+
+    __tablename__ = "ttl_cache_entries"
+
+    key: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    value: Mapped[bytes] = mapped_column(sa.LargeBinary, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True), nullable=False)
+
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+
+class TtlCacheGeneration(Base):
+    """The single-row generation of ttl_cache_entries, bumped by every shared invalidation.
+
+    A calculation only publishes its result if the generation is unchanged since it started.
+    """
+
+    __tablename__ = "ttl_cache_generation"
+
+    id: Mapped[bool] = mapped_column(sa.Boolean, primary_key=True, server_default=sa.text("TRUE"))
+    generation: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+
+    __table_args__ = (sa.CheckConstraint("id", name="ttl_cache_generation_single_row"),)
@@ -182,6 +182,20 @@ def _agent_log_paths(trial_paths: TrialPaths) -> list[Path]:
     ]
 
 
+def live_log_paths(job_dir: Path) -> list[tuple[str, Path]]:
+    """Return the log files of a job's trial that can be tailed while it runs.
+
+    Each path is paired with its source name, its path relative to the trial
+    directory. Empty until Harbor has created the trial directory.
+    """
+    trial_paths = _resolve_single_trial_paths(job_dir)
+    if trial_paths is None:
+        return []
+
+    paths = [*_agent_log_paths(trial_paths), trial_paths.test_stdout_path]
+    return [(path.relative_to(trial_paths.trial_dir).as_posix(), path) for path in paths]
+
+
 def _resolve_single_trial_paths(job_dir: Path) -> TrialPaths | None:
     """Return TrialPaths for a job directory containing exactly one trial, else None."""
     try:
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import shutil
 import tempfile
 from collections.abc import Awaitable, Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 from uuid import UUID
@@ -18,9 +21,11 @@ from execution.types import ExecutionResult, ExecutionRunRequest, TrialSnapshot
 from models.evaluation_run import EvaluationRunErrorCode
 from models.harbor_task import HarborRemoteTaskExecutionSpec
 from models.openrouter import OpenRouterRuntimeConfig
+from ridges_harbor.digest import digest_manifest_path
 from ridges_harbor.runner import DEFAULT_RESULTS_DIR, run_task
 from ridges_harbor.seed import problem_seed
 from utils.task_cache import get_cached_task, get_or_download_task
+from utils.tree_clone import clone_tree
 
 logger = logging.getLogger(__name__)
 _JOB_NAME_FORMAT = "{problem_name}__{evaluation_run_id}"
@@ -71,6 +76,38 @@ def resolved_agent_source(
             temp_agent_path.unlink()
 
 
+# Only strategies that give the workspace private files (see materialize_task_workspace)
+TASK_WORKSPACE_CLONE_STRATEGIES = ("reflink", "copy")
+
+
+def materialize_task_workspace(task_dir: Path, workspace_dir: Path) -> Path:
+    """Clone a cached task into ``workspace_dir`` for one trial, and return the clone.
+
+    The digest manifest is carried over (clones keep file stats), so the runner's
+    digest check still skips re-hashing the task.
+
+    Hardlinks are never used: Harbor writes the task directory directly, with no
+    hook to copy a file up first, so a write or chmod through a hardlink would
+    change the cached task and break its digest. Filesystems without reflinks
+    get a plain copy.
+    """
+
+    if workspace_dir.exists():
+        shutil.rmtree(workspace_dir)
+    workspace_task_dir = workspace_dir / task_dir.name
+    result = clone_tree(task_dir, workspace_task_dir, strategies=TASK_WORKSPACE_CLONE_STRATEGIES)
+
+    manifest_path = digest_manifest_path(task_dir)
+    if manifest_path.exists():
+        shutil.copy2(manifest_path, digest_manifest_path(workspace_task_dir))
+
+    logger.info(
+        f"Materialized task workspace {workspace_task_dir} ({result.num_files} file(s)) "
+        f"with {result.strategy} in {result.elapsed_seconds:.3f} second(s)"
+    )
+    return workspace_task_dir
+
+
 class ExecutionEngine:
     """Run one promoted Harbor task for one evaluation run."""
 
@@ -84,6 +121,7 @@ class ExecutionEngine:
         max_eval_timeout_sec: float | None = None,
         max_cost_usd: float | None = None,
         build_timeout_multiplier: float | None = None,
+        task_workspace_dir: str | Path | None = None,
     ):
         self.inference_url = inference_url
         self.results_dir = harbor_results_dir
@@ -92,6 +130,8 @@ class ExecutionEngine:
         self.max_eval_timeout_sec = max_eval_timeout_sec
         self.max_cost_usd = max_cost_usd
         self.build_timeout_multiplier = build_timeout_multiplier
+        # When set, every trial runs on its own clone of the cached task under this directory
+        self.task_workspace_dir = Path(task_workspace_dir).expanduser() if task_workspace_dir is not None else None
 
     async def evaluate(
         self,
@@ -126,8 +166,14 @@ class ExecutionEngine:
             attempt_number=attempt_number,
         )
         inference_seed = problem_seed(problem_name)
+        workspace_dir = self.task_workspace_dir / request.job_name if self.task_workspace_dir is not None else None
 
         try:
+            if workspace_dir is not None:
+                workspace_task_dir = await asyncio.to_thread(
+                    materialize_task_workspace, request.task_dir, workspace_dir
+                )
+                request = replace(request, task_dir=workspace_task_dir)
 
             async def harbor_on_agent_started(_event: Any) -> None:
                 try:
@@ -179,6 +225,17 @@ class ExecutionEngine:
                 extra=collect_job_crash_context(job_dir=request.job_dir),
             ) from exception
 
+        finally:
+            if workspace_dir is not None:
+                await asyncio.to_thread(shutil.rmtree, workspace_dir, ignore_errors=True)
+
+    def job_dir_for(self, *, problem_name: str, evaluation_run_id: UUID, attempt_number: int = 1) -> Path:
+        """The job directory Harbor writes an evaluation run attempt into, e.g. for tailing its logs."""
+        job_name = _format_job_name(
+            problem_name=problem_name, evaluation_run_id=evaluation_run_id, attempt_number=attempt_number
+        )
+        return Path(self.results_dir or DEFAULT_RESULTS_DIR).expanduser().resolve() / job_name
+
     def _parse_execution_spec(
         self,
         problem_name: str,
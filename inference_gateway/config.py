@@ -55,6 +55,10 @@ if USE_DATABASE:
         logger.fatal("CHECK_EVALUATION_RUNS is not set in .env")
     CHECK_EVALUATION_RUNS = CHECK_EVALUATION_RUNS.lower() == "true"
 
+    INFERENCE_LEDGER_MAX_QUEUE_SIZE = int(os.getenv("INFERENCE_LEDGER_MAX_QUEUE_SIZE", "10000"))
+    INFERENCE_LEDGER_BATCH_SIZE = int(os.getenv("INFERENCE_LEDGER_BATCH_SIZE", "500"))
+    INFERENCE_LEDGER_FLUSH_INTERVAL_SECONDS = float(os.getenv("INFERENCE_LEDGER_FLUSH_INTERVAL_SECONDS", "0.5"))
+
 
 MAX_COST_PER_EVALUATION_RUN_USD = os.getenv("MAX_COST_PER_EVALUATION_RUN_USD")
 if not MAX_COST_PER_EVALUATION_RUN_USD:
@@ -129,6 +133,11 @@ if not USE_CHUTES and not USE_TARGON and not USE_OPENROUTER:
     logger.fatal("Either USE_CHUTES or USE_TARGON or USE_OPENROUTER must be set to True in .env")
 
 
+ROUTER_EWMA_ALPHA = float(os.getenv("ROUTER_EWMA_ALPHA", "0.2"))
+ROUTER_FAILURE_THRESHOLD = int(os.getenv("ROUTER_FAILURE_THRESHOLD", "5"))
+ROUTER_OPEN_SECONDS = float(os.getenv("ROUTER_OPEN_SECONDS", "30"))
+
+
 TEST_INFERENCE_MODELS = os.getenv("TEST_INFERENCE_MODELS")
 if not TEST_INFERENCE_MODELS:
     logger.fatal("TEST_INFERENCE_MODELS is not set in .env")
@@ -151,6 +160,11 @@ if USE_DATABASE:
     logger.info(f"Database Host: {DATABASE_HOST}")
     logger.info(f"Database Port: {DATABASE_PORT}")
     logger.info(f"Database Name: {DATABASE_NAME}")
+    logger.info(
+        f"Inference Ledger: batch size {INFERENCE_LEDGER_BATCH_SIZE}, "
+        f"flush interval {INFERENCE_LEDGER_FLUSH_INTERVAL_SECONDS} second(s), "
+        f"max queue size {INFERENCE_LEDGER_MAX_QUEUE_SIZE}"
+    )
     if not CHECK_EVALUATION_RUNS:
         logger.warning("Not Checking Evaluation Runs!")
 else:
@@ -179,5 +193,10 @@ if USE_OPENROUTER:
     logger.info(f"OpenRouter Weight: {OPENROUTER_WEIGHT}")
 else:
     logger.warning("Not Using OpenRouter!")
+logger.info("---------------------------------------")
+
+logger.info(f"Router EWMA Alpha: {ROUTER_EWMA_ALPHA}")
+logger.info(f"Router Failure Threshold: {ROUTER_FAILURE_THRESHOLD} consecutive failure(s)")
+logger.info(f"Router Open Duration: {ROUTER_OPEN_SECONDS} second(s)")
 
 logger.info("=======================================")
@@ -0,0 +1,247 @@
+# NOTE: Write-behind persistence for inference records. Request handlers hand
+#       their records to the ledger instead of writing to the database, and a
+#       single background task flushes them in batches. Events are flushed in
+#       the order they were queued, and each batch runs in one transaction that
+#       inserts before it updates, so a response is never written before its
+#       inference. An inference whose response arrives before its insert is
+#       flushed is written as one complete row. Transient database errors are
+#       retried with backoff; a batch that fails any other way is bisected until
+#       the rows that cannot be written are found, and only those are dropped, so
+#       one bad row never stalls the ledger.
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import asyncpg
+
+from inference_gateway.models import InferenceMessage
+from queries.inference import write_inference_batch
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_LEDGER_MAX_QUEUE_SIZE = 10_000
+INFERENCE_LEDGER_BATCH_SIZE = 500
+INFERENCE_LEDGER_FLUSH_INTERVAL_SECONDS = 0.5
+INFERENCE_LEDGER_SHUTDOWN_TIMEOUT_SECONDS = 30
+INFERENCE_LEDGER_MAX_RETRY_DELAY_SECONDS = 30
+
+# Errors that say nothing about the rows themselves; the same batch is retried until it succeeds
+TRANSIENT_WRITE_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.InterfaceError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.InsufficientResourcesError,
+    asyncpg.OperatorInterventionError,
+    asyncpg.TransactionRollbackError,
+)
+
+_REQUEST = "request"
+_RESPONSE = "response"
+
+
+class InferenceLedgerRecord:
+    def __init__(
+        self,
+        *,
+        evaluation_run_id: UUID,
+        provider: str,
+        model: str,
+        temperature: float,
+        messages: List[InferenceMessage],
+    ):
+        self.inference_id = uuid4()
+        self.evaluation_run_id = evaluation_run_id
+        self.provider = provider
+        self.model = model
+        self.temperature = temperature
+        self.messages = messages
+        self.request_received_at = datetime.now(timezone.utc)
+
+        self.has_response = False
+        self.status_code: Optional[int] = None
+        self.response: Optional[str] = None
+        self.num_input_tokens: Optional[int] = None
+        self.num_output_tokens: Optional[int] = None
+        self.cost_usd: Optional[float] = None
+        self.response_sent_at: Optional[datetime] = None
+
+        # Set once a committed insert already carried the response
+        self.response_persisted = False
+
+    def new_inference_row(self) -> tuple:
+        return (
+            self.inference_id,
+            self.evaluation_run_id,
+            self.provider,
+            self.model,
+            self.temperature,
+            self.messages,
+            self.status_code,
+            self.response,
+            self.num_input_tokens,
+            self.num_output_tokens,
+            self.cost_usd,
+            self.request_received_at,
+            self.response_sent_at,
+        )
+
+    def finished_inference_row(self) -> tuple:
+        return (
+            self.inference_id,
+            self.status_code,
+            self.response,
+            self.num_input_tokens,
+            self.num_output_tokens,
+            self.cost_usd,
+            self.response_sent_at,
+        )
+
+
+WriteBatch = Callable[..., Awaitable[None]]
+
+
+class InferenceLedger:
+    def __init__(
+        self,
+        *,
+        max_queue_size: int = INFERENCE_LEDGER_MAX_QUEUE_SIZE,
+        batch_size: int = INFERENCE_LEDGER_BATCH_SIZE,
+        flush_interval_seconds: float = INFERENCE_LEDGER_FLUSH_INTERVAL_SECONDS,
+        write_batch: WriteBatch = write_inference_batch,
+    ):
+        # A full queue makes record_request()/record_response() wait, which pushes
+        # back on request handlers instead of growing memory without bound
+        self.queue: asyncio.Queue[Tuple[str, InferenceLedgerRecord]] = asyncio.Queue(maxsize=max_queue_size)
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.write_batch = write_batch
+        self.flush_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self, *, timeout: float = INFERENCE_LEDGER_SHUTDOWN_TIMEOUT_SECONDS):
+        if self.flush_task is None:
+            return
+
+        logger.info(f"Flushing {self.queue.qsize()} queued inference ledger event(s)...")
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Dropping {self.queue.qsize()} inference ledger event(s) that could not be flushed")
+
+        self.flush_task.cancel()
+        await asyncio.gather(self.flush_task, return_exceptions=True)
+        self.flush_task = None
+        logger.info("Flushed inference ledger.")
+
+    async def record_request(
+        self,
+        *,
+        evaluation_run_id: UUID,
+        provider: str,
+        model: str,
+        temperature: float,
+        messages: List[InferenceMessage],
+    ) -> InferenceLedgerRecord:
+        record = InferenceLedgerRecord(
+            evaluation_run_id=evaluation_run_id,
+            provider=provider,
+            model=model,
+            temperature=temperature,
+            messages=messages,
+        )
+        await self.queue.put((_REQUEST, record))
+        return record
+
+    async def record_response(
+        self,
+        record: InferenceLedgerRecord,
+        *,
+        status_code: int,
+        response: Optional[str],
+        num_input_tokens: Optional[int],
+        num_output_tokens: Optional[int],
+        cost_usd: Optional[float],
+    ):
+        record.status_code = status_code
+        record.response = response
+        record.num_input_tokens = num_input_tokens
+        record.num_output_tokens = num_output_tokens
+        record.cost_usd = cost_usd
+        record.response_sent_at = datetime.now(timezone.utc)
+        record.has_response = True
+        await self.queue.put((_RESPONSE, record))
+
+    def _build_batch(
+        self, events: List[Tuple[str, InferenceLedgerRecord]]
+    ) -> Tuple[List[tuple], List[tuple], List[InferenceLedgerRecord]]:
+        new_inference_rows = []
+        finished_inference_rows = []
+        inserted_with_response = []
+        inserted_with_response_ids = set()
+
+        for kind, record in events:
+            if kind == _REQUEST:
+                new_inference_rows.append(record.new_inference_row())
+                if record.has_response:
+                    inserted_with_response.append(record)
+                    inserted_with_response_ids.add(record.inference_id)
+            elif not record.response_persisted and record.inference_id not in inserted_with_response_ids:
+                finished_inference_rows.append(record.finished_inference_row())
+
+        return new_inference_rows, finished_inference_rows, inserted_with_response
+
+    async def _write_with_retry(self, events: List[Tuple[str, InferenceLedgerRecord]]):
+        delay = self.flush_interval_seconds or 0.1
+        while True:
+            # Rebuilt on every attempt so responses that arrived meanwhile are coalesced
+            new_inference_rows, finished_inference_rows, inserted_with_response = self._build_batch(events)
+            try:
+                await self.write_batch(
+                    new_inference_rows=new_inference_rows, finished_inference_rows=finished_inference_rows
+                )
+            except TRANSIENT_WRITE_ERRORS as e:
+                logger.error(
+                    f"Failed to flush {len(events)} inference ledger event(s), retrying in {delay:.1f} second(s): "
+                    f"{type(e).__name__}: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, INFERENCE_LEDGER_MAX_RETRY_DELAY_SECONDS)
+                continue
+            except Exception as e:
+                if len(events) == 1:
+                    [(kind, record)] = events
+                    logger.error(
+                        f"Dropping inference ledger {kind} event for inference {record.inference_id} "
+                        f"(evaluation run {record.evaluation_run_id}) that cannot be written: {type(e).__name__}: {e}"
+                    )
+                    return
+                # Halves are written in order, so an inference is still inserted before its response is
+                middle = len(events) // 2
+                await self._write_with_retry(events[:middle])
+                await self._write_with_retry(events[middle:])
+                return
+
+            for record in inserted_with_response:
+                record.response_persisted = True
+            return
+
+    async def _flush_loop(self):
+        while True:
+            events = [await self.queue.get()]
+            if self.queue.qsize() < self.batch_size - 1:
+                await asyncio.sleep(self.flush_interval_seconds)
+            while len(events) < self.batch_size and not self.queue.empty():
+                events.append(self.queue.get_nowait())
+
+            try:
+                await self._write_with_retry(events)
+            finally:
+                for _ in events:
+                    self.queue.task_done()
@@ -1,8 +1,7 @@
 import logging
-import random
 from contextlib import asynccontextmanager
 from functools import wraps
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 import uvicorn
@@ -11,6 +10,7 @@ from pydantic import BaseModel
 
 import inference_gateway.config as config
 from inference_gateway.cost_hash_map import CostHashMap
+from inference_gateway.inference_ledger import InferenceLedger
 from inference_gateway.models import (
     EmbeddingModelInfo,
     EmbeddingRequest,
@@ -22,41 +22,35 @@ from inference_gateway.models import (
 )
 from inference_gateway.providers.chutes import ChutesProvider
 from inference_gateway.providers.openrouter import OpenRouterProvider
-from inference_gateway.providers.provider import Provider
 from inference_gateway.providers.targon import TargonProvider
+from inference_gateway.router import ProviderRouter, RouteChoice, WeightedProvider
 from models.evaluation_run import EvaluationRunStatus
 from queries.embedding import create_new_embedding, update_embedding_by_id
 from queries.evaluation_run import get_evaluation_run_status_by_id
-from queries.inference import create_new_inference, update_inference_by_id
 from utils.database import deinitialize_database, get_debug_query_info, initialize_database
 from utils.logger import setup_logging
 
 logger = logging.getLogger("inference_gateway")
 
 
-class WeightedProvider:
-    def __init__(self, provider: Provider, weight: int):
-        self.provider = provider
-        self.weight = weight
-
-
 providers = []
+inference_ledger = None
+router = ProviderRouter(
+    ewma_alpha=config.ROUTER_EWMA_ALPHA,
+    failure_threshold=config.ROUTER_FAILURE_THRESHOLD,
+    open_seconds=config.ROUTER_OPEN_SECONDS,
+)
 
 
-def get_provider_that_supports_model_for_inference(model_name: str) -> Provider:
+# The returned choice must be released (or consumed by router.track()) on every path
+def get_provider_that_supports_model_for_inference(model_name: str) -> Optional[RouteChoice]:
     inference_providers = [wp for wp in providers if wp.provider.is_model_supported_for_inference(model_name)]
-    if not inference_providers:
-        return None
-    chosen = random.choices(inference_providers, weights=[wp.weight for wp in inference_providers], k=1)[0]
-    return chosen.provider
+    return router.choose(inference_providers, model_name)
 
 
-def get_provider_that_supports_model_for_embedding(model_name: str) -> Provider:
+def get_provider_that_supports_model_for_embedding(model_name: str) -> Optional[RouteChoice]:
     embedding_providers = [wp for wp in providers if wp.provider.is_model_supported_for_embedding(model_name)]
-    if not embedding_providers:
-        return None
-    chosen = random.choices(embedding_providers, weights=[wp.weight for wp in embedding_providers], k=1)[0]
-    return chosen.provider
+    return router.choose(embedding_providers, model_name)
 
 
 @asynccontextmanager
@@ -71,6 +65,14 @@ async def lifespan(app: FastAPI):
             name=config.DATABASE_NAME,
         )
 
+        global inference_ledger
+        inference_ledger = InferenceLedger(
+            max_queue_size=config.INFERENCE_LEDGER_MAX_QUEUE_SIZE,
+            batch_size=config.INFERENCE_LEDGER_BATCH_SIZE,
+            flush_interval_seconds=config.INFERENCE_LEDGER_FLUSH_INTERVAL_SECONDS,
+        )
+        inference_ledger.start()
+
     global providers
     if config.USE_CHUTES:
         providers.append(WeightedProvider(await ChutesProvider().init(), weight=config.CHUTES_WEIGHT))
@@ -88,6 +90,7 @@ async def lifespan(app: FastAPI):
     yield
 
     if config.USE_DATABASE:
+        await inference_ledger.stop()
         await deinitialize_database()
 
 
@@ -154,32 +157,38 @@ async def inference(request: InferenceRequest) -> InferenceResponse:
             )
 
     # Make sure we support the model for inference
-    provider = get_provider_that_supports_model_for_inference(request.model)
-    if not provider:
+    choice = get_provider_that_supports_model_for_inference(request.model)
+    if not choice:
         raise HTTPException(
             status_code=404, detail=f"The model {request.model} is not supported by Ridges for inference."
         )
+    provider = choice.provider
+
+    try:
+        if config.USE_DATABASE:
+            inference_record = await inference_ledger.record_request(
+                evaluation_run_id=request.evaluation_run_id,
+                provider=provider.name.lower(),
+                model=request.model,
+                temperature=request.temperature,
+                messages=request.messages,
+            )
 
-    if config.USE_DATABASE:
-        inference_id = await create_new_inference(
-            evaluation_run_id=request.evaluation_run_id,
-            provider=provider.name.lower(),
-            model=request.model,
-            temperature=request.temperature,
-            messages=request.messages,
-        )
-
-    response = await provider.inference(
-        model_name=request.model,
-        temperature=request.temperature,
-        messages=request.messages,
-        tool_mode=request.tool_mode,
-        tools=request.tools,
-    )
+        with router.track(choice) as outcome:
+            response = await provider.inference(
+                model_name=request.model,
+                temperature=request.temperature,
+                messages=request.messages,
+                tool_mode=request.tool_mode,
+                tools=request.tools,
+            )
+            outcome["status_code"] = response.status_code
+    finally:
+        choice.release()
 
     if config.USE_DATABASE:
-        await update_inference_by_id(
-            inference_id=inference_id,
+        await inference_ledger.record_response(
+            inference_record,
             status_code=response.status_code,
             response=response.content if response.status_code == 200 else response.error_message,
             num_input_tokens=response.num_input_tokens,
@@ -229,21 +238,27 @@ async def embedding(request: EmbeddingRequest) -> EmbeddingResponse:
             )
 
     # Make sure we support the model for embedding
-    provider = get_provider_that_supports_model_for_embedding(request.model)
-    if not provider:
+    choice = get_provider_that_supports_model_for_embedding(request.model)
+    if not choice:
         raise HTTPException(
             status_code=404, detail=f"The model {request.model} is not supported by Ridges for embedding."
         )
+    provider = choice.provider
+
+    try:
+        if config.USE_DATABASE:
+            embedding_id = await create_new_embedding(
+                evaluation_run_id=request.evaluation_run_id,
+                provider=provider.name.lower(),
+                model=request.model,
+                input=request.input,
+            )
 
-    if config.USE_DATABASE:
-        embedding_id = await create_new_embedding(
-            evaluation_run_id=request.evaluation_run_id,
-            provider=provider.name.lower(),
-            model=request.model,
-            input=request.input,
-        )
-
-    response = await provider.embedding(model_name=request.model, input=request.input)
+        with router.track(choice) as outcome:
+            response = await provider.embedding(model_name=request.model, input=request.input)
+            outcome["status_code"] = response.status_code
+    finally:
+        choice.release()
 
     if config.USE_DATABASE:
         await update_embedding_by_id(
@@ -297,5 +312,10 @@ async def debug_query_info():
     return get_debug_query_info()
 
 
+@app.get("/debug/routing-state")
+async def debug_routing_state():
+    return router.snapshot()
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host=config.HOST, port=config.PORT)
@@ -0,0 +1,190 @@
+# NOTE: The router replaces the static random.choices over provider weights.
+#       Each (provider, model) pair keeps an EWMA of latency and error rate,
+#       plus its in-flight count, and the static weight is scaled down for
+#       pairs that are slow, failing or busy. Consecutive failures open a
+#       circuit breaker that sheds all traffic from the pair until a single
+#       half-open probe succeeds. The probe is reserved when the route is chosen,
+#       so requests chosen while the first one is still on its way to the
+#       provider never probe it too.
+
+import random
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from inference_gateway.providers.provider import Provider
+
+ROUTER_MIN_HEALTH_FACTOR = 0.01
+
+
+class WeightedProvider:
+    def __init__(self, provider: Provider, weight: int):
+        self.provider = provider
+        self.weight = weight
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_failure_status_code(status_code: int) -> bool:
+    # -1 is an internal provider error; 429 and 5xx mean the provider is unhealthy.
+    # Other 4xx responses are caused by the request, not the provider.
+    return status_code == -1 or status_code == 429 or status_code >= 500
+
+
+class RouteHealth:
+    def __init__(self):
+        self.ewma_latency_seconds: Optional[float] = None
+        self.ewma_error_rate = 0.0
+        self.in_flight = 0
+        self.num_requests = 0
+        self.num_failures = 0
+        self.consecutive_failures = 0
+        self.state = CircuitState.CLOSED
+        self.opened_at: Optional[float] = None
+        self.probe_in_flight = False
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state.value,
+            "ewma_latency_seconds": self.ewma_latency_seconds,
+            "ewma_error_rate": self.ewma_error_rate,
+            "in_flight": self.in_flight,
+            "num_requests": self.num_requests,
+            "num_failures": self.num_failures,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class RouteChoice:
+    """A provider chosen for one request. Pass it to ProviderRouter.track(), and release() it on every path."""
+
+    def __init__(self, weighted_provider: WeightedProvider, model_name: str, route: RouteHealth, is_probe: bool):
+        self.weighted_provider = weighted_provider
+        self.model_name = model_name
+        self.route = route
+        self.is_probe = is_probe
+        self.released = False
+
+    @property
+    def provider(self) -> Provider:
+        return self.weighted_provider.provider
+
+    def release(self):
+        """Give back the half-open probe reservation, if this choice holds it. Safe to call more than once."""
+        if self.is_probe and not self.released:
+            self.route.probe_in_flight = False
+        self.released = True
+
+
+class ProviderRouter:
+    def __init__(
+        self,
+        *,
+        ewma_alpha: float,
+        failure_threshold: int,
+        open_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.routes: Dict[Tuple[str, str], RouteHealth] = {}
+
+    def _route(self, provider_name: str, model_name: str) -> RouteHealth:
+        key = (provider_name, model_name)
+        if key not in self.routes:
+            self.routes[key] = RouteHealth()
+        return self.routes[key]
+
+    def _is_available(self, route: RouteHealth) -> bool:
+        if route.state == CircuitState.CLOSED:
+            return True
+        if route.state == CircuitState.OPEN and self.clock() - route.opened_at >= self.open_seconds:
+            route.state = CircuitState.HALF_OPEN
+        # A half-open route admits a single probe request at a time
+        return route.state == CircuitState.HALF_OPEN and not route.probe_in_flight
+
+    def _effective_weight(self, weight: int, route: RouteHealth, best_latency: Optional[float]) -> float:
+        health_factor = 1.0 - route.ewma_error_rate
+        if best_latency is not None and route.ewma_latency_seconds:
+            health_factor *= best_latency / route.ewma_latency_seconds
+        health_factor /= 1 + route.in_flight
+        return weight * max(health_factor, ROUTER_MIN_HEALTH_FACTOR)
+
+    def choose(self, candidates: List[WeightedProvider], model_name: str) -> Optional[RouteChoice]:
+        if not candidates:
+            return None
+
+        available = [wp for wp in candidates if self._is_available(self._route(wp.provider.name, model_name))]
+        if not available:
+            # Every breaker is open: fall back to static weights rather than refusing the request
+            chosen = self.rng.choices(candidates, weights=[wp.weight for wp in candidates], k=1)[0]
+            return RouteChoice(chosen, model_name, self._route(chosen.provider.name, model_name), is_probe=False)
+
+        routes = [self._route(wp.provider.name, model_name) for wp in available]
+        latencies = [route.ewma_latency_seconds for route in routes if route.ewma_latency_seconds]
+        best_latency = min(latencies) if latencies else None
+        weights = [self._effective_weight(wp.weight, route, best_latency) for wp, route in zip(available, routes)]
+        chosen = self.rng.choices(available, weights=weights, k=1)[0]
+
+        route = self._route(chosen.provider.name, model_name)
+        is_probe = route.state == CircuitState.HALF_OPEN
+        if is_probe:
+            route.probe_in_flight = True
+        return RouteChoice(chosen, model_name, route, is_probe)
+
+    def record(self, provider_name: str, model_name: str, latency_seconds: float, failed: bool):
+        route = self._route(provider_name, model_name)
+        alpha = self.ewma_alpha
+
+        route.num_requests += 1
+        route.ewma_error_rate = alpha * (1.0 if failed else 0.0) + (1 - alpha) * route.ewma_error_rate
+        if route.ewma_latency_seconds is None:
+            route.ewma_latency_seconds = latency_seconds
+        else:
+            route.ewma_latency_seconds = alpha * latency_seconds + (1 - alpha) * route.ewma_latency_seconds
+
+        if failed:
+            route.num_failures += 1
+            route.consecutive_failures += 1
+            if route.state == CircuitState.HALF_OPEN or route.consecutive_failures >= self.failure_threshold:
+                route.state = CircuitState.OPEN
+                route.opened_at = self.clock()
+        else:
+            route.consecutive_failures = 0
+            route.state = CircuitState.CLOSED
+            route.opened_at = None
+
+    @contextmanager
+    def track(self, choice: RouteChoice) -> Iterator[dict]:
+        # Usage: with router.track(choice) as outcome: ...; outcome["status_code"] = result.status_code
+        route = choice.route
+        route.in_flight += 1
+
+        outcome = {"status_code": -1}
+        started_at = self.clock()
+        try:
+            yield outcome
+        finally:
+            route.in_flight -= 1
+            choice.release()
+            self.record(
+                choice.provider.name,
+                choice.model_name,
+                self.clock() - started_at,
+                is_failure_status_code(outcome["status_code"]),
+            )
+
+    def snapshot(self) -> dict:
+        return {
+            f"{provider_name}:{model_name}": route.to_dict()
+            for (provider_name, model_name), route in sorted(self.routes.items())
+        }
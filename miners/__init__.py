@@ -1,12 +1,20 @@
 """Miner-facing local tooling."""
 
 from miners.inference_client import LocalInferenceClient, LocalInferenceConfig
-from miners.local_harbor import CustomSandboxProxyConfig, LocalRunInferenceConfig, run_local_task
+from miners.local_harbor import (
+    CustomSandboxProxyConfig,
+    LocalRunInferenceConfig,
+    LocalTaskOutcome,
+    run_local_task,
+    run_local_tasks,
+)
 
 __all__ = [
     "CustomSandboxProxyConfig",
     "LocalInferenceClient",
     "LocalInferenceConfig",
     "LocalRunInferenceConfig",
+    "LocalTaskOutcome",
     "run_local_task",
+    "run_local_tasks",
 ]
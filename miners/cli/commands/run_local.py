@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import replace
 from pathlib import Path
 
-from miners import run_local_task
+from miners import LocalTaskOutcome, run_local_task, run_local_tasks
 from miners.cli.click_ext import click, format_help
 from miners.cli.config import (
     MinerConfig,
@@ -33,7 +34,7 @@ from miners.cli.provider_env import (
     resolve_inference_config,
 )
 from miners.cli.registry import HarborRegistryAdapter
-from miners.local_harbor import LocalRunInferenceConfig
+from miners.local_harbor import DEFAULT_LOCAL_BATCH_CONCURRENCY, LocalRunInferenceConfig
 
 from .setup import _run_setup_flow
 from .shared import (
@@ -140,6 +141,97 @@ async def _run_local_task_and_report(
     return 0
 
 
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m {seconds}s"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+async def _run_local_batch_and_report(
+    task_paths: list[Path],
+    *,
+    agent_path,
+    inference: LocalRunInferenceConfig,
+    results_dir=None,
+    concurrency: int = DEFAULT_LOCAL_BATCH_CONCURRENCY,
+    debug: bool = False,
+) -> int:
+    """Run several local Harbor tasks concurrently, print each one as it finishes, then an aggregate summary."""
+    from execution.artifacts import result_from_summary
+    from execution.errors import EvaluationRunException
+
+    print("Warning: local mode does not enforce evaluation sandbox restrictions.")
+    print(f"Running {len(task_paths)} tasks, {concurrency} at a time.")
+
+    rewards: list[float] = []
+    num_failed = 0
+    num_errors = 0
+
+    def report_task(outcome: LocalTaskOutcome) -> None:
+        nonlocal num_failed, num_errors
+        finished = len(rewards) + num_failed + num_errors + 1
+        prefix = f"[{finished}/{len(task_paths)}] {outcome.task_path.name}"
+        duration = _format_duration(outcome.elapsed_seconds)
+
+        if outcome.summary is None:
+            num_errors += 1
+            print(
+                f"{prefix}: ERROR in {duration}: {type(outcome.exception).__name__}: {outcome.exception}",
+                file=click.get_text_stream("stderr"),
+            )
+            return
+
+        try:
+            result = result_from_summary(outcome.summary)
+        except EvaluationRunException as exception:
+            num_failed += 1
+            print(f"{prefix}: FAILED in {duration}: {exception.error_code.name} ({outcome.summary.trial_dir})")
+            return
+
+        reward = result.verifier_reward or 0.0
+        rewards.append(reward)
+        passed, failed, skipped = _count_test_results(result.test_results)
+        print(
+            f"{prefix}: {'SOLVED' if reward >= 1 else 'SUCCEEDED'} in {duration}: reward {reward}, "
+            f"tests {passed} passed, {failed} failed, {skipped} skipped"
+        )
+
+    started_at = time.monotonic()
+    outcomes = await run_local_tasks(
+        task_paths,
+        agent_path=agent_path,
+        inference=inference,
+        max_concurrency=concurrency,
+        results_dir=results_dir,
+        debug=debug,
+        on_task_done=report_task,
+    )
+    wall_seconds = time.monotonic() - started_at
+    task_seconds = sum(outcome.elapsed_seconds for outcome in outcomes)
+    num_solved = sum(1 for reward in rewards if reward >= 1)
+
+    print(f"BATCH FINISHED: {len(task_paths)} tasks")
+    print(f"solved: {num_solved}/{len(task_paths)} ({num_solved / len(task_paths):.1%})")
+    print(f"mean reward: {sum(rewards) / len(task_paths):.3f}")
+    print(f"succeeded: {len(rewards)}, failed: {num_failed}, errors: {num_errors}")
+    print(
+        f"time: {_format_duration(wall_seconds)} wall, {_format_duration(task_seconds)} of task time "
+        f"({task_seconds / max(wall_seconds, 1e-6):.1f}x)"
+    )
+    if results_dir is not None:
+        print(f"results_dir: {results_dir}")
+
+    if num_errors:
+        return 2
+    if num_failed:
+        return 1
+    return 0
+
+
 def _resolve_selected_provider(
     cfg: MinerConfig,
     *,
@@ -182,6 +274,63 @@ def _resolve_selected_provider(
     return updated, resolve_inference_config(updated.provider or "", updated.workspace)
 
 
+def _run_local_batch_flow(
+    cfg: MinerConfig,
+    *,
+    config_target: Path,
+    dataset: str | None,
+    problems: tuple[str, ...],
+    all_problems: bool,
+    results_dir: Path | None,
+    concurrency: int,
+    debug: bool,
+    non_interactive: bool,
+) -> int:
+    """Run `ridges miner run-local` over several problems of one dataset and return the exit code."""
+    if not dataset:
+        raise click.ClickException("--problems and --all-problems require --dataset.")
+    if problems and all_problems:
+        raise click.ClickException("Pass either --problems or --all-problems, not both.")
+    if concurrency < 1:
+        raise click.ClickException("--concurrency must be at least 1.")
+
+    if non_interactive:
+        if not cfg.agent_path:
+            raise click.ClickException(
+                "Missing required values in non-interactive mode: agent_path (--agent-path or config [miner].agent_path)"
+            )
+    elif not cfg.is_complete():
+        cfg = _run_setup_flow(existing=cfg, config_path=config_target)
+
+    cfg, inference = _resolve_selected_provider(cfg, config_target=config_target, non_interactive=non_interactive)
+
+    render_step("Fetch tasks", step="2/3")
+    adapter = HarborRegistryAdapter.build()
+    problem_ids = list(problems) if problems else [problem.id for problem in adapter.list_problems(dataset)]
+    if not problem_ids:
+        raise click.ClickException(f"Dataset {dataset} has no problems to run.")
+
+    cfg.cache_dir.mkdir(parents=True, exist_ok=True)
+    task_paths: list[Path] = []
+    for index, problem_id in enumerate(problem_ids, start=1):
+        print(f"[{index}/{len(problem_ids)}] Fetching {problem_id}")
+        task_paths.append(adapter.download_problem(dataset, problem_id, dest=cfg.cache_dir))
+    cfg = record_recent(cfg, dataset=dataset, problem=None)
+    save_config(cfg, config_target)
+
+    render_step("Run Harbor", step="3/3")
+    return asyncio.run(
+        _run_local_batch_and_report(
+            task_paths,
+            agent_path=cfg.agent_path,
+            inference=inference,
+            results_dir=results_dir or cfg.results_dir,
+            concurrency=concurrency,
+            debug=debug,
+        )
+    )
+
+
 def run_local_flow(
     *,
     config_path: Path | None,
@@ -194,6 +343,9 @@ def run_local_flow(
     problem: str | None,
     debug: bool,
     non_interactive: bool,
+    problems: tuple[str, ...] = (),
+    all_problems: bool = False,
+    concurrency: int = DEFAULT_LOCAL_BATCH_CONCURRENCY,
 ) -> int:
     """Run the full `ridges miner run-local` flow and return the exit code."""
     config_target = config_path or default_config_path()
@@ -205,6 +357,21 @@ def run_local_flow(
         agent_path=agent_path,
     )
 
+    if problems or all_problems:
+        if task_path is not None or problem is not None:
+            raise click.ClickException("--problems/--all-problems cannot be combined with --task-path or --problem.")
+        return _run_local_batch_flow(
+            cfg,
+            config_target=config_target,
+            dataset=dataset,
+            problems=problems,
+            all_problems=all_problems,
+            results_dir=results_dir,
+            concurrency=concurrency,
+            debug=debug,
+            non_interactive=non_interactive,
+        )
+
     resolved_task_path = task_path
     inference: LocalRunInferenceConfig | None = None
 
@@ -288,12 +455,14 @@ def run_local_flow(
 
 @click.command(
     "run-local",
-    short_help="Run one Harbor task locally.",
+    short_help="Run Harbor tasks locally.",
     help=format_help(
-        "Run one Harbor task locally using the current miner config and selected local provider.",
+        "Run one Harbor task locally using the current miner config and selected local provider, "
+        "or a batch of problems from one dataset with --problems / --all-problems.",
         "ridges miner run-local",
         "ridges miner run-local --task-path ./task --provider custom",
         "ridges miner run-local --dataset swebench-verified@1.0 --problem astropy__astropy-7166",
+        "ridges miner run-local --dataset aider-polyglot@1.0 --all-problems --concurrency 8",
     ),
 )
 @click.option("--config-path", default=None, help="Read config from this path.")
@@ -309,6 +478,15 @@ def run_local_flow(
 @click.option("--task-path", default=None, help="Local Harbor task dir or .tar.gz/.tgz archive.")
 @click.option("--dataset", default=None, help="Harbor registry dataset ref, e.g. swebench-verified@1.0")
 @click.option("--problem", default=None, help="Problem id within the selected Harbor dataset.")
+@click.option("--problems", default=None, help="Comma-separated problem ids within --dataset to run as a batch.")
+@click.option("--all-problems", is_flag=True, help="Run every problem in --dataset as a batch.")
+@click.option(
+    "--concurrency",
+    default=DEFAULT_LOCAL_BATCH_CONCURRENCY,
+    show_default=True,
+    type=int,
+    help="Maximum number of batch tasks to run at once.",
+)
 @click.option("--debug", is_flag=True, help="Enable Harbor debug logging.")
 @click.option("--non-interactive", is_flag=True, help="Disable prompts; require CLI/config inputs.")
 def run_local_command(
@@ -320,6 +498,9 @@ def run_local_command(
     task_path: str | None,
     dataset: str | None,
     problem: str | None,
+    problems: str | None,
+    all_problems: bool,
+    concurrency: int,
     debug: bool,
     non_interactive: bool,
 ) -> None:
@@ -334,5 +515,8 @@ def run_local_command(
         problem=problem,
         debug=debug,
         non_interactive=non_interactive,
+        problems=tuple(problem_id.strip() for problem_id in (problems or "").split(",") if problem_id.strip()),
+        all_problems=all_problems,
+        concurrency=concurrency,
     )
     raise click.exceptions.Exit(exit_code)
@@ -11,7 +11,7 @@ import time
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal, Sequence
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -25,6 +25,8 @@ _ARCHIVE_SUFFIXES = (".tar.gz", ".tgz")
 _IGNORED_TOP_LEVEL_NAMES = {"__MACOSX", ".DS_Store"}
 _TASK_STAGING_DIRNAME = "_task_staging"
 
+DEFAULT_LOCAL_BATCH_CONCURRENCY = 4
+
 logger = logging.getLogger(__name__)
 
 
@@ -241,6 +243,13 @@ def _local_agent_env(
     return env
 
 
+async def _prune_dangling_images_after_run() -> None:
+    try:
+        await prune_dangling_images()
+    except Exception as exception:
+        logger.warning("Failed to prune dangling Docker images after local Harbor run: %s", exception)
+
+
 async def run_local_task(
     task_path: str | Path,
     *,
@@ -253,6 +262,7 @@ async def run_local_task(
     results_dir: str | Path | None = DEFAULT_RESULTS_DIR,
     debug: bool = False,
     job_name: str | None = None,
+    prune_images: bool = True,
 ) -> HarborRunSummary:
     """Run a local Harbor task for miner testing without validator scaffold assumptions."""
     from harbor.environments.factory import EnvironmentFactory
@@ -272,7 +282,8 @@ async def run_local_task(
     normalized_inference = inference.normalized()
 
     effective_task_name = task_name or _default_task_name(resolved_task_path)
-    effective_task_dir = _prepare_local_task_dir(
+    effective_task_dir = await asyncio.to_thread(
+        _prepare_local_task_dir,
         resolved_task_path,
         results_dir=resolved_results_dir,
     )
@@ -321,10 +332,8 @@ async def run_local_task(
         log_hint = job_log_path if job_log_path.exists() else error_path
         raise RuntimeError(f"Harbor failed for {effective_task_name}. See {log_hint}") from exception
     finally:
-        try:
-            await prune_dangling_images()
-        except Exception as exception:
-            logger.warning("Failed to prune dangling Docker images after local Harbor run: %s", exception)
+        if prune_images:
+            await _prune_dangling_images_after_run()
 
     if len(job_result.trial_results) != 1:
         raise RuntimeError(
@@ -340,3 +349,67 @@ async def run_local_task(
         task_dir=effective_task_dir,
         trial_dir=trial_dir,
     )
+
+
+@dataclass(frozen=True, slots=True)
+class LocalTaskOutcome:
+    """One finished task from run_local_tasks(): its Harbor summary, or the exception that stopped it."""
+
+    task_path: Path
+    elapsed_seconds: float
+    summary: HarborRunSummary | None = None
+    exception: Exception | None = None
+
+
+async def run_local_tasks(
+    task_paths: Sequence[str | Path],
+    *,
+    agent_path: str | Path,
+    inference: LocalRunInferenceConfig,
+    max_concurrency: int = DEFAULT_LOCAL_BATCH_CONCURRENCY,
+    agent_timeout_sec: float | None = None,
+    results_dir: str | Path | None = DEFAULT_RESULTS_DIR,
+    debug: bool = False,
+    on_task_done: Callable[[LocalTaskOutcome], None] | None = None,
+) -> list[LocalTaskOutcome]:
+    """Run several local Harbor tasks, at most max_concurrency at a time.
+
+    Every task shares the content-addressed archive staging cache, and dangling
+    images are pruned once after the whole batch instead of after every task.
+    on_task_done is called as each task finishes; the returned outcomes are in
+    task_paths order. A failing task does not stop the others.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(task_path: str | Path) -> LocalTaskOutcome:
+        async with semaphore:
+            started_at = time.monotonic()
+            try:
+                summary = await run_local_task(
+                    task_path,
+                    agent_path=agent_path,
+                    inference=inference,
+                    agent_timeout_sec=agent_timeout_sec,
+                    results_dir=results_dir,
+                    debug=debug,
+                    prune_images=False,
+                )
+                outcome = LocalTaskOutcome(
+                    task_path=Path(task_path), elapsed_seconds=time.monotonic() - started_at, summary=summary
+                )
+            except Exception as exception:
+                outcome = LocalTaskOutcome(
+                    task_path=Path(task_path), elapsed_seconds=time.monotonic() - started_at, exception=exception
+                )
+
+        if on_task_done is not None:
+            on_task_done(outcome)
+        return outcome
+
+    try:
+        return list(await asyncio.gather(*(run_one(task_path) for task_path in task_paths)))
+    finally:
+        await _prune_dangling_images_after_run()
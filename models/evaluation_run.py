@@ -198,3 +198,16 @@ class EvaluationRunLogType(str, Enum):
 
     agent = "agent"
     eval = "eval"
+
+
+class EvaluationRunLogChunk(BaseModel):
+    """Part of a log file, shipped while an evaluation run attempt is in flight.
+
+    ``offset`` is the chunk's byte offset in ``source`` (a log file relative to
+    the trial directory), so concatenating a source's chunks in offset order
+    reassembles the file, and polling with ``after_offset`` tails it.
+    """
+
+    source: str
+    offset: int
+    logs: str
@@ -699,18 +699,35 @@ async def get_agents_in_queue(conn: DatabaseConnection, queue_stage: QueueStage)
     return [Agent(**agent) for agent in queue]
 
 
-@db_operation
-async def get_next_agent_id_awaiting_evaluation_for_validator_hotkey(
-    conn: DatabaseConnection, validator_hotkey: str
-) -> Optional[UUID]:
-    if validator_hotkey.startswith("screener-1"):
-        result = await conn.fetchrow("""
-            SELECT agent_id FROM screener_1_queue LIMIT 1
-        """)
-    elif validator_hotkey.startswith("screener-2"):
-        result = await conn.fetchrow("""
-             SELECT agent_id FROM screener_2_queue LIMIT 1
-        """)
+# Reads the agent's dispatch_version in the same statement (and therefore the same snapshot) as the
+# queue, so a claim can later tell whether another validator released the agent after this read
+_DISPATCH_VERSION_SQL = (
+    "COALESCE((SELECT d.dispatch_version FROM agent_dispatch d WHERE d.agent_id = {alias}.agent_id), 0)"
+)
+
+# Agents currently leased to another validator are skipped up front instead of at claim time
+_NOT_CLAIMED_SQL = """
+    NOT EXISTS (
+        SELECT 1 FROM agent_dispatch d
+        WHERE d.agent_id = {alias}.agent_id AND d.claimed_until > NOW()
+    )
+"""
+
+
+async def _get_agent_dispatch_candidates_for_validator_hotkey(
+    conn: DatabaseConnection, validator_hotkey: str, limit: int
+) -> list[tuple[UUID, int]]:
+    if validator_hotkey.startswith("screener-1") or validator_hotkey.startswith("screener-2"):
+        queue_view = "screener_1_queue" if validator_hotkey.startswith("screener-1") else "screener_2_queue"
+        results = await conn.fetch(
+            f"""
+            SELECT q.agent_id, {_DISPATCH_VERSION_SQL.format(alias="q")} AS dispatch_version
+            FROM (
+                SELECT agent_id FROM {queue_view} WHERE {_NOT_CLAIMED_SQL.format(alias=queue_view)} LIMIT $1
+            ) q
+            """,
+            limit,
+        )
     else:
         # The query is structured to force a candidates-first execution order, avoiding a
         # full scan of evaluation_runs that the planner would otherwise choose.
@@ -725,7 +742,7 @@ async def get_next_agent_id_awaiting_evaluation_for_validator_hotkey(
         #   candidates (MATERIALIZED, ~1–50 rows)
         #     → evaluations by agent_id (index seek, ~10–50 rows per candidate)
         #       → evaluation_runs via JOIN LATERAL by evaluation_id (index seek, ~20–50 rows each)
-        result = await conn.fetchrow(
+        results = await conn.fetch(
             f"""
             WITH candidates AS MATERIALIZED (
                 SELECT
@@ -743,6 +760,7 @@ async def get_next_agent_id_awaiting_evaluation_for_validator_hotkey(
                         WHERE
                             b.agent_id = agents.agent_id
                     )
+                    AND {_NOT_CLAIMED_SQL.format(alias="agents")}
             ),
             combined_eval_stats AS (
                 SELECT
@@ -817,7 +835,8 @@ async def get_next_agent_id_awaiting_evaluation_for_validator_hotkey(
             SELECT
                 c.agent_id,
                 COALESCE(s.num_running_evals, 0) AS num_running_evals,
-                COALESCE(s.num_finished_evals, 0) AS num_finished_evals
+                COALESCE(s.num_finished_evals, 0) AS num_finished_evals,
+                {_DISPATCH_VERSION_SQL.format(alias="c")} AS dispatch_version
             FROM
                 candidates c
                 LEFT JOIN combined_eval_stats s ON s.agent_id = c.agent_id
@@ -828,11 +847,76 @@ async def get_next_agent_id_awaiting_evaluation_for_validator_hotkey(
                 COALESCE(s.screener_2_score, 0) DESC,
                 c.created_at ASC
             LIMIT
-                1
+                $3
             """,
             validator_hotkey,
             config.NUM_EVALS_PER_AGENT,
+            limit,
+        )
+
+    return [(result["agent_id"], result["dispatch_version"]) for result in results]
+
+
+@db_operation
+async def get_next_agent_id_awaiting_evaluation_for_validator_hotkey(
+    conn: DatabaseConnection, validator_hotkey: str
+) -> Optional[UUID]:
+    candidates = await _get_agent_dispatch_candidates_for_validator_hotkey(conn, validator_hotkey, 1)
+    if not candidates:
+        return None
+
+    return candidates[0][0]
+
+
+@db_operation
+async def claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(
+    conn: DatabaseConnection, validator_hotkey: str
+) -> Optional[UUID]:
+    """Claim the best agent awaiting an evaluation from this validator, or None.
+
+    The claim is a lease on the agent's agent_dispatch row, taken with FOR UPDATE SKIP LOCKED so concurrent
+    validators (on any API worker) never wait on each other: each one takes the first candidate nobody else is
+    claiming. The caller must release the claim with release_agent_dispatch_claim() once it has created the
+    evaluation (or given up), and the lease expires on its own if the caller dies first.
+    """
+    candidates = await _get_agent_dispatch_candidates_for_validator_hotkey(
+        conn, validator_hotkey, config.VALIDATOR_DISPATCH_CANDIDATE_LIMIT
+    )
+    if not candidates:
+        return None
+
+    agent_ids = [agent_id for agent_id, _ in candidates]
+    dispatch_versions = [dispatch_version for _, dispatch_version in candidates]
+
+    await conn.execute(
+        "INSERT INTO agent_dispatch (agent_id) SELECT unnest($1::uuid[]) ON CONFLICT (agent_id) DO NOTHING",
+        agent_ids,
+    )
+
+    # A candidate whose dispatch_version moved on was released by another validator after the candidates were
+    # read, so its evaluation counts may be stale; it is skipped here and picked up again on the next request
+    result = await conn.fetchrow(
+        """
+        UPDATE agent_dispatch d
+        SET claimed_by = $3, claimed_until = NOW() + make_interval(secs => $4)
+        WHERE d.agent_id = (
+            SELECT locked.agent_id
+            FROM agent_dispatch locked
+            JOIN unnest($1::uuid[], $2::bigint[]) WITH ORDINALITY AS c(agent_id, dispatch_version, position)
+                ON c.agent_id = locked.agent_id
+            WHERE locked.dispatch_version = c.dispatch_version
+              AND (locked.claimed_until IS NULL OR locked.claimed_until <= NOW())
+            ORDER BY c.position
+            LIMIT 1
+            FOR UPDATE OF locked SKIP LOCKED
         )
+        RETURNING d.agent_id
+        """,
+        agent_ids,
+        dispatch_versions,
+        validator_hotkey,
+        config.VALIDATOR_DISPATCH_CLAIM_TIMEOUT_SECONDS,
+    )
 
     if result is None:
         return None
@@ -840,6 +924,20 @@ async def get_next_agent_id_awaiting_evaluation_for_validator_hotkey(
     return result["agent_id"]
 
 
+@db_operation
+async def release_agent_dispatch_claim(conn: DatabaseConnection, agent_id: UUID, validator_hotkey: str) -> None:
+    # Bumping dispatch_version invalidates every candidate list read before this validator's evaluation existed
+    await conn.execute(
+        """
+        UPDATE agent_dispatch
+        SET claimed_by = NULL, claimed_until = NULL, dispatch_version = dispatch_version + 1
+        WHERE agent_id = $1 AND claimed_by = $2
+        """,
+        agent_id,
+        validator_hotkey,
+    )
+
+
 @db_operation
 async def get_pending_work_counts(conn: DatabaseConnection) -> dict[str, int]:
     row = await conn.fetchrow("""
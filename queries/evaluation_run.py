@@ -5,7 +5,7 @@ from uuid import UUID, uuid4
 
 import asyncpg
 
-from models.evaluation_run import EvaluationRun, EvaluationRunLogType, EvaluationRunStatus
+from models.evaluation_run import EvaluationRun, EvaluationRunLogChunk, EvaluationRunLogType, EvaluationRunStatus
 from models.evaluation_set import EvaluationSetProblem
 from queries._row_parsing import parse_jsonb_fields
 from utils.database import DatabaseConnection, db_operation
@@ -431,3 +431,62 @@ async def get_evaluation_run_logs_by_id(
     )
 
     return logs
+
+
+@db_operation
+async def create_evaluation_run_log_chunks(
+    conn: DatabaseConnection, evaluation_id: UUID, chunks: List[tuple[UUID, int, str, int, str]]
+) -> int:
+    """Store (evaluation_run_id, attempt_number, source, offset, logs) chunks of runs in an evaluation.
+
+    Chunks already stored (retries) and chunks of runs outside the evaluation are skipped.
+    Returns the number of chunks stored.
+    """
+    stored = await conn.fetchval(
+        """
+        WITH new_chunks AS (
+            INSERT INTO evaluation_run_log_chunks (evaluation_run_id, attempt_number, source, "offset", logs)
+            SELECT chunk.evaluation_run_id, chunk.attempt_number, chunk.source, chunk."offset", chunk.logs
+            FROM UNNEST($2::uuid[], $3::int[], $4::text[], $5::bigint[], $6::text[])
+                AS chunk(evaluation_run_id, attempt_number, source, "offset", logs)
+            JOIN evaluation_runs er ON er.evaluation_run_id = chunk.evaluation_run_id AND er.evaluation_id = $1
+            ON CONFLICT DO NOTHING
+            RETURNING 1
+        )
+        SELECT COUNT(*) FROM new_chunks
+        """,
+        evaluation_id,
+        [chunk[0] for chunk in chunks],
+        [chunk[1] for chunk in chunks],
+        [chunk[2] for chunk in chunks],
+        [chunk[3] for chunk in chunks],
+        [chunk[4].replace("\x00", "") for chunk in chunks],
+    )
+
+    logger.debug(f"Stored {stored} of {len(chunks)} evaluation run log chunk(s) for evaluation {evaluation_id}")
+    return stored
+
+
+@db_operation
+async def get_evaluation_run_log_chunks_by_id(
+    conn: DatabaseConnection, evaluation_run_id: UUID, source: Optional[str] = None, after_offset: int = -1
+) -> List[EvaluationRunLogChunk]:
+    """Log chunks of the latest attempt of an evaluation run, in (source, offset) order."""
+    rows = await conn.fetch(
+        """
+        SELECT source, "offset", logs
+        FROM evaluation_run_log_chunks
+        WHERE evaluation_run_id = $1
+          AND attempt_number = (
+              SELECT COALESCE(MAX(attempt_number), 1) FROM evaluation_run_log_chunks WHERE evaluation_run_id = $1
+          )
+          AND ($2::text IS NULL OR source = $2)
+          AND "offset" > $3
+        ORDER BY source, "offset"
+        """,
+        evaluation_run_id,
+        source,
+        after_offset,
+    )
+
+    return [EvaluationRunLogChunk(source=row["source"], offset=row["offset"], logs=row["logs"]) for row in rows]
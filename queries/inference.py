@@ -89,3 +89,66 @@ async def update_inference_by_id(
 @db_operation
 async def get_number_of_inferences_for_evaluation_run(conn: DatabaseConnection, evaluation_run_id: UUID) -> int:
     return await conn.fetchval("""SELECT COUNT(*) FROM inferences WHERE evaluation_run_id = $1""", evaluation_run_id)
+
+
+@db_operation
+async def write_inference_batch(
+    conn: DatabaseConnection,
+    *,
+    new_inference_rows: List[tuple],
+    finished_inference_rows: List[tuple],
+) -> None:
+    # Rows come from the inference ledger (inference_gateway/inference_ledger.py).
+    # Inserts run before updates in one transaction, so an inference's response is
+    # never written before the inference itself.
+    async with conn.conn.transaction():
+        if new_inference_rows:
+            await conn.executemany(
+                """
+                INSERT INTO inferences (
+                    inference_id,
+                    evaluation_run_id,
+
+                    provider,
+                    model,
+                    temperature,
+                    messages,
+
+                    status_code,
+                    response,
+                    num_input_tokens,
+                    num_output_tokens,
+                    cost_usd,
+
+                    request_received_at,
+                    response_sent_at
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+                """,
+                [
+                    (
+                        *row[:5],
+                        json.dumps([_remove_null_bytes(message.model_dump()) for message in row[5]]),
+                        row[6],
+                        _remove_null_bytes(row[7]),
+                        *row[8:],
+                    )
+                    for row in new_inference_rows
+                ],
+            )
+
+        if finished_inference_rows:
+            await conn.executemany(
+                """
+                UPDATE inferences
+                SET
+                    status_code = $2,
+                    response = $3,
+                    num_input_tokens = $4,
+                    num_output_tokens = $5,
+                    cost_usd = $6,
+
+                    response_sent_at = $7
+                WHERE inference_id = $1
+                """,
+                [(row[0], row[1], _remove_null_bytes(row[2]), *row[3:]) for row in finished_inference_rows],
+            )
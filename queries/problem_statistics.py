@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -405,3 +405,33 @@ async def get_problem_statistics(conn: DatabaseConnection, set_id: int) -> List[
             problem_stats.append(problem_stat)
 
     return problem_stats
+
+
+@db_operation
+async def get_problem_average_times(conn: DatabaseConnection, set_id: int) -> Dict[str, float]:
+    """Average evaluation run time per problem in a set, in seconds.
+
+    The same figure as ProblemStatistics.average_time, without the rest of the
+    statistics; validators use it to schedule the longest runs first.
+    """
+    rows = await conn.fetch(
+        """
+        SELECT
+            erh.problem_name,
+            AVG(EXTRACT(EPOCH FROM (erh.finished_or_errored_at - erh.started_initializing_agent_at))) AS average_time
+        FROM evaluation_runs_hydrated erh
+            JOIN evaluations e ON erh.evaluation_id = e.evaluation_id
+            JOIN agents a ON e.agent_id = a.agent_id
+        WHERE e.set_id = $1
+            AND NOT EXISTS (
+                SELECT 1 FROM banned_coldkeys bc
+                WHERE bc.miner_coldkey = a.miner_coldkey
+            )
+            AND a.agent_id NOT IN (SELECT agent_id FROM unapproved_agent_ids)
+            AND a.agent_id NOT IN (SELECT agent_id FROM benchmark_agent_ids)
+        GROUP BY erh.problem_name
+        """,
+        set_id,
+    )
+
+    return {row["problem_name"]: float(row["average_time"]) for row in rows if row["average_time"] is not None}
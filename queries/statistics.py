@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Dict, Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -7,12 +8,19 @@ import api.config as config
 from models.evaluation_set import EvaluationSetGroup
 from utils.database import DatabaseConnection, db_operation
 
+PERFECTLY_SOLVED_SINCE_SQL = "TIMESTAMP WITH TIME ZONE '2025-11-27 15:30:00.000 -0500'"  # Problem Set 6
+
 
 class TopScoreOverTime(BaseModel):
     hour: datetime
     top_score: float
 
 
+# NOTE: agent_scores is already maintained incrementally (one row per agent per set), so the
+#       series is derived from it in one pass: each eligible agent's score is bucketed into the
+#       first hour at or after its created_at, and a running MAX over the hours carries the top
+#       score forward. Eligibility (bans, approvals) is applied at read time, so a ban is
+#       reflected immediately.
 @db_operation
 async def get_top_scores_over_time(conn: DatabaseConnection) -> list[TopScoreOverTime]:
     query = """
@@ -20,43 +28,21 @@ async def get_top_scores_over_time(conn: DatabaseConnection) -> list[TopScoreOve
         max_set AS (
             SELECT MAX(set_id) as set_id FROM evaluation_sets
         ),
-        time_series AS (
+        eligible_scores AS (
             SELECT
-            generate_series(
-                (
-                SELECT
-                    MIN(DATE_TRUNC('hour', agent_scores.created_at))
-                FROM
-                    agent_scores
-                JOIN
-                    agents a ON agent_scores.agent_id = a.agent_id
-                WHERE
-                    agent_scores.final_score IS NOT NULL
-                    AND agent_scores.set_id = (SELECT set_id FROM max_set)
-                    AND NOT EXISTS (
-                        SELECT 1 FROM banned_coldkeys bc
-                        WHERE bc.miner_coldkey = a.miner_coldkey
-                    )
-                    AND a.agent_id NOT IN (SELECT agent_id FROM unapproved_agent_ids)
-                    AND a.agent_id NOT IN (SELECT agent_id FROM benchmark_agent_ids)
-                ),
-                DATE_TRUNC('hour', NOW()),
-                '1 hour'::interval
-            ) as hour
-        )
-        SELECT
-        ts.hour,
-        COALESCE(
-            (
-            SELECT
-                MAX(agent_scores.final_score)
+                agent_scores.final_score,
+                DATE_TRUNC('hour', agent_scores.created_at) AS created_hour,
+                -- An agent counts from the first hour mark at or after its created_at
+                DATE_TRUNC('hour', agent_scores.created_at) + CASE
+                    WHEN agent_scores.created_at > DATE_TRUNC('hour', agent_scores.created_at) THEN '1 hour'::interval
+                    ELSE '0'::interval
+                END AS counted_from_hour
             FROM
                 agent_scores
             JOIN
                 agents a ON agent_scores.agent_id = a.agent_id
             WHERE
                 agent_scores.final_score IS NOT NULL
-                AND agent_scores.created_at <= ts.hour
                 AND agent_scores.set_id = (SELECT set_id FROM max_set)
                 AND NOT EXISTS (
                     SELECT 1 FROM banned_coldkeys bc
@@ -64,13 +50,28 @@ async def get_top_scores_over_time(conn: DatabaseConnection) -> list[TopScoreOve
                 )
                 AND a.agent_id NOT IN (SELECT agent_id FROM unapproved_agent_ids)
                 AND a.agent_id NOT IN (SELECT agent_id FROM benchmark_agent_ids)
-            ),
-            0
-        ) as top_score
+        ),
+        hourly_top_scores AS (
+            SELECT counted_from_hour AS hour, MAX(final_score) AS top_score
+            FROM eligible_scores
+            GROUP BY counted_from_hour
+        ),
+        time_series AS (
+            SELECT
+            generate_series(
+                (SELECT MIN(created_hour) FROM eligible_scores),
+                DATE_TRUNC('hour', NOW()),
+                '1 hour'::interval
+            ) as hour
+        )
+        SELECT
+            ts.hour,
+            COALESCE(MAX(hts.top_score) OVER (ORDER BY ts.hour), 0) as top_score
         FROM
-        time_series ts
+            time_series ts
+            LEFT JOIN hourly_top_scores hts ON hts.hour = ts.hour
         ORDER BY
-        ts.hour
+            ts.hour
     """
     rows = await conn.fetch(query)
     return [TopScoreOverTime(**row) for row in rows]
@@ -82,38 +83,36 @@ class PerfectlySolvedOverTime(BaseModel):
     by_family: dict[str, int] = Field(default_factory=dict)
 
 
+# NOTE: Reads agent_problem_solve_rollup, which is updated once per evaluation as it finishes
+#       (see record_evaluation_in_statistics_rollups()), instead of rescanning every evaluation
+#       run. Rows are kept per agent so that eligibility (bans, approvals) can still be applied at
+#       read time.
 @db_operation
 async def get_perfectly_solved_over_time(conn: DatabaseConnection) -> list[PerfectlySolvedOverTime]:
-    query = """
+    query = f"""
         WITH
             time_series AS (
                 SELECT generate_series(
-                    TIMESTAMP WITH TIME ZONE '2025-11-27 15:30:00.000 -0500', -- Problem Set 6
+                    {PERFECTLY_SOLVED_SINCE_SQL},
                     DATE_TRUNC('hour', NOW()),
                     '6 hours'::interval
                 ) as hour
             ),
             perfectly_solved_problems AS (
                 SELECT
-                    erh.benchmark_family,
-                    erh.problem_name,
-                    MIN(erh.created_at) as first_perfectly_solved_at
-                FROM evaluation_runs_hydrated erh
-                    JOIN evaluations e ON erh.evaluation_id = e.evaluation_id
-                    JOIN agents a ON e.agent_id = a.agent_id
-                WHERE erh.created_at >= TIMESTAMP WITH TIME ZONE '2025-11-27 15:30:00.000 -0500' -- Problem Set 6
-                    AND erh.status = 'finished'
-                    AND erh.benchmark_family IS NOT NULL
-                    AND erh.benchmark_family <> ''
-                    AND erh.benchmark_family <> 'custom'
-                    AND NOT EXISTS (
+                    r.benchmark_family,
+                    r.problem_name,
+                    MIN(r.first_run_at) as first_perfectly_solved_at
+                FROM agent_problem_solve_rollup r
+                    JOIN agents a ON r.agent_id = a.agent_id
+                WHERE NOT EXISTS (
                         SELECT 1 FROM banned_coldkeys bc
                         WHERE bc.miner_coldkey = a.miner_coldkey
                     )
-                    AND e.agent_id NOT IN (SELECT agent_id FROM unapproved_agent_ids)
-                    AND e.agent_id NOT IN (SELECT agent_id FROM benchmark_agent_ids)
-                GROUP BY erh.benchmark_family, erh.problem_name
-                HAVING COUNT(*) FILTER (WHERE erh.solved = true)::float / COUNT(*) >= 0.90
+                    AND r.agent_id NOT IN (SELECT agent_id FROM unapproved_agent_ids)
+                    AND r.agent_id NOT IN (SELECT agent_id FROM benchmark_agent_ids)
+                GROUP BY r.benchmark_family, r.problem_name
+                HAVING SUM(r.num_solved)::float / SUM(r.num_runs) >= 0.90
             )
         SELECT
             ts.hour,
@@ -151,6 +150,77 @@ async def get_perfectly_solved_over_time(conn: DatabaseConnection) -> list[Perfe
     return results
 
 
+# Folds the finished runs of the selected evaluations into agent_problem_solve_rollup
+_ROLL_UP_EVALUATION_RUNS_SQL = f"""
+    INSERT INTO agent_problem_solve_rollup AS r (
+        agent_id, benchmark_family, problem_name, num_runs, num_solved, first_run_at
+    )
+    SELECT
+        e.agent_id,
+        erh.benchmark_family,
+        erh.problem_name,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE erh.solved = true),
+        MIN(erh.created_at)
+    FROM evaluation_runs_hydrated erh
+        JOIN evaluations e ON erh.evaluation_id = e.evaluation_id
+    WHERE {{evaluation_filter}}
+        AND erh.created_at >= {PERFECTLY_SOLVED_SINCE_SQL}
+        AND erh.status = 'finished'
+        AND erh.benchmark_family IS NOT NULL
+        AND erh.benchmark_family <> ''
+        AND erh.benchmark_family <> 'custom'
+    GROUP BY e.agent_id, erh.benchmark_family, erh.problem_name
+    ON CONFLICT (agent_id, benchmark_family, problem_name) DO UPDATE SET
+        num_runs = r.num_runs + EXCLUDED.num_runs,
+        num_solved = r.num_solved + EXCLUDED.num_solved,
+        first_run_at = LEAST(r.first_run_at, EXCLUDED.first_run_at)
+"""
+
+
+@db_operation
+async def record_evaluation_in_statistics_rollups(conn: DatabaseConnection, evaluation_id: UUID) -> None:
+    async with conn.conn.transaction():
+        # Each evaluation is folded in at most once, even if its finish is handled twice
+        newly_recorded = await conn.fetchval(
+            """
+            INSERT INTO statistics_rolled_up_evaluations (evaluation_id)
+            VALUES ($1)
+            ON CONFLICT (evaluation_id) DO NOTHING
+            RETURNING evaluation_id
+            """,
+            evaluation_id,
+        )
+        if newly_recorded is None:
+            return
+
+        await conn.execute(_ROLL_UP_EVALUATION_RUNS_SQL.format(evaluation_filter="e.evaluation_id = $1"), evaluation_id)
+
+
+@db_operation
+async def backfill_statistics_rollups(conn: DatabaseConnection) -> int:
+    """Rebuild the statistics rollups from every finished evaluation. Returns the number of evaluations rolled up."""
+    async with conn.conn.transaction():
+        # TRUNCATE locks both tables, so evaluations finishing meanwhile wait and are then skipped as already recorded
+        await conn.execute("TRUNCATE agent_problem_solve_rollup, statistics_rolled_up_evaluations")
+        num_evaluations = await conn.fetchval(
+            """
+            WITH recorded AS (
+                INSERT INTO statistics_rolled_up_evaluations (evaluation_id)
+                SELECT evaluation_id FROM evaluations WHERE finished_at IS NOT NULL
+                RETURNING evaluation_id
+            )
+            SELECT COUNT(*) FROM recorded
+            """
+        )
+        await conn.execute(
+            _ROLL_UP_EVALUATION_RUNS_SQL.format(
+                evaluation_filter="e.evaluation_id IN (SELECT evaluation_id FROM statistics_rolled_up_evaluations)"
+            )
+        )
+    return num_evaluations
+
+
 # NOTE: None is returned if there are no successful evaluations for a given
 #       evaluation set group.
 @db_operation
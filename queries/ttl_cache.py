@@ -0,0 +1,88 @@
+from typing import Optional, Tuple
+
+from utils.database import DatabaseConnection, db_operation, db_transaction
+
+# Expired rows are only overwritten when their key is recalculated, so every
+# this-many writes the backend also sweeps out rows that nobody asks for anymore
+TTL_CACHE_SWEEP_EVERY_N_WRITES = 100
+
+
+@db_operation
+async def get_ttl_cache_entry(conn: DatabaseConnection, key: str) -> Optional[Tuple[bytes, float]]:
+    result = await conn.fetchrow(
+        """
+        SELECT value, EXTRACT(EPOCH FROM (expires_at - NOW()))::float AS remaining_seconds
+        FROM ttl_cache_entries
+        WHERE key = $1 AND expires_at > NOW()
+        """,
+        key,
+    )
+
+    if result is None:
+        return None
+
+    return result["value"], result["remaining_seconds"]
+
+
+@db_operation
+async def get_ttl_cache_generation(conn: DatabaseConnection) -> int:
+    return await conn.fetchval("SELECT generation FROM ttl_cache_generation")
+
+
+@db_operation
+async def upsert_ttl_cache_entry(
+    conn: DatabaseConnection, key: str, value: bytes, ttl_seconds: float, generation: int
+) -> None:
+    # FOR SHARE makes a concurrent bump_ttl_cache_generation() either wait for this write (and then delete
+    # it) or finish first (and then the generation no longer matches, so nothing is written)
+    await conn.execute(
+        """
+        INSERT INTO ttl_cache_entries (key, value, expires_at)
+        SELECT $1, $2, NOW() + make_interval(secs => $3)
+        FROM (SELECT 1 FROM ttl_cache_generation WHERE generation = $4 FOR SHARE) AS unchanged_generation
+        ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, expires_at = EXCLUDED.expires_at
+        """,
+        key,
+        value,
+        float(ttl_seconds),
+        generation,
+    )
+
+
+@db_operation
+async def delete_expired_ttl_cache_entries(conn: DatabaseConnection) -> None:
+    await conn.execute("DELETE FROM ttl_cache_entries WHERE expires_at <= NOW()")
+
+
+@db_operation
+async def delete_all_ttl_cache_entries(conn: DatabaseConnection) -> None:
+    await conn.execute("DELETE FROM ttl_cache_entries")
+
+
+@db_operation
+async def bump_ttl_cache_generation(conn: DatabaseConnection) -> None:
+    await conn.execute("UPDATE ttl_cache_generation SET generation = generation + 1")
+
+
+class DatabaseTTLCacheBackend:
+    """Shared ttl_cache backend that stores entries in Postgres, so every API worker reuses one calculation."""
+
+    def __init__(self):
+        self.num_writes = 0
+
+    async def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        return await get_ttl_cache_entry(key)
+
+    async def get_generation(self) -> int:
+        return await get_ttl_cache_generation()
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float, generation: int) -> None:
+        await upsert_ttl_cache_entry(key, value, ttl_seconds, generation)
+        self.num_writes += 1
+        if self.num_writes % TTL_CACHE_SWEEP_EVERY_N_WRITES == 0:
+            await delete_expired_ttl_cache_entries()
+
+    async def clear(self) -> None:
+        async with db_transaction():
+            await bump_ttl_cache_generation()
+            await delete_all_ttl_cache_entries()
@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import stat
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 IGNORED_ARTIFACT_NAMES = {".DS_Store"}
 IGNORED_ARTIFACT_SUFFIXES = {".pyc", ".pyo"}
 IGNORED_ARTIFACT_PARTS = {"__pycache__"}
+DIGEST_MANIFEST_VERSION = 1
+
+# compute_task_digest reads files in batches of about this size on a pool of worker threads.
+# At most two batches per worker are in flight, which bounds its memory use.
+DIGEST_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_DIGEST_WORKERS = min(8, os.cpu_count() or 1)
 
 
 def is_ignored_artifact(path: Path) -> bool:
@@ -21,17 +32,199 @@ def is_ignored_artifact(path: Path) -> bool:
     )
 
 
-def compute_task_digest(task_dir: Path) -> str:
-    """Hash the exact task directory Harbor will execute."""
+def _task_files(task_dir: Path) -> list[Path]:
+    return sorted(p for p in task_dir.rglob("*") if p.is_file() and not is_ignored_artifact(p))
+
+
+class TaskDigestBuilder:
+    """Compute ``compute_task_digest`` incrementally from files fed in digest order.
+
+    Files must be added in the order ``compute_task_digest`` sorts them (by path
+    components) with their final mode, each followed by its contents. A file fed
+    out of order marks the builder ``invalid`` instead of producing a wrong digest.
+    """
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+        self.last_parts: tuple[str, ...] | None = None
+        self.file_stats: dict[str, list[int]] = {}
+        self.invalid = False
+
+    def start_file(self, relative_path: str, mode: int) -> None:
+        parts = tuple(Path(relative_path).parts)
+        if self.last_parts is not None and parts <= self.last_parts:
+            self.invalid = True
+        self.last_parts = parts
+        self.hash.update(relative_path.encode("utf-8"))
+        self.hash.update(b"\0")
+        self.hash.update(f"{mode:o}".encode("utf-8"))
+        self.hash.update(b"\0")
+
+    def update(self, data: bytes) -> None:
+        self.hash.update(data)
+
+    def end_file(self) -> None:
+        self.hash.update(b"\0")
+
+    def record_file_stat(self, relative_path: str, file_stat: os.stat_result) -> None:
+        self.file_stats[relative_path] = [file_stat.st_size, file_stat.st_mtime_ns, stat.S_IMODE(file_stat.st_mode)]
+
+    def hexdigest(self) -> str:
+        return f"sha256:{self.hash.hexdigest()}"
+
 
-    digest = hashlib.sha256()
-    for path in sorted(p for p in task_dir.rglob("*") if p.is_file() and not is_ignored_artifact(p)):
+# One piece of a file for the digest: (path, relative path, mode, offset, length or None to read to EOF, is last piece)
+_DigestPiece = tuple[Path, str, int, int, "int | None", bool]
+
+
+def _read_pieces(pieces: list[_DigestPiece]) -> list[bytes]:
+    data = []
+    for path, _, _, offset, length, _ in pieces:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data.append(f.read(-1 if length is None else length))
+    return data
+
+
+def _digest_jobs(task_dir: Path) -> Iterator[list[_DigestPiece]]:
+    """Batches of pieces to read, in digest order.
+
+    Large files are split into ``DIGEST_CHUNK_SIZE`` pieces, one per batch, and
+    consecutive small files are grouped into batches of about that size, so the
+    pool isn't dominated by per-task overhead on trees of many tiny files.
+    """
+    batch: list[_DigestPiece] = []
+    batch_bytes = 0
+    for path in _task_files(task_dir):
+        file_stat = path.stat()
         relative_path = path.relative_to(task_dir).as_posix()
-        mode = stat.S_IMODE(path.stat().st_mode)
-        digest.update(relative_path.encode("utf-8"))
-        digest.update(b"\0")
-        digest.update(f"{mode:o}".encode("utf-8"))
-        digest.update(b"\0")
-        digest.update(path.read_bytes())
-        digest.update(b"\0")
-    return f"sha256:{digest.hexdigest()}"
+        mode = stat.S_IMODE(file_stat.st_mode)
+        num_chunks = max(1, -(-file_stat.st_size // DIGEST_CHUNK_SIZE))
+        for index in range(num_chunks):
+            is_last = index == num_chunks - 1
+            # The last piece reads to EOF, like read_bytes() would
+            batch.append(
+                (path, relative_path, mode, index * DIGEST_CHUNK_SIZE, None if is_last else DIGEST_CHUNK_SIZE, is_last)
+            )
+            batch_bytes += file_stat.st_size - index * DIGEST_CHUNK_SIZE if is_last else DIGEST_CHUNK_SIZE
+            if batch_bytes >= DIGEST_CHUNK_SIZE or len(batch) >= 256:
+                yield batch
+                batch, batch_bytes = [], 0
+    if batch:
+        yield batch
+
+
+def compute_task_digest(task_dir: Path, *, max_workers: int | None = None) -> str:
+    """Hash the exact task directory Harbor will execute.
+
+    Files are read in batches of about ``DIGEST_CHUNK_SIZE`` bytes by
+    ``max_workers`` threads (by default ``DEFAULT_DIGEST_WORKERS``), ahead of a
+    single hasher that consumes them in digest order. Reads and hashing both
+    release the GIL, so I/O for many small files or a few huge ones overlaps
+    with hashing while the digest stays identical to a sequential pass.
+    """
+
+    builder = TaskDigestBuilder()
+    jobs = _digest_jobs(task_dir)
+    num_workers = DEFAULT_DIGEST_WORKERS if max_workers is None else max(1, max_workers)
+
+    def consume(pieces: list[_DigestPiece], data: list[bytes]) -> None:
+        for (_, relative_path, mode, offset, _, is_last), piece_data in zip(pieces, data):
+            if offset == 0:
+                builder.start_file(relative_path, mode)
+            builder.update(piece_data)
+            if is_last:
+                builder.end_file()
+
+    if num_workers == 1:
+        for pieces in jobs:
+            consume(pieces, _read_pieces(pieces))
+        return builder.hexdigest()
+
+    with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="task-digest") as pool:
+        in_flight: deque[tuple[list[_DigestPiece], Future]] = deque()
+
+        def submit_next() -> None:
+            pieces = next(jobs, None)
+            if pieces is not None:
+                in_flight.append((pieces, pool.submit(_read_pieces, pieces)))
+
+        for _ in range(2 * num_workers):
+            submit_next()
+        while in_flight:
+            pieces, future = in_flight.popleft()
+            submit_next()
+            consume(pieces, future.result())
+    return builder.hexdigest()
+
+
+def digest_manifest_path(task_dir: Path) -> Path:
+    """Return the sidecar manifest path for a task directory.
+
+    The manifest lives next to the task directory, never inside it, so it does
+    not change the digest it records.
+    """
+
+    return task_dir.parent / f".{task_dir.name}.manifest.json"
+
+
+def _file_stats(task_dir: Path) -> dict[str, list[int]]:
+    stats = {}
+    for path in _task_files(task_dir):
+        file_stat = path.stat()
+        stats[path.relative_to(task_dir).as_posix()] = [
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            stat.S_IMODE(file_stat.st_mode),
+        ]
+    return stats
+
+
+def write_digest_manifest(task_dir: Path, task_digest: str, *, file_stats: dict[str, list[int]] | None = None) -> Path:
+    """Record a verified digest plus the size, mtime and mode of every task file.
+
+    Only call this after ``compute_task_digest`` matched ``task_digest``. Pass
+    ``file_stats`` (e.g. from a ``TaskDigestBuilder``) to skip walking the task.
+    """
+
+    manifest_path = digest_manifest_path(task_dir)
+    if file_stats is None:
+        file_stats = _file_stats(task_dir)
+    manifest = {"version": DIGEST_MANIFEST_VERSION, "task_digest": task_digest, "files": file_stats}
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+    tmp_path.write_text(json.dumps(manifest))
+    os.replace(tmp_path, manifest_path)
+    return manifest_path
+
+
+def read_manifest_digest(task_dir: Path) -> str | None:
+    """Return the manifest's digest if every task file still has its recorded stats.
+
+    Returns None when there is no readable manifest or any file was added,
+    removed, resized, touched or re-moded since it was written.
+    """
+
+    try:
+        manifest = json.loads(digest_manifest_path(task_dir).read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != DIGEST_MANIFEST_VERSION:
+        return None
+    if manifest.get("files") != _file_stats(task_dir):
+        return None
+    task_digest = manifest.get("task_digest")
+    return task_digest if isinstance(task_digest, str) else None
+
+
+def resolve_task_digest(task_dir: Path, *, paranoid: bool = False) -> str:
+    """Return the digest of a task directory, trusting a matching manifest.
+
+    With ``paranoid`` set, or without a matching manifest, every file is re-hashed.
+    """
+
+    if not paranoid:
+        recorded_digest = read_manifest_digest(task_dir)
+        if recorded_digest is not None:
+            return recorded_digest
+    return compute_task_digest(task_dir)
@@ -0,0 +1,112 @@
+"""Throughput benchmark for ``compute_task_digest`` over synthetic task trees.
+
+Builds a tree of many small files plus a few huge ones, then hashes it with
+each worker count and reports MiB/s. Every run must produce the same digest.
+
+    uv run python -m ridges_harbor.digest_benchmark
+    uv run python -m ridges_harbor.digest_benchmark --small-files 50000 --large-files 2 --large-file-mb 2048 --workers 1,4,8
+
+Run it on the disk the task cache lives on (``--dir``). The page cache will
+serve every run after the first unless it is dropped in between
+(``echo 3 > /proc/sys/vm/drop_caches``), so pass ``--repeat`` to see both.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from ridges_harbor.digest import DEFAULT_DIGEST_WORKERS, compute_task_digest
+
+_WRITE_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def build_synthetic_task_tree(
+    root: Path, *, num_small_files: int, small_file_bytes: int, num_large_files: int, large_file_bytes: int
+) -> int:
+    """Write a synthetic task under ``root`` and return its total size in bytes."""
+    total_bytes = 0
+    for index in range(num_small_files):
+        path = root / "environment" / f"pkg{index // 1000}" / f"module{index}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(small_file_bytes))
+        total_bytes += small_file_bytes
+
+    for index in range(num_large_files):
+        path = root / "environment" / "data" / f"blob{index}.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            remaining = large_file_bytes
+            while remaining > 0:
+                chunk = os.urandom(min(_WRITE_CHUNK_SIZE, remaining))
+                f.write(chunk)
+                remaining -= len(chunk)
+        total_bytes += large_file_bytes
+
+    return total_bytes
+
+
+def benchmark_task_digest(task_dir: Path, *, total_bytes: int, worker_counts: list[int], repeat: int = 1) -> list[dict]:
+    """Hash ``task_dir`` with every worker count and return one result per run."""
+    results = []
+    digests = set()
+    for num_workers in worker_counts:
+        for attempt in range(repeat):
+            started_at = time.perf_counter()
+            digest = compute_task_digest(task_dir, max_workers=num_workers)
+            elapsed = max(time.perf_counter() - started_at, 1e-9)
+            digests.add(digest)
+            results.append(
+                {
+                    "workers": num_workers,
+                    "attempt": attempt + 1,
+                    "seconds": elapsed,
+                    "mib_per_second": total_bytes / elapsed / (1024 * 1024),
+                }
+            )
+
+    if len(digests) != 1:
+        raise RuntimeError(f"Digests differ between worker counts: {sorted(digests)}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--small-files", type=int, default=20_000)
+    parser.add_argument("--small-file-kb", type=int, default=8)
+    parser.add_argument("--large-files", type=int, default=2)
+    parser.add_argument("--large-file-mb", type=int, default=512)
+    parser.add_argument("--workers", default=f"1,{DEFAULT_DIGEST_WORKERS}")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--dir", type=Path, default=None, help="Where to build the synthetic tree")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp_dir:
+        task_dir = Path(tmp_dir) / "task"
+        total_bytes = build_synthetic_task_tree(
+            task_dir,
+            num_small_files=args.small_files,
+            small_file_bytes=args.small_file_kb * 1024,
+            num_large_files=args.large_files,
+            large_file_bytes=args.large_file_mb * 1024 * 1024,
+        )
+        print(
+            f"Synthetic task: {args.small_files} x {args.small_file_kb} KiB + "
+            f"{args.large_files} x {args.large_file_mb} MiB = {total_bytes / (1024 * 1024):.0f} MiB"
+        )
+
+        worker_counts = [int(count) for count in args.workers.split(",")]
+        for result in benchmark_task_digest(
+            task_dir, total_bytes=total_bytes, worker_counts=worker_counts, repeat=args.repeat
+        ):
+            print(
+                f"workers={result['workers']:<3} attempt={result['attempt']} "
+                f"{result['seconds']:.2f}s {result['mib_per_second']:.0f} MiB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
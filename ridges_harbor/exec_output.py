@@ -0,0 +1,134 @@
+"""Collecting command output from Kubernetes exec WebSocket streams.
+
+``KubernetesEnvironment.exec`` runs a command in the Pod and waits for its
+stdout, stderr and exit status.  ``ExecOutputReader`` does that with one
+blocking ``update()`` per received frame: output is moved straight out of the
+stream's channel buffers into bounded buffers (no ``peek_*`` round trips, no
+string re-concatenation), and it returns as soon as the exit status arrives
+rather than waiting for the server to close the stream.  A deadline is
+enforced inside the read loop, so a timed-out exec doesn't leave a thread
+reading the stream after ``exec`` has given up on it.
+
+Everything in this module blocks on WebSocket I/O and must be run via
+``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any
+
+STDOUT_CHANNEL = 1
+STDERR_CHANNEL = 2
+# Carries the exec's final v1.Status once the command has exited
+STATUS_CHANNEL = 3
+
+# Most output kept per stream; beyond it the oldest output is dropped
+EXEC_OUTPUT_MAX_CHARS = 16 * 1024 * 1024
+# Longest single wait for a frame, so deadlines and stop() are noticed
+EXEC_POLL_INTERVAL_SEC = 1.0
+
+
+class OutputRingBuffer:
+    """Keeps the last ``max_chars`` characters appended to it."""
+
+    def __init__(self, max_chars: int = EXEC_OUTPUT_MAX_CHARS):
+        self.max_chars = max_chars
+        self.chunks: deque[str] = deque()
+        self.num_chars = 0
+        self.num_dropped_chars = 0
+
+    def append(self, chunk: str) -> None:
+        self.chunks.append(chunk)
+        self.num_chars += len(chunk)
+        while self.num_chars > self.max_chars:
+            excess = self.num_chars - self.max_chars
+            oldest = self.chunks[0]
+            if len(oldest) <= excess:
+                self.chunks.popleft()
+                dropped = len(oldest)
+            else:
+                self.chunks[0] = oldest[excess:]
+                dropped = excess
+            self.num_chars -= dropped
+            self.num_dropped_chars += dropped
+
+    def getvalue(self) -> str:
+        value = "".join(self.chunks)
+        if self.num_dropped_chars:
+            return f"<truncated {self.num_dropped_chars} chars>\n" + value
+        return value
+
+
+class ExecOutputReader:
+    """Reads an exec stream's stdout, stderr and exit status until the command exits."""
+
+    def __init__(self, resp: Any, *, max_chars: int = EXEC_OUTPUT_MAX_CHARS):
+        self.resp = resp
+        self.stdout = OutputRingBuffer(max_chars)
+        self.stderr = OutputRingBuffer(max_chars)
+        self.status: str | None = None
+        self.started_at = time.monotonic()
+        self.finished_at: float | None = None
+        self.stopped = threading.Event()
+
+    @property
+    def elapsed_sec(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def return_code(self) -> int | None:
+        """The exit code from the status channel, or None if the stream ended without one.
+
+        Parsed the way kubernetes' WSClient.returncode does, so a malformed
+        status raises the same TypeError/ValueError/KeyError/IndexError.
+        """
+        if self.status is None:
+            return None
+        status = json.loads(self.status)
+        if status["status"] == "Success":
+            return 0
+        return int(status["details"]["causes"][0]["message"])
+
+    def read(self, timeout_sec: float | None = None) -> bool:
+        """Collect output until the exit status arrives or the stream closes.
+
+        Returns False if ``timeout_sec`` elapsed (or ``stop()`` was called) first.
+        """
+        deadline = None if timeout_sec is None else self.started_at + timeout_sec
+        try:
+            while self.status is None and self.resp.is_open():
+                if self.stopped.is_set():
+                    return False
+                wait = EXEC_POLL_INTERVAL_SEC
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return False
+                # Returns as soon as a frame arrives, buffering it into the stream's channels
+                self.resp.update(timeout=wait)
+                self._take_channels()
+            self._take_channels()
+            return True
+        finally:
+            self.finished_at = time.monotonic()
+
+    def stop(self) -> None:
+        """Make a read() running in another thread give up within EXEC_POLL_INTERVAL_SEC."""
+        self.stopped.set()
+
+    def _take_channels(self) -> None:
+        # WSClient keeps received data in its _channels dict until it is read. Taking it from
+        # there directly avoids the extra poll() that every peek_*/read_* call performs.
+        channels = self.resp._channels
+        stdout = channels.pop(STDOUT_CHANNEL, None)
+        if stdout:
+            self.stdout.append(stdout)
+        stderr = channels.pop(STDERR_CHANNEL, None)
+        if stderr:
+            self.stderr.append(stderr)
+        if STATUS_CHANNEL in channels:
+            self.status = channels.pop(STATUS_CHANNEL)
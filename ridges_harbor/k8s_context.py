@@ -0,0 +1,68 @@
+"""Process-wide state shared by every Kubernetes-mode Harbor run.
+
+In Kubernetes mode every evaluation run used to load the kubeconfig (or
+in-cluster config) and build fresh ``CoreV1Api``/``BatchV1Api`` objects, each
+with its own ``ApiClient`` and urllib3 connection pool, and to ask the
+platform for a new presigned task-download URL.  With many concurrent runs
+that is a config load, a TLS handshake and a platform request per trial.
+This module keeps that state once per process instead:
+
+* ``get_k8s_api_client`` returns one configured ``ApiClient`` per kubeconfig
+  context, so the runner, every ``KubernetesEnvironment`` and
+  ``pre_build_images`` share one connection pool.  The global default
+  configuration is left untouched.
+* ``presigned_url_cache`` remembers each task archive's presigned URL until
+  fewer than ``PRESIGNED_URL_MIN_REMAINING_SEC`` of its lifetime remain, so a
+  build Job started from a cached URL still has time to download the archive.
+  Concurrent fetches for the same task share one platform request, and
+  failures are not cached (see ``SingleFlightTTLCache``).
+
+``get_k8s_api_client`` loads config from disk and must be run via
+``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from kubernetes import client as k8s_client
+from kubernetes import config as k8s_config
+
+from ridges_harbor.single_flight_cache import SingleFlightTTLCache
+
+# Lifetime of the platform's task-download URLs (see /validator/task-download-url)
+PRESIGNED_URL_TTL_SEC = 300
+# A cached URL is only handed out while at least this much of its lifetime is left
+PRESIGNED_URL_MIN_REMAINING_SEC = 180
+
+_api_clients: dict[str | None, k8s_client.ApiClient] = {}
+_api_clients_lock = threading.Lock()
+
+
+def get_k8s_api_client(kubeconfig_context: str | None = None) -> k8s_client.ApiClient:
+    """The process's ``ApiClient`` for ``kubeconfig_context``, loading in-cluster or kubeconfig config once."""
+    with _api_clients_lock:
+        api_client = _api_clients.get(kubeconfig_context)
+        if api_client is None:
+            configuration = k8s_client.Configuration()
+            try:
+                k8s_config.load_incluster_config(client_configuration=configuration)
+            except k8s_config.ConfigException:
+                k8s_config.load_kube_config(context=kubeconfig_context, client_configuration=configuration)
+            api_client = k8s_client.ApiClient(configuration)
+            _api_clients[kubeconfig_context] = api_client
+        return api_client
+
+
+def get_k8s_apis(kubeconfig_context: str | None = None) -> tuple[k8s_client.CoreV1Api, k8s_client.BatchV1Api]:
+    api_client = get_k8s_api_client(kubeconfig_context)
+    return k8s_client.CoreV1Api(api_client), k8s_client.BatchV1Api(api_client)
+
+
+def presigned_url_ttl_sec(_url: str) -> float:
+    # The URL's lifetime starts when the platform signs it, which the cache counts from
+    return PRESIGNED_URL_TTL_SEC - PRESIGNED_URL_MIN_REMAINING_SEC
+
+
+# task digest -> presigned task-download URL
+presigned_url_cache: SingleFlightTTLCache[str, str] = SingleFlightTTLCache(presigned_url_ttl_sec)
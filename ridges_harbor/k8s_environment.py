@@ -23,12 +23,12 @@ Two classes are defined here:
 from __future__ import annotations
 
 import asyncio
-import io
 import logging
 import re
 import shlex
 import ssl
 import tarfile
+import time
 from pathlib import Path
 from typing import Any, Sequence
 
@@ -37,13 +37,17 @@ from harbor.models.environment_type import EnvironmentType
 from harbor.models.task.config import EnvironmentConfig
 from harbor.models.trial.paths import EnvironmentPaths, TrialPaths
 from kubernetes import client as k8s_client
-from kubernetes import config as k8s_config
 from kubernetes.client.rest import ApiException
 from kubernetes.stream import stream
 from tenacity import retry, stop_after_attempt, wait_exponential
 from websocket import WebSocketException
 
+from ridges_harbor.exec_output import ExecOutputReader
+from ridges_harbor.k8s_context import get_k8s_apis
+from ridges_harbor.k8s_informer import get_build_job_informer
+from ridges_harbor.registry_cache import image_existence_cache
 from ridges_harbor.runtime_contract import ExecTransportError
+from ridges_harbor.tar_stream import ExecStdinWriter, ExecStdoutReader, iter_dir_files, log_transfer
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +58,8 @@ BUILD_MEMORY_TIERS: list[tuple[str, str]] = [
     ("16Gi", "28Gi"),  # fits ccx33 (32GB) evaluator nodes
 ]
 BUILD_MEMORY_TIER_ANNOTATION = "ridges.ai/build-memory-tier"
+# How often a build Job is polled while the shared build Job watch is down
+BUILD_JOB_POLL_INTERVAL_SEC = 5
 
 # ---------------------------------------------------------------------------
 # KubernetesEnvironment – generic base
@@ -159,13 +165,8 @@ class KubernetesEnvironment(BaseEnvironment):
         """No local file validation needed – the image lives in the registry."""
 
     def _init_k8s_client(self) -> None:
-        """Load kubeconfig (or in-cluster config) and create API clients."""
-        try:
-            k8s_config.load_incluster_config()
-        except k8s_config.ConfigException:
-            k8s_config.load_kube_config(context=self.kubeconfig_context)
-        self._core_api = k8s_client.CoreV1Api()
-        self._batch_api = k8s_client.BatchV1Api()
+        """Create API clients on the process's shared, already configured ApiClient."""
+        self._core_api, self._batch_api = get_k8s_apis(self.kubeconfig_context)
 
     async def _ensure_client(self) -> None:
         if self._core_api is None:
@@ -268,6 +269,7 @@ class KubernetesEnvironment(BaseEnvironment):
     async def start(self, force_build: bool) -> None:
         """Create the Pod and wait until all containers are ready."""
         await self._ensure_client()
+        started_at = time.monotonic()
 
         pod = self._build_pod()
 
@@ -300,6 +302,7 @@ class KubernetesEnvironment(BaseEnvironment):
                 f"Failed to create log directories in Pod {self.pod_name}: "
                 f"stdout={mkdir_result.stdout}, stderr={mkdir_result.stderr}"
             )
+        self.logger.info(f"Pod {self.pod_name} ready in {time.monotonic() - started_at:.1f}s")
 
     async def stop(self, delete: bool = True) -> None:
         """Delete the Pod (optionally)."""
@@ -358,33 +361,40 @@ class KubernetesEnvironment(BaseEnvironment):
                 stdout=True,
                 tty=False,
                 _preload_content=False,
+                # Output is collected by ExecOutputReader; don't keep a second copy of it
+                capture_all=False,
             )
 
-            if timeout_sec is not None:
-                try:
-                    stdout, stderr = await asyncio.wait_for(
-                        asyncio.to_thread(self._read_exec_output, resp),
-                        timeout=timeout_sec,
-                    )
-                except asyncio.TimeoutError:
-                    return ExecResult(
-                        stdout=None,
-                        stderr=f"Command timed out after {timeout_sec} seconds",
-                        return_code=124,
-                    )
-            else:
-                stdout, stderr = await asyncio.to_thread(self._read_exec_output, resp)
+            reader = ExecOutputReader(resp)
+            try:
+                finished = await asyncio.to_thread(reader.read, timeout_sec)
+            except asyncio.CancelledError:
+                reader.stop()
+                raise
+            self.logger.debug(
+                f"Exec in Pod {self.pod_name} {'returned' if finished else 'timed out'} after "
+                f"{reader.elapsed_sec:.3f}s ({reader.stdout.num_chars} chars of stdout, "
+                f"{reader.stderr.num_chars} chars of stderr)"
+            )
+            if not finished:
+                return ExecResult(
+                    stdout=None,
+                    stderr=f"Command timed out after {timeout_sec} seconds",
+                    return_code=124,
+                )
 
-            resp.run_forever(timeout=0)
             try:
-                return_code = resp.returncode
+                return_code = reader.return_code
+                if return_code is None:
+                    resp.run_forever(timeout=0)
+                    return_code = resp.returncode
             except (TypeError, ValueError, KeyError, IndexError) as exc:
                 raise ExecTransportError(
                     f"Exec stream to Pod {self.pod_name} returned a malformed exit status: {exc!r}"
                 ) from exc
             if return_code is None:
                 raise ExecTransportError(f"Exec stream to Pod {self.pod_name} closed without an exit status")
-            return ExecResult(stdout=stdout, stderr=stderr, return_code=return_code)
+            return ExecResult(stdout=reader.stdout.getvalue(), stderr=reader.stderr.getvalue(), return_code=return_code)
 
         except ExecTransportError:
             raise
@@ -417,8 +427,6 @@ class KubernetesEnvironment(BaseEnvironment):
         await self._wait_for_container_exec_ready()
 
         source_path = Path(source_path)
-        payload = await asyncio.to_thread(self._build_tar_single_file, source_path, Path(target_path).name)
-
         target_dir = str(Path(target_path).parent)
         await self.exec(f"mkdir -p {shlex.quote(target_dir)}", user="root")
 
@@ -435,7 +443,12 @@ class KubernetesEnvironment(BaseEnvironment):
             tty=False,
             _preload_content=False,
         )
-        await asyncio.to_thread(self._write_tar_stream, resp, payload)
+        await asyncio.to_thread(
+            self._write_tar_stream,
+            resp,
+            [(source_path, Path(target_path).name)],
+            f"to Pod {self.pod_name}:{target_path}",
+        )
 
     @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=2, max=30), reraise=True)
     async def upload_dir(self, source_dir: Path | str, target_dir: str) -> None:
@@ -443,7 +456,7 @@ class KubernetesEnvironment(BaseEnvironment):
         await self._wait_for_container_exec_ready()
 
         source_dir = Path(source_dir)
-        payload = await asyncio.to_thread(self._build_tar_dir, source_dir)
+        files = await asyncio.to_thread(iter_dir_files, source_dir)
 
         await self.exec(f"mkdir -p {shlex.quote(target_dir)}", user="root")
 
@@ -461,7 +474,7 @@ class KubernetesEnvironment(BaseEnvironment):
             _preload_content=False,
         )
         try:
-            await asyncio.to_thread(self._write_tar_stream, resp, payload)
+            await asyncio.to_thread(self._write_tar_stream, resp, files, f"to Pod {self.pod_name}:{target_dir}")
         except Exception as exc:
             raise RuntimeError(f"Failed to write tar data to Pod {self.pod_name}: {exc}") from exc
 
@@ -485,9 +498,9 @@ class KubernetesEnvironment(BaseEnvironment):
             _preload_content=False,
         )
 
-        tar_data, _stderr_data = await asyncio.to_thread(self._read_tar_stream, resp)
-
-        await asyncio.to_thread(self._extract_tar_member, tar_data, source_path, target_path)
+        reader = ExecStdoutReader(resp)
+        await asyncio.to_thread(self._extract_tar_member, reader, source_path, target_path)
+        log_transfer("Downloaded", f"from Pod {self.pod_name}:{source_path}", reader.num_bytes, reader.started_at)
 
     @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=2, max=30), reraise=True)
     async def download_dir(self, source_dir: str, target_dir: Path | str) -> None:
@@ -512,18 +525,26 @@ class KubernetesEnvironment(BaseEnvironment):
         except ApiException as exc:
             raise RuntimeError(f"Failed to start tar download from Pod {self.pod_name}: {exc}") from exc
 
-        tar_data, stderr_data = await asyncio.to_thread(self._read_tar_stream, resp)
+        # Members are extracted as they arrive; stderr is only complete once the stream has been drained
+        reader = ExecStdoutReader(resp)
+        tar_error = None
+        try:
+            await asyncio.to_thread(self._extract_tar_all, reader, target_dir)
+        except tarfile.TarError as exc:
+            tar_error = exc
+            await asyncio.to_thread(reader.drain)
 
+        stderr_data = reader.stderr
         if stderr_data and ("No such file or directory" in stderr_data or "cannot cd" in stderr_data):
             raise RuntimeError(f"Failed to access directory {source_dir} in Pod {self.pod_name}: {stderr_data.strip()}")
 
-        if not tar_data:
+        if reader.num_bytes == 0:
             raise RuntimeError(f"No data received when downloading {source_dir} from Pod {self.pod_name}")
 
-        try:
-            await asyncio.to_thread(self._extract_tar_all, tar_data, target_dir)
-        except tarfile.TarError as exc:
-            raise RuntimeError(f"Failed to extract {source_dir} from Pod {self.pod_name}: {exc}") from exc
+        if tar_error is not None:
+            raise RuntimeError(f"Failed to extract {source_dir} from Pod {self.pod_name}: {tar_error}") from tar_error
+
+        log_transfer("Downloaded", f"from Pod {self.pod_name}:{source_dir}", reader.num_bytes, reader.started_at)
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -535,67 +556,34 @@ class KubernetesEnvironment(BaseEnvironment):
     # runs.
     # ------------------------------------------------------------------
 
-    def _read_exec_output(self, resp: Any) -> tuple[str, str]:
-        stdout = ""
-        stderr = ""
-        while resp.is_open():
-            resp.update(timeout=1)
-            if resp.peek_stdout():
-                stdout += resp.read_stdout()
-            if resp.peek_stderr():
-                stderr += resp.read_stderr()
-        return stdout, stderr
-
-    def _read_tar_stream(self, resp: Any) -> tuple[bytes, str]:
-        """Blocking: drain a WebSocket exec stream, returning (stdout_bytes, stderr_text)."""
-        tar_data = b""
-        stderr_data = ""
-        while resp.is_open():
-            resp.update(timeout=1)
-            if resp.peek_stdout():
-                chunk = resp.read_stdout()
-                tar_data += chunk.encode("utf-8", errors="surrogateescape") if isinstance(chunk, str) else chunk
-            if resp.peek_stderr():
-                stderr_data += resp.read_stderr()
-        return tar_data, stderr_data
-
-    def _write_tar_stream(self, resp: Any, payload: bytes) -> None:
-        """Blocking: write payload to the exec stream stdin and drain until closed."""
-        resp.write_stdin(payload)
-        resp.run_forever(timeout=1)
-        resp.close()
-
-    def _build_tar_single_file(self, source_path: Path, arcname: str) -> bytes:
-        """Blocking: build an in-memory tar archive containing a single file."""
-        tar_buffer = io.BytesIO()
-        with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
-            tar.add(str(source_path), arcname=arcname)
-        return tar_buffer.getvalue()
-
-    def _build_tar_dir(self, source_dir: Path) -> bytes:
-        """Blocking: build an in-memory tar archive of every file under source_dir."""
-        tar_buffer = io.BytesIO()
-        with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
-            for item in source_dir.rglob("*"):
-                if item.is_file():
-                    tar.add(str(item), arcname=str(item.relative_to(source_dir)))
-        return tar_buffer.getvalue()
-
-    def _extract_tar_member(self, tar_data: bytes, source_path: str, target_path: Path) -> None:
-        """Blocking: extract a single named member from an in-memory tar archive."""
-        tar_buffer = io.BytesIO(tar_data)
-        with tarfile.open(fileobj=tar_buffer, mode="r") as tar:
-            for member in tar.getmembers():
+    def _write_tar_stream(self, resp: Any, files: list[tuple[Path, str]], description: str) -> None:
+        """Blocking: stream a tar archive of files to the exec stream stdin and drain until closed."""
+        writer = ExecStdinWriter(resp)
+        try:
+            with tarfile.open(fileobj=writer, mode="w|") as tar:
+                for path, arcname in files:
+                    tar.add(str(path), arcname=arcname)
+            writer.flush()
+            log_transfer("Uploaded", description, writer.num_bytes, writer.started_at)
+            resp.run_forever(timeout=1)
+        finally:
+            resp.close()
+
+    def _extract_tar_member(self, reader: ExecStdoutReader, source_path: str, target_path: Path) -> None:
+        """Blocking: extract a single named member from a streamed tar archive."""
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+            for member in tar:
                 if member.name == source_path or member.name.startswith(source_path.lstrip("/")):
                     member.name = target_path.name
                     tar.extract(member, path=str(target_path.parent), filter="data")
                     break
+        reader.drain()
 
-    def _extract_tar_all(self, tar_data: bytes, target_dir: Path) -> None:
-        """Blocking: extract every member of an in-memory tar archive."""
-        tar_buffer = io.BytesIO(tar_data)
-        with tarfile.open(fileobj=tar_buffer, mode="r") as tar:
+    def _extract_tar_all(self, reader: ExecStdoutReader, target_dir: Path) -> None:
+        """Blocking: extract every member of a streamed tar archive."""
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
             tar.extractall(path=str(target_dir), filter="data")
+        reader.drain()
 
     async def _wait_for_container_exec_ready(self, max_attempts: int = 60) -> None:
         for attempt in range(max_attempts):
@@ -796,7 +784,12 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
         """Ensure the task image exists in the registry, then start the Pod."""
         await self._ensure_client()
         await self._ensure_image(force_build=force_build)
-        await super().start(force_build=False)
+        try:
+            await super().start(force_build=False)
+        except Exception:
+            # E.g. the image was pruned from the registry: make the next run check it again
+            image_existence_cache.invalidate(self._build_image_ref)
+            raise
 
     async def stop(self, delete: bool = True) -> None:
         """Download proxy data from the Pod, then delete it."""
@@ -952,7 +945,7 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
 
     async def _ensure_image(self, *, force_build: bool = False) -> None:
         """Check registry for the task image; build with BuildKit if missing."""
-        image_ref = f"{self.build_registry}/{self.task_name.lower()}:{self.digest_tag}"
+        image_ref = self._build_image_ref
 
         if not force_build and await self._image_exists_in_registry(image_ref):
             self.logger.debug(f"Image {image_ref} already in registry – skipping build")
@@ -993,6 +986,11 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
 
         await self._wait_for_build_job(job_name, secret_name, image_ref, timeout_sec=2000)
 
+    @property
+    def _build_image_ref(self) -> str:
+        """The task image as BuildKit pushes it (and as image_existence_cache knows it)."""
+        return f"{self.build_registry}/{self.task_name.lower()}:{self.digest_tag}"
+
     async def _image_exists_in_registry(self, image_ref: str) -> bool:
         """HEAD-check the task image (self.task_name:self.digest_tag) in the registry."""
         return await _registry_image_exists(
@@ -1038,7 +1036,11 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
     async def _wait_for_build_job(
         self, job_name: str, secret_name: str, image_ref: str, timeout_sec: int = 600
     ) -> None:
-        """Poll until the build Job succeeds or fails.
+        """Wait until the build Job succeeds or fails.
+
+        Waits on the namespace's shared build Job watch (see
+        ``ridges_harbor.k8s_informer``), so the outcome is seen as soon as the
+        Job's status changes; while the watch is down, polls the Job instead.
 
         On OOMKilled below the max tier, recreates the Job one tier up
         (fresh deadline) instead of raising; the registry cache lets it
@@ -1046,29 +1048,41 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
         outcome, so a recreated Job can still read it.
         """
         self.logger.debug(f"Waiting for build job {job_name} (timeout={timeout_sec}s)")
+        informer = get_build_job_informer(self._batch, self.namespace)
         deadline = asyncio.get_event_loop().time() + timeout_sec
+        # UID of a failed Job that has been replaced, until the cache catches up with its deletion
+        replaced_job_uid = None
 
         while asyncio.get_event_loop().time() < deadline:
-            try:
-                job = await asyncio.to_thread(
-                    self._batch.read_namespaced_job,
-                    name=job_name,
-                    namespace=self.namespace,
-                )
-            except ApiException as exc:
-                if exc.status == 404:
-                    await asyncio.sleep(5)
-                    continue
-                raise
+            if informer.synced:
+                job = informer.get(job_name)
+            else:
+                try:
+                    job = await asyncio.to_thread(
+                        self._batch.read_namespaced_job,
+                        name=job_name,
+                        namespace=self.namespace,
+                    )
+                except ApiException as exc:
+                    if exc.status != 404:
+                        raise
+                    job = None
 
-            outcome = self._build_job_outcome(job)
+            if job is None or job.metadata.uid == replaced_job_uid:
+                outcome = "pending"
+            else:
+                outcome = self._build_job_outcome(job)
 
             if outcome == "pending":
-                await asyncio.sleep(5)
+                remaining = deadline - asyncio.get_event_loop().time()
+                await informer.wait_for_change(
+                    job_name, timeout=remaining if informer.synced else min(remaining, BUILD_JOB_POLL_INTERVAL_SEC)
+                )
                 continue
 
             if outcome == "complete":
                 self.logger.info(f"Build job {job_name} completed successfully")
+                image_existence_cache.put(image_ref, True)
                 await self._delete_secret(secret_name)
                 return
 
@@ -1077,7 +1091,7 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
                 (c.message for c in (job.status.conditions or []) if c.type == "Failed" and c.status == "True"),
                 "",
             )
-            was_oom, tier = await self._job_oom_tier(job_name)
+            was_oom, tier = await self._job_oom_tier(job_name, job=job)
 
             if was_oom and tier < len(BUILD_MEMORY_TIERS) - 1:
                 next_tier = tier + 1
@@ -1087,12 +1101,13 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
                     f"{next_tier} (request={mem_request}, limit={mem_limit})"
                 )
                 await self._delete_job(job_name)
+                replaced_job_uid = job.metadata.uid
                 try:
                     await asyncio.to_thread(self._create_build_job_sync, job_name, secret_name, image_ref, next_tier)
                 except ApiException as exc:
                     if exc.status != 409:
                         raise
-                    self.logger.debug(f"Build job {job_name} recreate raced with another screener — continuing to poll")
+                    self.logger.debug(f"Build job {job_name} recreate raced with another screener — continuing to wait")
                 deadline = asyncio.get_event_loop().time() + timeout_sec
                 continue
 
@@ -1117,15 +1132,16 @@ class RidgesKubernetesEnvironment(KubernetesEnvironment):
                 return "failed"
         return "pending"
 
-    async def _job_oom_tier(self, job_name: str) -> tuple[bool, int]:
-        """Return (was_oom_killed, memory_tier) for a build Job's pod(s)."""
+    async def _job_oom_tier(self, job_name: str, job: "k8s_client.V1Job | None" = None) -> tuple[bool, int]:
+        """Return (was_oom_killed, memory_tier) for a build Job's pod(s); ``job`` saves re-reading the Job."""
         tier = 0
         try:
-            job = await asyncio.to_thread(
-                self._batch.read_namespaced_job,
-                name=job_name,
-                namespace=self.namespace,
-            )
+            if job is None:
+                job = await asyncio.to_thread(
+                    self._batch.read_namespaced_job,
+                    name=job_name,
+                    namespace=self.namespace,
+                )
             tier = int((job.metadata.annotations or {}).get(BUILD_MEMORY_TIER_ANNOTATION, "0"))
         except (ApiException, ValueError, TypeError):
             pass
@@ -1213,6 +1229,8 @@ async def _registry_image_exists(
 
     Uses the lowercased task name to match how images are actually pushed
     (OCI repository names must be lowercase; see ``_ensure_image``).
+    Answers are cached process-wide in ``image_existence_cache``; a failed
+    check counts as missing and is not cached.
     """
     import base64
     import http.client
@@ -1241,7 +1259,7 @@ async def _registry_image_exists(
             conn.close()
             return resp.status == 200
 
-        return await asyncio.to_thread(_head)
+        return await image_existence_cache.get(f"{registry}/{name}:{tag}", lambda: asyncio.to_thread(_head))
     except Exception as exc:
         logger.debug(f"Registry check failed for {name}:{tag}: {exc}")
         return False
@@ -1458,18 +1476,6 @@ def _build_job_body(
     )
 
 
-def _init_standalone_k8s_clients(
-    kubeconfig_context: str | None,
-) -> tuple["k8s_client.CoreV1Api", "k8s_client.BatchV1Api"]:
-    """Load kubeconfig (or in-cluster config) and create API clients, outside
-    the context of any particular Harbor environment instance."""
-    try:
-        k8s_config.load_incluster_config()
-    except k8s_config.ConfigException:
-        k8s_config.load_kube_config(context=kubeconfig_context)
-    return k8s_client.CoreV1Api(), k8s_client.BatchV1Api()
-
-
 async def pre_build_images(
     tasks: Sequence[tuple[str, str, str]],
     *,
@@ -1503,7 +1509,7 @@ async def pre_build_images(
     This function does not wait for builds to finish. Each task's own
     ``RidgesKubernetesEnvironment._ensure_image()`` call (later, in the
     normal lazy path) will find the Job already running — a 409 on create —
-    and just poll it to completion, or find the image already pushed.
+    and just wait for it to complete, or find the image already pushed.
 
     Best-effort: each task is handled independently, so one failure (bad
     task data, registry hiccup, etc.) never blocks the others.
@@ -1519,7 +1525,7 @@ async def pre_build_images(
         build_registry_insecure if build_registry_insecure is not None else registry_insecure
     )
 
-    core_api, batch_api = await asyncio.to_thread(_init_standalone_k8s_clients, kubeconfig_context)
+    core_api, batch_api = await asyncio.to_thread(get_k8s_apis, kubeconfig_context)
 
     async def _pre_build_one(task_name: str, digest_tag: str, presigned_url: str) -> None:
         image_ref = f"{effective_build_registry}/{task_name.lower()}:{digest_tag}"
@@ -0,0 +1,178 @@
+"""Watch-based cache of the BuildKit build Jobs in a namespace.
+
+Every ``RidgesKubernetesEnvironment`` whose task image is missing waits for a
+build Job to finish.  Instead of each waiter polling ``read_namespaced_job``
+on its own timer, one ``BuildJobInformer`` per namespace lists the build Jobs
+once and then follows a watch stream from the listed resource version.
+Waiters read the cache and wake as soon as their Job changes, so a finished
+build is noticed within one event and API calls scale with Job events rather
+than with the number of waiters.
+
+The watch runs on a daemon thread and hands every event to the event loop
+that started the informer, so the cache is only ever touched from that loop.
+A watch that times out or drops is resumed from the last seen resource
+version; only an expired version (410 Gone) forces a fresh list.  While the
+watch is down the informer reports itself unsynced and callers fall back to
+polling the API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any
+
+from kubernetes import watch as k8s_watch
+from kubernetes.client.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+BUILD_JOB_LABEL_SELECTOR = "ridges.ai/build-job=true"
+# Server-side lifetime of one watch request; it is resumed from where it left off
+WATCH_TIMEOUT_SEC = 300
+WATCH_RETRY_DELAY_SEC = 5
+
+
+class BuildJobInformer:
+    def __init__(self, batch_api: Any, namespace: str, *, label_selector: str = BUILD_JOB_LABEL_SELECTOR):
+        self.batch_api = batch_api
+        self.namespace = namespace
+        self.label_selector = label_selector
+
+        # Only touched on self.loop
+        self.jobs: dict[str, Any] = {}
+        self.synced = False
+        self.waiters: dict[str, asyncio.Event] = {}
+
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+        self.watch: k8s_watch.Watch | None = None
+        self.stopped = threading.Event()
+
+    def start(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.thread = threading.Thread(target=self._run, name=f"build-job-informer-{self.namespace}", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.watch is not None:
+            self.watch.stop()
+
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive() and not self.stopped.is_set()
+
+    def get(self, job_name: str) -> Any | None:
+        """The cached Job, or None if it doesn't exist (only meaningful while synced)."""
+        return self.jobs.get(job_name)
+
+    async def wait_for_change(self, job_name: str, timeout: float) -> None:
+        """Wait until the Job changes, the informer gains or loses sync, or ``timeout`` elapses."""
+        event = self.waiters.setdefault(job_name, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    # -- event loop side -------------------------------------------------
+
+    def _wake(self, job_name: str | None = None) -> None:
+        names = list(self.waiters) if job_name is None else [job_name]
+        for name in names:
+            event = self.waiters.pop(name, None)
+            if event is not None:
+                event.set()
+
+    def _replace(self, jobs: list[Any]) -> None:
+        self.jobs = {job.metadata.name: job for job in jobs}
+        self.synced = True
+        self._wake()
+
+    def _apply(self, event_type: str, job: Any) -> None:
+        if not self.synced:
+            # The first event of a resumed watch: everything missed has been replayed from here on
+            self.synced = True
+            self._wake()
+        if event_type == "BOOKMARK":
+            return
+        name = job.metadata.name
+        if event_type == "DELETED":
+            self.jobs.pop(name, None)
+        else:
+            self.jobs[name] = job
+        self._wake(name)
+
+    def _lose_sync(self) -> None:
+        self.synced = False
+        self._wake()
+
+    # -- watch thread ----------------------------------------------------
+
+    def _post(self, callback: Any, *args: Any) -> None:
+        try:
+            self.loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # The event loop is gone; nobody is left to wait on builds
+            self.stopped.set()
+
+    def _run(self) -> None:
+        resource_version: str | None = None
+        while not self.stopped.is_set():
+            try:
+                if resource_version is None:
+                    listing = self.batch_api.list_namespaced_job(
+                        namespace=self.namespace, label_selector=self.label_selector
+                    )
+                    resource_version = listing.metadata.resource_version
+                    self._post(self._replace, list(listing.items))
+
+                self.watch = k8s_watch.Watch()
+                for event in self.watch.stream(
+                    self.batch_api.list_namespaced_job,
+                    namespace=self.namespace,
+                    label_selector=self.label_selector,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=WATCH_TIMEOUT_SEC,
+                    _request_timeout=WATCH_TIMEOUT_SEC + 30,
+                ):
+                    resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                    self._post(self._apply, event["type"], event["object"])
+                    if self.stopped.is_set():
+                        break
+
+            except ApiException as exc:
+                if exc.status == 410:
+                    logger.debug(f"Build Job watch in {self.namespace} expired — relisting")
+                    resource_version = None
+                    continue
+                self._on_watch_error(exc)
+            except Exception as exc:
+                self._on_watch_error(exc)
+
+    def _on_watch_error(self, exc: Exception) -> None:
+        logger.warning(
+            f"Build Job watch in {self.namespace} failed ({type(exc).__name__}: {exc}) — "
+            f"polling until it resumes in {WATCH_RETRY_DELAY_SEC}s"
+        )
+        self._post(self._lose_sync)
+        self.stopped.wait(WATCH_RETRY_DELAY_SEC)
+
+
+_informers: dict[str, BuildJobInformer] = {}
+
+
+def get_build_job_informer(batch_api: Any, namespace: str) -> BuildJobInformer:
+    """Return the running build Job informer for ``namespace``, starting one if needed.
+
+    Must be called from the event loop the informer's waiters run on.
+    """
+    informer = _informers.get(namespace)
+    if informer is None or not informer.is_running() or informer.loop is not asyncio.get_running_loop():
+        if informer is not None:
+            informer.stop()
+        informer = BuildJobInformer(batch_api, namespace)
+        informer.start()
+        _informers[namespace] = informer
+    return informer
@@ -0,0 +1,30 @@
+"""Process-wide cache of which task images exist in the registry.
+
+``RidgesKubernetesEnvironment._ensure_image`` (and ``pre_build_images``) ask
+the registry whether a task image is already built before every run.  Task
+images are tagged with their task digest, so once an image is confirmed it
+stays valid; ``image_existence_cache`` remembers each answer by image reference
+so only the first run of a task pays the HEAD round trip:
+
+* Positive answers live for ``POSITIVE_TTL_SEC``; negative answers only for
+  ``NEGATIVE_TTL_SEC``, because another screener may be building the image.
+* Concurrent lookups of the same image share one request, and failed lookups
+  are not cached (see ``SingleFlightTTLCache``).
+* A finished build records the image as present, and a Pod that fails to
+  start with an image invalidates it, so the next run checks again.
+"""
+
+from __future__ import annotations
+
+from ridges_harbor.single_flight_cache import SingleFlightTTLCache
+
+POSITIVE_TTL_SEC = 30 * 60
+NEGATIVE_TTL_SEC = 15
+
+
+def image_existence_ttl_sec(exists: bool) -> float:
+    return POSITIVE_TTL_SEC if exists else NEGATIVE_TTL_SEC
+
+
+# image ref -> whether it is in the registry
+image_existence_cache: SingleFlightTTLCache[str, bool] = SingleFlightTTLCache(image_existence_ttl_sec)
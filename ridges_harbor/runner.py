@@ -12,7 +12,7 @@ from uuid import uuid4
 
 from models.openrouter import OpenRouterRuntimeConfig
 from ridges_harbor._stdlib_contract import HARBOR_RUNNER_ERROR_FILENAME
-from ridges_harbor.digest import compute_task_digest
+from ridges_harbor.digest import resolve_task_digest
 from ridges_harbor.docker_runtime import (
     TrialHook,
     build_enable_verifier_egress_hook,
@@ -85,7 +85,9 @@ async def run_task(
 
     The caller is responsible for obtaining the task directory — either from the
     local filesystem or from the remote task cache. This function only verifies
-    the content digest and hands the directory to Harbor.
+    the content digest and hands the directory to Harbor. A digest manifest
+    written by the task cache is trusted when every file's stats still match;
+    set RIDGES_TASK_DIGEST_PARANOID=true to always re-hash the whole tree.
     """
     resolved_task_dir = Path(task_dir).expanduser().resolve()
     resolved_agent_path = Path(agent_path).expanduser().resolve()
@@ -96,7 +98,8 @@ async def run_task(
     if not resolved_task_dir.exists():
         raise FileNotFoundError(f"Harbor task directory does not exist: {resolved_task_dir}")
 
-    actual_digest = await asyncio.to_thread(compute_task_digest, resolved_task_dir)
+    paranoid = os.getenv("RIDGES_TASK_DIGEST_PARANOID", "false").lower() == "true"
+    actual_digest = await asyncio.to_thread(resolve_task_digest, resolved_task_dir, paranoid=paranoid)
     if actual_digest != task_digest:
         raise RuntimeError(f"Harbor task digest mismatch for {task_name}: expected {task_digest}, got {actual_digest}")
 
@@ -183,9 +186,6 @@ async def _run_task_dir(
         # The proxy sidecar shares the pod network namespace and listens on 8080.
         agent_env["SANDBOX_PROXY_URL"] = "http://127.0.0.1:8080"
 
-        from kubernetes import client as k8s_client_mod
-        from kubernetes import config as k8s_config_mod
-
         from validator.config import (
             K8S_BUILD_REGISTRY,
             K8S_BUILD_REGISTRY_INSECURE,
@@ -205,14 +205,16 @@ async def _run_task_dir(
         K8S_OWNER_POD_NAME = os.getenv("MY_POD_NAME")
         K8S_OWNER_POD_UID = os.getenv("MY_POD_UID")
 
+        from ridges_harbor.k8s_context import get_k8s_apis, presigned_url_cache
         from ridges_harbor.k8s_runtime import build_k8s_verifier_egress_hook
 
         digest_tag = task_digest.split(":")[1][:12]
 
-        # Generate a fresh presigned URL for the build Job's init container (5-min TTL).
+        # Presigned URL for the build Job's init container (5-min TTL), reused across runs of
+        # the same task while enough of its lifetime is left.
         if fetch_task_url is None:
             raise RuntimeError("fetch_task_url callback is required in Kubernetes mode")
-        presigned_url = await fetch_task_url(task_digest)
+        presigned_url = await presigned_url_cache.get(task_digest, lambda: fetch_task_url(task_digest))
 
         environment_config = EnvironmentConfig(
             import_path="ridges_harbor.k8s_environment:RidgesKubernetesEnvironment",
@@ -245,12 +247,8 @@ async def _run_task_dir(
             },
         )
 
-        # Build k8s client for the egress hook
-        try:
-            k8s_config_mod.load_incluster_config()
-        except k8s_config_mod.ConfigException:
-            k8s_config_mod.load_kube_config(context=K8S_CONTEXT)
-        core_api = k8s_client_mod.CoreV1Api()
+        # k8s client for the egress hook, on the process's shared ApiClient
+        core_api, _ = await asyncio.to_thread(get_k8s_apis, K8S_CONTEXT)
 
         enable_verifier_egress = build_k8s_verifier_egress_hook(
             namespace=K8S_NAMESPACE,
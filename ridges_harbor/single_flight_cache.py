@@ -0,0 +1,76 @@
+"""Process-wide single-flight cache with a per-entry time to live.
+
+Used for the per-run platform and registry round trips that Kubernetes mode
+would otherwise repeat for every trial of the same task (presigned task URLs in
+``k8s_context``, image existence in ``registry_cache``):
+
+* Each value lives for ``ttl_sec(value)`` seconds, counted from when its load
+  started, so a value whose lifetime starts when it is requested (such as a
+  presigned URL) is never kept past it.
+* Concurrent lookups of the same key share one load, and a cancelled caller
+  doesn't cancel the load the others are waiting on.
+* Failed loads are not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlightTTLCache(Generic[K, V]):
+    def __init__(self, ttl_sec: Callable[[V], float], *, clock: Callable[[], float] = time.monotonic):
+        self.ttl_sec = ttl_sec
+        self.clock = clock
+        # key -> (value, expires at)
+        self.entries: dict[K, tuple[V, float]] = {}
+        self.loads: dict[K, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        """The value for ``key``, calling ``load`` only if no fresh value is cached.
+
+        Exceptions from ``load`` propagate to every caller waiting on it and are not cached.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if self.clock() < expires_at:
+                self.hits += 1
+                return value
+            del self.entries[key]
+
+        self.misses += 1
+        task = self.loads.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, load))
+            self.loads[key] = task
+        # Shielded so one cancelled caller doesn't cancel the load the others are waiting on
+        return await asyncio.shield(task)
+
+    def put(self, key: K, value: V, *, loaded_at: float | None = None) -> None:
+        loaded_at = self.clock() if loaded_at is None else loaded_at
+        self.entries[key] = (value, loaded_at + self.ttl_sec(value))
+
+    def invalidate(self, key: K) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "num_entries": len(self.entries)}
+
+    async def _load(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        try:
+            started_at = self.clock()
+            value = await load()
+            self.put(key, value, loaded_at=started_at)
+            return value
+        finally:
+            self.loads.pop(key, None)
@@ -0,0 +1,119 @@
+"""Streaming tar transfer over Kubernetes exec WebSocket streams.
+
+``KubernetesEnvironment`` copies files in and out of Pods by piping a tar
+archive through ``tar xf -`` / ``tar cf -`` running in the container.  The
+helpers here adapt the exec stream to the file-object interface that
+``tarfile``'s stream modes (``"r|"`` / ``"w|"``) expect, so archive members are
+produced and consumed incrementally through a bounded buffer instead of
+materializing the whole archive in memory.
+
+Everything in this module blocks on WebSocket I/O and must be run via
+``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Size of the frames written to the exec stream's stdin, and the most stdout
+# data buffered ahead of tarfile on downloads.
+TAR_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _as_bytes(chunk: str | bytes) -> bytes:
+    return chunk.encode("utf-8", errors="surrogateescape") if isinstance(chunk, str) else chunk
+
+
+class ExecStdoutReader:
+    """Readable file object over an exec stream's stdout.
+
+    Pulls frames off the WebSocket only when ``read()`` needs more data, so at
+    most one read request plus one frame is held in memory.  stderr is
+    collected on the side for error reporting.
+    """
+
+    def __init__(self, resp: Any):
+        self.resp = resp
+        self.buffer = bytearray()
+        self.stderr_chunks: list[str] = []
+        self.num_bytes = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def stderr(self) -> str:
+        return "".join(self.stderr_chunks)
+
+    def _pull(self) -> None:
+        if self.resp.peek_stdout():
+            chunk = _as_bytes(self.resp.read_stdout())
+            self.buffer += chunk
+            self.num_bytes += len(chunk)
+        if self.resp.peek_stderr():
+            self.stderr_chunks.append(self.resp.read_stderr())
+
+    def read(self, size: int = -1) -> bytes:
+        while (size < 0 or len(self.buffer) < size) and self.resp.is_open():
+            self.resp.update(timeout=1)
+            self._pull()
+
+        if size < 0 or size >= len(self.buffer):
+            data = bytes(self.buffer)
+            self.buffer.clear()
+        else:
+            data = bytes(self.buffer[:size])
+            del self.buffer[:size]
+        return data
+
+    def drain(self) -> None:
+        """Discard the rest of stdout (e.g. tar's end-of-archive padding) until the stream closes."""
+        while self.read(TAR_STREAM_CHUNK_SIZE):
+            pass
+
+
+class ExecStdinWriter:
+    """Writable file object over an exec stream's stdin.
+
+    Coalesces tarfile's small writes into frames of ``chunk_size`` bytes so the
+    archive is sent while it is being built.
+    """
+
+    def __init__(self, resp: Any, chunk_size: int = TAR_STREAM_CHUNK_SIZE):
+        self.resp = resp
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+        self.num_bytes = 0
+        self.started_at = time.monotonic()
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        while len(self.buffer) >= self.chunk_size:
+            self._send(bytes(self.buffer[: self.chunk_size]))
+            del self.buffer[: self.chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        if self.buffer:
+            self._send(bytes(self.buffer))
+            self.buffer.clear()
+
+    def _send(self, chunk: bytes) -> None:
+        self.resp.write_stdin(chunk)
+        self.num_bytes += len(chunk)
+
+
+def iter_dir_files(source_dir: Path) -> list[tuple[Path, str]]:
+    """Every regular file under source_dir, paired with its archive name."""
+    return [(item, str(item.relative_to(source_dir))) for item in source_dir.rglob("*") if item.is_file()]
+
+
+def log_transfer(direction: str, description: str, num_bytes: int, started_at: float) -> None:
+    elapsed = max(time.monotonic() - started_at, 1e-6)
+    logger.info(
+        f"{direction} {num_bytes} bytes {description} in {elapsed:.1f}s "
+        f"({num_bytes / elapsed / (1024 * 1024):.1f} MiB/s)"
+    )
@@ -86,6 +86,9 @@ async def test_screening_2_completion_uses_top_eligible_agent(monkeypatch) -> No
         return True
 
     monkeypatch.setattr(validator_endpoint, "update_evaluation_finished_at", fake_update_evaluation_finished_at)
+    monkeypatch.setattr(
+        validator_endpoint, "record_evaluation_in_statistics_rollups", fake_update_evaluation_finished_at
+    )
     monkeypatch.setattr(validator_endpoint, "get_hydrated_evaluation_by_id", fake_get_hydrated_evaluation_by_id)
     monkeypatch.setattr(validator_endpoint, "get_agent_by_id", fake_get_agent_by_id)
     monkeypatch.setattr(validator_endpoint, "get_top_agents", fake_get_top_agents)
@@ -135,6 +138,9 @@ async def test_handle_evaluation_finished_enqueues_auto_approval(monkeypatch) ->
         raise AssertionError("transition_agent_status_if_matches should not be called when auto approval is enabled")
 
     monkeypatch.setattr(validator_endpoint, "update_evaluation_finished_at", fake_update_evaluation_finished_at)
+    monkeypatch.setattr(
+        validator_endpoint, "record_evaluation_in_statistics_rollups", fake_update_evaluation_finished_at
+    )
     monkeypatch.setattr(validator_endpoint, "get_hydrated_evaluation_by_id", fake_get_hydrated_evaluation_by_id)
     monkeypatch.setattr(validator_endpoint, "get_agent_by_id", fake_get_agent_by_id)
     monkeypatch.setattr(
@@ -192,6 +198,9 @@ async def test_handle_evaluation_finished_skips_auto_approval_for_non_leader_can
         return True
 
     monkeypatch.setattr(validator_endpoint, "update_evaluation_finished_at", fake_update_evaluation_finished_at)
+    monkeypatch.setattr(
+        validator_endpoint, "record_evaluation_in_statistics_rollups", fake_update_evaluation_finished_at
+    )
     monkeypatch.setattr(validator_endpoint, "get_hydrated_evaluation_by_id", fake_get_hydrated_evaluation_by_id)
     monkeypatch.setattr(validator_endpoint, "get_agent_by_id", fake_get_agent_by_id)
     monkeypatch.setattr(
@@ -305,6 +314,9 @@ async def test_handle_evaluation_finished_updates_status_without_auto_approval(m
         return True
 
     monkeypatch.setattr(validator_endpoint, "update_evaluation_finished_at", fake_update_evaluation_finished_at)
+    monkeypatch.setattr(
+        validator_endpoint, "record_evaluation_in_statistics_rollups", fake_update_evaluation_finished_at
+    )
     monkeypatch.setattr(validator_endpoint, "get_hydrated_evaluation_by_id", fake_get_hydrated_evaluation_by_id)
     monkeypatch.setattr(validator_endpoint, "get_agent_by_id", fake_get_agent_by_id)
     monkeypatch.setattr(
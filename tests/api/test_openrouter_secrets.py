@@ -516,9 +516,12 @@ def _patch_validator_dependencies(
         _make_evaluation_run(evaluation.evaluation_id, problem_name="problem-2"),
     ]
 
-    async def fake_get_next_agent_id(_hotkey: str):
+    async def fake_claim_next_agent_id(_hotkey: str):
         return agent_id
 
+    async def fake_release_agent_dispatch_claim(_agent_id, _hotkey: str) -> None:
+        return None
+
     async def fake_get_agent_by_id(_agent_id):
         return _make_agent(agent_id)
 
@@ -546,6 +549,9 @@ def _patch_validator_dependencies(
         if handled_evaluations is not None:
             handled_evaluations.append(evaluation_id)
 
+    async def fake_get_problem_average_times(_set_id):
+        return {"problem-1": 120.0}
+
     async def fake_get_internal_flags_parsed(_flags):
         return {
             InternalFlagName.VALIDATORS_PAUSED: False,
@@ -553,12 +559,14 @@ def _patch_validator_dependencies(
         }
 
     monkeypatch.setattr(validator_endpoint, "get_internal_flags_parsed", fake_get_internal_flags_parsed)
+    monkeypatch.setattr(validator_endpoint, "_get_problem_average_times", fake_get_problem_average_times)
     monkeypatch.setattr(validator_endpoint, "record_validator_heartbeat", lambda _validator: None)
     monkeypatch.setattr(
         validator_endpoint,
-        "get_next_agent_id_awaiting_evaluation_for_validator_hotkey",
-        fake_get_next_agent_id,
+        "claim_next_agent_id_awaiting_evaluation_for_validator_hotkey",
+        fake_claim_next_agent_id,
     )
+    monkeypatch.setattr(validator_endpoint, "release_agent_dispatch_claim", fake_release_agent_dispatch_claim)
     monkeypatch.setattr(validator_endpoint, "get_agent_by_id", fake_get_agent_by_id)
     monkeypatch.setattr(validator_endpoint, "download_text_file_from_s3", fake_download_text)
     monkeypatch.setattr(validator_endpoint, "create_new_evaluation_and_evaluation_runs", fake_create_bundle)
@@ -612,6 +620,7 @@ async def test_validator_request_evaluation_returns_decrypted_keys_and_hash(monk
     )
     assert validator.current_evaluation_id is not None
     assert validator.current_agent is not None
+    assert [run.expected_duration_seconds for run in response.evaluation_runs] == [120.0, None]
 
 
 @pytest.mark.anyio
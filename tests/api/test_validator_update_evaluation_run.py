@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
@@ -7,7 +9,7 @@ import pytest
 from fastapi import HTTPException
 
 from api.endpoints import validator as validator_endpoint
-from api.endpoints.validator_models import ValidatorUpdateEvaluationRunRequest
+from api.endpoints.validator_models import ValidatorUpdateEvaluationRunRequest, ValidatorUpdateEvaluationRunsRequest
 from models.evaluation_run import EvaluationRun, EvaluationRunLogType, EvaluationRunStatus
 from models.problem import ProblemTestCategory, ProblemTestResult, ProblemTestResultStatus
 
@@ -54,7 +56,10 @@ def _make_evaluation_run(
 
 
 def _install_endpoint_capture(
-    monkeypatch, evaluation_run: EvaluationRun, *, existing_logs: set[EvaluationRunLogType] | None = None
+    monkeypatch,
+    evaluation_run: EvaluationRun,
+    *other_evaluation_runs: EvaluationRun,
+    existing_logs: set[EvaluationRunLogType] | None = None,
 ):
     capture = {
         "updated_runs": [],
@@ -62,8 +67,10 @@ def _install_endpoint_capture(
         "existing_logs": set(existing_logs or set()),
     }
 
-    async def fake_get_evaluation_run_by_id(_evaluation_run_id):
-        return evaluation_run
+    evaluation_runs = {run.evaluation_run_id: run for run in other_evaluation_runs}
+
+    async def fake_get_evaluation_run_by_id(evaluation_run_id):
+        return evaluation_runs.get(evaluation_run_id, evaluation_run)
 
     async def fake_check_if_evaluation_run_logs_exist(_evaluation_run_id, log_type):
         return log_type in capture["existing_logs"]
@@ -352,3 +359,150 @@ async def test_error_ignores_duplicate_agent_and_eval_logs(monkeypatch) -> None:
     assert evaluation_run.error_code == 1234
     assert evaluation_run.error_message == "boom"
     assert capture["created_logs"] == []
+
+
+def _install_transaction_capture(monkeypatch) -> list[str]:
+    transactions: list[str] = []
+
+    @asynccontextmanager
+    async def fake_db_transaction():
+        try:
+            yield
+        except Exception:
+            transactions.append("rolled back")
+            raise
+        transactions.append("committed")
+
+    monkeypatch.setattr(validator_endpoint, "db_transaction", fake_db_transaction)
+    return transactions
+
+
+@pytest.mark.anyio
+async def test_batch_applies_ordered_transitions_for_one_run_in_one_transaction(monkeypatch) -> None:
+    evaluation_run = _make_evaluation_run(status=EvaluationRunStatus.running_agent)
+    capture = _install_endpoint_capture(monkeypatch, evaluation_run)
+    transactions = _install_transaction_capture(monkeypatch)
+    validator = _make_validator(evaluation_run.evaluation_id)
+
+    response = await validator_endpoint.validator_update_evaluation_runs.__wrapped__(
+        ValidatorUpdateEvaluationRunsRequest(
+            updates=[
+                ValidatorUpdateEvaluationRunRequest(
+                    evaluation_run_id=evaluation_run.evaluation_run_id,
+                    updated_status=EvaluationRunStatus.initializing_eval,
+                    patch="patch",
+                    agent_logs="agent logs",
+                ),
+                ValidatorUpdateEvaluationRunRequest(
+                    evaluation_run_id=evaluation_run.evaluation_run_id,
+                    updated_status=EvaluationRunStatus.running_eval,
+                ),
+            ]
+        ),
+        validator=validator,
+    )
+
+    # The group's savepoint, then the outer transaction
+    assert transactions == ["committed", "committed"]
+    [group_result] = response.results
+    assert group_result.error is None
+    assert len(group_result.results) == 2
+    assert [run.status for run in capture["updated_runs"]] == [
+        EvaluationRunStatus.initializing_eval,
+        EvaluationRunStatus.running_eval,
+    ]
+    assert capture["created_logs"] == [{"type": EvaluationRunLogType.agent, "logs": "agent logs"}]
+
+
+@pytest.mark.anyio
+async def test_batch_rejects_a_group_with_an_invalid_update_and_names_it(monkeypatch) -> None:
+    evaluation_run = _make_evaluation_run(status=EvaluationRunStatus.running_agent)
+    _install_endpoint_capture(monkeypatch, evaluation_run)
+    transactions = _install_transaction_capture(monkeypatch)
+    validator = _make_validator(evaluation_run.evaluation_id)
+
+    response = await validator_endpoint.validator_update_evaluation_runs.__wrapped__(
+        ValidatorUpdateEvaluationRunsRequest(
+            updates=[
+                ValidatorUpdateEvaluationRunRequest(
+                    evaluation_run_id=evaluation_run.evaluation_run_id,
+                    updated_status=EvaluationRunStatus.initializing_eval,
+                    patch="patch",
+                    agent_logs="agent logs",
+                ),
+                ValidatorUpdateEvaluationRunRequest(
+                    evaluation_run_id=evaluation_run.evaluation_run_id,
+                    updated_status=EvaluationRunStatus.running_agent,
+                ),
+            ]
+        ),
+        validator=validator,
+    )
+
+    # The group's savepoint rolls back; the (now empty) outer transaction still commits
+    assert transactions == ["rolled back", "committed"]
+    [group_result] = response.results
+    assert group_result.results is None
+    assert group_result.status_code == 400
+    assert re.match(r"Update 1 \(.* to running_agent\): An evaluation run can only be updated", group_result.error)
+
+
+@pytest.mark.anyio
+async def test_batch_applies_valid_groups_next_to_a_rejected_group_of_another_run(monkeypatch) -> None:
+    stale_run = _make_evaluation_run(status=EvaluationRunStatus.finished)
+    finishing_run = _make_evaluation_run(status=EvaluationRunStatus.running_eval, patch="existing patch")
+    finishing_run.evaluation_id = stale_run.evaluation_id
+    capture = _install_endpoint_capture(
+        monkeypatch, stale_run, finishing_run, existing_logs={EvaluationRunLogType.agent}
+    )
+    transactions = _install_transaction_capture(monkeypatch)
+    validator = _make_validator(stale_run.evaluation_id)
+
+    response = await validator_endpoint.validator_update_evaluation_runs.__wrapped__(
+        ValidatorUpdateEvaluationRunsRequest(
+            updates=[
+                ValidatorUpdateEvaluationRunRequest(
+                    evaluation_run_id=stale_run.evaluation_run_id,
+                    updated_status=EvaluationRunStatus.running_eval,
+                ),
+                ValidatorUpdateEvaluationRunRequest(
+                    evaluation_run_id=finishing_run.evaluation_run_id,
+                    updated_status=EvaluationRunStatus.finished,
+                    verifier_reward=1.0,
+                    test_results=[_test_result()],
+                    eval_logs="eval logs",
+                ),
+            ],
+            group_sizes=[1, 1],
+        ),
+        validator=validator,
+    )
+
+    assert transactions == ["rolled back", "committed", "committed"]
+    rejected, accepted = response.results
+    assert rejected.results is None and rejected.status_code == 400
+    assert accepted.error is None and len(accepted.results) == 1
+    assert stale_run.status == EvaluationRunStatus.finished
+    assert finishing_run.status == EvaluationRunStatus.finished
+    assert [run.evaluation_run_id for run in capture["updated_runs"]] == [finishing_run.evaluation_run_id]
+
+
+@pytest.mark.anyio
+async def test_batch_rejects_group_sizes_that_do_not_split_the_updates(monkeypatch) -> None:
+    evaluation_run = _make_evaluation_run(status=EvaluationRunStatus.running_agent)
+    _install_endpoint_capture(monkeypatch, evaluation_run)
+    validator = _make_validator(evaluation_run.evaluation_id)
+
+    with pytest.raises(HTTPException, match="do not split"):
+        await validator_endpoint.validator_update_evaluation_runs.__wrapped__(
+            ValidatorUpdateEvaluationRunsRequest(
+                updates=[
+                    ValidatorUpdateEvaluationRunRequest(
+                        evaluation_run_id=evaluation_run.evaluation_run_id,
+                        updated_status=EvaluationRunStatus.initializing_eval,
+                    )
+                ],
+                group_sizes=[2],
+            ),
+            validator=validator,
+        )
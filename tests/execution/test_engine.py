@@ -620,3 +620,50 @@ async def test_evaluate_defaults_build_timeout_multiplier_to_none(tmp_path: Path
     )
 
     assert captured["environment_build_timeout_multiplier"] is None
+
+
+@pytest.mark.anyio
+async def test_evaluate_runs_each_trial_on_a_cloned_task_workspace(tmp_path: Path, monkeypatch) -> None:
+    from ridges_harbor.digest import compute_task_digest, read_manifest_digest, write_digest_manifest
+
+    task_dir = tmp_path / "cache" / "sha256_fake" / "update-status-file"
+    write(task_dir / "instruction.md", "Solve.\n")
+    write(task_dir / "tests" / "test.sh", "#!/bin/bash\n")
+    write_digest_manifest(task_dir, compute_task_digest(task_dir))
+    agent_path = tmp_path / "agent.py"
+    write(agent_path, "def agent_main(_input):\n    return ''\n")
+    captured: dict[str, object] = {}
+
+    async def fake_resolve_task_dir(self, execution_spec, problem_name, fetch_task_url):
+        return task_dir
+
+    async def fake_run_task(task_dir_arg, **kwargs):
+        captured["task_dir"] = task_dir_arg
+        captured["manifest_digest"] = read_manifest_digest(task_dir_arg)
+        # Harbor writes the task directory in place; the cached task must not change
+        (task_dir_arg / "instruction.md").write_text("Modified.\n")
+        (task_dir_arg / "tests" / "test.sh").chmod(0o755)
+        return make_summary(tmp_path, test_results=None, verifier_result=successful_verifier_result())
+
+    monkeypatch.setattr(ExecutionEngine, "_resolve_task_dir", fake_resolve_task_dir)
+    monkeypatch.setattr(engine_module, "run_task", fake_run_task)
+
+    engine = ExecutionEngine(
+        "http://inference", harbor_results_dir=tmp_path / "results", task_workspace_dir=tmp_path / "workspaces"
+    )
+    evaluation_run_id = uuid4()
+    await engine.evaluate(
+        evaluation_run_id=evaluation_run_id,
+        problem_name="update-status-file",
+        execution_spec=valid_execution_spec(),
+        agent_path=agent_path,
+        agent_code=None,
+    )
+
+    workspace_task_dir = tmp_path / "workspaces" / f"update-status-file__{evaluation_run_id}" / "update-status-file"
+    assert captured["task_dir"] == workspace_task_dir
+    assert captured["manifest_digest"] == compute_task_digest(task_dir)
+    assert not workspace_task_dir.parent.exists()
+    assert (task_dir / "tests" / "test.sh").exists()
+    assert read_manifest_digest(task_dir) == compute_task_digest(task_dir)
+    assert (task_dir / "instruction.md").read_text() == "Solve.\n"
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import asyncpg
+import pytest
+
+from inference_gateway.inference_ledger import InferenceLedger
+from inference_gateway.models import InferenceMessage
+
+
+class FakeWriter:
+    def __init__(self, *, failures: int = 0) -> None:
+        self.batches: list[dict] = []
+        self.failures = failures
+        # Inserts for these evaluation runs violate the foreign key
+        self.unknown_evaluation_run_ids: set = set()
+
+    async def __call__(self, *, new_inference_rows, finished_inference_rows) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        if any(row[1] in self.unknown_evaluation_run_ids for row in new_inference_rows):
+            raise asyncpg.ForeignKeyViolationError("inferences_evaluation_run_id_fkey")
+        self.batches.append({"new": list(new_inference_rows), "finished": list(finished_inference_rows)})
+
+
+async def _record_request(ledger: InferenceLedger):
+    return await ledger.record_request(
+        evaluation_run_id=uuid4(),
+        provider="chutes",
+        model="test-model",
+        temperature=0.5,
+        messages=[InferenceMessage(role="user", content="hello")],
+    )
+
+
+async def _record_response(ledger: InferenceLedger, record, *, status_code: int = 200) -> None:
+    await ledger.record_response(
+        record,
+        status_code=status_code,
+        response="hi",
+        num_input_tokens=10,
+        num_output_tokens=2,
+        cost_usd=0.001,
+    )
+
+
+@pytest.mark.anyio
+async def test_ledger_coalesces_response_into_unflushed_insert() -> None:
+    writer = FakeWriter()
+    ledger = InferenceLedger(flush_interval_seconds=0.01, write_batch=writer)
+    ledger.start()
+
+    record = await _record_request(ledger)
+    await _record_response(ledger, record)
+    await ledger.stop()
+
+    assert len(writer.batches) == 1
+    [row] = writer.batches[0]["new"]
+    assert row[0] == record.inference_id
+    assert row[6:9] == (200, "hi", 10)
+    assert writer.batches[0]["finished"] == []
+
+
+@pytest.mark.anyio
+async def test_ledger_updates_response_after_insert_was_flushed() -> None:
+    writer = FakeWriter()
+    ledger = InferenceLedger(flush_interval_seconds=0.01, write_batch=writer)
+    ledger.start()
+
+    record = await _record_request(ledger)
+    await ledger.queue.join()
+    await _record_response(ledger, record, status_code=503)
+    await ledger.stop()
+
+    assert [len(batch["new"]) for batch in writer.batches] == [1, 0]
+    assert writer.batches[0]["new"][0][6] is None
+    assert writer.batches[1]["finished"] == [record.finished_inference_row()]
+    assert writer.batches[1]["finished"][0][1] == 503
+
+
+@pytest.mark.anyio
+async def test_ledger_batches_many_requests_in_queue_order() -> None:
+    writer = FakeWriter()
+    ledger = InferenceLedger(batch_size=4, flush_interval_seconds=0.01, write_batch=writer)
+
+    records = [await _record_request(ledger) for _ in range(10)]
+    ledger.start()
+    await ledger.stop()
+
+    assert [len(batch["new"]) for batch in writer.batches] == [4, 4, 2]
+    flushed_ids = [row[0] for batch in writer.batches for row in batch["new"]]
+    assert flushed_ids == [record.inference_id for record in records]
+
+
+@pytest.mark.anyio
+async def test_ledger_retries_failed_batch_without_losing_events() -> None:
+    writer = FakeWriter(failures=2)
+    ledger = InferenceLedger(flush_interval_seconds=0.01, write_batch=writer)
+    ledger.start()
+
+    record = await _record_request(ledger)
+    await ledger.stop()
+
+    assert len(writer.batches) == 1
+    assert writer.batches[0]["new"][0][0] == record.inference_id
+
+
+@pytest.mark.anyio
+async def test_ledger_applies_back_pressure_when_queue_is_full() -> None:
+    writer = FakeWriter()
+    ledger = InferenceLedger(max_queue_size=2, flush_interval_seconds=0.01, write_batch=writer)
+
+    await _record_request(ledger)
+    await _record_request(ledger)
+    blocked = asyncio.create_task(_record_request(ledger))
+    await asyncio.sleep(0.02)
+    assert not blocked.done()
+
+    ledger.start()
+    await blocked
+    await ledger.stop()
+
+    assert sum(len(batch["new"]) for batch in writer.batches) == 3
+
+
+@pytest.mark.anyio
+async def test_ledger_drops_a_row_that_cannot_be_written_and_keeps_flushing() -> None:
+    writer = FakeWriter()
+    ledger = InferenceLedger(flush_interval_seconds=0.01, write_batch=writer)
+
+    records = [await _record_request(ledger) for _ in range(4)]
+    writer.unknown_evaluation_run_ids.add(records[2].evaluation_run_id)
+    ledger.start()
+    await asyncio.wait_for(ledger.queue.join(), timeout=5)
+
+    later = await _record_request(ledger)
+    await _record_response(ledger, later)
+    await ledger.stop()
+
+    written = [row[0] for batch in writer.batches for row in batch["new"]]
+    assert written == [records[0].inference_id, records[1].inference_id, records[3].inference_id, later.inference_id]
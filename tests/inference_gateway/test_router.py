@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import random
+
+from inference_gateway.router import CircuitState, ProviderRouter, WeightedProvider
+
+MODEL = "test-model"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProvider:
+    """Stand-in provider whose latency and status are injected per request."""
+
+    def __init__(self, name: str, *, latency_seconds: float, status_code: int = 200) -> None:
+        self.name = name
+        self.latency_seconds = latency_seconds
+        self.status_code = status_code
+
+
+def _serve(router: ProviderRouter, candidates: list[WeightedProvider], clock: FakeClock) -> tuple[str, float]:
+    choice = router.choose(candidates, MODEL)
+    provider = choice.provider
+    with router.track(choice) as outcome:
+        clock.now += provider.latency_seconds
+        outcome["status_code"] = provider.status_code
+    return provider.name, provider.latency_seconds
+
+
+def _p95(latencies: list[float]) -> float:
+    ordered = sorted(latencies)
+    return ordered[int(len(ordered) * 0.95)]
+
+
+def test_router_shifts_traffic_away_from_slow_provider_and_cuts_tail_latency() -> None:
+    fast = WeightedProvider(FakeProvider("fast", latency_seconds=0.5), weight=1)
+    slow = WeightedProvider(FakeProvider("slow", latency_seconds=10.0), weight=1)
+    candidates = [fast, slow]
+
+    static_rng = random.Random(0)
+    static_latencies = [
+        static_rng.choices(candidates, weights=[1, 1], k=1)[0].provider.latency_seconds for _ in range(1000)
+    ]
+
+    clock = FakeClock()
+    router = ProviderRouter(ewma_alpha=0.2, failure_threshold=5, open_seconds=30, clock=clock, rng=random.Random(0))
+    routed = [_serve(router, candidates, clock) for _ in range(1000)]
+    routed_latencies = [latency for _, latency in routed]
+
+    assert sum(1 for name, _ in routed if name == "slow") < 100
+    assert _p95(static_latencies) == 10.0
+    assert _p95(routed_latencies) == 0.5
+
+
+def test_circuit_opens_after_consecutive_failures_and_half_open_probe_closes_it() -> None:
+    clock = FakeClock()
+    router = ProviderRouter(ewma_alpha=0.2, failure_threshold=3, open_seconds=30, clock=clock, rng=random.Random(0))
+    flaky_provider = FakeProvider("flaky", latency_seconds=1.0, status_code=503)
+    flaky = WeightedProvider(flaky_provider, weight=1)
+    healthy = WeightedProvider(FakeProvider("healthy", latency_seconds=1.0), weight=1)
+
+    for _ in range(3):
+        _serve(router, [flaky], clock)
+    assert router.routes[("flaky", MODEL)].state == CircuitState.OPEN
+
+    assert all(router.choose([flaky, healthy], MODEL).weighted_provider is healthy for _ in range(50))
+
+    clock.now += 31
+    probe = router.choose([flaky], MODEL)
+    assert probe.weighted_provider is flaky and probe.is_probe
+    assert router.routes[("flaky", MODEL)].state == CircuitState.HALF_OPEN
+    probe.release()
+
+    flaky_provider.status_code = 200
+    _serve(router, [flaky], clock)
+    assert router.routes[("flaky", MODEL)].state == CircuitState.CLOSED
+
+
+def test_half_open_probe_failure_reopens_circuit() -> None:
+    clock = FakeClock()
+    router = ProviderRouter(ewma_alpha=0.2, failure_threshold=1, open_seconds=10, clock=clock, rng=random.Random(0))
+    flaky = WeightedProvider(FakeProvider("flaky", latency_seconds=1.0, status_code=-1), weight=1)
+
+    _serve(router, [flaky], clock)
+    clock.now += 11
+    _serve(router, [flaky], clock)
+
+    route = router.routes[("flaky", MODEL)]
+    assert route.state == CircuitState.OPEN
+    assert route.opened_at == clock.now
+
+
+def test_client_errors_do_not_count_against_provider() -> None:
+    clock = FakeClock()
+    router = ProviderRouter(ewma_alpha=0.2, failure_threshold=1, open_seconds=30, clock=clock)
+    provider = WeightedProvider(FakeProvider("strict", latency_seconds=1.0, status_code=422), weight=1)
+
+    _serve(router, [provider], clock)
+
+    snapshot = router.snapshot()[f"strict:{MODEL}"]
+    assert snapshot["state"] == "closed"
+    assert snapshot["num_failures"] == 0
+    assert snapshot["in_flight"] == 0
+
+
+def test_all_open_circuits_fall_back_to_static_weights() -> None:
+    clock = FakeClock()
+    router = ProviderRouter(ewma_alpha=0.2, failure_threshold=1, open_seconds=30, clock=clock, rng=random.Random(0))
+    only = WeightedProvider(FakeProvider("only", latency_seconds=1.0, status_code=500), weight=1)
+
+    _serve(router, [only], clock)
+
+    assert router.routes[("only", MODEL)].state == CircuitState.OPEN
+    assert router.choose([only], MODEL).weighted_provider is only
+
+
+def test_half_open_probe_is_reserved_when_the_route_is_chosen() -> None:
+    clock = FakeClock()
+    router = ProviderRouter(ewma_alpha=0.2, failure_threshold=1, open_seconds=10, clock=clock, rng=random.Random(0))
+    flaky = WeightedProvider(FakeProvider("flaky", latency_seconds=1.0, status_code=500), weight=1)
+    healthy = WeightedProvider(FakeProvider("healthy", latency_seconds=1.0), weight=1)
+
+    _serve(router, [flaky], clock)
+    clock.now += 11
+
+    # Concurrent requests are chosen before the first one reaches track()
+    choices = [router.choose([flaky, healthy], MODEL) for _ in range(50)]
+    probes = [choice for choice in choices if choice.weighted_provider is flaky]
+    assert len(probes) == 1 and probes[0].is_probe
+
+    # A probe that never reached the provider (e.g. its ledger write failed) gives the reservation back
+    probes[0].release()
+    probes[0].release()
+    assert router.routes[("flaky", MODEL)].probe_in_flight is False
+    assert router.choose([flaky], MODEL).is_probe
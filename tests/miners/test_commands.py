@@ -108,6 +108,56 @@ async def test_run_local_task_and_report_prints_setup_failure_to_stderr(monkeypa
     assert "ERROR: RuntimeError: setup blew up" in captured.err
 
 
+@pytest.mark.anyio
+async def test_run_local_batch_and_report_prints_progress_and_aggregate(monkeypatch, capsys) -> None:
+    async def fake_run_local_tasks(task_paths, *, on_task_done, max_concurrency, **kwargs):
+        assert max_concurrency == 3
+        outcomes = [
+            run_local_module.LocalTaskOutcome(
+                task_path=Path(task_path),
+                elapsed_seconds=60.0,
+                summary=None
+                if Path(task_path).name == "broken"
+                else SimpleNamespace(name=Path(task_path).name, trial_dir=Path("/tmp/trial")),
+                exception=RuntimeError("setup blew up") if Path(task_path).name == "broken" else None,
+            )
+            for task_path in task_paths
+        ]
+        for outcome in outcomes:
+            on_task_done(outcome)
+        return outcomes
+
+    def fake_result_from_summary(summary):
+        if summary.name == "bad-patch":
+            raise EvaluationRunException(
+                error_code=EvaluationRunErrorCode.AGENT_INVALID_PATCH,
+                error_message="bad patch",
+            )
+        return SimpleNamespace(
+            verifier_reward=1.0 if summary.name == "solved" else 0.5,
+            test_results=[SimpleNamespace(status=ProblemTestResultStatus.PASS)],
+        )
+
+    monkeypatch.setattr(run_local_module, "run_local_tasks", fake_run_local_tasks)
+    monkeypatch.setattr(artifacts_module, "result_from_summary", fake_result_from_summary)
+
+    exit_code = await run_local_module._run_local_batch_and_report(
+        [Path("/tmp/solved"), Path("/tmp/partial"), Path("/tmp/bad-patch"), Path("/tmp/broken")],
+        agent_path="/tmp/agent.py",
+        inference=LocalInferenceConfig(provider="openrouter", api_key="secret"),
+        concurrency=3,
+    )
+
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert "[1/4] solved: SOLVED in 1m 0s: reward 1.0" in captured.out
+    assert "[3/4] bad-patch: FAILED in 1m 0s: AGENT_INVALID_PATCH" in captured.out
+    assert "[4/4] broken: ERROR in 1m 0s: RuntimeError: setup blew up" in captured.err
+    assert "solved: 1/4 (25.0%)" in captured.out
+    assert "mean reward: 0.375" in captured.out
+    assert "succeeded: 2, failed: 1, errors: 1" in captured.out
+
+
 def test_setup_flow_saves_provider_when_one_is_configured(tmp_path: Path, monkeypatch) -> None:
     config_path = tmp_path / "miner.toml"
     agent_file = tmp_path / "agent.py"
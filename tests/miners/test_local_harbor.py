@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import tarfile
@@ -418,3 +419,44 @@ async def test_run_local_task_requires_valid_local_inference_config(tmp_path: Pa
             agent_path=agent_path,
             inference=LocalInferenceConfig(provider="openrouter", api_key=" "),
         )
+
+
+@pytest.mark.anyio
+async def test_run_local_tasks_bounds_concurrency_and_prunes_once(tmp_path: Path, monkeypatch) -> None:
+    running = 0
+    max_running = 0
+    pruned = []
+
+    async def fake_run_local_task(task_path, **kwargs):
+        nonlocal running, max_running
+        assert kwargs["prune_images"] is False
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if Path(task_path).name == "task-2":
+            raise RuntimeError("docker build failed")
+        return types.SimpleNamespace(task_name=Path(task_path).name)
+
+    async def fake_prune() -> None:
+        pruned.append(True)
+
+    monkeypatch.setattr(local_harbor_module, "run_local_task", fake_run_local_task)
+    monkeypatch.setattr(local_harbor_module, "prune_dangling_images", fake_prune)
+
+    finished = []
+    task_paths = [tmp_path / f"task-{index}" for index in range(6)]
+    outcomes = await local_harbor_module.run_local_tasks(
+        task_paths,
+        agent_path=tmp_path / "agent.py",
+        inference=_inference(),
+        max_concurrency=2,
+        on_task_done=lambda outcome: finished.append(outcome.task_path),
+    )
+
+    assert max_running == 2
+    assert pruned == [True]
+    assert sorted(finished) == sorted(task_paths)
+    assert [outcome.task_path for outcome in outcomes] == task_paths
+    assert [outcome.summary is None for outcome in outcomes] == [False, False, True, False, False, False]
+    assert str(outcomes[2].exception) == "docker build failed"
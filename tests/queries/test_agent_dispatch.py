@@ -0,0 +1,168 @@
+"""Integration tests and a contention benchmark for the agent_dispatch SKIP LOCKED claim."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import utils.database as _db
+from queries.agent import (
+    claim_next_agent_id_awaiting_evaluation_for_validator_hotkey,
+    get_next_agent_id_awaiting_evaluation_for_validator_hotkey,
+    release_agent_dispatch_claim,
+)
+
+logger = logging.getLogger(__name__)
+
+HOTKEY = "validator-hotkey-1"
+OTHER_HOTKEY = "validator-hotkey-2"
+
+# anyio_backend is defined in tests/conftest.py and inherited automatically.
+
+_CLEAN_TABLES_SQL = (
+    "TRUNCATE agent_dispatch, evaluation_runs, evaluations, benchmark_agent_ids, agents RESTART IDENTITY CASCADE"
+)
+
+
+@pytest.fixture(autouse=True)
+async def clean_tables(postgres_db):
+    async with _db.pool.acquire() as conn:
+        await conn.execute(_CLEAN_TABLES_SQL)
+    yield
+    async with _db.pool.acquire() as conn:
+        await conn.execute(_CLEAN_TABLES_SQL)
+
+
+async def _insert_agent(*, status: str = "evaluating", created_at: datetime | None = None) -> uuid.UUID:
+    agent_id = uuid.uuid4()
+    async with _db.pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO agents (agent_id, miner_hotkey, name, version_num, status, created_at, ip_address)
+            VALUES ($1, $2, $3, $4, $5::agentstatus, $6, $7)
+            """,
+            agent_id,
+            f"hotkey-{agent_id}",
+            "test-agent",
+            1,
+            status,
+            created_at or datetime.now(timezone.utc),
+            "127.0.0.1",
+        )
+    return agent_id
+
+
+async def _start_evaluation(agent_id: uuid.UUID, validator_hotkey: str, *, group: str) -> None:
+    # Stands in for create_new_evaluation_and_evaluation_runs(): one running run makes the evaluation count
+    evaluation_id = uuid.uuid4()
+    async with _db.pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO evaluations (evaluation_id, agent_id, validator_hotkey, set_id, evaluation_set_group)
+            VALUES ($1, $2, $3, 1, $4::evaluationsetgroup)
+            """,
+            evaluation_id,
+            agent_id,
+            validator_hotkey,
+            group,
+        )
+        await conn.execute(
+            """
+            INSERT INTO evaluation_runs (evaluation_run_id, evaluation_id, problem_name, status, created_at)
+            VALUES ($1, $2, 'test-problem', 'running_agent'::evaluationrunstatus, NOW())
+            """,
+            uuid.uuid4(),
+            evaluation_id,
+        )
+
+
+async def _run_validator(validator_hotkey: str, *, group: str, claimed: list[tuple[str, uuid.UUID]]) -> None:
+    # Mirrors /validator/request-evaluation: claim, create the evaluation, release. A validator keeps polling
+    # while other claims are in flight, like the real one does after an empty response
+    for _ in range(200):
+        agent_id = await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(validator_hotkey)
+        if agent_id is None:
+            if await get_next_agent_id_awaiting_evaluation_for_validator_hotkey(validator_hotkey) is None:
+                return
+            await asyncio.sleep(0.01)
+            continue
+
+        try:
+            await asyncio.sleep(0.005)  # agent code download, OpenRouter secrets, ...
+            await _start_evaluation(agent_id, validator_hotkey, group=group)
+            claimed.append((validator_hotkey, agent_id))
+        finally:
+            await release_agent_dispatch_claim(agent_id, validator_hotkey)
+
+
+@pytest.mark.anyio
+async def test_concurrent_claim_takes_next_candidate_instead_of_waiting():
+    now = datetime.now(timezone.utc)
+    first = await _insert_agent(created_at=now - timedelta(seconds=10))
+    second = await _insert_agent(created_at=now)
+
+    assert await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(HOTKEY) == first
+    assert await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(OTHER_HOTKEY) == second
+
+
+@pytest.mark.anyio
+async def test_released_claim_is_not_reissued_past_the_eval_limit():
+    agent_id = await _insert_agent()
+
+    assert await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(HOTKEY) == agent_id
+    await _start_evaluation(agent_id, HOTKEY, group="validator")
+    await release_agent_dispatch_claim(agent_id, HOTKEY)
+
+    # NUM_EVALS_PER_AGENT is 1 in tests, so the agent is now full for every other validator
+    assert await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(OTHER_HOTKEY) is None
+
+
+@pytest.mark.anyio
+async def test_expired_claim_can_be_taken_over():
+    agent_id = await _insert_agent()
+    assert await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(HOTKEY) == agent_id
+
+    async with _db.pool.acquire() as conn:
+        await conn.execute("UPDATE agent_dispatch SET claimed_until = NOW() - INTERVAL '1 second'")
+
+    assert await claim_next_agent_id_awaiting_evaluation_for_validator_hotkey(OTHER_HOTKEY) == agent_id
+    # The expired holder's late release must not clear the new holder's lease
+    await release_agent_dispatch_claim(agent_id, HOTKEY)
+    async with _db.pool.acquire() as conn:
+        assert await conn.fetchval("SELECT claimed_by FROM agent_dispatch WHERE agent_id = $1", agent_id) == (
+            OTHER_HOTKEY
+        )
+
+
+@pytest.mark.anyio
+async def test_contention_benchmark_dozens_of_validators():
+    num_validators = 40
+    agent_ids = [await _insert_agent() for _ in range(30)]
+    claimed: list[tuple[str, uuid.UUID]] = []
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(_run_validator(f"validator-{i}", group="validator", claimed=claimed) for i in range(num_validators))
+    )
+    elapsed = time.perf_counter() - started_at
+    logger.info(f"{num_validators} validators claimed {len(claimed)} agent(s) in {elapsed:.3f} second(s)")
+
+    # Every agent was handed out exactly NUM_EVALS_PER_AGENT (1) times, and never twice to one validator
+    assert Counter(agent_id for _, agent_id in claimed) == Counter(agent_ids)
+    assert len(set(claimed)) == len(claimed)
+
+
+@pytest.mark.anyio
+async def test_contention_benchmark_screeners_never_share_an_agent():
+    agent_ids = [await _insert_agent(status="screening_1") for _ in range(20)]
+    claimed: list[tuple[str, uuid.UUID]] = []
+
+    await asyncio.gather(*(_run_validator(f"screener-1-{i}", group="screener_1", claimed=claimed) for i in range(24)))
+
+    assert sorted(agent_id for _, agent_id in claimed) == sorted(agent_ids)
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+import utils.database as _db
+from queries.statistics import (
+    PERFECTLY_SOLVED_SINCE_SQL,
+    backfill_statistics_rollups,
+    get_perfectly_solved_over_time,
+    get_top_scores_over_time,
+    record_evaluation_in_statistics_rollups,
+)
+
+SET_ID = 31
+SINCE = datetime(2025, 11, 27, 20, 30, tzinfo=timezone.utc)  # PERFECTLY_SOLVED_SINCE_SQL
+TRUNCATE_STATISTICS_TEST_TABLES = (
+    "TRUNCATE agent_problem_solve_rollup, statistics_rolled_up_evaluations, evaluation_runs, evaluations, "
+    "agent_scores, evaluation_sets, benchmark_agent_ids, unapproved_agent_ids, banned_coldkeys, agents "
+    "RESTART IDENTITY CASCADE"
+)
+
+# The queries the rollups replaced: they rescan every finished evaluation run (and every agent score) on each call
+FULL_SCAN_PERFECTLY_SOLVED_SQL = f"""
+    WITH
+        time_series AS (
+            SELECT generate_series(
+                {PERFECTLY_SOLVED_SINCE_SQL},
+                DATE_TRUNC('hour', NOW()),
+                '6 hours'::interval
+            ) as hour
+        ),
+        perfectly_solved_problems AS (
+            SELECT
+                erh.benchmark_family,
+                erh.problem_name,
+                MIN(erh.created_at) as first_perfectly_solved_at
+            FROM evaluation_runs_hydrated erh
+                JOIN evaluations e ON erh.evaluation_id = e.evaluation_id
+                JOIN agents a ON e.agent_id = a.agent_id
+            WHERE erh.created_at >= {PERFECTLY_SOLVED_SINCE_SQL}
+                AND erh.status = 'finished'
+                AND erh.benchmark_family IS NOT NULL
+                AND erh.benchmark_family <> ''
+                AND erh.benchmark_family <> 'custom'
+                AND NOT EXISTS (
+                    SELECT 1 FROM banned_coldkeys bc
+                    WHERE bc.miner_coldkey = a.miner_coldkey
+                )
+                AND e.agent_id NOT IN (SELECT agent_id FROM unapproved_agent_ids)
+                AND e.agent_id NOT IN (SELECT agent_id FROM benchmark_agent_ids)
+            GROUP BY erh.benchmark_family, erh.problem_name
+            HAVING COUNT(*) FILTER (WHERE erh.solved = true)::float / COUNT(*) >= 0.90
+        )
+    SELECT
+        ts.hour,
+        psp.benchmark_family,
+        COUNT(psp.problem_name)::int as solved_count
+    FROM time_series ts
+    LEFT JOIN perfectly_solved_problems psp ON psp.first_perfectly_solved_at <= ts.hour
+    GROUP BY ts.hour, psp.benchmark_family
+    ORDER BY ts.hour ASC, psp.benchmark_family ASC NULLS LAST;
+"""
+
+_ELIGIBLE_SCORES_FILTER = """
+    agent_scores.final_score IS NOT NULL
+    AND agent_scores.set_id = (SELECT set_id FROM max_set)
+    AND NOT EXISTS (
+        SELECT 1 FROM banned_coldkeys bc
+        WHERE bc.miner_coldkey = a.miner_coldkey
+    )
+    AND a.agent_id NOT IN (SELECT agent_id FROM unapproved_agent_ids)
+    AND a.agent_id NOT IN (SELECT agent_id FROM benchmark_agent_ids)
+"""
+
+FULL_SCAN_TOP_SCORES_SQL = f"""
+    WITH
+    max_set AS (
+        SELECT MAX(set_id) as set_id FROM evaluation_sets
+    ),
+    time_series AS (
+        SELECT generate_series(
+            (
+                SELECT MIN(DATE_TRUNC('hour', agent_scores.created_at))
+                FROM agent_scores JOIN agents a ON agent_scores.agent_id = a.agent_id
+                WHERE {_ELIGIBLE_SCORES_FILTER}
+            ),
+            DATE_TRUNC('hour', NOW()),
+            '1 hour'::interval
+        ) as hour
+    )
+    SELECT
+        ts.hour,
+        COALESCE(
+            (
+                SELECT MAX(agent_scores.final_score)
+                FROM agent_scores JOIN agents a ON agent_scores.agent_id = a.agent_id
+                WHERE {_ELIGIBLE_SCORES_FILTER} AND agent_scores.created_at <= ts.hour
+            ),
+            0
+        ) as top_score
+    FROM time_series ts
+    ORDER BY ts.hour
+"""
+
+
+@pytest.fixture(autouse=True)
+async def clean_tables(postgres_db):
+    async with _db.pool.acquire() as conn:
+        await conn.execute(TRUNCATE_STATISTICS_TEST_TABLES)
+    yield
+    async with _db.pool.acquire() as conn:
+        await conn.execute(TRUNCATE_STATISTICS_TEST_TABLES)
+
+
+async def _insert_agent(conn, name: str, *, miner_coldkey: str | None = None) -> UUID:
+    agent_id = uuid4()
+    await conn.execute(
+        """
+        INSERT INTO agents (agent_id, miner_hotkey, miner_coldkey, name, version_num, status, created_at, ip_address)
+        VALUES ($1, $2, $3, $2, 0, 'finished', $4, '127.0.0.1')
+        """,
+        agent_id,
+        name,
+        miner_coldkey,
+        SINCE,
+    )
+    return agent_id
+
+
+async def _insert_evaluation(
+    conn, agent_id: UUID, runs: list[tuple[str, str, str, bool, datetime]], *, finished: bool = True
+) -> UUID:
+    """Insert an evaluation with one run per (benchmark_family, problem_name, status, solved, created_at)."""
+    evaluation_id = uuid4()
+    created_at = min(run_created_at for *_, run_created_at in runs)
+    await conn.execute(
+        """
+        INSERT INTO evaluations (
+            evaluation_id, agent_id, validator_hotkey, set_id, evaluation_set_group, created_at, finished_at
+        )
+        VALUES ($1, $2, 'validator-hotkey', $3, 'validator', $4, $5)
+        """,
+        evaluation_id,
+        agent_id,
+        SET_ID,
+        created_at,
+        created_at + timedelta(hours=1) if finished else None,
+    )
+    for benchmark_family, problem_name, status, solved, run_created_at in runs:
+        await conn.execute(
+            """
+            INSERT INTO evaluation_runs (
+                evaluation_run_id, evaluation_id, problem_name, benchmark_family, status, created_at, verifier_reward
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            """,
+            uuid4(),
+            evaluation_id,
+            problem_name,
+            benchmark_family,
+            status,
+            run_created_at,
+            (1.0 if solved else 0.0) if status == "finished" else None,
+        )
+    return evaluation_id
+
+
+async def _insert_agent_score(conn, agent_id: UUID, name: str, final_score: float, created_at: datetime) -> None:
+    await conn.execute(
+        """
+        INSERT INTO agent_scores (
+            agent_id, miner_hotkey, name, version_num, created_at, status,
+            set_id, approved, approved_at, validator_count, final_score
+        )
+        VALUES ($1, $2, $2, 0, $3, 'finished', $4, false, NULL, 1, $5)
+        """,
+        agent_id,
+        name,
+        created_at,
+        SET_ID,
+        final_score,
+    )
+
+
+async def _seed_history() -> list[UUID]:
+    """Seed evaluations that exercise every filter of the statistics. Returns the finished evaluations' ids."""
+    at = SINCE + timedelta(days=3, minutes=17)
+    async with _db.pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO evaluation_sets (set_id, set_group, problem_name, created_at)
+            VALUES ($1, 'validator', 'problem-a', $2)
+            """,
+            SET_ID,
+            SINCE,
+        )
+        agent = await _insert_agent(conn, "agent")
+        other_agent = await _insert_agent(conn, "other-agent")
+        banned_agent = await _insert_agent(conn, "banned-agent", miner_coldkey="banned-coldkey")
+        benchmark_agent = await _insert_agent(conn, "benchmark-agent")
+        unapproved_agent = await _insert_agent(conn, "unapproved-agent")
+        await conn.execute("INSERT INTO banned_coldkeys (miner_coldkey, banned_reason) VALUES ('banned-coldkey', 'x')")
+        await conn.execute(
+            "INSERT INTO benchmark_agent_ids (agent_id, description) VALUES ($1, 'baseline')", benchmark_agent
+        )
+        await conn.execute("INSERT INTO unapproved_agent_ids (agent_id) VALUES ($1)", unapproved_agent)
+
+        finished_evaluation_ids = [
+            await _insert_evaluation(
+                conn,
+                agent,
+                [
+                    ("swe-bench", "problem-a", "finished", True, at),
+                    ("swe-bench", "problem-b", "finished", True, at),
+                    ("polyglot", "problem-c", "finished", True, at + timedelta(minutes=5)),
+                    # Custom problems, errored runs and runs before Problem Set 6 never count
+                    ("custom", "problem-d", "finished", True, at),
+                    ("swe-bench", "problem-e", "error", False, at),
+                    ("swe-bench", "problem-f", "finished", True, SINCE - timedelta(days=1)),
+                ],
+            ),
+            # Solves problem-a again later, and brings problem-b below the 90% bar
+            await _insert_evaluation(
+                conn,
+                other_agent,
+                [
+                    ("swe-bench", "problem-a", "finished", True, at + timedelta(days=2)),
+                    ("swe-bench", "problem-b", "finished", False, at + timedelta(days=2)),
+                ],
+            ),
+            # Solves of ineligible agents don't count
+            await _insert_evaluation(conn, banned_agent, [("swe-bench", "problem-g", "finished", True, at)]),
+            await _insert_evaluation(conn, benchmark_agent, [("swe-bench", "problem-h", "finished", True, at)]),
+            await _insert_evaluation(conn, unapproved_agent, [("polyglot", "problem-i", "finished", True, at)]),
+        ]
+
+        await _insert_agent_score(conn, agent, "agent", 0.4, at)
+        # Exactly on an hour mark: counted from that hour
+        await _insert_agent_score(conn, other_agent, "other-agent", 0.6, at.replace(minute=0) + timedelta(days=1))
+        await _insert_agent_score(conn, banned_agent, "banned-agent", 0.9, at + timedelta(hours=5))
+        await _insert_agent_score(conn, benchmark_agent, "benchmark-agent", 0.95, at + timedelta(hours=6))
+    return finished_evaluation_ids
+
+
+async def _full_scan_perfectly_solved() -> dict[datetime, dict[str, int]]:
+    async with _db.pool.acquire() as conn:
+        rows = await conn.fetch(FULL_SCAN_PERFECTLY_SOLVED_SQL)
+    series: dict[datetime, dict[str, int]] = {}
+    for row in rows:
+        by_family = series.setdefault(row["hour"], {})
+        if row["benchmark_family"] is not None and row["solved_count"] > 0:
+            by_family[row["benchmark_family"]] = row["solved_count"]
+    return series
+
+
+async def _rollup_perfectly_solved() -> dict[datetime, dict[str, int]]:
+    return {point.hour: point.by_family for point in await get_perfectly_solved_over_time()}
+
+
+async def _rollup_rows() -> list[tuple]:
+    async with _db.pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT agent_id, benchmark_family, problem_name, num_runs, num_solved, first_run_at
+            FROM agent_problem_solve_rollup
+            ORDER BY agent_id, benchmark_family, problem_name
+            """
+        )
+    return [tuple(row) for row in rows]
+
+
+@pytest.mark.anyio
+async def test_recorded_evaluations_match_the_full_scan() -> None:
+    for evaluation_id in await _seed_history():
+        await record_evaluation_in_statistics_rollups(evaluation_id)
+
+    expected = await _full_scan_perfectly_solved()
+    assert await _rollup_perfectly_solved() == expected
+    # problem-a and problem-c stay solved; problem-b drops below 90% once other-agent fails it
+    assert list(expected.values())[-1] == {"polyglot": 1, "swe-bench": 1}
+
+    async with _db.pool.acquire() as conn:
+        expected_top_scores = [(row["hour"], row["top_score"]) for row in await conn.fetch(FULL_SCAN_TOP_SCORES_SQL)]
+    top_scores = [(point.hour, point.top_score) for point in await get_top_scores_over_time()]
+    assert top_scores == expected_top_scores
+    assert top_scores[-1][1] == 0.6
+
+
+@pytest.mark.anyio
+async def test_recording_an_evaluation_again_does_not_double_count_it() -> None:
+    evaluation_ids = await _seed_history()
+    for evaluation_id in evaluation_ids:
+        await record_evaluation_in_statistics_rollups(evaluation_id)
+    rollup_rows = await _rollup_rows()
+
+    for evaluation_id in evaluation_ids:
+        await record_evaluation_in_statistics_rollups(evaluation_id)
+
+    assert await _rollup_rows() == rollup_rows
+    assert await _rollup_perfectly_solved() == await _full_scan_perfectly_solved()
+
+
+@pytest.mark.anyio
+async def test_backfill_rebuilds_the_rollups_from_history() -> None:
+    evaluation_ids = await _seed_history()
+    async with _db.pool.acquire() as conn:
+        unfinished_agent = await _insert_agent(conn, "unfinished-agent")
+        await _insert_evaluation(
+            conn, unfinished_agent, [("swe-bench", "problem-j", "running_agent", False, SINCE)], finished=False
+        )
+    # Partially recorded beforehand, as on a platform that ran before the backfill
+    await record_evaluation_in_statistics_rollups(evaluation_ids[0])
+
+    assert await backfill_statistics_rollups() == len(evaluation_ids)
+    rollup_rows = await _rollup_rows()
+    assert await _rollup_perfectly_solved() == await _full_scan_perfectly_solved()
+
+    # The rebuild starts from scratch, so running it again changes nothing
+    assert await backfill_statistics_rollups() == len(evaluation_ids)
+    assert await _rollup_rows() == rollup_rows
@@ -1,9 +1,12 @@
+import logging
+import time
 from pathlib import Path
 
 import pytest
 from kubernetes.client.rest import ApiException
 from websocket import WebSocketConnectionClosedException
 
+import ridges_harbor.exec_output as exec_output
 import ridges_harbor.k8s_environment as k8s_environment
 from ridges_harbor.agents import RidgesMinerAgent
 from ridges_harbor.k8s_environment import RidgesKubernetesEnvironment
@@ -11,30 +14,25 @@ from ridges_harbor.runtime_contract import ExecTransportError, MinerRuntimeError
 
 
 class FakeResp:
-    """Minimal stand-in for a kubernetes-client WSClient."""
+    """Minimal stand-in for a kubernetes-client WSClient.
 
-    def __init__(self, returncode, stdout=""):
+    Each update() moves the next (channel, data) frame into _channels; the stream
+    stays open until every frame has been received.
+    """
+
+    def __init__(self, returncode, stdout="", *, frames=None):
         self._returncode = returncode
-        self._stdout = stdout
+        self._channels = {}
+        self.frames = list(frames or ([(1, stdout)] if stdout else []))
+        self.num_updates = 0
 
     def is_open(self):
-        return bool(self._stdout)
+        return bool(self.frames)
 
     def update(self, timeout):
-        pass
-
-    def peek_stdout(self):
-        return bool(self._stdout)
-
-    def read_stdout(self):
-        out, self._stdout = self._stdout, ""
-        return out
-
-    def peek_stderr(self):
-        return False
-
-    def read_stderr(self):
-        return ""
+        self.num_updates += 1
+        channel, data = self.frames.pop(0)
+        self._channels[channel] = self._channels.get(channel, "") + data
 
     def run_forever(self, timeout):
         pass
@@ -55,6 +53,7 @@ def make_env() -> RidgesKubernetesEnvironment:
     env = RidgesKubernetesEnvironment.__new__(RidgesKubernetesEnvironment)
     env.pod_name = "test-pod"
     env.namespace = "test-ns"
+    env.logger = logging.getLogger(__name__)
     env._core_api = _Api()  # backs the read-only `_api` property
     env._resolve_user = lambda user: None
     env._merge_env = lambda extra: {}
@@ -151,6 +150,51 @@ async def test_nonzero_exit_still_returns_exec_result(monkeypatch) -> None:
     assert result.return_code == 137
 
 
+@pytest.mark.anyio
+async def test_exec_returns_once_the_exit_status_arrives(monkeypatch) -> None:
+    failure = '{"status":"Failure","details":{"causes":[{"reason":"ExitCode","message":"3"}]}}'
+    # The close frame after the status is never waited for
+    resp = FakeResp(
+        returncode=None,
+        frames=[(1, "out "), (2, "err"), (1, "put"), (3, failure), (1, "never read")],
+    )
+    monkeypatch.setattr(k8s_environment, "stream", lambda *a, **k: resp)
+
+    result = await make_env().exec("exit 3")
+
+    assert (result.stdout, result.stderr, result.return_code) == ("out put", "err", 3)
+    assert resp.num_updates == 4
+
+
+@pytest.mark.anyio
+async def test_exec_times_out_inside_the_reader(monkeypatch) -> None:
+    class SilentResp(FakeResp):
+        def is_open(self):
+            return True
+
+        def update(self, timeout):
+            self.num_updates += 1
+            time.sleep(timeout)
+
+    resp = SilentResp(returncode=None)
+    monkeypatch.setattr(k8s_environment, "stream", lambda *a, **k: resp)
+    monkeypatch.setattr(exec_output, "EXEC_POLL_INTERVAL_SEC", 0.05)
+
+    result = await make_env().exec("sleep infinity", timeout_sec=1)
+
+    assert result.return_code == 124
+    assert 10 <= resp.num_updates <= 30
+
+
+def test_exec_output_keeps_the_most_recent_output() -> None:
+    resp = FakeResp(returncode=None, frames=[(1, "abcdef"), (1, "ghij"), (3, '{"status":"Success"}')])
+    reader = exec_output.ExecOutputReader(resp, max_chars=5)
+
+    assert reader.read() is True
+    assert reader.return_code == 0
+    assert reader.stdout.getvalue() == "<truncated 5 chars>\nfghij"
+
+
 @pytest.mark.anyio
 async def test_statusful_api_error_still_returns_exec_result(monkeypatch) -> None:
     def failing_stream(*args, **kwargs):
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from kubernetes import config as k8s_config
+
+from ridges_harbor import k8s_context
+
+
+def test_api_client_is_configured_once_per_context(monkeypatch) -> None:
+    loads: list[str | None] = []
+
+    def load_incluster_config(client_configuration):
+        raise k8s_config.ConfigException("not in a cluster")
+
+    def load_kube_config(context, client_configuration):
+        loads.append(context)
+        client_configuration.host = f"https://{context}.example.test"
+
+    monkeypatch.setattr(k8s_context, "_api_clients", {})
+    monkeypatch.setattr(k8s_config, "load_incluster_config", load_incluster_config)
+    monkeypatch.setattr(k8s_config, "load_kube_config", load_kube_config)
+
+    core_api, batch_api = k8s_context.get_k8s_apis("staging")
+    assert core_api.api_client is batch_api.api_client
+    assert core_api.api_client.configuration.host == "https://staging.example.test"
+    assert k8s_context.get_k8s_apis("staging")[0].api_client is core_api.api_client
+    assert k8s_context.get_k8s_api_client("prod") is not core_api.api_client
+    assert loads == ["staging", "prod"]
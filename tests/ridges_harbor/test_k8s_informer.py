@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+from types import SimpleNamespace
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+import ridges_harbor.k8s_environment as k8s_environment
+import ridges_harbor.k8s_informer as k8s_informer
+from ridges_harbor.k8s_environment import RidgesKubernetesEnvironment
+
+
+def _job(name: str, *, uid: str = "uid-1", condition: str | None = None, resource_version: str = "1"):
+    conditions = [SimpleNamespace(type=condition, status="True", message="")] if condition else []
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, uid=uid, annotations={}, resource_version=resource_version),
+        status=SimpleNamespace(conditions=conditions),
+    )
+
+
+def _event(event_type: str, job) -> dict:
+    return {
+        "type": event_type,
+        "object": job,
+        "raw_object": {"metadata": {"resourceVersion": job.metadata.resource_version}},
+    }
+
+
+class FakeWatch:
+    """Replays events the test puts on ``events``; an exception instance is raised, None ends the stream."""
+
+    events: queue.Queue = queue.Queue()
+    resource_versions: list[str] = []
+
+    def __init__(self) -> None:
+        self._stop = False
+
+    def stop(self) -> None:
+        self._stop = True
+
+    def stream(self, func, **kwargs):
+        FakeWatch.resource_versions.append(kwargs["resource_version"])
+        while not self._stop:
+            try:
+                event = FakeWatch.events.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if event is None:
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+class FakeBatchApi:
+    def __init__(self, jobs: list) -> None:
+        self.jobs = {job.metadata.name: job for job in jobs}
+        self.num_lists = 0
+        self.num_reads = 0
+
+    def list_namespaced_job(self, namespace, label_selector, **kwargs):
+        self.num_lists += 1
+        return SimpleNamespace(metadata=SimpleNamespace(resource_version="10"), items=list(self.jobs.values()))
+
+    def read_namespaced_job(self, name, namespace):
+        self.num_reads += 1
+        if name not in self.jobs:
+            raise ApiException(status=404)
+        return self.jobs[name]
+
+
+class FakeCoreApi:
+    def delete_namespaced_secret(self, name, namespace):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_watch(monkeypatch):
+    FakeWatch.events = queue.Queue()
+    FakeWatch.resource_versions = []
+    monkeypatch.setattr(k8s_informer.k8s_watch, "Watch", FakeWatch)
+    monkeypatch.setattr(k8s_informer, "WATCH_RETRY_DELAY_SEC", 0.05)
+    yield
+    for informer in k8s_informer._informers.values():
+        informer.stop()
+    k8s_informer._informers.clear()
+
+
+def make_env(batch_api: FakeBatchApi) -> RidgesKubernetesEnvironment:
+    env = RidgesKubernetesEnvironment.__new__(RidgesKubernetesEnvironment)
+    env.namespace = "test-ns"
+    env.logger = logging.getLogger(__name__)
+    env._batch_api = batch_api
+    env._core_api = FakeCoreApi()
+    return env
+
+
+async def _wait_until(predicate) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.anyio
+async def test_build_wait_wakes_on_watch_event_without_polling() -> None:
+    batch_api = FakeBatchApi([_job("build-a")])
+    env = make_env(batch_api)
+
+    waiter = asyncio.create_task(env._wait_for_build_job("build-a", "build-a-url", "img", timeout_sec=30))
+    await _wait_until(lambda: "test-ns" in k8s_informer._informers)
+    informer = k8s_informer._informers["test-ns"]
+    await _wait_until(lambda: informer.synced and "build-a" in informer.waiters)
+    reads_before_event = batch_api.num_reads
+
+    FakeWatch.events.put(_event("MODIFIED", _job("build-a", condition="Complete", resource_version="11")))
+    await asyncio.wait_for(waiter, timeout=2)
+
+    assert batch_api.num_lists == 1
+    assert batch_api.num_reads == reads_before_event
+    assert FakeWatch.resource_versions == ["10"]
+
+
+@pytest.mark.anyio
+async def test_informer_resumes_from_last_resource_version_and_relists_when_gone() -> None:
+    batch_api = FakeBatchApi([])
+    informer = k8s_informer.get_build_job_informer(batch_api, "test-ns")
+    await _wait_until(lambda: informer.synced)
+
+    FakeWatch.events.put(_event("ADDED", _job("build-b", resource_version="12")))
+    # A dropped stream resumes from the last event's resource version
+    FakeWatch.events.put(None)
+    await _wait_until(lambda: FakeWatch.resource_versions == ["10", "12"])
+    assert informer.get("build-b") is not None
+
+    # A transient failure drops sync (waiters poll) until the resumed watch delivers an event
+    FakeWatch.events.put(ConnectionError("reset"))
+    await _wait_until(lambda: not informer.synced)
+    FakeWatch.events.put(_event("DELETED", _job("build-b", resource_version="13")))
+    await _wait_until(lambda: informer.synced and informer.get("build-b") is None)
+    assert batch_api.num_lists == 1
+
+    # An expired resource version forces a fresh list
+    FakeWatch.events.put(ApiException(status=410))
+    await _wait_until(lambda: batch_api.num_lists == 2)
+
+
+@pytest.mark.anyio
+async def test_build_wait_polls_while_the_watch_is_down(monkeypatch) -> None:
+    monkeypatch.setattr(k8s_environment, "BUILD_JOB_POLL_INTERVAL_SEC", 0.05)
+
+    class FailingListBatchApi(FakeBatchApi):
+        def list_namespaced_job(self, namespace, label_selector, **kwargs):
+            raise ConnectionError("API server unavailable")
+
+    batch_api = FailingListBatchApi([_job("build-c")])
+    env = make_env(batch_api)
+
+    waiter = asyncio.create_task(env._wait_for_build_job("build-c", "build-c-url", "img", timeout_sec=30))
+    await _wait_until(lambda: batch_api.num_reads >= 2)
+    batch_api.jobs["build-c"] = _job("build-c", condition="Complete")
+    await asyncio.wait_for(waiter, timeout=2)
@@ -22,6 +22,7 @@ from ridges_harbor._stdlib_contract import (
 from ridges_harbor.agents import MinerRuntimeError, RidgesMinerAgent
 from ridges_harbor.docker_runtime import docker_environment_env
 from ridges_harbor.runner import _run_task_dir
+from ridges_harbor.single_flight_cache import SingleFlightTTLCache
 
 
 def test_docker_environment_defaults_to_buildkit_bake(monkeypatch, tmp_path: Path) -> None:
@@ -267,15 +268,13 @@ async def test_run_task_dir_uses_task_config_and_environment_env(tmp_path: Path,
 
 @pytest.mark.anyio
 async def test_run_task_dir_uses_loopback_proxy_in_kubernetes(tmp_path: Path, monkeypatch) -> None:
-    from kubernetes import client as k8s_client
-    from kubernetes import config as k8s_config
-
+    from ridges_harbor import k8s_context
     from validator import config as validator_config
 
     _install_fake_harbor(monkeypatch)
     monkeypatch.setenv("RIDGES_ENVIRONMENT_TYPE", "kubernetes")
-    monkeypatch.setattr(k8s_config, "load_incluster_config", lambda: None)
-    monkeypatch.setattr(k8s_client, "CoreV1Api", lambda: object())
+    monkeypatch.setattr(k8s_context, "get_k8s_apis", lambda context: (object(), object()))
+    monkeypatch.setattr(k8s_context, "presigned_url_cache", SingleFlightTTLCache(k8s_context.presigned_url_ttl_sec))
     # These are absent if another test imported validator.config in Docker mode.
     monkeypatch.setattr(validator_config, "K8S_MEMORY_REQUEST_FRACTION", 0.25, raising=False)
     monkeypatch.setattr(validator_config, "K8S_CPU_REQUEST_FRACTION", 0.25, raising=False)
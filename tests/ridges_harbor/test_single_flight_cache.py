@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ridges_harbor.k8s_context import presigned_url_ttl_sec
+from ridges_harbor.registry_cache import image_existence_ttl_sec
+from ridges_harbor.single_flight_cache import SingleFlightTTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSource:
+    def __init__(self, value, clock: FakeClock | None = None, load_sec: float = 0) -> None:
+        self.value = value
+        self.clock = clock
+        self.load_sec = load_sec
+        self.num_loads = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def load(self):
+        self.num_loads += 1
+        await self.release.wait()
+        if self.clock is not None:
+            self.clock.now += self.load_sec
+        return self.value
+
+
+@pytest.mark.anyio
+async def test_values_live_for_their_own_ttl_from_when_their_load_started() -> None:
+    clock = FakeClock()
+    cache = SingleFlightTTLCache(lambda exists: 600 if exists else 10, clock=clock)
+    present, missing = FakeSource(True, clock, load_sec=4), FakeSource(False)
+
+    assert await cache.get("a", present.load) is True
+    assert await cache.get("b", missing.load) is False
+    clock.now = 9
+    assert await cache.get("b", missing.load) is False
+    assert (present.num_loads, missing.num_loads) == (1, 1)
+
+    # "b" was loaded at 4 and "a" at 0, while its 4s load was running
+    clock.now = 14
+    missing.value = True
+    assert await cache.get("b", missing.load) is True
+    clock.now = 599
+    assert await cache.get("a", present.load) is True
+    clock.now = 600
+    assert await cache.get("a", present.load) is True
+    assert (present.num_loads, missing.num_loads) == (2, 2)
+    assert cache.stats() == {"hits": 2, "misses": 4, "num_entries": 2}
+
+
+@pytest.mark.anyio
+async def test_concurrent_lookups_share_one_load_and_failures_are_not_cached() -> None:
+    cache = SingleFlightTTLCache(lambda _value: 60, clock=FakeClock())
+    calls = 0
+    release = asyncio.Event()
+
+    async def flaky_load() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        if calls == 1:
+            raise ConnectionError("unavailable")
+        return "value"
+
+    waiters = [asyncio.create_task(cache.get("a", flaky_load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    # A cancelled caller doesn't cancel the load the others are waiting on
+    waiters[0].cancel()
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert all(isinstance(result, ConnectionError) for result in results[1:])
+    assert calls == 1
+
+    assert await cache.get("a", flaky_load) == "value"
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_put_and_invalidate_override_loaded_values() -> None:
+    cache = SingleFlightTTLCache(image_existence_ttl_sec, clock=FakeClock())
+    registry = FakeSource(False)
+
+    assert await cache.get("registry/a:1", registry.load) is False
+    # A finished build records the image; a failed Pod start forgets it again
+    cache.put("registry/a:1", True)
+    assert await cache.get("registry/a:1", registry.load) is True
+    cache.invalidate("registry/a:1")
+    assert await cache.get("registry/a:1", registry.load) is False
+    assert registry.num_loads == 2
+
+
+def test_cached_presigned_urls_and_images_expire_as_configured() -> None:
+    # A URL is handed out only while at least 3 of its 5 minutes are left
+    assert presigned_url_ttl_sec("https://tasks.example.test/task.tar.gz") == 120
+    # Another screener may be building a missing image, so a negative answer is short-lived
+    assert image_existence_ttl_sec(True) == 30 * 60
+    assert image_existence_ttl_sec(False) == 15
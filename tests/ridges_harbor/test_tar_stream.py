@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import io
+import tarfile
+
+from ridges_harbor.k8s_environment import KubernetesEnvironment
+from ridges_harbor.tar_stream import TAR_STREAM_CHUNK_SIZE, ExecStdoutReader, iter_dir_files
+
+BLOB = bytes(range(256)) * 8192
+
+
+class FakeExecStream:
+    """Stand-in for a kubernetes.stream WSClient that serves stdout in fixed-size frames."""
+
+    def __init__(self, stdout: bytes = b"", *, frame_size: int = 4096, stderr: str = "") -> None:
+        self.frames = [stdout[i : i + frame_size] for i in range(0, len(stdout), frame_size)]
+        self.stderr = stderr
+        self.pending_stdout: bytes | None = None
+        self.pending_stderr: str | None = None
+        self.stdin_frames: list[bytes] = []
+        self.closed = False
+
+    def is_open(self) -> bool:
+        return not self.closed
+
+    def update(self, timeout: float = 0) -> None:
+        if self.frames:
+            self.pending_stdout = self.frames.pop(0)
+        elif self.stderr:
+            self.pending_stderr, self.stderr = self.stderr, ""
+        else:
+            self.closed = True
+
+    def peek_stdout(self) -> bool:
+        return self.pending_stdout is not None
+
+    def read_stdout(self) -> bytes:
+        chunk, self.pending_stdout = self.pending_stdout, None
+        return chunk
+
+    def peek_stderr(self) -> bool:
+        return self.pending_stderr is not None
+
+    def read_stderr(self) -> str:
+        chunk, self.pending_stderr = self.pending_stderr, None
+        return chunk
+
+    def write_stdin(self, data: bytes) -> None:
+        self.stdin_frames.append(data)
+
+    def run_forever(self, timeout: float = 0) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _make_workspace(tmp_path):
+    source_dir = tmp_path / "workspace"
+    (source_dir / "src").mkdir(parents=True)
+    (source_dir / "README.md").write_text("hello\n")
+    (source_dir / "src" / "blob.bin").write_bytes(BLOB)
+    return source_dir
+
+
+def _environment() -> KubernetesEnvironment:
+    return KubernetesEnvironment.__new__(KubernetesEnvironment)
+
+
+def test_upload_streams_archive_in_bounded_frames(tmp_path) -> None:
+    source_dir = _make_workspace(tmp_path)
+    resp = FakeExecStream()
+
+    _environment()._write_tar_stream(resp, iter_dir_files(source_dir), "to test pod")
+
+    assert len(resp.stdin_frames) > 1
+    assert max(len(frame) for frame in resp.stdin_frames) <= TAR_STREAM_CHUNK_SIZE
+    assert resp.closed
+    with tarfile.open(fileobj=io.BytesIO(b"".join(resp.stdin_frames)), mode="r") as tar:
+        assert sorted(tar.getnames()) == ["README.md", "src/blob.bin"]
+        assert tar.extractfile("src/blob.bin").read() == BLOB
+
+
+def test_download_extracts_members_while_reading_with_bounded_buffer(tmp_path) -> None:
+    source_dir = _make_workspace(tmp_path)
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        tar.add(str(source_dir), arcname=".")
+    resp = FakeExecStream(archive.getvalue())
+    reader = ExecStdoutReader(resp)
+
+    max_buffered = 0
+    original_read = reader.read
+
+    def tracking_read(size: int = -1) -> bytes:
+        nonlocal max_buffered
+        data = original_read(size)
+        max_buffered = max(max_buffered, len(reader.buffer) + len(data))
+        return data
+
+    reader.read = tracking_read
+    target_dir = tmp_path / "downloaded"
+    target_dir.mkdir()
+    _environment()._extract_tar_all(reader, target_dir)
+
+    assert (target_dir / "README.md").read_text() == "hello\n"
+    assert (target_dir / "src" / "blob.bin").read_bytes() == BLOB
+    assert reader.num_bytes == len(archive.getvalue())
+    assert max_buffered < 64 * 1024
+
+
+def test_download_single_member_drains_rest_and_collects_stderr(tmp_path) -> None:
+    source_dir = _make_workspace(tmp_path)
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        tar.add(str(source_dir / "README.md"), arcname="workspace/README.md")
+        tar.add(str(source_dir / "src" / "blob.bin"), arcname="workspace/src/blob.bin")
+    resp = FakeExecStream(archive.getvalue(), stderr="tar: Removing leading `/'\n")
+    reader = ExecStdoutReader(resp)
+
+    target_path = tmp_path / "out" / "readme.txt"
+    target_path.parent.mkdir()
+    _environment()._extract_tar_member(reader, "/workspace/README.md", target_path)
+
+    assert target_path.read_text() == "hello\n"
+    assert resp.closed
+    assert reader.num_bytes == len(archive.getvalue())
+    assert "Removing leading" in reader.stderr
@@ -2,7 +2,7 @@ import os
 import time
 from pathlib import Path
 
-from utils.cleanup import prune_dirs_older_than
+from utils.cleanup import prune_dirs_older_than, prune_dirs_to_size_budget
 
 
 def _make_dir(parent: Path, name: str, *, age_seconds: float | None = None) -> Path:
@@ -83,3 +83,34 @@ def test_one_bad_dir_does_not_abort_sweep(tmp_path: Path, monkeypatch):
     assert removed == 1
     assert bad.exists()
     assert not good.exists()
+
+
+def test_size_budget_evicts_least_recently_modified_down_to_target(tmp_path: Path):
+    oldest = _make_dir(tmp_path, "oldest", age_seconds=300)
+    older = _make_dir(tmp_path, "older", age_seconds=200)
+    pinned = _make_dir(tmp_path, "pinned", age_seconds=1_000)
+    newest = _make_dir(tmp_path, "newest", age_seconds=10)
+    sizes = {"oldest": 40, "older": 30, "pinned": 50, "newest": 20}
+
+    summary = prune_dirs_to_size_budget(
+        tmp_path,
+        max_bytes=120,
+        target_bytes=90,
+        exclude_names={"pinned"},
+        size_of=lambda path: sizes[path.name],
+    )
+
+    assert summary == {"total_bytes": 70, "removed": 2, "removed_bytes": 70}
+    assert not oldest.exists()
+    assert not older.exists()
+    assert pinned.exists()
+    assert newest.exists()
+
+
+def test_size_budget_does_nothing_under_the_high_watermark(tmp_path: Path):
+    kept = _make_dir(tmp_path, "kept", age_seconds=10_000)
+
+    summary = prune_dirs_to_size_budget(tmp_path, max_bytes=10, target_bytes=0)
+
+    assert summary == {"total_bytes": 1, "removed": 0, "removed_bytes": 0}
+    assert kept.exists()
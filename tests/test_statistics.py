@@ -32,8 +32,8 @@ async def test_get_perfectly_solved_over_time_returns_dynamic_family_counts() ->
     result = await statistics_module.get_perfectly_solved_over_time.__wrapped__(conn)
 
     assert conn.query is not None
-    assert "erh.benchmark_family <> 'custom'" in conn.query
-    assert "GROUP BY erh.benchmark_family, erh.problem_name" in conn.query
+    assert "FROM agent_problem_solve_rollup r" in conn.query
+    assert "GROUP BY r.benchmark_family, r.problem_name" in conn.query
     assert result == [
         statistics_module.PerfectlySolvedOverTime(hour=hour_1, total_solved=0, by_family={}),
         statistics_module.PerfectlySolvedOverTime(
@@ -42,3 +42,12 @@ async def test_get_perfectly_solved_over_time_returns_dynamic_family_counts() ->
             by_family={"scale-ai": 1, "swe-bench": 2},
         ),
     ]
+
+
+def test_rollup_excludes_custom_family_and_merges_counts() -> None:
+    query = statistics_module._ROLL_UP_EVALUATION_RUNS_SQL
+
+    assert "erh.benchmark_family <> 'custom'" in query
+    assert "GROUP BY e.agent_id, erh.benchmark_family, erh.problem_name" in query
+    assert "num_runs = r.num_runs + EXCLUDED.num_runs" in query
+    assert "first_run_at = LEAST(r.first_run_at, EXCLUDED.first_run_at)" in query
@@ -1,11 +1,14 @@
+import asyncio
 import io
 import tarfile
+import threading
 from pathlib import Path
 
 import pytest
 
+import ridges_harbor.digest as digest_module
 import utils.task_cache as task_cache_module
-from ridges_harbor.digest import compute_task_digest
+from ridges_harbor.digest import compute_task_digest, resolve_task_digest, write_digest_manifest
 
 
 def _write(path: Path, content: str) -> None:
@@ -20,11 +23,11 @@ def _task_archive_bytes(task_dir: Path, *, top_level_name: str) -> bytes:
     return buffer.getvalue()
 
 
-def _loose_task_archive_bytes(task_dir: Path) -> bytes:
+def _loose_task_archive_bytes(task_dir: Path, *, recursive: bool = True) -> bytes:
     buffer = io.BytesIO()
     with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
         for path in sorted(task_dir.rglob("*")):
-            tar.add(path, arcname=path.relative_to(task_dir))
+            tar.add(path, arcname=path.relative_to(task_dir), recursive=recursive)
     return buffer.getvalue()
 
 
@@ -41,27 +44,29 @@ class _FakeStreamResponse:
     def __init__(self, payload: bytes):
         self._payload = payload
 
-    async def __aenter__(self):
+    def __enter__(self):
         return self
 
-    async def __aexit__(self, exc_type, exc, tb):
+    def __exit__(self, exc_type, exc, tb):
         return False
 
     def raise_for_status(self) -> None:
         return None
 
-    async def aiter_bytes(self):
-        yield self._payload
+    def iter_bytes(self, chunk_size: int | None = None):
+        # Small chunks, so tar headers and member data straddle chunk boundaries
+        for offset in range(0, len(self._payload), 7):
+            yield self._payload[offset : offset + 7]
 
 
-class _FakeAsyncClient:
+class _FakeClient:
     def __init__(self, payload: bytes):
         self._payload = payload
 
-    async def __aenter__(self):
+    def __enter__(self):
         return self
 
-    async def __aexit__(self, exc_type, exc, tb):
+    def __exit__(self, exc_type, exc, tb):
         return False
 
     def stream(self, method: str, url: str, **kwargs):
@@ -79,8 +84,8 @@ async def test_get_or_download_task_caches_under_digest_then_task_name(tmp_path:
 
     monkeypatch.setattr(
         task_cache_module.httpx,
-        "AsyncClient",
-        lambda: _FakeAsyncClient(archive_bytes),
+        "Client",
+        lambda **kwargs: _FakeClient(archive_bytes),
     )
 
     cached_task_dir = await task_cache_module.get_or_download_task(
@@ -108,8 +113,8 @@ async def test_get_or_download_task_handles_loose_top_level_files(tmp_path: Path
 
     monkeypatch.setattr(
         task_cache_module.httpx,
-        "AsyncClient",
-        lambda: _FakeAsyncClient(archive_bytes),
+        "Client",
+        lambda **kwargs: _FakeClient(archive_bytes),
     )
 
     cached_task_dir = await task_cache_module.get_or_download_task(
@@ -170,11 +175,11 @@ async def test_get_or_download_task_reuses_existing_digest_dir_for_different_tas
     _write(cached_task_dir / "task.toml", 'version = "1.0"\n')
     _write(cached_task_dir / "tests" / "test.sh", "#!/bin/bash\n")
 
-    class _FailAsyncClient:
+    class _FailClient:
         def __init__(self, *args, **kwargs):
             raise AssertionError("network should not be used when digest is already cached")
 
-    monkeypatch.setattr(task_cache_module.httpx, "AsyncClient", _FailAsyncClient)
+    monkeypatch.setattr(task_cache_module.httpx, "Client", _FailClient)
 
     resolved = await task_cache_module.get_or_download_task(
         "https://example.test/task.tar.gz",
@@ -186,6 +191,201 @@ async def test_get_or_download_task_reuses_existing_digest_dir_for_different_tas
     assert resolved == cached_task_dir
 
 
+@pytest.mark.anyio
+async def test_get_or_download_task_hashes_while_streaming(tmp_path: Path, monkeypatch) -> None:
+    source_task_dir = tmp_path / "source-task"
+    _write(source_task_dir / "instruction.md", "Solve the problem.\n")
+    _write(source_task_dir / "task.toml", 'version = "1.0"\n')
+    _write(source_task_dir / "tests" / "test.sh", "#!/bin/bash\n")
+    (source_task_dir / "tests" / "test.sh").chmod(0o755)
+    _write(source_task_dir / "tests" / "__pycache__" / "x.pyc", "ignored")
+    digest = compute_task_digest(source_task_dir)
+
+    def fail_compute(_task_dir: Path) -> str:
+        raise AssertionError("task was re-hashed after extraction")
+
+    monkeypatch.setattr(task_cache_module, "compute_task_digest", fail_compute)
+
+    for cache_name, archive_bytes in (
+        ("nested", _task_archive_bytes(source_task_dir, top_level_name="downloaded-task")),
+        ("loose", _loose_task_archive_bytes(source_task_dir, recursive=False)),
+    ):
+        monkeypatch.setattr(task_cache_module.httpx, "Client", lambda **kwargs: _FakeClient(archive_bytes))
+
+        cached_task_dir = await task_cache_module.get_or_download_task(
+            "https://example.test/task.tar.gz",
+            "update-status-file",
+            digest,
+            cache_root=tmp_path / cache_name,
+        )
+
+        assert (cached_task_dir / "tests" / "test.sh").stat().st_mode & 0o111
+        assert digest_module.read_manifest_digest(cached_task_dir) == digest
+
+
+@pytest.mark.anyio
+async def test_get_or_download_task_rehashes_unordered_archive(tmp_path: Path, monkeypatch) -> None:
+    source_task_dir = tmp_path / "source-task"
+    _write(source_task_dir / "instruction.md", "Solve the problem.\n")
+    _write(source_task_dir / "task.toml", 'version = "1.0"\n')
+    digest = compute_task_digest(source_task_dir)
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for path in sorted(source_task_dir.iterdir(), reverse=True):
+            tar.add(path, arcname=f"task/{path.name}")
+    archive_bytes = buffer.getvalue()
+    monkeypatch.setattr(task_cache_module.httpx, "Client", lambda **kwargs: _FakeClient(archive_bytes))
+
+    cached_task_dir = await task_cache_module.get_or_download_task(
+        "https://example.test/task.tar.gz",
+        "task",
+        digest,
+        cache_root=tmp_path / "cache",
+    )
+
+    assert digest_module.read_manifest_digest(cached_task_dir) == digest
+
+
+@pytest.mark.anyio
+async def test_get_or_download_task_rejects_digest_mismatch(tmp_path: Path, monkeypatch) -> None:
+    source_task_dir = tmp_path / "source-task"
+    _write(source_task_dir / "instruction.md", "Solve the problem.\n")
+    archive_bytes = _task_archive_bytes(source_task_dir, top_level_name="downloaded-task")
+    monkeypatch.setattr(task_cache_module.httpx, "Client", lambda **kwargs: _FakeClient(archive_bytes))
+
+    with pytest.raises(RuntimeError, match="digest mismatch"):
+        await task_cache_module.get_or_download_task(
+            "https://example.test/task.tar.gz",
+            "task",
+            "sha256:expected",
+            cache_root=tmp_path / "cache",
+        )
+
+    leftovers = [path.name for path in (tmp_path / "cache").iterdir()]
+    assert leftovers == [task_cache_module.LOCKS_DIR_NAME]
+
+
+@pytest.mark.anyio
+async def test_task_downloaded_hook_runs_after_downloads_only(tmp_path: Path, monkeypatch) -> None:
+    source_task_dir = tmp_path / "source-task"
+    _write(source_task_dir / "instruction.md", "Solve the problem.\n")
+    digest = compute_task_digest(source_task_dir)
+    archive_bytes = _task_archive_bytes(source_task_dir, top_level_name="downloaded-task")
+    monkeypatch.setattr(task_cache_module.httpx, "Client", lambda **kwargs: _FakeClient(archive_bytes))
+
+    downloaded: list[str] = []
+
+    async def hook(task_digest: str) -> None:
+        # The download is already in the cache when the hook runs
+        assert task_cache_module.get_cached_task("task", task_digest, cache_root=tmp_path / "cache") is not None
+        downloaded.append(task_digest)
+        raise RuntimeError("eviction failed")
+
+    monkeypatch.setattr(task_cache_module, "_task_downloaded_hook", None)
+    task_cache_module.set_task_downloaded_hook(hook)
+    for _ in range(2):
+        # A failing hook doesn't fail the download
+        await task_cache_module.get_or_download_task(
+            "https://example.test/task.tar.gz", "task", digest, cache_root=tmp_path / "cache"
+        )
+
+    assert downloaded == [digest]
+
+
+class _StallingClient(_FakeClient):
+    """Streams the first chunk, then blocks until ``resume`` is set before streaming the rest."""
+
+    def __init__(self, payload: bytes):
+        super().__init__(payload)
+        self.stalled = threading.Event()
+        self.resume = threading.Event()
+        self.num_chunks_sent = 0
+
+    def stream(self, method: str, url: str, **kwargs):
+        client = self
+
+        class _StallingResponse(_FakeStreamResponse):
+            def iter_bytes(self, chunk_size: int | None = None):
+                for offset in range(0, len(self._payload), 64):
+                    if client.num_chunks_sent == 1:
+                        client.stalled.set()
+                        client.resume.wait()
+                    client.num_chunks_sent += 1
+                    yield self._payload[offset : offset + 64]
+
+        return _StallingResponse(self._payload)
+
+
+@pytest.mark.anyio
+async def test_cancelled_download_stops_its_thread_before_cleaning_up(tmp_path: Path, monkeypatch) -> None:
+    source_task_dir = tmp_path / "source-task"
+    for index in range(20):
+        _write(source_task_dir / f"file-{index}.txt", f"{index}\n" * 200)
+    digest = compute_task_digest(source_task_dir)
+    archive_bytes = _task_archive_bytes(source_task_dir, top_level_name="task")
+    client = _StallingClient(archive_bytes)
+    monkeypatch.setattr(task_cache_module.httpx, "Client", lambda **kwargs: client)
+    cache_root = tmp_path / "cache"
+
+    download = asyncio.create_task(
+        task_cache_module.get_or_download_task(
+            "https://example.test/task.tar.gz", "task", digest, cache_root=cache_root
+        )
+    )
+    while not client.stalled.is_set():
+        await asyncio.sleep(0.01)
+    download.cancel()
+    await asyncio.sleep(0.05)
+
+    # The thread is still writing into its download dir, so neither it nor the download lock is released yet
+    assert not download.done()
+    assert list(cache_root.glob(".tmp-*"))
+
+    client.resume.set()
+    with pytest.raises(asyncio.CancelledError):
+        await download
+    assert client.num_chunks_sent == 2
+    assert not list(cache_root.glob(".tmp-*"))
+
+    # The lock was released: the next download goes through
+    monkeypatch.setattr(task_cache_module.httpx, "Client", lambda **kwargs: _FakeClient(archive_bytes))
+    cached_task_dir = await task_cache_module.get_or_download_task(
+        "https://example.test/task.tar.gz", "task", digest, cache_root=cache_root
+    )
+    assert (cached_task_dir / "file-0.txt").exists()
+
+
+@pytest.mark.anyio
+async def test_prefetched_runs_count_one_lookup_each(tmp_path: Path, monkeypatch) -> None:
+    source_task_dir = tmp_path / "source-task"
+    _write(source_task_dir / "instruction.md", "Solve the problem.\n")
+    digest = compute_task_digest(source_task_dir)
+    archive_bytes = _task_archive_bytes(source_task_dir, top_level_name="task")
+    monkeypatch.setattr(task_cache_module.httpx, "Client", lambda **kwargs: _FakeClient(archive_bytes))
+    monkeypatch.setattr(task_cache_module, "task_cache_stats", task_cache_module.TaskCacheStats())
+    monkeypatch.setattr(task_cache_module, "_prefetched_digests", set())
+    cache_root = tmp_path / "cache"
+
+    async def prefetch_then_run() -> None:
+        # As the validator does: the prefetch probes the cache, then stages the task ahead of the run
+        if task_cache_module.get_cached_task("task", digest, cache_root=cache_root, record_stats=False) is None:
+            await task_cache_module.get_or_download_task(
+                "https://example.test/task.tar.gz", "task", digest, cache_root=cache_root, prefetch=True
+            )
+        assert task_cache_module.get_cached_task("task", digest, cache_root=cache_root) is not None
+
+    # Cold: one download, and the run finding the prefetched task isn't a hit
+    await prefetch_then_run()
+    stats = task_cache_module.get_task_cache_stats()
+    assert (stats["hits"], stats["downloads"], stats["hit_ratio"]) == (0, 1, 0.0)
+
+    # Warm: one hit
+    await prefetch_then_run()
+    stats = task_cache_module.get_task_cache_stats()
+    assert (stats["hits"], stats["downloads"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
 def test_compute_task_digest_changes_when_file_mode_changes(tmp_path: Path) -> None:
     task_dir = tmp_path / "task"
     _write(task_dir / "instruction.md", "Solve the problem.\n")
@@ -202,6 +402,63 @@ def test_compute_task_digest_changes_when_file_mode_changes(tmp_path: Path) -> N
     assert executable_digest != non_executable_digest
 
 
+@pytest.mark.anyio
+async def test_get_or_download_task_writes_digest_manifest(tmp_path: Path, monkeypatch) -> None:
+    source_task_dir = tmp_path / "source-task"
+    _write(source_task_dir / "instruction.md", "Solve the problem.\n")
+    _write(source_task_dir / "tests" / "test.sh", "#!/bin/bash\n")
+    digest = compute_task_digest(source_task_dir)
+    archive_bytes = _task_archive_bytes(source_task_dir, top_level_name="downloaded-task")
+
+    monkeypatch.setattr(
+        task_cache_module.httpx,
+        "Client",
+        lambda **kwargs: _FakeClient(archive_bytes),
+    )
+
+    cached_task_dir = await task_cache_module.get_or_download_task(
+        "https://example.test/task.tar.gz",
+        "update-status-file",
+        digest,
+        cache_root=tmp_path / "cache",
+    )
+
+    assert (cached_task_dir.parent / ".update-status-file.manifest.json").exists()
+    assert digest_module.read_manifest_digest(cached_task_dir) == digest
+    assert task_cache_module._cached_task_dirs_for_digest(digest, cache_root=tmp_path / "cache") == [cached_task_dir]
+
+
+def test_resolve_task_digest_trusts_matching_manifest(tmp_path: Path, monkeypatch) -> None:
+    task_dir = tmp_path / "task"
+    _write(task_dir / "instruction.md", "Solve the problem.\n")
+    write_digest_manifest(task_dir, "sha256:recorded")
+
+    def fail_compute(_task_dir: Path) -> str:
+        raise AssertionError("task was re-hashed")
+
+    monkeypatch.setattr(digest_module, "compute_task_digest", fail_compute)
+
+    assert resolve_task_digest(task_dir) == "sha256:recorded"
+
+
+def test_resolve_task_digest_rehashes_when_files_change_or_paranoid(tmp_path: Path) -> None:
+    import os
+
+    task_dir = tmp_path / "task"
+    _write(task_dir / "instruction.md", "Solve the problem.\n")
+    write_digest_manifest(task_dir, "sha256:recorded")
+
+    assert resolve_task_digest(task_dir, paranoid=True) == compute_task_digest(task_dir)
+
+    stat_result = (task_dir / "instruction.md").stat()
+    os.utime(task_dir / "instruction.md", ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+    assert resolve_task_digest(task_dir) == compute_task_digest(task_dir)
+
+    write_digest_manifest(task_dir, "sha256:recorded")
+    _write(task_dir / "extra.txt", "new file\n")
+    assert resolve_task_digest(task_dir) == compute_task_digest(task_dir)
+
+
 def test_get_cached_task_touches_digest_dir(tmp_path: Path) -> None:
     import os
     import time
@@ -264,3 +521,125 @@ def test_prune_task_cache_reaps_orphaned_tmp_dir(tmp_path: Path) -> None:
 
     assert removed == 1
     assert not (cache_root / ".tmp-deadbeef").exists()
+
+
+def test_evict_task_cache_to_budget_keeps_recent_and_active_tasks(tmp_path: Path, monkeypatch) -> None:
+    import os
+    import time
+
+    monkeypatch.setattr(task_cache_module, "task_cache_stats", task_cache_module.TaskCacheStats())
+    cache_root = tmp_path / "cache"
+    for age_seconds, digest in ((3_000, "sha256:active"), (2_000, "sha256:cold"), (1_000, "sha256:warm")):
+        task_dir = _seed_cached_digest(cache_root, digest)
+        (task_dir / "payload.bin").write_bytes(b"x" * 1_000)
+        old = time.time() - age_seconds
+        os.utime(cache_root / digest.replace(":", "_"), (old, old))
+    (cache_root / ".tmp-download").mkdir()
+    (cache_root / ".tmp-download" / "partial.bin").write_bytes(b"x" * 500)
+
+    # A cache hit makes "warm" the most recently used task
+    assert task_cache_module.get_cached_task("task", "sha256:warm", cache_root=cache_root) is not None
+
+    summary = task_cache_module.evict_task_cache_to_budget(
+        cache_root, max_bytes=4_000, high_watermark=0.75, low_watermark=0.75, exclude_names={"sha256_active"}
+    )
+
+    assert summary["removed"] == 1
+    assert not (cache_root / "sha256_cold").exists()
+    assert (cache_root / "sha256_active").exists()
+    assert (cache_root / "sha256_warm").exists()
+    assert (cache_root / ".tmp-download").exists()
+
+    stats = task_cache_module.get_task_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["evictions"] == 1
+    assert stats["evicted_bytes"] == summary["removed_bytes"]
+    assert stats["size_bytes"] == summary["total_bytes"] <= 3_000
+
+
+@pytest.mark.anyio
+async def test_concurrent_get_or_download_task_downloads_once(tmp_path: Path, monkeypatch) -> None:
+    import asyncio
+
+    source_task_dir = tmp_path / "source-task"
+    _write(source_task_dir / "instruction.md", "Solve the problem.\n")
+    digest = compute_task_digest(source_task_dir)
+    archive_bytes = _task_archive_bytes(source_task_dir, top_level_name="downloaded-task")
+    downloads = 0
+
+    def client(**_kwargs):
+        nonlocal downloads
+        downloads += 1
+        return _FakeClient(archive_bytes)
+
+    monkeypatch.setattr(task_cache_module.httpx, "Client", client)
+    # A staging directory left behind by a crashed download of the same task
+    abandoned_dir = tmp_path / "cache" / f".tmp-{digest.replace(':', '_')}-crashed"
+    abandoned_dir.mkdir(parents=True)
+
+    cached_task_dirs = await asyncio.gather(
+        *(
+            task_cache_module.get_or_download_task(
+                "https://example.test/task.tar.gz", "task", digest, cache_root=tmp_path / "cache"
+            )
+            for _ in range(3)
+        )
+    )
+
+    assert downloads == 1
+    assert len(set(cached_task_dirs)) == 1
+    assert not abandoned_dir.exists()
+
+
+@pytest.mark.anyio
+async def test_eviction_skips_tasks_held_by_a_reader(tmp_path: Path) -> None:
+    cache_root = tmp_path / "cache"
+    _seed_cached_digest(cache_root, "sha256:held")
+
+    async with task_cache_module.hold_cached_task("sha256:held", cache_root=cache_root):
+        summary = task_cache_module.evict_task_cache_to_budget(cache_root, max_bytes=0)
+        assert summary["removed"] == 0
+        assert task_cache_module.prune_task_cache(cache_root, max_age_seconds=0) == 0
+        assert (cache_root / "sha256_held").exists()
+
+    assert task_cache_module.evict_task_cache_to_budget(cache_root, max_bytes=0)["removed"] == 1
+    assert not (cache_root / "sha256_held").exists()
+    assert (cache_root / task_cache_module.LOCKS_DIR_NAME).exists()
+
+
+def test_reap_abandoned_task_downloads_spares_downloads_in_progress(tmp_path: Path) -> None:
+    cache_root = tmp_path / "cache"
+    in_progress = cache_root / ".tmp-sha256_busy-1"
+    abandoned = cache_root / ".tmp-sha256_dead-1"
+    in_progress.mkdir(parents=True)
+    abandoned.mkdir()
+
+    lock_path = task_cache_module._lock_path("sha256_busy", "download", cache_root=cache_root)
+    download_lock = task_cache_module._acquire_lock(lock_path)
+    try:
+        assert task_cache_module.reap_abandoned_task_downloads(cache_root) == 1
+    finally:
+        import os
+
+        os.close(download_lock)
+
+    assert in_progress.exists()
+    assert not abandoned.exists()
+
+
+def test_compute_task_digest_is_identical_across_worker_counts_and_chunks(tmp_path: Path, monkeypatch) -> None:
+    from ridges_harbor.digest_benchmark import benchmark_task_digest, build_synthetic_task_tree
+
+    task_dir = tmp_path / "task"
+    total_bytes = build_synthetic_task_tree(
+        task_dir, num_small_files=30, small_file_bytes=100, num_large_files=2, large_file_bytes=10_000
+    )
+    (task_dir / "empty.txt").write_bytes(b"")
+    sequential_digest = compute_task_digest(task_dir, max_workers=1)
+
+    # Small chunks, so the large files span many chunks read out of order by the pool
+    monkeypatch.setattr(digest_module, "DIGEST_CHUNK_SIZE", 1_000)
+    results = benchmark_task_digest(task_dir, total_bytes=total_bytes, worker_counts=[1, 4], repeat=2)
+
+    assert [result["workers"] for result in results] == [1, 1, 4, 4]
+    assert compute_task_digest(task_dir, max_workers=4) == sequential_digest
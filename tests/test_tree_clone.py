@@ -0,0 +1,57 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from utils.tree_clone import CLONE_STRATEGIES, clone_tree, ensure_private_file
+
+
+def _make_tree(root: Path) -> None:
+    (root / "tests").mkdir(parents=True)
+    (root / "instruction.md").write_text("Solve.\n")
+    (root / "tests" / "test.sh").write_text("#!/bin/bash\n")
+    (root / "tests" / "test.sh").chmod(0o755)
+    os.symlink("instruction.md", root / "README.md")
+    os.utime(root / "instruction.md", ns=(1_000_000_000, 1_000_000_000))
+
+
+@pytest.mark.parametrize("strategies", [CLONE_STRATEGIES, ("hardlink",), ("copy",)])
+def test_clone_tree_preserves_contents_modes_and_mtimes(tmp_path: Path, strategies) -> None:
+    source = tmp_path / "source"
+    _make_tree(source)
+
+    result = clone_tree(source, tmp_path / "clone", strategies=strategies)
+
+    clone = tmp_path / "clone"
+    assert result.num_files == 2
+    assert result.strategy in CLONE_STRATEGIES
+    assert (clone / "instruction.md").read_text() == "Solve.\n"
+    assert (clone / "instruction.md").stat().st_mtime_ns == 1_000_000_000
+    assert (clone / "tests" / "test.sh").stat().st_mode & 0o777 == 0o755
+    assert os.readlink(clone / "README.md") == "instruction.md"
+
+
+def test_clone_tree_falls_back_to_copy(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    _make_tree(source)
+
+    result = clone_tree(source, tmp_path / "clone", strategies=("copy",))
+
+    assert result.strategy == "copy"
+    assert (tmp_path / "clone" / "instruction.md").stat().st_ino != (source / "instruction.md").stat().st_ino
+
+
+def test_hardlink_farm_copies_up_before_writes(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    _make_tree(source)
+
+    result = clone_tree(source, tmp_path / "clone", strategies=("hardlink",))
+    cloned_file = tmp_path / "clone" / "instruction.md"
+    assert result.strategy == "hardlink"
+    assert cloned_file.stat().st_ino == (source / "instruction.md").stat().st_ino
+
+    assert ensure_private_file(cloned_file)
+    cloned_file.write_text("Changed.\n")
+
+    assert (source / "instruction.md").read_text() == "Solve.\n"
+    assert not ensure_private_file(cloned_file)
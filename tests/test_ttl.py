@@ -2,7 +2,7 @@ import asyncio
 
 import pytest
 
-from utils.ttl import ttl_cache
+from utils.ttl import get_ttl_cache_stats, invalidate_all_ttl_caches, set_shared_ttl_cache_backend, ttl_cache
 
 
 @pytest.mark.anyio
@@ -44,3 +44,173 @@ async def test_cache_clear_does_not_restore_in_flight_stale_value() -> None:
 
     assert await first_call == 1
     assert await cached_value() == 2
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class InMemoryBackend:
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[bytes, float]] = {}
+        self.generation = 0
+
+    async def get(self, key: str):
+        return self.entries.get(key)
+
+    async def get_generation(self) -> int:
+        return self.generation
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float, generation: int) -> None:
+        if generation == self.generation:
+            self.entries[key] = (value, ttl_seconds)
+
+    async def clear(self) -> None:
+        self.generation += 1
+        self.entries.clear()
+
+
+@pytest.mark.anyio
+async def test_stale_value_is_served_while_refreshing_in_background() -> None:
+    clock = FakeClock()
+    current_value = 1
+
+    @ttl_cache(ttl_seconds=10, clock=clock)
+    async def cached_value() -> int:
+        return current_value
+
+    assert await cached_value() == 1
+    current_value = 2
+    clock.now = 11
+
+    assert await cached_value() == 1
+    await asyncio.sleep(0)
+    assert await cached_value() == 2
+
+    stats = cached_value.cache_stats.to_dict()
+    assert (stats["hits"], stats["stale_hits"], stats["misses"], stats["calculations"]) == (1, 1, 1, 2)
+
+
+@pytest.mark.anyio
+async def test_least_recently_used_entry_is_evicted_first() -> None:
+    calls: list[int] = []
+
+    @ttl_cache(ttl_seconds=60, max_entries=2)
+    async def cached_square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    await cached_square(1)
+    await cached_square(2)
+    await cached_square(1)  # 1 is now the most recently used
+    await cached_square(3)  # evicts 2
+
+    await cached_square(1)
+    await cached_square(2)
+
+    assert calls == [1, 2, 3, 2]
+    assert cached_square.cache_stats.evictions == 2
+
+
+@pytest.mark.anyio
+async def test_shared_backend_reuses_calculation_from_another_worker() -> None:
+    backend = InMemoryBackend()
+    set_shared_ttl_cache_backend(backend)
+    calls = 0
+
+    async def compute(x: int) -> dict:
+        nonlocal calls
+        calls += 1
+        return {"x": x}
+
+    try:
+        # Two decorations with the same name stand in for the same cache in two API workers
+        worker_1 = ttl_cache(ttl_seconds=60, shared=True, name="test_shared_cache")(compute)
+        worker_2 = ttl_cache(ttl_seconds=60, shared=True, name="test_shared_cache")(compute)
+
+        assert await worker_1(7) == {"x": 7}
+        assert await worker_2(7) == {"x": 7}
+        assert calls == 1
+        assert worker_2.cache_stats.shared_hits == 1
+        assert "test_shared_cache#2" in get_ttl_cache_stats()
+
+        await invalidate_all_ttl_caches()
+        assert backend.entries == {}
+        assert await worker_2(7) == {"x": 7}
+        assert calls == 2
+    finally:
+        set_shared_ttl_cache_backend(None)
+
+
+@pytest.mark.anyio
+async def test_shared_backend_skips_values_calculated_across_an_invalidation() -> None:
+    backend = InMemoryBackend()
+    set_shared_ttl_cache_backend(backend)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    @ttl_cache(ttl_seconds=60, shared=True, name="test_shared_invalidation")
+    async def cached_value() -> int:
+        started.set()
+        await release.wait()
+        return 1
+
+    try:
+        first_call = asyncio.create_task(cached_value())
+        await started.wait()
+        await invalidate_all_ttl_caches()
+        release.set()
+
+        assert await first_call == 1
+        assert backend.entries == {}
+    finally:
+        set_shared_ttl_cache_backend(None)
+
+
+@pytest.mark.anyio
+async def test_shared_backend_skips_values_calculated_across_another_workers_invalidation() -> None:
+    backend = InMemoryBackend()
+    set_shared_ttl_cache_backend(backend)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    current_value = 1
+
+    @ttl_cache(ttl_seconds=60, shared=True, name="test_shared_remote_invalidation")
+    async def cached_value() -> int:
+        value = current_value
+        started.set()
+        await release.wait()
+        return value
+
+    try:
+        first_call = asyncio.create_task(cached_value())
+        await started.wait()
+        # Another worker's invalidation only reaches this one through the backend
+        current_value = 2
+        await backend.clear()
+        release.set()
+
+        assert await first_call == 1
+        assert backend.entries == {}
+        cached_value.cache_clear()
+        assert await cached_value() == 2
+        assert len(backend.entries) == 1
+    finally:
+        set_shared_ttl_cache_backend(None)
+
+
+@pytest.mark.anyio
+async def test_shared_cache_rejects_arguments_without_a_stable_repr() -> None:
+    @ttl_cache(ttl_seconds=60, shared=True, name="test_shared_arguments")
+    async def cached_value(x, *, label=None) -> str:
+        return f"{x}-{label}"
+
+    assert await cached_value(1, label="a") == "1-a"
+    with pytest.raises(TypeError, match="got object"):
+        await cached_value(object())
+    with pytest.raises(TypeError, match="got list"):
+        await cached_value(1, label=["a"])
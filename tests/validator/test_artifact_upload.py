@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import io
+import tarfile
+
+import httpx
+import pytest
+
+from validator.artifact_upload import upload_job_artifacts, write_job_archive
+
+
+def _make_job_dir(tmp_path):
+    job_dir = tmp_path / "problem__run"
+    (job_dir / "trial").mkdir(parents=True)
+    (job_dir / "result.json").write_text('{"reward": 1.0}')
+    (job_dir / "trial" / "agent.log").write_text("agent log line\n")
+    (job_dir / "trial" / "huge.bin").write_bytes(b"x" * 4096)
+    return job_dir
+
+
+def test_write_job_archive_skips_files_over_cap(tmp_path) -> None:
+    job_dir = _make_job_dir(tmp_path)
+    archive_path = tmp_path / "job.tar.gz"
+
+    skipped = write_job_archive(job_dir, archive_path, max_file_bytes=1024)
+
+    assert skipped == ["problem__run/trial/huge.bin"]
+    with tarfile.open(archive_path, "r:gz") as tar:
+        names = set(tar.getnames())
+    assert "problem__run/result.json" in names
+    assert "problem__run/trial/agent.log" in names
+    assert "problem__run/trial/huge.bin" not in names
+
+
+@pytest.mark.anyio
+async def test_upload_job_artifacts_streams_archive_with_content_length(tmp_path) -> None:
+    job_dir = _make_job_dir(tmp_path)
+    received: dict = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received["method"] = request.method
+        received["headers"] = request.headers
+        received["body"] = await request.aread()
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        uploaded = await upload_job_artifacts(job_dir, "https://s3/upload", chunk_size=64, client=client)
+
+    assert received["method"] == "PUT"
+    assert "transfer-encoding" not in received["headers"]
+    assert int(received["headers"]["content-length"]) == uploaded == len(received["body"])
+    with tarfile.open(fileobj=io.BytesIO(received["body"]), mode="r:gz") as tar:
+        assert "problem__run/trial/huge.bin" in tar.getnames()
+
+
+@pytest.mark.anyio
+async def test_upload_job_artifacts_removes_spool_file_on_failure(tmp_path, monkeypatch) -> None:
+    job_dir = _make_job_dir(tmp_path)
+    spool_dir = tmp_path / "spool"
+    spool_dir.mkdir()
+    monkeypatch.setattr("tempfile.tempdir", str(spool_dir))
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await upload_job_artifacts(job_dir, "https://s3/upload", client=client)
+
+    assert list(spool_dir.iterdir()) == []
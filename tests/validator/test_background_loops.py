@@ -19,7 +19,13 @@ def _configure_cleanup(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(background_loops.config, "CLEANUP_PULLED_IMAGE_DISK_PERCENT", 50)
     monkeypatch.setattr(background_loops.config, "CLEANUP_DISK_PRESSURE_PERCENT", 75)
     monkeypatch.setattr(background_loops.config, "CLEANUP_INTERVAL_SECONDS", 3600)
+    monkeypatch.setattr(background_loops.config, "CLEANUP_TASK_CACHE_MAX_GB", 50.0)
     monkeypatch.setattr(background_loops, "prune_task_cache", lambda **_kwargs: 0)
+    monkeypatch.setattr(
+        background_loops,
+        "evict_task_cache_to_budget",
+        lambda **_kwargs: {"total_bytes": 0, "removed": 0, "removed_bytes": 0},
+    )
     monkeypatch.setattr(background_loops, "prune_dirs_older_than", lambda *_args: 0)
 
     async def stop_after_tick(_seconds):
@@ -172,3 +178,33 @@ async def test_cleanup_loop_logs_zero_summary_when_sweeps_fail(monkeypatch, tmp_
     assert (
         "Janitor: containers=0 images=0 prune_bytes=0 disk_percent=unknown errors=3 dry_run=false names=-" in messages
     )
+
+
+@pytest.mark.anyio
+async def test_evict_task_cache_spares_active_tasks_and_never_raises(monkeypatch) -> None:
+    monkeypatch.setattr(background_loops.config, "CLEANUP_TASK_CACHE_MAX_GB", 2.0)
+    monkeypatch.setattr(background_loops.config, "CLEANUP_TASK_CACHE_HIGH_WATERMARK", 0.9)
+    monkeypatch.setattr(background_loops.config, "CLEANUP_TASK_CACHE_LOW_WATERMARK", 0.7)
+    calls = []
+
+    def evict(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            raise OSError("disk went away")
+        return {"total_bytes": 0, "removed": 1, "removed_bytes": 10}
+
+    monkeypatch.setattr(background_loops, "evict_task_cache_to_budget", evict)
+
+    await background_loops.evict_task_cache({"sha256:abc"})
+    await background_loops.evict_task_cache(set())
+
+    assert calls[0] == {
+        "max_bytes": 2_000_000_000,
+        "high_watermark": 0.9,
+        "low_watermark": 0.7,
+        "exclude_names": {"sha256_abc"},
+    }
+
+    monkeypatch.setattr(background_loops.config, "CLEANUP_TASK_CACHE_MAX_GB", 0.0)
+    await background_loops.evict_task_cache(set())
+    assert len(calls) == 2
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from models.evaluation_run import EvaluationRunErrorCode
+from utils.system_metrics import SystemMetrics
+from validator.concurrency import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(clock: FakeClock, *, max_limit: int = 4) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        min_limit=1,
+        max_limit=max_limit,
+        cpu_high_percent=95,
+        ram_high_percent=85,
+        disk_high_percent=90,
+        cooldown_seconds=60,
+        clock=clock,
+    )
+
+
+def _metrics(*, cpu: float = 10, ram: float = 10, disk: float = 10) -> SystemMetrics:
+    return SystemMetrics(cpu_percent=cpu, ram_percent=ram, disk_percent=disk)
+
+
+async def _hold(limiter: AdaptiveConcurrencyLimiter, release: asyncio.Event, started: list[int], index: int) -> None:
+    async with limiter:
+        started.append(index)
+        await release.wait()
+
+
+@pytest.mark.anyio
+async def test_limiter_admits_runs_up_to_its_limit() -> None:
+    limiter = _limiter(FakeClock(), max_limit=2)
+    release = asyncio.Event()
+    started: list[int] = []
+
+    tasks = [asyncio.create_task(_hold(limiter, release, started, index)) for index in range(3)]
+    await asyncio.sleep(0)
+    assert started == [0, 1]
+    assert limiter.stats()["waiting"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started == [0, 1, 2]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_limiter_halves_on_pressure_and_validator_faults_once_per_cooldown() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock, max_limit=8)
+
+    await limiter.observe(_metrics(ram=92))
+    assert limiter.limit == 4
+
+    # Same congestion event: no second cut inside the cooldown
+    limiter.record_outcome(EvaluationRunErrorCode.VALIDATOR_INTERNAL_ERROR)
+    assert limiter.limit == 4
+
+    clock.now = 61
+    limiter.record_outcome(EvaluationRunErrorCode.AGENT_TIMEOUT_RUNNING_AGENT)
+    limiter.record_outcome(None)
+    assert limiter.limit == 4
+    limiter.record_outcome(EvaluationRunErrorCode.VALIDATOR_FAILED_RUNNING_EVAL)
+    assert limiter.limit == 2
+
+    clock.now = 200
+    for _ in range(3):
+        clock.now += 61
+        await limiter.observe(_metrics(cpu=97))
+    assert limiter.limit == 1
+    assert limiter.stats()["decreases"] == 3
+
+
+@pytest.mark.anyio
+async def test_limiter_probes_up_only_when_saturated_and_queued() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock, max_limit=3)
+    limiter.record_outcome(EvaluationRunErrorCode.VALIDATOR_INTERNAL_ERROR)
+    assert limiter.limit == 1
+
+    release = asyncio.Event()
+    started: list[int] = []
+    first = asyncio.create_task(_hold(limiter, release, started, 0))
+    await asyncio.sleep(0)
+
+    # Nobody waiting: headroom alone doesn't raise the limit
+    clock.now = 61
+    await limiter.observe(_metrics())
+    assert limiter.limit == 1
+
+    second = asyncio.create_task(_hold(limiter, release, started, 1))
+    await asyncio.sleep(0)
+    assert started == [0]
+
+    await limiter.observe(_metrics())
+    await asyncio.sleep(0)
+    assert limiter.limit == 2
+    assert started == [0, 1]
+
+    release.set()
+    await asyncio.gather(first, second)
+
+
+@pytest.mark.anyio
+async def test_persistently_full_disk_holds_the_limit_without_cutting_it() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock, max_limit=2)
+    limiter.record_outcome(EvaluationRunErrorCode.VALIDATOR_INTERNAL_ERROR)
+    assert limiter.limit == 1
+
+    release = asyncio.Event()
+    started: list[int] = []
+    tasks = [asyncio.create_task(_hold(limiter, release, started, index)) for index in range(2)]
+    await asyncio.sleep(0)
+    assert started == [0]
+
+    # Saturated and queued, but the disk stays full for an hour: no cuts, no probes
+    for _ in range(60):
+        clock.now += 61
+        await limiter.observe(_metrics(disk=95))
+    assert limiter.limit == 1
+    assert limiter.stats()["decreases"] == 1
+
+    # Once cleanup frees the disk, probing resumes
+    await limiter.observe(_metrics(disk=60))
+    await asyncio.sleep(0)
+    assert limiter.limit == 2
+    assert started == [0, 1]
+
+    release.set()
+    await asyncio.gather(*tasks)
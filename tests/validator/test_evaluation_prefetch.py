@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+import validator.main as validator_main
+from api.endpoints.validator_models import (
+    ValidatorRequestEvaluationResponse,
+    ValidatorRequestEvaluationResponseEvaluationRun,
+    ValidatorUpdateEvaluationRunResponse,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_task_cache_locks(monkeypatch):
+    @asynccontextmanager
+    async def hold_cached_task(_task_digest):
+        yield
+
+    monkeypatch.setattr(validator_main, "hold_cached_task", hold_cached_task)
+
+
+def _harbor_spec(task_name: str, task_digest: str) -> dict:
+    return {
+        "kind": "harbor_remote_task",
+        "dataset_name": "dataset",
+        "task_name": task_name,
+        "s3_key": f"tasks/{task_name}.tar.gz",
+        "task_digest": task_digest,
+    }
+
+
+def _request_response(*specs: dict | None) -> ValidatorRequestEvaluationResponse:
+    return ValidatorRequestEvaluationResponse(
+        evaluation_id=uuid4(),
+        agent_id=uuid4(),
+        agent_code="print('agent')",
+        evaluation_runs=[
+            ValidatorRequestEvaluationResponseEvaluationRun(
+                evaluation_run_id=uuid4(),
+                problem_name=f"problem-{idx}",
+                execution_spec=spec,
+            )
+            for idx, spec in enumerate(specs)
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def _pipeline_config(monkeypatch):
+    monkeypatch.setattr(validator_main.config, "SIMULATE_EVALUATION_RUNS", False)
+    monkeypatch.setattr(validator_main.config, "EVALUATION_PIPELINE_ENABLED", True)
+    monkeypatch.setattr(validator_main.config, "EVALUATION_PIPELINE_LOOKAHEAD", 2)
+    monkeypatch.setattr(validator_main, "get_cached_task", lambda _name, _digest, **_kwargs: None)
+    yield
+    validator_main._task_prefetches.clear()
+
+
+@pytest.mark.anyio
+async def test_prefetch_downloads_each_digest_once_in_run_order(monkeypatch) -> None:
+    downloaded: list[tuple[str, str]] = []
+
+    async def fake_fetch_url(task_digest):
+        return f"https://s3/{task_digest}"
+
+    async def fake_download(presigned_url, task_name, task_digest, **_kwargs):
+        downloaded.append((task_name, presigned_url))
+
+    monkeypatch.setattr(validator_main, "_fetch_task_download_url", fake_fetch_url)
+    monkeypatch.setattr(validator_main, "get_or_download_task", fake_download)
+
+    response = _request_response(
+        _harbor_spec("task-a", "sha256:aaa"),
+        None,
+        _harbor_spec("task-b", "sha256:bbb"),
+        _harbor_spec("task-a", "sha256:aaa"),
+        {"kind": "something_else"},
+    )
+    tasks = validator_main._start_task_prefetches(response)
+    await asyncio.gather(*tasks)
+
+    assert downloaded == [("task-a", "https://s3/sha256:aaa"), ("task-b", "https://s3/sha256:bbb")]
+
+
+@pytest.mark.anyio
+async def test_prefetch_is_disabled_outside_pipeline_mode(monkeypatch) -> None:
+    monkeypatch.setattr(validator_main.config, "EVALUATION_PIPELINE_ENABLED", False)
+
+    assert validator_main._start_task_prefetches(_request_response(_harbor_spec("task-a", "sha256:aaa"))) == []
+    assert validator_main._task_prefetches == {}
+
+
+@pytest.mark.anyio
+async def test_prefetch_failure_is_best_effort(monkeypatch) -> None:
+    async def failing_fetch_url(_task_digest):
+        raise RuntimeError("platform down")
+
+    monkeypatch.setattr(validator_main, "_fetch_task_download_url", failing_fetch_url)
+
+    tasks = validator_main._start_task_prefetches(_request_response(_harbor_spec("task-a", "sha256:aaa")))
+    await asyncio.gather(*tasks)
+
+    assert all(task.exception() is None for task in tasks)
+
+
+@pytest.mark.anyio
+async def test_evaluation_run_waits_for_in_flight_prefetch(monkeypatch) -> None:
+    download_released = asyncio.Event()
+    events: list[str] = []
+
+    async def fake_fetch_url(task_digest):
+        return f"https://s3/{task_digest}"
+
+    async def fake_download(_presigned_url, _task_name, _task_digest, **_kwargs):
+        await download_released.wait()
+        events.append("prefetched")
+
+    async def fake_attempt(*_args, **_kwargs):
+        events.append("attempt")
+        return ValidatorUpdateEvaluationRunResponse()
+
+    monkeypatch.setattr(validator_main, "_fetch_task_download_url", fake_fetch_url)
+    monkeypatch.setattr(validator_main, "get_or_download_task", fake_download)
+    monkeypatch.setattr(validator_main, "_run_single_attempt", fake_attempt)
+
+    spec = _harbor_spec("task-a", "sha256:aaa")
+    validator_main._start_task_prefetches(_request_response(spec))
+    run = asyncio.create_task(
+        validator_main._run_evaluation_run(
+            SimpleNamespace(evaluation_run_id=uuid4(), problem_name="problem-0", execution_spec=spec),
+            "print('agent')",
+        )
+    )
+    await asyncio.sleep(0.01)
+    assert events == []
+
+    download_released.set()
+    await run
+
+    assert events == ["prefetched", "attempt"]
+
+
+@pytest.mark.anyio
+async def test_run_evaluation_cancels_pending_prefetches_on_platform_cancellation(monkeypatch) -> None:
+    prefetches_cancelled = 0
+
+    async def fake_fetch_url(task_digest):
+        return f"https://s3/{task_digest}"
+
+    async def fake_download(_presigned_url, _task_name, _task_digest, **_kwargs):
+        nonlocal prefetches_cancelled
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            prefetches_cancelled += 1
+            raise
+
+    async def fake_poll(_evaluation_id, _agent_id, cancellation_event, cancellation_reason):
+        await asyncio.sleep(0)
+        cancellation_reason["reason"] = "score bound"
+        cancellation_event.set()
+
+    async def fake_run(*_args, **_kwargs):
+        await asyncio.Event().wait()
+
+    async def fake_post(_endpoint, _body, **_kwargs):
+        return {}
+
+    monkeypatch.setattr(validator_main.config, "MAX_CONCURRENT_EVALUATION_RUNS", 1)
+    monkeypatch.setattr(validator_main, "_fetch_task_download_url", fake_fetch_url)
+    monkeypatch.setattr(validator_main, "get_or_download_task", fake_download)
+    monkeypatch.setattr(validator_main, "_poll_evaluation_cancellation", fake_poll)
+    monkeypatch.setattr(validator_main, "_run_evaluation_run_with_semaphore", fake_run)
+    monkeypatch.setattr(validator_main, "post_ridges_platform", fake_post)
+    monkeypatch.setattr(validator_main, "prune_docker_disk_resources", lambda: None)
+
+    await validator_main._run_evaluation(
+        _request_response(_harbor_spec("task-a", "sha256:aaa"), _harbor_spec("task-b", "sha256:bbb"))
+    )
+
+    assert prefetches_cancelled == 2
+    assert validator_main._task_prefetches == {}
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from api.endpoints.validator_models import ValidatorUpdateEvaluationRunRequest, ValidatorUpdateEvaluationRunResponse
+from models.evaluation_run import EvaluationRunStatus
+from validator.evaluation_run_updates import EvaluationRunUpdateBatcher, EvaluationRunUpdateRejected
+
+
+def _update(status: EvaluationRunStatus = EvaluationRunStatus.running_agent) -> ValidatorUpdateEvaluationRunRequest:
+    return ValidatorUpdateEvaluationRunRequest(evaluation_run_id=uuid4(), updated_status=status)
+
+
+class FakePoster:
+    def __init__(self, *, failures: int = 0) -> None:
+        self.batches: list[tuple[list[ValidatorUpdateEvaluationRunRequest], float | None]] = []
+        self.failures = failures
+        # Groups containing one of these updates are rejected
+        self.invalid: set[int] = set()
+
+    async def __call__(self, groups, timeout):
+        updates = [update for group in groups for update in group]
+        self.batches.append((updates, timeout))
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("platform unavailable")
+        results = []
+        index = 0
+        for group in groups:
+            if any(id(update) in self.invalid for update in group):
+                results.append(EvaluationRunUpdateRejected(400, "invalid transition"))
+            else:
+                results.append(
+                    [ValidatorUpdateEvaluationRunResponse(attempt_number=index + i) for i in range(len(group))]
+                )
+            index += len(group)
+        return results
+
+
+@pytest.mark.anyio
+async def test_batcher_coalesces_concurrent_submissions_in_order() -> None:
+    poster = FakePoster()
+    batcher = EvaluationRunUpdateBatcher(poster, window_seconds=0.01)
+
+    first = [_update(EvaluationRunStatus.initializing_eval), _update(EvaluationRunStatus.running_eval)]
+    second = [_update()]
+    first_results, second_results = await asyncio.gather(batcher.submit(first, timeout=5), batcher.submit(second))
+
+    assert len(poster.batches) == 1
+    assert poster.batches[0] == (first + second, None)
+    assert [result.attempt_number for result in first_results] == [0, 1]
+    assert [result.attempt_number for result in second_results] == [2]
+
+
+@pytest.mark.anyio
+async def test_batcher_never_splits_a_group_across_batches() -> None:
+    poster = FakePoster()
+    batcher = EvaluationRunUpdateBatcher(poster, window_seconds=0.01, max_batch_size=3)
+
+    groups = [[_update(), _update()], [_update(), _update()], [_update()]]
+    await asyncio.gather(*(batcher.submit(group, timeout=5) for group in groups))
+
+    assert [updates for updates, _ in poster.batches] == [groups[0], groups[1] + groups[2]]
+    assert [timeout for _, timeout in poster.batches] == [5, 5]
+
+
+@pytest.mark.anyio
+async def test_batcher_fails_every_submission_of_a_failed_batch_and_recovers() -> None:
+    poster = FakePoster(failures=1)
+    batcher = EvaluationRunUpdateBatcher(poster, window_seconds=0.01)
+
+    results = await asyncio.gather(batcher.submit([_update()]), batcher.submit([_update()]), return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+    [result] = await batcher.submit([_update()])
+    assert result.attempt_number == 0
+    assert len(poster.batches) == 2
+
+
+@pytest.mark.anyio
+async def test_batcher_fails_only_the_submission_whose_group_was_rejected() -> None:
+    poster = FakePoster()
+    batcher = EvaluationRunUpdateBatcher(poster, window_seconds=0.01)
+
+    stale = _update(EvaluationRunStatus.running_agent)
+    poster.invalid.add(id(stale))
+    rejected, accepted = await asyncio.gather(
+        batcher.submit([stale]), batcher.submit([_update(EvaluationRunStatus.finished)]), return_exceptions=True
+    )
+
+    assert len(poster.batches) == 1
+    assert isinstance(rejected, EvaluationRunUpdateRejected)
+    assert rejected.status_code == 400
+    assert [result.attempt_number for result in accepted] == [1]
@@ -22,29 +22,54 @@ class _FakeResponse:
 
 
 class _CaptureClient:
-    def __init__(self, captured: list):
+    def __init__(self, captured: list, captured_timeouts: list):
         self._captured = captured
+        self._captured_timeouts = captured_timeouts
+        self.is_closed = False
 
-    async def __aenter__(self):
-        return self
+    async def aclose(self) -> None:
+        self.is_closed = True
 
-    async def __aexit__(self, *_exc):
-        return False
-
-    async def get(self, url, headers=None):
+    async def get(self, url, headers=None, timeout=None):
         self._captured.append(("GET", url, headers))
+        self._captured_timeouts.append(timeout)
         return _FakeResponse()
 
-    async def post(self, url, json=None, headers=None):
+    async def post(self, url, json=None, headers=None, timeout=None):
         self._captured.append(("POST", url, headers))
+        self._captured_timeouts.append(timeout)
         return _FakeResponse()
 
 
 @pytest.fixture()
-def captured_requests(monkeypatch) -> list:
+def created_clients(monkeypatch) -> list:
+    clients: list = []
+    monkeypatch.setattr(http_utils.config, "RIDGES_PLATFORM_MAX_CONNECTIONS", 10, raising=False)
+    monkeypatch.setattr(http_utils.config, "RIDGES_PLATFORM_KEEPALIVE_EXPIRY_SECONDS", 60, raising=False)
+    monkeypatch.setattr(http_utils.config, "RIDGES_PLATFORM_HTTP2", False, raising=False)
+    monkeypatch.setattr(http_utils, "_client", None)
+    monkeypatch.setattr(http_utils, "_client_loop", None)
+    monkeypatch.setattr(http_utils, "_latency_histograms", {})
+    return clients
+
+
+@pytest.fixture()
+def captured_timeouts() -> list:
+    return []
+
+
+@pytest.fixture()
+def captured_requests(monkeypatch, created_clients, captured_timeouts) -> list:
     captured: list = []
-    monkeypatch.setattr(http_utils.httpx, "AsyncClient", lambda **_kwargs: _CaptureClient(captured))
+
+    def create_client(**_kwargs):
+        client = _CaptureClient(captured, captured_timeouts)
+        created_clients.append(client)
+        return client
+
+    monkeypatch.setattr(http_utils.httpx, "AsyncClient", create_client)
     monkeypatch.setattr(http_utils.config, "RIDGES_PLATFORM_URL", "http://platform.test", raising=False)
+    monkeypatch.setattr(http_utils.config, "SCREENER_EDGE_KEY", None, raising=False)
     return captured
 
 
@@ -87,3 +112,48 @@ async def test_get_sends_no_headers_when_edge_key_unset(monkeypatch, captured_re
 
     _method, _url, headers = captured_requests[0]
     assert headers is None
+
+
+@pytest.mark.anyio
+async def test_requests_reuse_one_pooled_client_until_closed(created_clients, captured_requests) -> None:
+    await http_utils.post_ridges_platform("/validator/heartbeat", _Body(), quiet=2)
+    await http_utils.post_ridges_platform("/validator/update-evaluation-run", _Body(), quiet=2)
+    await http_utils.get_ridges_platform("/scoring/weights", quiet=2)
+    assert len(created_clients) == 1
+
+    await http_utils.close_ridges_platform_client()
+    assert created_clients[0].is_closed
+
+    await http_utils.get_ridges_platform("/scoring/weights", quiet=2)
+    assert len(created_clients) == 2
+
+
+@pytest.mark.anyio
+async def test_requests_use_per_endpoint_timeouts(captured_requests, captured_timeouts) -> None:
+    await http_utils.post_ridges_platform("/validator/heartbeat", _Body(), quiet=2)
+    await http_utils.post_ridges_platform("/validator/request-evaluation", _Body(), quiet=2)
+    await http_utils.post_ridges_platform("/validator/heartbeat", _Body(), quiet=2, timeout=2)
+    await http_utils.post_ridges_platform("/validator/update-evaluation-run", _Body(), quiet=2)
+    await http_utils.post_ridges_platform("/validator/update-evaluation-runs", _Body(), quiet=2)
+
+    assert [timeout.read for timeout in captured_timeouts] == [
+        5,
+        http_utils.HTTP_TIMEOUT_SECONDS,
+        2,
+        http_utils.HTTP_TIMEOUT_SECONDS,
+        http_utils.HTTP_TIMEOUT_SECONDS,
+    ]
+    assert [timeout.connect for timeout in captured_timeouts][:3] == [5, http_utils.HTTP_CONNECT_TIMEOUT_SECONDS, 2]
+
+
+@pytest.mark.anyio
+async def test_requests_record_latency_per_endpoint(captured_requests) -> None:
+    await http_utils.post_ridges_platform("/validator/heartbeat", _Body(), quiet=2)
+    await http_utils.post_ridges_platform("/validator/heartbeat/", _Body(), quiet=2)
+    await http_utils.get_ridges_platform("/scoring/weights?netuid=62", quiet=2)
+
+    stats = http_utils.get_ridges_platform_latency_stats()
+    assert list(stats) == ["GET /scoring/weights", "POST /validator/heartbeat"]
+    assert stats["POST /validator/heartbeat"]["count"] == 2
+    assert stats["POST /validator/heartbeat"]["errors"] == 0
+    assert sum(stats["POST /validator/heartbeat"]["buckets"].values()) == 2
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import base64
+import gzip
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from api.endpoints.validator_models import ValidatorEvaluationRunLogChunk
+from validator.log_shipper import EvaluationRunLogShipper, read_log_chunk
+
+
+class FakePlatform:
+    def __init__(self) -> None:
+        self.batches: list[list[ValidatorEvaluationRunLogChunk]] = []
+        self.fail_next = False
+
+    async def post_chunks(self, chunks: list[ValidatorEvaluationRunLogChunk]) -> None:
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("platform unavailable")
+        self.batches.append(chunks)
+
+    def received(self, source: str) -> bytes:
+        chunks = sorted(
+            (chunk for batch in self.batches for chunk in batch if chunk.source == source),
+            key=lambda chunk: chunk.offset,
+        )
+        return b"".join(gzip.decompress(base64.b64decode(chunk.data)) for chunk in chunks)
+
+
+def _shipper(platform: FakePlatform, log_path: Path, **kwargs) -> EvaluationRunLogShipper:
+    return EvaluationRunLogShipper(
+        platform.post_chunks,
+        lambda: [("agent/run.log", log_path)],
+        evaluation_run_id=uuid4(),
+        attempt_number=1,
+        interval_seconds=3600,
+        max_source_bytes=kwargs.pop("max_source_bytes", 1024 * 1024),
+        **kwargs,
+    )
+
+
+def test_read_log_chunk_stops_at_the_last_complete_line(tmp_path: Path) -> None:
+    log_path = tmp_path / "run.log"
+    log_path.write_bytes(b"one\ntwo\nthr")
+
+    assert read_log_chunk(log_path, 0, 1024, final=False) == b"one\ntwo\n"
+    assert read_log_chunk(log_path, 8, 1024, final=False) == b""
+    assert read_log_chunk(log_path, 8, 1024, final=True) == b"thr"
+    # A line longer than a whole chunk still makes progress
+    assert read_log_chunk(log_path, 8, 2, final=False) == b"th"
+    assert read_log_chunk(tmp_path / "missing.log", 0, 1024, final=False) == b""
+
+
+@pytest.mark.anyio
+async def test_shipper_sends_only_new_lines_and_flushes_the_rest_on_close(tmp_path: Path) -> None:
+    platform = FakePlatform()
+    log_path = tmp_path / "run.log"
+    shipper = _shipper(platform, log_path)
+
+    assert await shipper.ship() == 0
+
+    log_path.write_bytes(b"step 1\nstep 2\npartial")
+    assert await shipper.ship() == 14
+    assert await shipper.ship() == 0
+
+    with open(log_path, "ab") as f:
+        f.write(b" line\nstep 3")
+    await shipper.close()
+    await shipper.close()
+
+    assert [chunk.offset for batch in platform.batches for chunk in batch] == [0, 14]
+    assert platform.received("agent/run.log") == b"step 1\nstep 2\npartial line\nstep 3"
+
+
+@pytest.mark.anyio
+async def test_shipper_retries_from_the_same_offset_after_a_failed_post(tmp_path: Path) -> None:
+    platform = FakePlatform()
+    log_path = tmp_path / "run.log"
+    log_path.write_bytes(b"a\nb\n")
+    shipper = _shipper(platform, log_path)
+
+    platform.fail_next = True
+    with pytest.raises(RuntimeError):
+        await shipper.ship()
+    assert shipper.offsets == {}
+
+    assert await shipper.ship() == 4
+    assert platform.received("agent/run.log") == b"a\nb\n"
+
+
+@pytest.mark.anyio
+async def test_shipper_splits_large_logs_into_chunks_and_caps_each_source(tmp_path: Path) -> None:
+    platform = FakePlatform()
+    log_path = tmp_path / "run.log"
+    log_path.write_bytes(b"line\n" * 10)
+    shipper = _shipper(platform, log_path, chunk_bytes=12, max_source_bytes=32)
+
+    # Whole lines per chunk, then whatever fits under the cap
+    assert await shipper.ship() == 32
+    assert [chunk.offset for chunk in platform.batches[0]] == [0, 10, 20, 30]
+    assert await shipper.ship() == 0
+
+    await shipper.close()
+    assert platform.received("agent/run.log") == (b"line\n" * 10)[:32]
+
+
+@pytest.mark.anyio
+async def test_shipper_counts_each_shipped_byte_once_across_batches(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("validator.log_shipper.MAX_EVALUATION_RUN_LOG_CHUNKS_PER_BATCH", 2)
+    platform = FakePlatform()
+    log_path = tmp_path / "run.log"
+    log_path.write_bytes(b"line\n" * 10)
+    shipper = _shipper(platform, log_path, chunk_bytes=10)
+
+    assert await shipper.ship() == 50
+    assert len(platform.batches) == 3
+    assert shipper.num_shipped_bytes == 50
+
+    with log_path.open("ab") as log_file:
+        log_file.write(b"tail")
+    await shipper.close()
+    assert shipper.num_shipped_bytes == 54
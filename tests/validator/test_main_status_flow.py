@@ -66,12 +66,21 @@ def _install_update_capture(
         )
         return ValidatorUpdateEvaluationRunResponse()
 
+    async def fake_update_transitions(evaluation_run_id, problem_name, transitions, *, timeout=None):
+        # Like the batched endpoint, a failure stops the transitions after it from being applied
+        return [
+            await fake_update(evaluation_run_id, problem_name, updated_status, extra, timeout=timeout)
+            for updated_status, extra in transitions
+        ]
+
     monkeypatch.setattr(validator_main, "update_evaluation_run", fake_update)
+    monkeypatch.setattr(validator_main, "update_evaluation_run_transitions", fake_update_transitions)
     return capture
 
 
 def _set_common_globals(monkeypatch, *, log_size_limit: int = 100_000) -> None:
     monkeypatch.setattr(validator_main, "max_evaluation_run_log_size_bytes", log_size_limit)
+    monkeypatch.setattr(validator_main.config, "EVALUATION_RUN_LOG_SHIPPING_ENABLED", False)
 
 
 class HookAwareEngine:
@@ -145,9 +154,9 @@ async def test_run_evaluation_run_success_posts_expected_status_sequence(monkeyp
     assert updates[1]["timeout"] == validator_main.STATUS_HOOK_TIMEOUT_SECONDS
     assert updates[2]["extra"] == {"patch": "PATCH", "agent_logs": "agent log line"}
     assert updates[2]["timeout"] == validator_main.STATUS_HOOK_TIMEOUT_SECONDS
+    # The agent logs already went out with initializing_eval, so finished leaves them out
     assert updates[4]["extra"] == {
         "patch": "PATCH",
-        "agent_logs": "agent log line",
         "verifier_reward": 1.0,
         "test_results": [
             {"name": "pass_case", "category": "default", "status": "pass"},
@@ -188,7 +197,6 @@ async def test_run_evaluation_run_posts_below_one_reward_as_finished(monkeypatch
     ]
     assert updates[-1]["extra"] == {
         "patch": "PATCH",
-        "agent_logs": "agent log line",
         "verifier_reward": 0.8,
         "test_results": [{"name": "fail_case", "category": "default", "status": "fail"}],
         "eval_logs": "eval log line",
@@ -328,7 +336,7 @@ async def test_run_evaluation_run_truncates_logs_on_success(monkeypatch) -> None
     await validator_main._run_evaluation_run(_evaluation_run(), "print('agent')")
 
     assert updates[2]["extra"]["agent_logs"] == "<truncated 5 chars>\n\nfghij"
-    assert updates[4]["extra"]["agent_logs"] == "<truncated 5 chars>\n\nfghij"
+    assert "agent_logs" not in updates[4]["extra"]
     assert updates[4]["extra"]["eval_logs"] == "<truncated 5 chars>\n\npqrst"
 
 
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from api.endpoints.validator_models import ValidatorRequestEvaluationResponseEvaluationRun
+from validator.scheduling import compare_policy_makespans, order_evaluation_runs, simulate_makespan
+
+
+def _run(problem_name: str, expected_duration_seconds: float | None) -> ValidatorRequestEvaluationResponseEvaluationRun:
+    return ValidatorRequestEvaluationResponseEvaluationRun(
+        evaluation_run_id=uuid4(),
+        problem_name=problem_name,
+        expected_duration_seconds=expected_duration_seconds,
+    )
+
+
+def test_longest_first_orders_by_expected_duration_and_keeps_ties_stable() -> None:
+    runs = [_run("a", 60), _run("b", None), _run("c", 600), _run("d", 60), _run("e", 240)]
+
+    # b has no history, so it counts as average length (240s) and keeps its place ahead of e
+    assert [run.problem_name for run in order_evaluation_runs(runs, "longest_first")] == ["c", "b", "e", "a", "d"]
+    assert [run.problem_name for run in order_evaluation_runs(runs, "shortest_first")] == ["a", "d", "b", "e", "c"]
+    assert order_evaluation_runs(runs, "platform") == runs
+
+
+def test_order_keeps_platform_order_without_any_expected_durations() -> None:
+    runs = [_run("a", None), _run("b", None)]
+
+    assert order_evaluation_runs(runs, "longest_first") == runs
+    assert compare_policy_makespans(runs, 2) == {}
+
+    with pytest.raises(ValueError):
+        order_evaluation_runs(runs, "random")
+
+
+def test_simulated_makespan_favours_longest_first_when_a_slow_run_comes_last() -> None:
+    runs = [_run(f"short-{index}", 10) for index in range(6)] + [_run("slow", 60)]
+
+    assert simulate_makespan([10, 10, 60], 2) == 70
+    assert compare_policy_makespans(runs, 2) == {"platform": 90, "longest_first": 60, "shortest_first": 90}
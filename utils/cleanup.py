@@ -1,7 +1,7 @@
-"""Fail-safe, age-based pruning of local directories.
+"""Fail-safe, age- and size-based pruning of local directories.
 
-A single generic helper used to reclaim disk from the validator's two unbounded
-local stores (the task cache and Harbor job artifacts). Pruning is deliberately
+Generic helpers used to reclaim disk from the validator's two unbounded local
+stores (the task cache and Harbor job artifacts). Pruning is deliberately
 conservative: it only ever removes immediate child directories whose modification
 time is older than a retention window, never touches in-flight work (dotfiles,
 temp dirs, or names in ``exclude_names``), and never raises — a single
@@ -12,20 +12,29 @@ event loop should invoke them via ``asyncio.to_thread``.
 """
 
 import logging
+import os
 import shutil
 import time
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+def _remove_dir(path: Path, remove: Callable[[Path], bool] | None) -> bool:
+    if remove is not None:
+        return remove(path)
+    shutil.rmtree(path, ignore_errors=False)
+    return True
+
+
 def prune_dirs_older_than(
     parent: Path,
     max_age_seconds: float,
     *,
     exclude_names: Iterable[str] = frozenset(),
     skip_hidden: bool = True,
+    remove: Callable[[Path], bool] | None = None,
 ) -> int:
     """Delete immediate child directories of ``parent`` older than the window.
 
@@ -42,6 +51,8 @@ def prune_dirs_older_than(
         Names to exclude from deletion, by default frozenset()
     skip_hidden : bool, optional
         Whether to skip hidden directories, by default True
+    remove : Callable[[Path], bool] | None, optional
+        Removes a directory, or returns False to keep it (e.g. while it is in use), by default shutil.rmtree
 
     Returns
     -------
@@ -73,9 +84,101 @@ def prune_dirs_older_than(
 
         try:
             logger.debug(f"Cleanup: removing {path} (age {age_seconds:.1f}s exceeds {max_age_seconds:.1f}s)")
-            shutil.rmtree(path, ignore_errors=False)
-            removed += 1
+            if _remove_dir(path, remove):
+                removed += 1
         except OSError as exc:
             logger.warning(f"Cleanup: failed to remove {path} (best-effort), skipping: {exc}")
 
     return removed
+
+
+def dir_size_bytes(path: Path) -> int:
+    """Total size of the regular files under ``path``, best-effort (unreadable entries count as 0)."""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def prune_dirs_to_size_budget(
+    parent: Path,
+    *,
+    max_bytes: int,
+    target_bytes: int,
+    exclude_names: Iterable[str] = frozenset(),
+    skip_hidden: bool = True,
+    size_of: Callable[[Path], int] = dir_size_bytes,
+    remove: Callable[[Path], bool] | None = None,
+) -> dict:
+    """Delete the least recently modified child directories of ``parent`` once they exceed a byte budget.
+
+    Nothing is removed while the children total at most ``max_bytes``. Past that,
+    directories are removed oldest-mtime first until the total is at most
+    ``target_bytes``. Excluded and (with ``skip_hidden``) hidden directories count
+    towards the total but are never removed. Never raises, like ``prune_dirs_older_than``.
+
+    Parameters
+    ----------
+    parent : Path
+        Parent directory whose immediate child directories are candidates for deletion.
+    max_bytes : int
+        Total size above which directories are removed (the high watermark).
+    target_bytes : int
+        Total size to prune down to once ``max_bytes`` is exceeded (the low watermark).
+    exclude_names : Iterable[str], optional
+        Names to exclude from deletion, by default frozenset()
+    skip_hidden : bool, optional
+        Whether to skip hidden directories, by default True
+    size_of : Callable[[Path], int], optional
+        Returns the size of a child directory, by default dir_size_bytes
+    remove : Callable[[Path], bool] | None, optional
+        Removes a directory, or returns False to keep it (e.g. while it is in use), by default shutil.rmtree
+
+    Returns
+    -------
+    dict
+        ``total_bytes`` left, and the number of ``removed`` directories and ``removed_bytes``
+    """
+    summary = {"total_bytes": 0, "removed": 0, "removed_bytes": 0}
+    if not parent.exists():
+        return summary
+
+    excluded = set(exclude_names)
+    candidates: list[tuple[float, Path, int]] = []
+    for path in parent.iterdir():
+        if not path.is_dir():
+            continue
+        try:
+            size = size_of(path)
+            mtime = path.stat().st_mtime
+        except OSError as exc:
+            logger.warning(f"Cleanup: could not size {path}, skipping: {exc}")
+            continue
+
+        summary["total_bytes"] += size
+        if (skip_hidden and path.name.startswith(".")) or path.name in excluded:
+            continue
+        candidates.append((mtime, path, size))
+
+    if summary["total_bytes"] <= max_bytes:
+        return summary
+
+    for _mtime, path, size in sorted(candidates, key=lambda candidate: candidate[0]):
+        if summary["total_bytes"] <= target_bytes:
+            break
+        try:
+            logger.debug(f"Cleanup: removing {path} ({size} bytes) to fit the {target_bytes} byte budget")
+            if not _remove_dir(path, remove):
+                continue
+        except OSError as exc:
+            logger.warning(f"Cleanup: failed to remove {path} (best-effort), skipping: {exc}")
+            continue
+        summary["total_bytes"] -= size
+        summary["removed"] += 1
+        summary["removed_bytes"] += size
+
+    return summary
@@ -4,6 +4,7 @@ import contextvars
 import logging
 import re
 import time
+from contextlib import asynccontextmanager
 from functools import wraps
 from pathlib import Path
 from typing import Optional
@@ -159,6 +160,31 @@ def db_operation(func):
     return wrapper
 
 
+@asynccontextmanager
+async def db_transaction():
+    """Run every @db_operation inside the block on one connection, in one transaction.
+
+    Nested blocks become savepoints. The transaction rolls back if the block raises.
+    """
+    global ACTIVE_CONNECTIONS
+
+    conn = _per_context_conn.get()
+    if conn:
+        async with conn.conn.transaction():
+            yield
+        return
+
+    async with pool.acquire() as _conn:
+        ACTIVE_CONNECTIONS += 1
+        token = _per_context_conn.set(DatabaseConnection(_conn, "db_transaction()"))
+        try:
+            async with _conn.transaction():
+                yield
+        finally:
+            _per_context_conn.reset(token)
+            ACTIVE_CONNECTIONS -= 1
+
+
 async def run_migrations() -> None:
     """Run pending Alembic migrations."""
     logger.info("Running database migrations...")
@@ -2,31 +2,224 @@
 
 Tasks are downloaded via presigned S3 URLs and stored locally by digest.
 Once cached, a task is never re-downloaded — the digest guarantees immutability.
+
+The cache can be shared by every validator process on a node: point
+``RIDGES_TASK_CACHE_DIR`` at a common host path. Per-digest file locks under
+``.locks/`` make that safe:
+
+* ``<digest>.download.lock`` (exclusive) single-flights downloads, so each task
+  is fetched once per node. Staging directories are named after their digest,
+  so one whose download lock is free was abandoned by a crashed process.
+* ``<digest>.readers.lock`` is held shared by every process using the task
+  (see ``hold_cached_task``); eviction only removes a task once it can take the
+  lock exclusively, i.e. once no process is reading it.
+
+The kernel releases the locks of a process that dies, so a crash never leaves
+a task pinned or a download blocked. Without ``fcntl`` (Windows) the locks are
+no-ops and the cache is only safe within one process.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import shutil
 import tarfile
-from collections.abc import Iterable
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
 from pathlib import Path
 from uuid import uuid4
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 import httpx
 
-from ridges_harbor.digest import compute_task_digest
-from utils.cleanup import prune_dirs_older_than
+from ridges_harbor.digest import TaskDigestBuilder, compute_task_digest, is_ignored_artifact, write_digest_manifest
+from utils.cleanup import dir_size_bytes, prune_dirs_older_than, prune_dirs_to_size_budget
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ridges" / "tasks"
+DEFAULT_CACHE_DIR = Path(os.getenv("RIDGES_TASK_CACHE_DIR") or Path.home() / ".cache" / "ridges" / "tasks").expanduser()
+
+# Per-trial clones of cached tasks (see utils.tree_clone) live next to the cache, on the same
+# filesystem, so they can be reflinked or hardlinked instead of copied
+DEFAULT_WORKSPACE_DIR = DEFAULT_CACHE_DIR.parent / "workspaces"
+
+LOCKS_DIR_NAME = ".locks"
+_TMP_DIR_PREFIX = ".tmp-"
+
+# Size of the reads from the HTTP response and from each archive member while ingesting
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+
+class TaskCacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.downloads = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self.size_bytes: int | None = None
+        self.budget_bytes: int | None = None
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.downloads
+        return {
+            "hits": self.hits,
+            "downloads": self.downloads,
+            "hit_ratio": self.hits / lookups if lookups else None,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+            "size_bytes": self.size_bytes,
+            "budget_bytes": self.budget_bytes,
+        }
+
+
+task_cache_stats = TaskCacheStats()
+
+# Cached digest directories never change, so each one is only sized once
+_digest_dir_sizes: dict[Path, int] = {}
+
+# Digests prefetched ahead of their run. The prefetch already counted the run's lookup as a
+# download, so the run finding the task cached isn't counted again as a hit.
+_prefetched_digests: set[str] = set()
+
+# Awaited with the task digest after each download lands in the cache
+_task_downloaded_hook: Callable[[str], Awaitable[None]] | None = None
+
+
+def get_task_cache_stats() -> dict:
+    return task_cache_stats.to_dict()
+
+
+def _record_lookup(task_digest: str, *, hit: bool, prefetch: bool = False) -> None:
+    """Count a run's task lookup. A prefetch counts it on behalf of the run, whose own lookup then isn't counted."""
+    if not prefetch and task_digest in _prefetched_digests:
+        _prefetched_digests.discard(task_digest)
+        return
+    if hit:
+        task_cache_stats.hits += 1
+    else:
+        task_cache_stats.downloads += 1
+    if prefetch:
+        _prefetched_digests.add(task_digest)
+
+
+def set_task_downloaded_hook(hook: Callable[[str], Awaitable[None]] | None) -> None:
+    """Run ``hook`` after every task download, e.g. to hold the cache to its budget. Its errors are logged."""
+    global _task_downloaded_hook
+    _task_downloaded_hook = hook
+
+
+def _lock_path(safe_digest: str, kind: str, *, cache_root: Path) -> Path:
+    locks_dir = cache_root / LOCKS_DIR_NAME
+    locks_dir.mkdir(parents=True, exist_ok=True)
+    return locks_dir / f"{safe_digest}.{kind}.lock"
+
+
+def _acquire_lock(path: Path, *, shared: bool = False, blocking: bool = True) -> int | None:
+    """Open ``path`` and flock it; closing the returned fd releases the lock.
+
+    Returns None instead of waiting when ``blocking`` is off and the lock is held.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+    if fcntl is None:
+        return fd
+    try:
+        fcntl.flock(fd, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | (0 if blocking else fcntl.LOCK_NB))
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+async def _acquire_lock_async(path: Path, *, shared: bool = False) -> int:
+    acquire = asyncio.ensure_future(asyncio.to_thread(_acquire_lock, path, shared=shared))
+    try:
+        return await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # The worker thread can't be interrupted; release the lock as soon as it is granted
+        acquire.add_done_callback(lambda done: done.exception() is None and os.close(done.result()))
+        raise
+
+
+@asynccontextmanager
+async def hold_cached_task(task_digest: str, *, cache_root: Path = DEFAULT_CACHE_DIR) -> AsyncIterator[None]:
+    """Keep a cached task from being evicted, by this or any other process, while in use.
+
+    Take this before resolving the task directory; the task may be downloaded
+    inside the block.
+    """
+    fd = await _acquire_lock_async(_lock_path(_safe_digest(task_digest), "readers", cache_root=cache_root), shared=True)
+    try:
+        yield
+    finally:
+        os.close(fd)
+
+
+def _remove_unless_in_use(path: Path) -> bool:
+    """Remove a digest or staging directory unless a process is still using it.
+
+    ``remove`` hook for the cleanup helpers, run while holding the directory's
+    lock so no reader or download can start halfway through.
+    """
+    if path.name == LOCKS_DIR_NAME:
+        return False
+    if path.name.startswith(_TMP_DIR_PREFIX):
+        safe_digest, _, _ = path.name[len(_TMP_DIR_PREFIX) :].rpartition("-")
+        if not safe_digest:
+            # Staging directory without a digest; only age tells whether it is abandoned
+            shutil.rmtree(path)
+            return True
+        kind = "download"
+    else:
+        safe_digest, kind = path.name, "readers"
+
+    fd = _acquire_lock(_lock_path(safe_digest, kind, cache_root=path.parent), blocking=False)
+    if fd is None:
+        logger.info(f"Task cache: {path.name} is in use, not removing it")
+        return False
+    try:
+        shutil.rmtree(path)
+    finally:
+        os.close(fd)
+    return True
+
+
+def reap_abandoned_task_downloads(cache_root: Path = DEFAULT_CACHE_DIR) -> int:
+    """Remove staging directories left behind by downloads whose process died.
+
+    Returns the number of directories removed. Never raises.
+    """
+    if not cache_root.exists():
+        return 0
+
+    removed = 0
+    for path in cache_root.iterdir():
+        if not path.name.startswith(_TMP_DIR_PREFIX) or not path.name[len(_TMP_DIR_PREFIX) :].rpartition("-")[0]:
+            continue
+        try:
+            if _remove_unless_in_use(path):
+                logger.info(f"Task cache: removed abandoned download {path.name}")
+                removed += 1
+        except OSError as exc:
+            logger.warning(f"Task cache: failed to remove abandoned download {path} (best-effort), skipping: {exc}")
+    return removed
+
+
+def _safe_digest(digest: str) -> str:
+    return digest.replace(":", "_")
 
 
 def _cache_dir_for_digest(digest: str, *, cache_root: Path = DEFAULT_CACHE_DIR) -> Path:
-    safe_digest = digest.replace(":", "_")
-    return cache_root / safe_digest
+    return cache_root / _safe_digest(digest)
 
 
 def _touch_digest_dir(task_digest: str, *, cache_root: Path = DEFAULT_CACHE_DIR) -> None:
@@ -84,6 +277,169 @@ def _stage_extracted_task_dir(
     return staged_digest_dir, staged_task_dir
 
 
+class _TaskDownloadCancelled(Exception):
+    pass
+
+
+class _ResponseReader:
+    """Readable file object over a streaming HTTP response, for tarfile's ``"r|gz"`` mode.
+
+    Raises ``_TaskDownloadCancelled`` at the next chunk once ``cancelled`` is set.
+    """
+
+    def __init__(self, response: httpx.Response, cancelled: threading.Event):
+        self.chunks = response.iter_bytes(ARCHIVE_CHUNK_SIZE)
+        self.cancelled = cancelled
+        self.buffer = bytearray()
+        self.num_bytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            if self.cancelled.is_set():
+                raise _TaskDownloadCancelled()
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+            self.num_bytes += len(chunk)
+
+        if size < 0 or size >= len(self.buffer):
+            data = bytes(self.buffer)
+            self.buffer.clear()
+        else:
+            data = bytes(self.buffer[:size])
+            del self.buffer[:size]
+        return data
+
+
+class _ArchiveDigests:
+    """Digest candidates for both task roots ``_resolved_extracted_task_dir`` can pick.
+
+    The root is only known once the whole archive has been seen: a single top-level
+    directory, or the extract dir itself for loose files. Both candidates are
+    hashed while members stream by, and the one matching the resolved root is used.
+    """
+
+    def __init__(self):
+        self.loose = TaskDigestBuilder()
+        self.nested: TaskDigestBuilder | None = TaskDigestBuilder()
+        self.nested_root: str | None = None
+
+    def builders_for(self, parts: tuple[str, ...]) -> list[tuple[TaskDigestBuilder, str]]:
+        builders = [(self.loose, "/".join(parts))]
+        if self.nested is not None:
+            if self.nested_root is None:
+                self.nested_root = parts[0]
+            if parts[0] != self.nested_root:
+                self.nested = None
+            elif len(parts) > 1:
+                builders.append((self.nested, "/".join(parts[1:])))
+        return [(builder, path) for builder, path in builders if not is_ignored_artifact(Path(path))]
+
+    def invalidate(self) -> None:
+        self.loose.invalid = True
+        if self.nested is not None:
+            self.nested.invalid = True
+
+    def for_task_dir(self, task_dir: Path, extract_dir: Path) -> TaskDigestBuilder | None:
+        if task_dir == extract_dir:
+            builder = self.loose
+        elif self.nested is not None and task_dir.name == self.nested_root:
+            builder = self.nested
+        else:
+            return None
+        return None if builder.invalid else builder
+
+
+def _extract_member_file(
+    tar: tarfile.TarFile, member: tarfile.TarInfo, target: Path, builders: list[tuple[TaskDigestBuilder, str]]
+) -> None:
+    for builder, relative_path in builders:
+        builder.start_file(relative_path, member.mode)
+
+    source = tar.extractfile(member)
+    with open(target, "wb") as f:
+        while chunk := source.read(ARCHIVE_CHUNK_SIZE):
+            f.write(chunk)
+            for builder, _ in builders:
+                builder.update(chunk)
+    os.chmod(target, member.mode)
+    os.utime(target, (member.mtime, member.mtime))
+
+    file_stat = target.stat()
+    for builder, relative_path in builders:
+        builder.end_file()
+        builder.record_file_stat(relative_path, file_stat)
+
+
+def _stream_task_archive(presigned_url: str, extract_dir: Path, cancelled: threading.Event) -> _ArchiveDigests:
+    """Download, extract and hash a task archive in one pass over its bytes.
+
+    Members are extracted straight out of the HTTP response with the ``data``
+    filter, and every regular file is hashed as it is written, so the archive is
+    never stored and the extracted tree is never read back. Runs blocking I/O;
+    call it via ``_stream_task_archive_in_thread``. Setting ``cancelled`` makes
+    it give up at the next chunk.
+    """
+    digests = _ArchiveDigests()
+    directories: list[tarfile.TarInfo] = []
+    with httpx.Client(follow_redirects=True, timeout=120) as client:
+        with client.stream("GET", presigned_url) as response:
+            response.raise_for_status()
+            reader = _ResponseReader(response, cancelled)
+            with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+                for member in tar:
+                    member = tarfile.data_filter(member, str(extract_dir))
+                    target = extract_dir / member.name
+                    parts = Path(member.name).parts
+                    if not parts:
+                        continue
+
+                    builders = digests.builders_for(parts)
+                    if member.isdir():
+                        target.mkdir(parents=True, exist_ok=True)
+                        directories.append(member)
+                    elif member.isreg() and member.mode is not None and not target.exists():
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        _extract_member_file(tar, member, target, builders)
+                    else:
+                        # Links, duplicate members, ...: let tarfile handle them and re-hash the tree afterwards
+                        tar.extract(member, path=extract_dir, filter="data")
+                        digests.invalidate()
+
+    # Like extractall(), apply directory modes last so read-only directories can still be filled
+    for member in sorted(directories, key=lambda member: member.name, reverse=True):
+        target = extract_dir / member.name
+        if member.mode is not None:
+            os.chmod(target, member.mode)
+        os.utime(target, (member.mtime, member.mtime))
+
+    logger.info(f"Streamed {reader.num_bytes} byte task archive into {extract_dir}")
+    return digests
+
+
+async def _stream_task_archive_in_thread(presigned_url: str, extract_dir: Path) -> _ArchiveDigests:
+    """``_stream_task_archive`` in a worker thread, stopping the thread when the caller is cancelled.
+
+    A thread can't be interrupted, so on cancellation this waits for it to notice
+    before re-raising: until then it is still writing into ``extract_dir``.
+    """
+    cancelled = threading.Event()
+    download = asyncio.ensure_future(asyncio.to_thread(_stream_task_archive, presigned_url, extract_dir, cancelled))
+    try:
+        return await asyncio.shield(download)
+    except asyncio.CancelledError:
+        cancelled.set()
+        while not download.done():
+            try:
+                await asyncio.wait({download})
+            except asyncio.CancelledError:
+                pass
+        if not download.cancelled():
+            download.exception()
+        raise
+
+
 def _cached_task_dirs_for_digest(
     task_digest: str,
     *,
@@ -125,10 +481,17 @@ def get_cached_task(
     task_digest: str,
     *,
     cache_root: Path = DEFAULT_CACHE_DIR,
+    record_stats: bool = True,
 ) -> Path | None:
-    """Return the cached task directory if it exists, otherwise None."""
+    """Return the cached task directory if it exists, otherwise None.
+
+    Pass ``record_stats=False`` for probes that aren't a run's lookup (e.g. a prefetch
+    checking whether it has anything to do), so the hit ratio counts one lookup per run.
+    """
     cached = _resolve_cached_task_dir(task_name, task_digest, cache_root=cache_root)
     if cached is not None:
+        if record_stats:
+            _record_lookup(task_digest, hit=True)
         _touch_digest_dir(task_digest, cache_root=cache_root)
     return cached
 
@@ -141,7 +504,8 @@ def prune_task_cache(
 ) -> int:
     """Delete cached tasks not used within `max_age_seconds`.
 
-    Include hidden directories (e.g. in-progress downloads that failed) in pruning, but never delete directories with excluded names.
+    Include hidden directories (e.g. in-progress downloads that failed) in pruning, but never delete directories with excluded names,
+    tasks another process is reading, or downloads still in progress. Abandoned downloads are removed regardless of age.
 
     Parameters
     ----------
@@ -158,7 +522,78 @@ def prune_task_cache(
         Number of removed directories
     """
 
-    return prune_dirs_older_than(cache_root, max_age_seconds, exclude_names=exclude_names, skip_hidden=False)
+    removed = reap_abandoned_task_downloads(cache_root)
+    return removed + prune_dirs_older_than(
+        cache_root,
+        max_age_seconds,
+        exclude_names={LOCKS_DIR_NAME, *exclude_names},
+        skip_hidden=False,
+        remove=_remove_unless_in_use,
+    )
+
+
+def _task_cache_dir_size(path: Path) -> int:
+    if path.name.startswith("."):
+        # In-progress downloads are still growing
+        return dir_size_bytes(path)
+    size = _digest_dir_sizes.get(path)
+    if size is None:
+        size = _digest_dir_sizes[path] = dir_size_bytes(path)
+    return size
+
+
+def evict_task_cache_to_budget(
+    cache_root: Path = DEFAULT_CACHE_DIR,
+    *,
+    max_bytes: int,
+    high_watermark: float = 0.9,
+    low_watermark: float = 0.7,
+    exclude_names: Iterable[str] = frozenset(),
+) -> dict:
+    """Evict least recently used cached tasks once the cache outgrows its byte budget.
+
+    Recency is the digest directory's mtime, which ``_touch_digest_dir`` bumps on
+    every cache hit. Once the cache exceeds ``high_watermark * max_bytes``, tasks
+    are evicted until it is at most ``low_watermark * max_bytes``. In-progress
+    downloads, excluded names (e.g. digests of running evaluations) and tasks held
+    with ``hold_cached_task`` by any process are never evicted.
+
+    Parameters
+    ----------
+    cache_root : Path, optional
+        Cache root directory, by default DEFAULT_CACHE_DIR
+    max_bytes : int
+        Disk budget of the cache.
+    high_watermark : float, optional
+        Fraction of the budget that triggers eviction, by default 0.9
+    low_watermark : float, optional
+        Fraction of the budget eviction prunes down to, by default 0.7
+    exclude_names : Iterable[str], optional
+        Names of directories to exclude from eviction, by default frozenset()
+
+    Returns
+    -------
+    dict
+        ``total_bytes`` left, and the number of ``removed`` directories and ``removed_bytes``
+    """
+
+    summary = prune_dirs_to_size_budget(
+        cache_root,
+        max_bytes=int(max_bytes * high_watermark),
+        target_bytes=int(max_bytes * low_watermark),
+        exclude_names=exclude_names,
+        size_of=_task_cache_dir_size,
+        remove=_remove_unless_in_use,
+    )
+
+    for path in [path for path in _digest_dir_sizes if path.parent == cache_root and not path.exists()]:
+        del _digest_dir_sizes[path]
+
+    task_cache_stats.evictions += summary["removed"]
+    task_cache_stats.evicted_bytes += summary["removed_bytes"]
+    task_cache_stats.size_bytes = summary["total_bytes"]
+    task_cache_stats.budget_bytes = max_bytes
+    return summary
 
 
 async def get_or_download_task(
@@ -167,13 +602,20 @@ async def get_or_download_task(
     task_digest: str,
     *,
     cache_root: Path = DEFAULT_CACHE_DIR,
+    prefetch: bool = False,
 ) -> Path:
     """Return the path to a cached task directory, downloading if needed.
 
     The cache is content-addressed: ``~/.cache/ridges/tasks/{digest}/{task_name}/``.
-    Downloads use atomic rename to prevent corruption from concurrent access.
+    Downloads hold the digest's download lock, so processes sharing the cache
+    fetch each task once, and use atomic rename to prevent corruption from concurrent access.
+    The archive is extracted and hashed while it streams in, so a cold task is
+    written to disk once and never read back for verification.
+    A ``.{task_name}.manifest.json`` sidecar records the verified digest and file
+    stats so later runs can skip re-hashing the task.
+    Pass ``prefetch=True`` when staging a task ahead of its run: the run's own lookup
+    is then not counted a second time in the hit ratio.
     """
-    cached_dir = _cache_dir_for_digest(task_digest, cache_root=cache_root)
     cached_task_dir = _resolve_cached_task_dir(
         task_name,
         task_digest,
@@ -181,40 +623,68 @@ async def get_or_download_task(
     )
     if cached_task_dir is not None:
         logger.info(f"Task cache hit for {task_digest}")
+        _record_lookup(task_digest, hit=True, prefetch=prefetch)
         _touch_digest_dir(task_digest, cache_root=cache_root)
         return cached_task_dir
 
-    logger.info(f"Task cache miss for {task_digest}, downloading...")
     cache_root.mkdir(parents=True, exist_ok=True)
+    download_lock = await _acquire_lock_async(_lock_path(_safe_digest(task_digest), "download", cache_root=cache_root))
+    try:
+        # Another process (or coroutine) may have downloaded it while we waited for the lock
+        cached_task_dir = _resolve_cached_task_dir(task_name, task_digest, cache_root=cache_root)
+        if cached_task_dir is not None:
+            logger.info(f"Task cache hit for {task_digest} after waiting for a concurrent download")
+            _record_lookup(task_digest, hit=True, prefetch=prefetch)
+            _touch_digest_dir(task_digest, cache_root=cache_root)
+            return cached_task_dir
+
+        for abandoned_dir in cache_root.glob(f"{_TMP_DIR_PREFIX}{_safe_digest(task_digest)}-*"):
+            logger.info(f"Removing abandoned download {abandoned_dir.name}")
+            shutil.rmtree(abandoned_dir, ignore_errors=True)
+
+        logger.info(f"Task cache miss for {task_digest}, downloading...")
+        cached_task_dir = await _download_task(presigned_url, task_name, task_digest, cache_root=cache_root)
+        _record_lookup(task_digest, hit=False, prefetch=prefetch)
+    finally:
+        os.close(download_lock)
+
+    if _task_downloaded_hook is not None:
+        try:
+            await _task_downloaded_hook(task_digest)
+        except Exception as e:
+            logger.warning(f"Task downloaded hook failed for {task_digest}: {type(e).__name__}: {e}")
+    return cached_task_dir
+
 
-    tmp_dir = cache_root / f".tmp-{uuid4().hex}"
+async def _download_task(presigned_url: str, task_name: str, task_digest: str, *, cache_root: Path) -> Path:
+    cached_dir = _cache_dir_for_digest(task_digest, cache_root=cache_root)
+    tmp_dir = cache_root / f"{_TMP_DIR_PREFIX}{_safe_digest(task_digest)}-{uuid4().hex}"
     try:
         tmp_dir.mkdir(parents=True)
 
-        archive_path = tmp_dir / "task.tar.gz"
-        async with httpx.AsyncClient() as client:
-            async with client.stream("GET", presigned_url, follow_redirects=True, timeout=120) as response:
-                response.raise_for_status()
-                with open(archive_path, "wb") as f:
-                    async for chunk in response.aiter_bytes():
-                        f.write(chunk)
-
         extract_dir = tmp_dir / "extracted"
         extract_dir.mkdir()
-        with tarfile.open(archive_path, "r:gz") as tar:
-            tar.extractall(path=extract_dir, filter="data")
+        digests = await _stream_task_archive_in_thread(presigned_url, extract_dir)
 
         task_dir = _resolved_extracted_task_dir(extract_dir)
 
-        actual_digest = compute_task_digest(task_dir)
+        builder = digests.for_task_dir(task_dir, extract_dir)
+        actual_digest = builder.hexdigest() if builder is not None else None
+        if actual_digest != task_digest:
+            # Rare: the archive's member order or contents didn't allow hashing it while streaming
+            actual_digest = await asyncio.to_thread(compute_task_digest, task_dir)
+            builder = None
         if actual_digest != task_digest:
             raise RuntimeError(f"Task archive digest mismatch: expected {task_digest}, got {actual_digest}")
 
-        staged_digest_dir, _ = _stage_extracted_task_dir(
+        staged_digest_dir, staged_task_dir = _stage_extracted_task_dir(
             extract_dir,
             source_task_dir=task_dir,
             task_name=task_name,
         )
+        write_digest_manifest(
+            staged_task_dir, task_digest, file_stats=builder.file_stats if builder is not None else None
+        )
         try:
             staged_digest_dir.rename(cached_dir)
         except OSError:
@@ -0,0 +1,149 @@
+"""Cheap clones of directory trees, for per-trial task workspaces.
+
+``clone_tree`` materializes a copy of a (read-only, content-addressed) tree with
+the cheapest strategy the filesystem supports:
+
+1. ``reflink``: copy-on-write clones (``FICLONE``, e.g. btrfs, XFS). Files share
+   extents until either side writes, so the clone is private and near-free.
+2. ``hardlink``: a hardlink farm. Files share inodes with the source, so writers
+   must copy a file up with ``ensure_private_file`` before modifying it in place.
+   Only pass it in ``strategies`` when every writer of the clone does so; a
+   write or chmod through a shared inode changes the source too.
+3. ``copy``: a plain copy, the last resort.
+
+Size, mtime and mode are preserved by every strategy, so a digest manifest
+recorded for the source tree (see ``ridges_harbor.digest``) stays valid for
+the clone. Everything here blocks; call it via ``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import shutil
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+CLONE_STRATEGIES = ("reflink", "hardlink", "copy")
+
+# ioctl(dst_fd, FICLONE, src_fd) from linux/fs.h
+_FICLONE = 0x40049409
+
+# Errors meaning "this filesystem (pair) can't do that", as opposed to a real I/O failure
+_UNSUPPORTED_ERRNOS = {
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EPERM,
+    errno.EMLINK,
+    errno.ENOSYS,
+}
+
+
+@dataclass(frozen=True)
+class TreeCloneResult:
+    """How a tree was cloned: the strategy used for its files, and how long it took."""
+
+    strategy: str
+    num_files: int
+    elapsed_seconds: float
+
+
+def _reflink_file(source: Path, destination: Path) -> None:
+    if fcntl is None:
+        raise OSError(errno.ENOTSUP, "reflinks need fcntl")
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    shutil.copystat(source, destination)
+
+
+def _clone_file(strategy: str, source: Path, destination: Path) -> None:
+    if strategy == "reflink":
+        _reflink_file(source, destination)
+    elif strategy == "hardlink":
+        os.link(source, destination)
+    else:
+        shutil.copy2(source, destination)
+
+
+def clone_tree(
+    source: Path,
+    destination: Path,
+    *,
+    strategies: Sequence[str] = CLONE_STRATEGIES,
+) -> TreeCloneResult:
+    """Clone ``source`` to the new directory ``destination`` with the first strategy that works.
+
+    A strategy the filesystem doesn't support is dropped for the rest of the
+    tree, so probing costs at most one failed attempt per strategy. Symlinks are
+    recreated as symlinks. The reported strategy is the one that cloned the last
+    file (the weakest one used).
+    """
+    started_at = time.monotonic()
+    remaining = [strategy for strategy in CLONE_STRATEGIES if strategy in strategies]
+    if not remaining or remaining[-1] != "copy":
+        remaining.append("copy")
+    num_files = 0
+
+    destination.mkdir(parents=True)
+    for root, dir_names, file_names in os.walk(source):
+        relative_root = Path(root).relative_to(source)
+        for dir_name in dir_names:
+            source_dir = Path(root) / dir_name
+            if not source_dir.is_symlink():
+                (destination / relative_root / dir_name).mkdir()
+
+        for name in [*file_names, *(name for name in dir_names if (Path(root) / name).is_symlink())]:
+            source_path = Path(root) / name
+            destination_path = destination / relative_root / name
+            if source_path.is_symlink():
+                os.symlink(os.readlink(source_path), destination_path)
+                continue
+
+            while True:
+                try:
+                    _clone_file(remaining[0], source_path, destination_path)
+                    break
+                except OSError as exc:
+                    if remaining[0] == "copy" or exc.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+                    logger.debug(f"Clone strategy {remaining[0]} unsupported for {destination}: {exc}")
+                    destination_path.unlink(missing_ok=True)
+                    remaining.pop(0)
+            num_files += 1
+
+    # Directory modes last, so read-only directories could still be filled
+    for root, dir_names, _ in os.walk(source):
+        relative_root = Path(root).relative_to(source)
+        for dir_name in dir_names:
+            if not (Path(root) / dir_name).is_symlink():
+                shutil.copystat(Path(root) / dir_name, destination / relative_root / dir_name)
+    shutil.copystat(source, destination)
+
+    return TreeCloneResult(strategy=remaining[0], num_files=num_files, elapsed_seconds=time.monotonic() - started_at)
+
+
+def ensure_private_file(path: Path) -> bool:
+    """Copy a hardlinked file up to its own inode, so writing it leaves the other links untouched.
+
+    Returns whether a copy was made. Reflinked and copied files are already private.
+    """
+    if path.is_symlink() or path.stat().st_nlink <= 1:
+        return False
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    shutil.copy2(path, tmp_path)
+    os.replace(tmp_path, path)
+    return True
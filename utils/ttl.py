@@ -1,10 +1,11 @@
 import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta, timezone
+import pickle
+import time
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Dict, List, Tuple, TypeAlias
-
-from pydantic import BaseModel, ConfigDict
+from typing import Any, Callable, Dict, List, Optional, Protocol, Set, Tuple, TypeAlias
 
 logger = logging.getLogger(__name__)
 TTLCacheKey: TypeAlias = Tuple[Any, ...]
@@ -13,6 +14,45 @@ TTLCacheKey: TypeAlias = Tuple[Any, ...]
 # at once after a mutation that can change any cached, network-wide data.
 _ALL_CACHE_CLEARERS: List[Callable[[], None]] = []
 
+# Registry of every ttl_cache's counters, keyed by cache name, for /debug/ttl-cache-info
+_ALL_CACHE_STATS: Dict[str, "TTLCacheStats"] = {}
+
+# Strong references to background refreshes, so they aren't garbage collected mid-flight
+_BACKGROUND_REFRESHES: Set[asyncio.Task] = set()
+
+# Argument types whose repr() is identical in every process, so they can key a shared cache entry
+_SHARED_KEY_ARG_TYPES = (type(None), bool, int, float, str)
+
+
+class TTLCacheBackend(Protocol):
+    """A cache shared between processes (e.g. every API worker).
+
+    Values are opaque bytes. get() returns the value together with the number of
+    seconds it has left to live, or None if the key is missing or expired.
+
+    Invalidation is versioned: clear() removes every entry and bumps the generation,
+    and set() only stores the value if the generation still equals the one passed in
+    (read by get_generation() when the calculation started), so a calculation that was
+    in flight during another process's clear() can't publish its outdated value.
+    """
+
+    async def get(self, key: str) -> Optional[Tuple[bytes, float]]: ...
+
+    async def get_generation(self) -> int: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float, generation: int) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+_shared_backend: Optional[TTLCacheBackend] = None
+
+
+def set_shared_ttl_cache_backend(backend: Optional[TTLCacheBackend]) -> None:
+    """Install the backend used by every ttl_cache(shared=True), or None to keep those caches process-local."""
+    global _shared_backend
+    _shared_backend = backend
+
 
 def clear_all_ttl_caches() -> None:
     """Invalidate every ttl_cache in the process.
@@ -24,15 +64,76 @@ def clear_all_ttl_caches() -> None:
         clear()
 
 
+async def invalidate_all_ttl_caches() -> None:
+    """clear_all_ttl_caches(), plus every entry in the shared backend (if one is installed)."""
+    clear_all_ttl_caches()
+    if _shared_backend is not None:
+        await _shared_backend.clear()
+
+
+def get_ttl_cache_stats() -> dict:
+    return {name: stats.to_dict() for name, stats in sorted(_ALL_CACHE_STATS.items())}
+
+
 def _args_and_kwargs_to_ttl_cache_key(args: Tuple, kwargs: Dict) -> TTLCacheKey:
     return (args, tuple(sorted(kwargs.items())))
 
 
-class TTLCacheEntry(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+def _check_shared_key_args(cache_name: str, args: Tuple, kwargs: Dict) -> None:
+    for arg in (*args, *kwargs.values()):
+        if not isinstance(arg, _SHARED_KEY_ARG_TYPES):
+            raise TypeError(
+                f"ttl_cache(shared=True) {cache_name} only accepts None, bool, int, float and str arguments, "
+                f"got {type(arg).__name__}"
+            )
+
 
-    expires_at: datetime
-    value: Any
+def _register_cache_name(name: str) -> str:
+    # The same function can be wrapped more than once with different TTLs
+    unique_name = name
+    suffix = 2
+    while unique_name in _ALL_CACHE_STATS:
+        unique_name = f"{name}#{suffix}"
+        suffix += 1
+    return unique_name
+
+
+class TTLCacheStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.calculations = 0
+        self.calculation_errors = 0
+        self.evictions = 0
+        self.total_calculation_seconds = 0.0
+        self.max_calculation_seconds = 0.0
+        self.num_entries = 0
+
+    def record_calculation(self, seconds: float):
+        self.calculations += 1
+        self.total_calculation_seconds += seconds
+        self.max_calculation_seconds = max(self.max_calculation_seconds, seconds)
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else None,
+            "shared_hits": self.shared_hits,
+            "calculations": self.calculations,
+            "calculation_errors": self.calculation_errors,
+            "average_calculation_seconds": (
+                self.total_calculation_seconds / self.calculations if self.calculations else None
+            ),
+            "max_calculation_seconds": self.max_calculation_seconds,
+            "evictions": self.evictions,
+            "num_entries": self.num_entries,
+        }
 
 
 # NOTE ADAM: A robust TTL cache implementation. The implementation supports the following
@@ -59,70 +160,130 @@ class TTLCacheEntry(BaseModel):
 #            The effect of these behaviors is that there is a maximum of one recalculation occuring
 #            at any given moment for a given key.
 #
+#            Entries live in an OrderedDict in least-recently-used order and expire against a
+#            monotonic clock, so lookups, expiry and eviction are all O(1). Once max_entries is
+#            exceeded, the least recently used entry is evicted.
 #
+#            With shared=True, a calculation first looks in the shared backend (if one is installed)
+#            and publishes its result there, so several API workers reuse one calculation. The result
+#            is only published if no worker invalidated the shared cache since the calculation
+#            started (see TTLCacheBackend). Only use it for functions whose results pickle cleanly
+#            and whose arguments are None, bool, int, float or str: the shared key is derived from
+#            their repr(), which other types (e.g. objects with a default repr) don't keep stable
+#            across processes.
 #
-def ttl_cache(ttl_seconds: int, max_entries: int = 200):
+def ttl_cache(
+    ttl_seconds: int,
+    max_entries: int = 200,
+    *,
+    shared: bool = False,
+    name: Optional[str] = None,
+    clock: Callable[[], float] = time.monotonic,
+):
     def decorator(func: Callable):
-        cache: Dict[TTLCacheKey, TTLCacheEntry] = {}
+        # key -> (expires_at, value), in least-recently-used order
+        cache: "OrderedDict[TTLCacheKey, Tuple[float, Any]]" = OrderedDict()
         recalculating_locks: Dict[TTLCacheKey, asyncio.Lock] = {}
         cache_generation = 0
 
-        def _evict_expired():
-            """Remove all expired entries and their locks."""
-            now = datetime.now(timezone.utc)
-            expired = [k for k, v in cache.items() if now >= v.expires_at]
-            for k in expired:
-                del cache[k]
-                recalculating_locks.pop(k, None)
-
-            # Hard cap: if still over max_entries, drop oldest
-            if len(cache) > max_entries:
-                by_expiry = sorted(cache.items(), key=lambda kv: kv[1].expires_at)
-                to_remove = len(cache) - max_entries
-                for k, _ in by_expiry[:to_remove]:
-                    del cache[k]
-                    recalculating_locks.pop(k, None)
+        # The shared backend is keyed by the base name, so the same cache in another API worker finds its entries
+        base_name = name or f"{func.__module__}.{func.__qualname__}"
+        cache_name = _register_cache_name(base_name)
+        stats = TTLCacheStats(cache_name)
+        _ALL_CACHE_STATS[cache_name] = stats
+
+        def _store(key: TTLCacheKey, value: Any, expires_at: float):
+            cache[key] = (expires_at, value)
+            cache.move_to_end(key)
+            while len(cache) > max_entries:
+                evicted_key, _ = cache.popitem(last=False)
+                lock = recalculating_locks.get(evicted_key)
+                if lock is not None and not lock.locked():
+                    del recalculating_locks[evicted_key]
+                stats.evictions += 1
+            stats.num_entries = len(cache)
+
+        def _shared_key(key: TTLCacheKey) -> str:
+            return f"{base_name}:{hashlib.sha256(repr(key).encode()).hexdigest()}"
+
+        async def _read_shared(key: TTLCacheKey) -> Optional[Tuple[Any, float]]:
+            try:
+                result = await _shared_backend.get(_shared_key(key))
+                if result is None:
+                    return None
+                value_bytes, remaining_seconds = result
+                return pickle.loads(value_bytes), remaining_seconds
+            except Exception as e:
+                logger.warning(f"[TTLCache] {cache_name}: Failed to read shared cache: {type(e).__name__}: {e}")
+                return None
+
+        async def _read_shared_generation() -> Optional[int]:
+            try:
+                return await _shared_backend.get_generation()
+            except Exception as e:
+                logger.warning(
+                    f"[TTLCache] {cache_name}: Failed to read shared cache generation: {type(e).__name__}: {e}"
+                )
+                return None
+
+        async def _write_shared(key: TTLCacheKey, value: Any, shared_generation: int):
+            try:
+                await _shared_backend.set(_shared_key(key), pickle.dumps(value), ttl_seconds, shared_generation)
+            except Exception as e:
+                logger.warning(f"[TTLCache] {cache_name}: Failed to write shared cache: {type(e).__name__}: {e}")
+
+        def _refresh_in_background(args: Tuple, kwargs: Dict):
+            task = asyncio.create_task(_recalculate(args, kwargs))
+            _BACKGROUND_REFRESHES.add(task)
+
+            def on_done(done_task: asyncio.Task):
+                _BACKGROUND_REFRESHES.discard(done_task)
+                if not done_task.cancelled() and (e := done_task.exception()) is not None:
+                    logger.error(f"[TTLCache] {cache_name}: Background recalculation failed: {type(e).__name__}: {e}")
+
+            task.add_done_callback(on_done)
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
+            if shared:
+                _check_shared_key_args(cache_name, args, kwargs)
             key = _args_and_kwargs_to_ttl_cache_key(args, kwargs)
 
-            # Periodically evict expired entries
-            if len(cache) > max_entries // 2:
-                _evict_expired()
-
-            lock = recalculating_locks.setdefault(key, asyncio.Lock())
-
-            if key in cache:
-                cache_entry = cache[key]
-                if datetime.now(timezone.utc) < cache_entry.expires_at:
+            cache_entry = cache.get(key)
+            if cache_entry is not None:
+                cache.move_to_end(key)
+                expires_at, value = cache_entry
+                if clock() < expires_at:
+                    stats.hits += 1
                     logger.debug(f"[TTLCache] {func.__name__}(): Cache hit")
-                    return cache_entry.value
+                    return value
+
+                stats.stale_hits += 1
+                lock = recalculating_locks.get(key)
+                if lock is not None and lock.locked():
+                    logger.debug(f"[TTLCache] {func.__name__}(): Cache miss, already recalculating")
                 else:
-                    if lock.locked():
-                        logger.debug(f"[TTLCache] {func.__name__}(): Cache miss, already recalculating")
-                        return cache_entry.value
-                    else:
-                        logger.debug(f"[TTLCache] {func.__name__}(): Cache miss, triggering recalculation")
-                        asyncio.create_task(_recalculate(args, kwargs))
-                        return cache_entry.value
-            else:
-                if lock.locked():
-                    logger.debug(f"[TTLCache] {func.__name__}(): First request, already calculating, started waiting")
-                    async with lock:
-                        logger.debug(
-                            f"[TTLCache] {func.__name__}(): First request, already calculating, stopped waiting"
-                        )
-                    if key in cache:
-                        return cache[key].value
-
-                logger.debug(f"[TTLCache] {func.__name__}(): First request, triggering calculation")
-                return await _recalculate(args, kwargs)
+                    logger.debug(f"[TTLCache] {func.__name__}(): Cache miss, triggering recalculation")
+                    _refresh_in_background(args, kwargs)
+                return value
+
+            stats.misses += 1
+            lock = recalculating_locks.get(key)
+            if lock is not None and lock.locked():
+                logger.debug(f"[TTLCache] {func.__name__}(): First request, already calculating, started waiting")
+                async with lock:
+                    logger.debug(f"[TTLCache] {func.__name__}(): First request, already calculating, stopped waiting")
+                if key in cache:
+                    return cache[key][1]
+
+            logger.debug(f"[TTLCache] {func.__name__}(): First request, triggering calculation")
+            return await _recalculate(args, kwargs)
 
         def cache_clear() -> None:
             nonlocal cache_generation
             cache_generation += 1
             cache.clear()
+            stats.num_entries = 0
             for key, lock in list(recalculating_locks.items()):
                 if not lock.locked():
                     recalculating_locks.pop(key, None)
@@ -132,19 +293,43 @@ def ttl_cache(ttl_seconds: int, max_entries: int = 200):
             lock = recalculating_locks.setdefault(key, asyncio.Lock())
 
             async with lock:
-                if key in cache and datetime.now(timezone.utc) < cache[key].expires_at:
-                    return cache[key].value
+                cache_entry = cache.get(key)
+                if cache_entry is not None and clock() < cache_entry[0]:
+                    return cache_entry[1]
 
                 calculation_generation = cache_generation
-                value = await func(*args, **kwargs)
+
+                use_shared = shared and _shared_backend is not None
+                shared_entry = await _read_shared(key) if use_shared else None
+                if shared_entry is not None:
+                    stats.shared_hits += 1
+                    value, remaining_seconds = shared_entry
+                    expires_at = clock() + min(remaining_seconds, ttl_seconds)
+                else:
+                    # Without a generation the value can't be checked against other workers' invalidations
+                    shared_generation = await _read_shared_generation() if use_shared else None
+                    started_at = clock()
+                    try:
+                        value = await func(*args, **kwargs)
+                    except Exception:
+                        stats.calculation_errors += 1
+                        raise
+                    finally:
+                        stats.record_calculation(clock() - started_at)
+                    expires_at = clock() + ttl_seconds
+                    # A cache_clear() during the calculation means the value may predate the mutation
+                    # that triggered it, so it must not be published to the other workers either. The
+                    # backend likewise drops it if another worker invalidated the shared cache meanwhile.
+                    if shared_generation is not None and calculation_generation == cache_generation:
+                        await _write_shared(key, value, shared_generation)
+
                 if calculation_generation == cache_generation:
-                    cache[key] = TTLCacheEntry(
-                        expires_at=datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds), value=value
-                    )
+                    _store(key, value, expires_at)
                     logger.debug(f"[TTLCache] {func.__name__}(): Calculation completed")
                 return value
 
         wrapper.cache_clear = cache_clear
+        wrapper.cache_stats = stats
         _ALL_CACHE_CLEARERS.append(cache_clear)
         return wrapper
 
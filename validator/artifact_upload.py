@@ -0,0 +1,122 @@
+"""Streaming upload of Harbor job artifacts to presigned S3 URLs.
+
+The job directory is tarred and gzip-compressed into a spool file on disk in a
+worker thread, then streamed to S3 in fixed-size chunks. Memory stays bounded by
+the chunk size regardless of how much output a trial produced, and the event
+loop is never blocked on compression.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tarfile
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE_BYTES = 1024 * 1024
+UPLOAD_TIMEOUT_SECONDS = 60
+
+
+def write_job_archive(
+    job_dir: Path,
+    archive_path: Path,
+    *,
+    max_file_bytes: int | None = None,
+    compresslevel: int = 6,
+) -> list[str]:
+    """Write ``job_dir`` as a gzip-compressed tar stream to ``archive_path``.
+
+    Regular files larger than ``max_file_bytes`` are left out of the archive.
+
+    Returns
+    -------
+    list[str]
+        Archive names of the files that were skipped for exceeding the cap.
+    """
+    skipped: list[str] = []
+
+    def _size_filter(member: tarfile.TarInfo) -> tarfile.TarInfo | None:
+        if max_file_bytes is not None and member.isfile() and member.size > max_file_bytes:
+            skipped.append(member.name)
+            return None
+        return member
+
+    with open(archive_path, "wb") as archive_file:
+        with tarfile.open(fileobj=archive_file, mode="w|gz", compresslevel=compresslevel) as tar:
+            tar.add(str(job_dir), arcname=job_dir.name, filter=_size_filter)
+
+    return skipped
+
+
+async def _iter_file_chunks(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+    with open(path, "rb") as handle:
+        while chunk := await asyncio.to_thread(handle.read, chunk_size):
+            yield chunk
+
+
+async def upload_job_artifacts(
+    job_dir: Path,
+    upload_url: str,
+    *,
+    max_file_bytes: int | None = None,
+    compresslevel: int = 6,
+    chunk_size: int = UPLOAD_CHUNK_SIZE_BYTES,
+    client: httpx.AsyncClient | None = None,
+) -> int:
+    """Compress ``job_dir`` and PUT it to a presigned S3 URL.
+
+    Presigned PUTs need a Content-Length, so the archive is spooled to a temp
+    file before upload rather than sent with chunked transfer encoding.
+
+    Returns
+    -------
+    int
+        Number of compressed bytes uploaded.
+    """
+    fd, spool_name = tempfile.mkstemp(prefix=f".{job_dir.name}-", suffix=".tar.gz")
+    os.close(fd)
+    spool_path = Path(spool_name)
+    try:
+        started = time.monotonic()
+        skipped = await asyncio.to_thread(
+            write_job_archive,
+            job_dir,
+            spool_path,
+            max_file_bytes=max_file_bytes,
+            compresslevel=compresslevel,
+        )
+        compressed_at = time.monotonic()
+        archive_size = spool_path.stat().st_size
+        if skipped:
+            logger.warning(
+                f"Left {len(skipped)} file(s) over {max_file_bytes} bytes out of job artifacts: "
+                f"{', '.join(skipped[:10])}"
+            )
+
+        headers = {"Content-Length": str(archive_size), "Content-Type": "application/gzip"}
+        content = _iter_file_chunks(spool_path, chunk_size)
+        if client is None:
+            async with httpx.AsyncClient(timeout=UPLOAD_TIMEOUT_SECONDS) as owned_client:
+                resp = await owned_client.put(upload_url, content=content, headers=headers)
+        else:
+            resp = await client.put(upload_url, content=content, headers=headers)
+        resp.raise_for_status()
+
+        finished = time.monotonic()
+        upload_seconds = max(finished - compressed_at, 1e-6)
+        logger.info(
+            f"Uploaded {archive_size} bytes of job artifacts to S3 "
+            f"(compress {compressed_at - started:.1f}s, upload {upload_seconds:.1f}s, "
+            f"{archive_size / upload_seconds / (1024 * 1024):.1f} MiB/s)"
+        )
+        return archive_size
+    finally:
+        spool_path.unlink(missing_ok=True)
@@ -1,5 +1,6 @@
 """Long-running background loops the validator/screener runs alongside its main
-evaluation loop: heartbeat, weight-setting, and local-storage cleanup.
+evaluation loop: heartbeat, weight-setting, local-storage cleanup, and adaptive
+evaluation run concurrency.
 
 These are started with `asyncio.create_task` from `validator.main`.
 """
@@ -24,7 +25,13 @@ from utils.docker import (
     sweep_stale_harbor_containers,
 )
 from utils.system_metrics import get_system_metrics
-from utils.task_cache import prune_task_cache
+from utils.task_cache import (
+    DEFAULT_WORKSPACE_DIR,
+    evict_task_cache_to_budget,
+    get_task_cache_stats,
+    prune_task_cache,
+)
+from validator.concurrency import AdaptiveConcurrencyLimiter
 from validator.http_utils import get_ridges_platform, post_ridges_platform
 from validator.retry_utils import retry_with_backoff
 from validator.set_weights import set_weights_from_mapping
@@ -76,9 +83,56 @@ async def set_weights_loop():
         await asyncio.sleep(config.SET_WEIGHTS_INTERVAL_SECONDS)
 
 
+# A loop that feeds system metrics to the adaptive evaluation run concurrency limiter.
+# Fail-safe: a failed sample only skips one adjustment.
+async def adaptive_concurrency_loop(limiter: AdaptiveConcurrencyLimiter):
+    logger.info("Starting adaptive concurrency loop...")
+    while True:
+        try:
+            await limiter.observe(await get_system_metrics())
+        except Exception as e:
+            logger.warning(f"Adaptive concurrency tick failed: {type(e).__name__}: {e}")
+
+        await asyncio.sleep(config.ADAPTIVE_CONCURRENCY_INTERVAL_SECONDS)
+
+
+# Serializes budget evictions, which run both from the cleanup loop and after each task download
+_task_cache_eviction_lock = asyncio.Lock()
+
+
+async def evict_task_cache(active_task_digests: Set[str]) -> None:
+    """Hold the task cache to its disk budget, never evicting the tasks of running evaluations.
+
+    Best-effort: errors are logged. A no-op when the budget is disabled.
+    """
+    max_bytes = int(config.CLEANUP_TASK_CACHE_MAX_GB * 1e9)
+    if max_bytes <= 0:
+        return
+    async with _task_cache_eviction_lock:
+        try:
+            # A copy, so the eviction running in a worker thread can't observe a mutation
+            task_guard = {digest.replace(":", "_") for digest in active_task_digests}
+            eviction = await asyncio.to_thread(
+                evict_task_cache_to_budget,
+                max_bytes=max_bytes,
+                high_watermark=config.CLEANUP_TASK_CACHE_HIGH_WATERMARK,
+                low_watermark=config.CLEANUP_TASK_CACHE_LOW_WATERMARK,
+                exclude_names=task_guard,
+            )
+            if eviction["removed"]:
+                logger.info(
+                    f"Evicted {eviction['removed']} cached task(s) "
+                    f"({eviction['removed_bytes'] / 1e6:.0f} MB) to fit the task cache budget"
+                )
+        except Exception as e:
+            logger.warning(f"Task cache eviction failed (best-effort): {type(e).__name__}: {e}")
+
+
 # A low-priority background loop that prunes the task cache and Harbor job
-# artifacts by age. Fail-safe: unlike the heartbeat loop it must NEVER exit the
-# validator — every sweep is wrapped so errors are logged and the loop continues.
+# artifacts by age, and holds the task cache to its disk budget (which is also
+# enforced after each task download). Fail-safe: unlike the heartbeat loop it
+# must NEVER exit the validator — every sweep is wrapped so errors are logged
+# and the loop continues.
 async def cleanup_loop(active_task_digests: Set[str]):
     logger.info("Starting cleanup loop...")
     task_cache_max_age = config.CLEANUP_TASK_CACHE_RETENTION_HOURS * 3600
@@ -96,11 +150,20 @@ async def cleanup_loop(active_task_digests: Set[str]):
                 prune_task_cache, max_age_seconds=task_cache_max_age, exclude_names=task_guard
             )
             artifacts_removed = await asyncio.to_thread(prune_dirs_older_than, results_dir, artifact_max_age)
+            if config.TASK_WORKSPACE_ISOLATION:
+                # Trial workspaces are removed when their run ends; this only reaps ones left by a crash
+                artifacts_removed += await asyncio.to_thread(
+                    prune_dirs_older_than, DEFAULT_WORKSPACE_DIR, artifact_max_age
+                )
             if tasks_removed or artifacts_removed:
                 logger.info(f"Cleanup pruned {tasks_removed} cached task(s) and {artifacts_removed} job artifact(s)")
         except Exception as e:
             logger.warning(f"Cleanup sweep failed (best-effort): {type(e).__name__}: {e}")
 
+        if config.CLEANUP_TASK_CACHE_MAX_GB > 0:
+            await evict_task_cache(active_task_digests)
+            logger.info(f"Task cache: {get_task_cache_stats()}")
+
         if config.CLEANUP_DOCKER_ENABLED and config.RIDGES_ENVIRONMENT_TYPE == "docker":
             dry_run = config.CLEANUP_DOCKER_DRY_RUN
             containers = {"count": 0, "names": [], "errors": 0}
@@ -0,0 +1,132 @@
+# NOTE: Adaptive limit on the number of evaluation runs in flight, used in place of a
+#       fixed asyncio.Semaphore(MAX_CONCURRENT_EVALUATION_RUNS). The limit follows AIMD
+#       control: while the host has headroom and runs are queued for a slot it grows by
+#       one per observation, and on resource pressure (CPU or RAM above their
+#       thresholds) or a validator-fault run failure (e.g. an OOM-killed environment)
+#       it is cut by DECREASE_FACTOR. Disk usage only holds the limit where it is:
+#       it is a level that cleanup brings down, not congestion that fewer runs
+#       relieve, so a disk that stays full must not ratchet the limit to the floor.
+#       It starts at, and never exceeds, the configured maximum, so a host that never
+#       struggles behaves exactly like the fixed semaphore. Lowering the limit never
+#       interrupts runs that already hold a slot.
+
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+from models.evaluation_run import EvaluationRunErrorCode
+from utils.system_metrics import SystemMetrics
+
+logger = logging.getLogger(__name__)
+
+DECREASE_FACTOR = 0.5
+# Failures and pressure readings within this long of a cut are the same congestion event
+DECREASE_COOLDOWN_SECONDS = 60.0
+
+
+def is_validator_fault(error_code: Optional[EvaluationRunErrorCode]) -> bool:
+    """Whether a run's error code blames the validator (2xxx), as opposed to the agent or the platform."""
+    return error_code is not None and 2000 <= error_code.value < 3000
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        *,
+        min_limit: int,
+        max_limit: int,
+        cpu_high_percent: float,
+        ram_high_percent: float,
+        disk_high_percent: float,
+        cooldown_seconds: float = DECREASE_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = min(max(1, min_limit), self.max_limit)
+        self.limit = self.max_limit
+        self.cpu_high_percent = cpu_high_percent
+        self.ram_high_percent = ram_high_percent
+        self.disk_high_percent = disk_high_percent
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.increases = 0
+        self.decreases = 0
+        self.last_decrease_at: Optional[float] = None
+        self.condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self.condition:
+            self.waiting += 1
+            try:
+                await self.condition.wait_for(lambda: self.in_flight < self.limit)
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    def record_outcome(self, error_code: Optional[EvaluationRunErrorCode]) -> None:
+        """Feed back how a run attempt ended: None on success, else its error code."""
+        if is_validator_fault(error_code):
+            self._decrease(f"evaluation run failed with {error_code.name}")
+
+    async def observe(self, metrics: SystemMetrics) -> None:
+        """Feed back a system metrics sample: back off under CPU/RAM pressure, hold while the disk is full, else
+        probe one slot higher."""
+        pressure = [
+            f"{name} at {value:.0f}%"
+            for name, value, threshold in (
+                ("CPU", metrics.cpu_percent, self.cpu_high_percent),
+                ("RAM", metrics.ram_percent, self.ram_high_percent),
+            )
+            if value is not None and value >= threshold
+        ]
+        disk_full = metrics.disk_percent is not None and metrics.disk_percent >= self.disk_high_percent
+        if pressure:
+            self._decrease(", ".join(pressure))
+        elif not disk_full and self.waiting > 0 and self.in_flight >= self.limit and not self._cooling_down():
+            self._set_limit(self.limit + 1, "host has headroom and runs are queued")
+            async with self.condition:
+                self.condition.notify_all()
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+    def _cooling_down(self) -> bool:
+        return self.last_decrease_at is not None and self.clock() - self.last_decrease_at < self.cooldown_seconds
+
+    def _decrease(self, reason: str) -> None:
+        if self._cooling_down():
+            return
+        self.last_decrease_at = self.clock()
+        self._set_limit(int(self.limit * DECREASE_FACTOR), reason)
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        limit = min(self.max_limit, max(self.min_limit, limit))
+        if limit == self.limit:
+            return
+        logger.info(
+            f"Evaluation run concurrency {self.limit} -> {limit} ({reason}; "
+            f"{self.in_flight} in flight, {self.waiting} waiting)"
+        )
+        if limit > self.limit:
+            self.increases += 1
+        else:
+            self.decreases += 1
+        self.limit = limit
@@ -125,6 +125,8 @@ SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS = os.getenv("SIMULATE_EVALUAT
 if not SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS:
     logger.fatal("SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS is not set in .env")
 SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS = int(SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS)
+# Simulated runs of problems with a known expected duration take that long times this scale
+SIMULATE_EVALUATION_RUN_TIME_SCALE = float(os.getenv("SIMULATE_EVALUATION_RUN_TIME_SCALE", "0.01"))
 
 INCLUDE_SOLUTIONS = os.getenv("INCLUDE_SOLUTIONS")
 if not INCLUDE_SOLUTIONS:
@@ -212,8 +214,55 @@ else:
     MAX_CONCURRENT_EVALUATION_RUNS = int(MAX_CONCURRENT_EVALUATION_RUNS)
 logger.info(f"Max Concurrent Evaluation Runs: {MAX_CONCURRENT_EVALUATION_RUNS}")
 
+# Adaptive concurrency: MAX_CONCURRENT_EVALUATION_RUNS becomes a ceiling. The in-flight limit is
+# halved on CPU/RAM pressure or validator-fault run failures, and probes back up one run per
+# interval while the host has headroom and runs are queued. Disk usage above its threshold only
+# stops the probing; it never cuts the limit.
+ADAPTIVE_CONCURRENCY_ENABLED = os.getenv("ADAPTIVE_CONCURRENCY_ENABLED", "true").lower() == "true"
+ADAPTIVE_CONCURRENCY_MIN = min(MAX_CONCURRENT_EVALUATION_RUNS, max(1, int(os.getenv("ADAPTIVE_CONCURRENCY_MIN", "1"))))
+ADAPTIVE_CONCURRENCY_INTERVAL_SECONDS = max(1.0, float(os.getenv("ADAPTIVE_CONCURRENCY_INTERVAL_SECONDS", "15")))
+ADAPTIVE_CONCURRENCY_CPU_PERCENT = float(os.getenv("ADAPTIVE_CONCURRENCY_CPU_PERCENT", "95"))
+ADAPTIVE_CONCURRENCY_RAM_PERCENT = float(os.getenv("ADAPTIVE_CONCURRENCY_RAM_PERCENT", "85"))
+ADAPTIVE_CONCURRENCY_DISK_PERCENT = float(os.getenv("ADAPTIVE_CONCURRENCY_DISK_PERCENT", "90"))
+logger.info(f"Adaptive Concurrency Enabled: {ADAPTIVE_CONCURRENCY_ENABLED}")
+if ADAPTIVE_CONCURRENCY_ENABLED:
+    logger.info(f"Adaptive Concurrency Min: {ADAPTIVE_CONCURRENCY_MIN}")
+    logger.info(f"Adaptive Concurrency Interval: {ADAPTIVE_CONCURRENCY_INTERVAL_SECONDS} second(s)")
+    logger.info(
+        f"Adaptive Concurrency Pressure Thresholds: CPU {ADAPTIVE_CONCURRENCY_CPU_PERCENT}%, "
+        f"RAM {ADAPTIVE_CONCURRENCY_RAM_PERCENT}%, disk {ADAPTIVE_CONCURRENCY_DISK_PERCENT}%"
+    )
+
+# Pipelined evaluations: stage task archives for queued evaluation runs while earlier
+# runs execute, and request the next evaluation as soon as the current one finishes.
+EVALUATION_PIPELINE_ENABLED = os.getenv("EVALUATION_PIPELINE_ENABLED", "true").lower() == "true"
+EVALUATION_PIPELINE_LOOKAHEAD = max(1, int(os.getenv("EVALUATION_PIPELINE_LOOKAHEAD", "4")))
+logger.info(f"Evaluation Pipeline Enabled: {EVALUATION_PIPELINE_ENABLED}")
+if EVALUATION_PIPELINE_ENABLED:
+    logger.info(f"Evaluation Pipeline Lookahead: {EVALUATION_PIPELINE_LOOKAHEAD} task(s)")
+
+# Order in which an evaluation's runs start: longest_first (by the platform's expected durations),
+# shortest_first, or platform (as assigned)
+EVALUATION_RUN_SCHEDULING_POLICY = os.getenv("EVALUATION_RUN_SCHEDULING_POLICY", "longest_first")
+if EVALUATION_RUN_SCHEDULING_POLICY not in ("platform", "longest_first", "shortest_first"):
+    logger.fatal("EVALUATION_RUN_SCHEDULING_POLICY must be 'longest_first', 'shortest_first' or 'platform'")
+logger.info(f"Evaluation Run Scheduling Policy: {EVALUATION_RUN_SCHEDULING_POLICY}")
+
+# Incremental log shipping: tail each running attempt's log files and post new lines to the
+# platform every interval, so logs are visible (and survive a validator crash) mid-run
+EVALUATION_RUN_LOG_SHIPPING_ENABLED = os.getenv("EVALUATION_RUN_LOG_SHIPPING_ENABLED", "true").lower() == "true"
+EVALUATION_RUN_LOG_SHIPPING_INTERVAL_SECONDS = max(
+    1.0, float(os.getenv("EVALUATION_RUN_LOG_SHIPPING_INTERVAL_SECONDS", "10"))
+)
+logger.info(f"Evaluation Run Log Shipping Enabled: {EVALUATION_RUN_LOG_SHIPPING_ENABLED}")
+if EVALUATION_RUN_LOG_SHIPPING_ENABLED:
+    logger.info(f"Evaluation Run Log Shipping Interval: {EVALUATION_RUN_LOG_SHIPPING_INTERVAL_SECONDS} second(s)")
+
 RIDGES_HARBOR_RESULTS_DIR = os.getenv("RIDGES_HARBOR_RESULTS_DIR")
 RIDGES_HARBOR_DEBUG = os.getenv("RIDGES_HARBOR_DEBUG", "false").lower() == "true"
+# Run every trial on its own reflink (or copy) clone of the cached task instead of the cache itself
+TASK_WORKSPACE_ISOLATION = os.getenv("TASK_WORKSPACE_ISOLATION", "false").lower() == "true"
+logger.info(f"Task Workspace Isolation: {TASK_WORKSPACE_ISOLATION}")
 RIDGES_MAX_COST_USD = HARDCODED_MAX_COST_USD
 
 # Local-storage cleanup: a low-priority background loop prunes the task cache and
@@ -222,11 +271,50 @@ CLEANUP_ENABLED = os.getenv("CLEANUP_ENABLED", "true").lower() == "true"
 CLEANUP_INTERVAL_SECONDS = int(os.getenv("CLEANUP_INTERVAL_SECONDS", "3600"))
 CLEANUP_ARTIFACT_RETENTION_HOURS = int(os.getenv("CLEANUP_ARTIFACT_RETENTION_HOURS", "48"))
 CLEANUP_TASK_CACHE_RETENTION_HOURS = int(os.getenv("CLEANUP_TASK_CACHE_RETENTION_HOURS", "168"))
+# The task cache is also held to a disk budget (0 disables it): past the high watermark,
+# least recently used tasks are evicted down to the low watermark.
+CLEANUP_TASK_CACHE_MAX_GB = max(0.0, float(os.getenv("CLEANUP_TASK_CACHE_MAX_GB", "50")))
+CLEANUP_TASK_CACHE_HIGH_WATERMARK = min(1.0, max(0.1, float(os.getenv("CLEANUP_TASK_CACHE_HIGH_WATERMARK", "0.9"))))
+CLEANUP_TASK_CACHE_LOW_WATERMARK = min(
+    CLEANUP_TASK_CACHE_HIGH_WATERMARK, max(0.0, float(os.getenv("CLEANUP_TASK_CACHE_LOW_WATERMARK", "0.7")))
+)
 logger.info(f"Cleanup Enabled: {CLEANUP_ENABLED}")
 if CLEANUP_ENABLED:
     logger.info(f"Cleanup Interval: {CLEANUP_INTERVAL_SECONDS} second(s)")
     logger.info(f"Cleanup Artifact Retention: {CLEANUP_ARTIFACT_RETENTION_HOURS} hour(s)")
     logger.info(f"Cleanup Task Cache Retention: {CLEANUP_TASK_CACHE_RETENTION_HOURS} hour(s)")
+    logger.info(f"Cleanup Task Cache Budget: {CLEANUP_TASK_CACHE_MAX_GB} GB")
+    if CLEANUP_TASK_CACHE_MAX_GB > 0:
+        logger.info(
+            f"Cleanup Task Cache Watermarks: {CLEANUP_TASK_CACHE_HIGH_WATERMARK} high, "
+            f"{CLEANUP_TASK_CACHE_LOW_WATERMARK} low"
+        )
+
+# Ridges platform client: one pooled, kept-alive connection pool for every platform call.
+# HTTP/2 needs the optional h2 package; without it the client falls back to HTTP/1.1.
+RIDGES_PLATFORM_MAX_CONNECTIONS = max(1, int(os.getenv("RIDGES_PLATFORM_MAX_CONNECTIONS", "50")))
+RIDGES_PLATFORM_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("RIDGES_PLATFORM_KEEPALIVE_EXPIRY_SECONDS", "60"))
+RIDGES_PLATFORM_HTTP2 = os.getenv("RIDGES_PLATFORM_HTTP2", "false").lower() == "true"
+logger.info(f"Ridges Platform Max Connections: {RIDGES_PLATFORM_MAX_CONNECTIONS}")
+logger.info(f"Ridges Platform Keep-Alive Expiry: {RIDGES_PLATFORM_KEEPALIVE_EXPIRY_SECONDS} second(s)")
+logger.info(f"Ridges Platform HTTP/2: {RIDGES_PLATFORM_HTTP2}")
+
+# Evaluation run status updates from concurrent runs are coalesced for up to the window
+# and sent as one /validator/update-evaluation-runs request
+EVALUATION_RUN_UPDATE_BATCHING_ENABLED = os.getenv("EVALUATION_RUN_UPDATE_BATCHING_ENABLED", "true").lower() == "true"
+EVALUATION_RUN_UPDATE_BATCH_WINDOW_SECONDS = max(
+    0.0, float(os.getenv("EVALUATION_RUN_UPDATE_BATCH_WINDOW_SECONDS", "0.2"))
+)
+logger.info(f"Evaluation Run Update Batching Enabled: {EVALUATION_RUN_UPDATE_BATCHING_ENABLED}")
+if EVALUATION_RUN_UPDATE_BATCHING_ENABLED:
+    logger.info(f"Evaluation Run Update Batch Window: {EVALUATION_RUN_UPDATE_BATCH_WINDOW_SECONDS} second(s)")
+
+# Job artifact upload: files over the cap are left out of the archive; lower gzip
+# levels trade archive size for compression time.
+ARTIFACT_UPLOAD_MAX_FILE_BYTES = int(os.getenv("ARTIFACT_UPLOAD_MAX_FILE_BYTES", str(256 * 1024 * 1024)))
+ARTIFACT_UPLOAD_COMPRESSION_LEVEL = min(9, max(1, int(os.getenv("ARTIFACT_UPLOAD_COMPRESSION_LEVEL", "6"))))
+logger.info(f"Artifact Upload Max File Size: {ARTIFACT_UPLOAD_MAX_FILE_BYTES} byte(s)")
+logger.info(f"Artifact Upload Compression Level: {ARTIFACT_UPLOAD_COMPRESSION_LEVEL}")
 
 CLEANUP_DOCKER_ENABLED = os.getenv("CLEANUP_DOCKER_ENABLED", "true").lower() == "true"
 CLEANUP_DOCKER_DRY_RUN = os.getenv("CLEANUP_DOCKER_DRY_RUN", "false").lower() == "true"
@@ -0,0 +1,108 @@
+# NOTE: Coalesces evaluation run status updates into /validator/update-evaluation-runs
+#       batches. Callers submit an ordered group of updates and wait for their
+#       results; a flush task waits a short window for concurrent runs to submit
+#       theirs, then posts everything that is pending in one request. A group is
+#       never split across batches, so a transition is never sent without the
+#       transitions it depends on. The platform applies or rejects each group on its
+#       own, so a rejected group only fails the caller that submitted it.
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple, Union
+
+from api.endpoints.validator_models import (
+    MAX_EVALUATION_RUN_UPDATES_PER_BATCH,
+    ValidatorUpdateEvaluationRunRequest,
+    ValidatorUpdateEvaluationRunResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+# Posts groups of updates; returns, per group, its results or the exception that rejected it
+PostEvaluationRunUpdates = Callable[
+    [List[List[ValidatorUpdateEvaluationRunRequest]], Optional[float]],
+    Awaitable[List[Union[List[ValidatorUpdateEvaluationRunResponse], Exception]]],
+]
+
+
+class EvaluationRunUpdateRejected(Exception):
+    """The platform rejected a group of evaluation run updates (none of them were applied)."""
+
+    def __init__(self, status_code: Optional[int], error: Optional[str]):
+        super().__init__(f"{status_code} {error}")
+        self.status_code = status_code
+        self.error = error
+
+
+class EvaluationRunUpdateBatcher:
+    def __init__(
+        self,
+        post_updates: PostEvaluationRunUpdates,
+        *,
+        window_seconds: float,
+        max_batch_size: int = MAX_EVALUATION_RUN_UPDATES_PER_BATCH,
+    ):
+        self.post_updates = post_updates
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        # (updates, timeout, future) per submitted group, in submission order
+        self.pending: List[Tuple[List[ValidatorUpdateEvaluationRunRequest], Optional[float], asyncio.Future]] = []
+        self.flush_task: Optional[asyncio.Task] = None
+
+    async def submit(
+        self, updates: List[ValidatorUpdateEvaluationRunRequest], *, timeout: Optional[float] = None
+    ) -> List[ValidatorUpdateEvaluationRunResponse]:
+        """Queue an ordered group of updates and wait for the platform's results for them."""
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((updates, timeout, future))
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self._flush_loop())
+        return await future
+
+    def _take_batch(self):
+        # Whole groups only; a group larger than max_batch_size is sent on its own
+        num_groups = 0
+        num_updates = 0
+        for updates, _, _ in self.pending:
+            if num_groups > 0 and num_updates + len(updates) > self.max_batch_size:
+                break
+            num_groups += 1
+            num_updates += len(updates)
+
+        batch, self.pending = self.pending[:num_groups], self.pending[num_groups:]
+        return batch
+
+    async def _flush_loop(self):
+        while self.pending:
+            await asyncio.sleep(self.window_seconds)
+            batch = self._take_batch()
+
+            groups = [group for group, _, _ in batch]
+            # The most generous timeout in the batch, so a short status-hook timeout never cuts off a terminal update
+            timeouts = [timeout for _, timeout, _ in batch]
+            timeout = None if None in timeouts else max(timeouts)
+            try:
+                group_results = await self.post_updates(groups, timeout)
+                if len(group_results) != len(groups):
+                    raise RuntimeError(
+                        f"Expected {len(groups)} evaluation run update group results, got {len(group_results)}"
+                    )
+            except Exception as e:
+                num_updates = sum(len(group) for group in groups)
+                logger.error(f"Failed to post {num_updates} evaluation run update(s): {type(e).__name__}: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (group, _, future), result in zip(batch, group_results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                elif len(result) != len(group):
+                    future.set_exception(
+                        RuntimeError(f"Expected {len(group)} evaluation run update results, got {len(result)}")
+                    )
+                else:
+                    future.set_result(result)
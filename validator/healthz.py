@@ -5,6 +5,10 @@ Usage (in validator/main.py):
     import validator.healthz as healthz
     asyncio.create_task(healthz.serve(get_session_id=lambda: session_id))
 
+GET /platform-latency returns the per-endpoint latency histograms of calls to the
+Ridges platform, when get_platform_latency_stats is given. GET /task-cache returns
+the task cache's size, hit ratio and evictions, when get_task_cache_stats is given.
+
 Pod spec:
 
     livenessProbe:
@@ -30,6 +34,8 @@ logger = logging.getLogger(__name__)
 async def serve(
     *,
     get_session_id: Callable[[], Any],
+    get_platform_latency_stats: Callable[[], dict] | None = None,
+    get_task_cache_stats: Callable[[], dict] | None = None,
     host: str = "0.0.0.0",
     port: int = 8080,
 ) -> None:
@@ -45,8 +51,18 @@ async def serve(
             return web.Response(text="ok")
         return web.Response(status=503, text="not registered")
 
+    async def platform_latency(request: web.Request) -> web.Response:
+        return web.json_response(get_platform_latency_stats())
+
+    async def task_cache(request: web.Request) -> web.Response:
+        return web.json_response(get_task_cache_stats())
+
     app = web.Application()
     app.router.add_get("/healthz", healthz)
+    if get_platform_latency_stats is not None:
+        app.router.add_get("/platform-latency", platform_latency)
+    if get_task_cache_stats is not None:
+        app.router.add_get("/task-cache", task_cache)
 
     runner = web.AppRunner(app)
     await runner.setup()
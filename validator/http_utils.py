@@ -1,7 +1,10 @@
+import asyncio
+import bisect
 import json
 import logging
 import textwrap
-from typing import Any
+import time
+from typing import Any, Dict, Optional
 
 import httpx
 from pydantic import BaseModel
@@ -13,6 +16,117 @@ logger = logging.getLogger(__name__)
 
 # TODO ADAM: .env
 HTTP_TIMEOUT_SECONDS = 120
+HTTP_CONNECT_TIMEOUT_SECONDS = 10
+
+# Endpoints that must answer quickly get a tighter timeout, so a stuck request
+# fails (and is retried) long before HTTP_TIMEOUT_SECONDS. The evaluation run
+# update endpoints are deliberately absent: they apply non-idempotent status
+# transitions, so a retry after a timed-out but committed update is rejected
+# and the run is lost, and they keep the full HTTP_TIMEOUT_SECONDS.
+ENDPOINT_TIMEOUT_SECONDS: Dict[str, float] = {
+    "/validator/heartbeat": 5,
+    "/validator/task-download-url": 15,
+    "/validator/disconnect": 15,
+    "/scoring/weights": 30,
+}
+
+LATENCY_HISTOGRAM_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_HISTOGRAM_BUCKETS_SECONDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, *, error: bool):
+        self.bucket_counts[bisect.bisect_left(LATENCY_HISTOGRAM_BUCKETS_SECONDS, seconds)] += 1
+        self.count += 1
+        self.errors += int(error)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> dict:
+        bucket_labels = [f"<={bucket}s" for bucket in LATENCY_HISTOGRAM_BUCKETS_SECONDS] + [
+            f">{LATENCY_HISTOGRAM_BUCKETS_SECONDS[-1]}s"
+        ]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "average_seconds": self.total_seconds / self.count if self.count else None,
+            "max_seconds": self.max_seconds,
+            "buckets": dict(zip(bucket_labels, self.bucket_counts)),
+        }
+
+
+# "GET /scoring/weights" -> histogram
+_latency_histograms: Dict[str, LatencyHistogram] = {}
+
+
+def get_ridges_platform_latency_stats() -> dict:
+    return {name: histogram.to_dict() for name, histogram in sorted(_latency_histograms.items())}
+
+
+def _record_latency(method: str, path: str, started_at: float, *, error: bool):
+    histogram = _latency_histograms.setdefault(f"{method} {path}", LatencyHistogram())
+    histogram.record(time.monotonic() - started_at, error=error)
+
+
+# One pooled client for every platform call, so heartbeats and status updates reuse
+# kept-alive connections instead of paying for a TCP/TLS handshake each time. The
+# client is tied to the event loop that created it.
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_platform_client() -> httpx.AsyncClient:
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        http2 = config.RIDGES_PLATFORM_HTTP2
+        if http2 and not _http2_available():
+            logger.warning("RIDGES_PLATFORM_HTTP2 is enabled but h2 is not installed; using HTTP/1.1")
+            http2 = False
+
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=config.RIDGES_PLATFORM_MAX_CONNECTIONS,
+                max_keepalive_connections=config.RIDGES_PLATFORM_MAX_CONNECTIONS,
+                keepalive_expiry=config.RIDGES_PLATFORM_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=http2,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_ridges_platform_client():
+    global _client, _client_loop
+
+    if _client is not None:
+        client, _client, _client_loop = _client, None, None
+        await client.aclose()
+
+
+def _endpoint_path(endpoint: str) -> str:
+    return "/" + endpoint.split("?", 1)[0].strip("/")
+
+
+def _request_timeout(path: str, timeout: Optional[float]) -> httpx.Timeout:
+    seconds = timeout if timeout is not None else ENDPOINT_TIMEOUT_SECONDS.get(path, HTTP_TIMEOUT_SECONDS)
+    return httpx.Timeout(seconds, connect=min(seconds, HTTP_CONNECT_TIMEOUT_SECONDS))
 
 
 def _pretty_print_httpx_error(method: str, url: str, e: httpx.HTTPStatusError):
@@ -43,7 +157,7 @@ def _platform_headers(bearer_token: str = None) -> dict | None:
     return headers or None
 
 
-async def get_ridges_platform(endpoint: str, *, quiet: int = 0) -> Any:
+async def get_ridges_platform(endpoint: str, *, quiet: int = 0, timeout: Optional[float] = None) -> Any:
     """
     Helper function that sends a GET request to the Ridges platform.
 
@@ -53,44 +167,51 @@ async def get_ridges_platform(endpoint: str, *, quiet: int = 0) -> Any:
                - 0: Print all debugging information, including the request and response bodies.
                - 1: Print debugging information, but exclude the request and response bodies.
                - 2: Print no debugging information, except for errors.
+        timeout: The timeout in seconds. By default, the endpoint's entry in `ENDPOINT_TIMEOUT_SECONDS`, or `HTTP_TIMEOUT_SECONDS`.
 
     Returns:
         The response from the Ridges platform. If the request returns a non-2xx status code, the function will print the error and exit the program.
     """
 
     url = f"{config.RIDGES_PLATFORM_URL.rstrip('/')}/{endpoint.lstrip('/')}"
+    path = _endpoint_path(endpoint)
 
     if quiet <= 1:
         logger.debug(f"Sending request for GET {url}")
 
+    started_at = time.monotonic()
     try:
         # Send the request
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
-            response = await client.get(url, headers=_platform_headers())
-            response.raise_for_status()
-            response_json = response.json()
+        response = await _get_platform_client().get(
+            url, headers=_platform_headers(), timeout=_request_timeout(path, timeout)
+        )
+        response.raise_for_status()
+        response_json = response.json()
+        _record_latency("GET", path, started_at, error=False)
 
-            if quiet <= 1:
-                logger.debug(f"Received response for GET {url}: {response.status_code} {response.reason_phrase}")
-            if response_json != {} and quiet == 0:
-                logger.debug(textwrap.indent(json.dumps(response_json, indent=2), "  "))
+        if quiet <= 1:
+            logger.debug(f"Received response for GET {url}: {response.status_code} {response.reason_phrase}")
+        if response_json != {} and quiet == 0:
+            logger.debug(textwrap.indent(json.dumps(response_json, indent=2), "  "))
 
-            return response.json()
+        return response_json
 
     except httpx.HTTPStatusError as e:
+        _record_latency("GET", path, started_at, error=True)
         _pretty_print_httpx_error("GET", url, e)
 
         raise
 
     except Exception as e:
         # Internal error (timeout, DNS error, etc.)
+        _record_latency("GET", path, started_at, error=True)
         logger.error(f"{type(e).__name__} during GET {url}")
 
         raise
 
 
 async def post_ridges_platform(
-    endpoint: str, body: BaseModel, *, bearer_token: str = None, quiet: int = 0, timeout: int = HTTP_TIMEOUT_SECONDS
+    endpoint: str, body: BaseModel, *, bearer_token: str = None, quiet: int = 0, timeout: Optional[float] = None
 ) -> Any:
     """
     Helper function that sends a POST request to the Ridges platform.
@@ -103,12 +224,14 @@ async def post_ridges_platform(
                - 0: Print all debugging information, including the request and response bodies.
                - 1: Print debugging information, but exclude the request and response bodies.
                - 2: Print no debugging information, except for errors.
+        timeout: The timeout in seconds. By default, the endpoint's entry in `ENDPOINT_TIMEOUT_SECONDS`, or `HTTP_TIMEOUT_SECONDS`.
 
     Returns:
         The response from the Ridges platform. If the request returns a non-2xx status code, the function will print the error and exit the program.
     """
 
     url = f"{config.RIDGES_PLATFORM_URL.rstrip('/')}/{endpoint.lstrip('/')}"
+    path = _endpoint_path(endpoint)
 
     body_dict = body.model_dump(mode="json")
 
@@ -117,27 +240,32 @@ async def post_ridges_platform(
     if body_dict != {} and quiet == 0:
         logger.debug(textwrap.indent(json.dumps(body_dict, indent=2), "  "))
 
+    started_at = time.monotonic()
     try:
         # Send the request
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(url, json=body_dict, headers=_platform_headers(bearer_token))
-            response.raise_for_status()
-            response_json = response.json()
+        response = await _get_platform_client().post(
+            url, json=body_dict, headers=_platform_headers(bearer_token), timeout=_request_timeout(path, timeout)
+        )
+        response.raise_for_status()
+        response_json = response.json()
+        _record_latency("POST", path, started_at, error=False)
 
-            if quiet <= 1:
-                logger.debug(f"Received response for POST {url}: {response.status_code} {response.reason_phrase}")
-            if response_json != {} and quiet == 0:
-                logger.debug(textwrap.indent(json.dumps(response_json, indent=2), "  "))
+        if quiet <= 1:
+            logger.debug(f"Received response for POST {url}: {response.status_code} {response.reason_phrase}")
+        if response_json != {} and quiet == 0:
+            logger.debug(textwrap.indent(json.dumps(response_json, indent=2), "  "))
 
-            return response.json()
+        return response_json
 
     except httpx.HTTPStatusError as e:
+        _record_latency("POST", path, started_at, error=True)
         _pretty_print_httpx_error("POST", url, e)
 
         raise
 
     except Exception as e:
         # Internal error (timeout, DNS error, etc.)
+        _record_latency("POST", path, started_at, error=True)
         logger.error(f"{type(e).__name__} during POST {url}")
 
         raise
@@ -0,0 +1,142 @@
+# NOTE: Ships an evaluation run attempt's logs to the platform while it is in flight,
+#       instead of only in the terminal status update. Every interval the shipper
+#       reads what was appended to each of the trial's log files since the last
+#       chunk it shipped, and posts the new bytes as gzip-compressed chunks keyed by
+#       (source, byte offset) to /validator/append-evaluation-run-log-chunks. The
+#       platform stores chunks idempotently, so a failed post is simply retried from
+#       the same offsets on the next tick. Chunks end on a line boundary (except the
+#       final flush, or a single line longer than a chunk), so each chunk decodes on
+#       its own. At most max_source_bytes of each file are shipped.
+
+import asyncio
+import base64
+import gzip
+import logging
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from api.endpoints.validator_models import MAX_EVALUATION_RUN_LOG_CHUNKS_PER_BATCH, ValidatorEvaluationRunLogChunk
+
+logger = logging.getLogger(__name__)
+
+LOG_CHUNK_BYTES = 256 * 1024
+
+PostLogChunks = Callable[[List[ValidatorEvaluationRunLogChunk]], Awaitable[None]]
+# The (source, path) of every log file to tail; may be empty until the files exist
+ListLogPaths = Callable[[], List[Tuple[str, Path]]]
+
+
+def read_log_chunk(path: Path, offset: int, max_bytes: int, *, final: bool) -> bytes:
+    """Read up to max_bytes of path from offset, cut back to the last complete line unless final."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read(max_bytes)
+    except FileNotFoundError:
+        return b""
+
+    if final or len(data) == 0:
+        return data
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        # A line longer than a whole chunk is shipped in pieces rather than never
+        return data if len(data) == max_bytes else b""
+    return data[:end]
+
+
+class EvaluationRunLogShipper:
+    def __init__(
+        self,
+        post_chunks: PostLogChunks,
+        list_log_paths: ListLogPaths,
+        *,
+        evaluation_run_id: UUID,
+        attempt_number: int,
+        interval_seconds: float,
+        max_source_bytes: int,
+        chunk_bytes: int = LOG_CHUNK_BYTES,
+    ):
+        self.post_chunks = post_chunks
+        self.list_log_paths = list_log_paths
+        self.evaluation_run_id = evaluation_run_id
+        self.attempt_number = attempt_number
+        self.interval_seconds = interval_seconds
+        self.max_source_bytes = max_source_bytes
+        self.chunk_bytes = chunk_bytes
+        # source -> bytes shipped so far
+        self.offsets: Dict[str, int] = {}
+        self.num_shipped_bytes = 0
+        self.task: Optional[asyncio.Task] = None
+        self.closed = False
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self._ship_loop())
+
+    async def close(self) -> None:
+        """Stop tailing and ship whatever the log files still hold. Never raises; later calls do nothing."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        try:
+            await self.ship(final=True)
+        except Exception as e:
+            logger.warning(
+                f"Final log shipment for evaluation run {self.evaluation_run_id} failed: {type(e).__name__}: {e}"
+            )
+        logger.debug(
+            f"Shipped {self.num_shipped_bytes} byte(s) of logs for evaluation run {self.evaluation_run_id} "
+            f"(attempt {self.attempt_number})"
+        )
+
+    async def ship(self, *, final: bool = False) -> int:
+        """Post everything appended to the log files since the last shipment. Returns the number of bytes shipped."""
+        num_bytes = 0
+        while True:
+            pending = await asyncio.to_thread(self._read_new_chunks, final)
+            if not pending:
+                return num_bytes
+
+            # Offsets only advance once the platform has the chunks, so a failed post is retried
+            await self.post_chunks([chunk for chunk, _, _ in pending])
+            for chunk, source, length in pending:
+                self.offsets[source] = chunk.offset + length
+                num_bytes += length
+                self.num_shipped_bytes += length
+
+    async def _ship_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.ship()
+            except Exception as e:
+                logger.warning(
+                    f"Log shipment for evaluation run {self.evaluation_run_id} failed, retrying next interval: "
+                    f"{type(e).__name__}: {e}"
+                )
+
+    def _read_new_chunks(self, final: bool) -> List[Tuple[ValidatorEvaluationRunLogChunk, str, int]]:
+        pending = []
+        for source, path in self.list_log_paths():
+            offset = self.offsets.get(source, 0)
+            while len(pending) < MAX_EVALUATION_RUN_LOG_CHUNKS_PER_BATCH:
+                max_bytes = min(self.chunk_bytes, self.max_source_bytes - offset)
+                if max_bytes <= 0:
+                    break
+                data = read_log_chunk(path, offset, max_bytes, final=final)
+                if not data:
+                    break
+                chunk = ValidatorEvaluationRunLogChunk(
+                    evaluation_run_id=self.evaluation_run_id,
+                    attempt_number=self.attempt_number,
+                    source=source,
+                    offset=offset,
+                    data=base64.b64encode(gzip.compress(data)).decode("ascii"),
+                )
+                pending.append((chunk, source, len(data)))
+                offset += len(data)
+        return pending
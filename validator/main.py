@@ -1,6 +1,7 @@
 # NOTE ADAM: Subtensor bug (self.disable_third_party_loggers())
 import asyncio
 import concurrent.futures
+import json
 import logging
 import os
 import pathlib
@@ -9,6 +10,7 @@ import signal
 import sys
 import time
 import traceback
+from contextlib import nullcontext
 from typing import Any, Dict
 from uuid import UUID
 
@@ -18,10 +20,12 @@ import validator.config as config
 from api.endpoints.validator_models import (
     ScreenerRegistrationRequest,
     ScreenerRegistrationResponse,
+    ValidatorAppendEvaluationRunLogChunksRequest,
     ValidatorCancelCurrentEvaluationRequest,
     ValidatorCheckCancellationRequest,
     ValidatorCheckCancellationResponse,
     ValidatorDisconnectRequest,
+    ValidatorEvaluationRunLogChunk,
     ValidatorFinishEvaluationRequest,
     ValidatorRegistrationRequest,
     ValidatorRegistrationResponse,
@@ -30,21 +34,47 @@ from api.endpoints.validator_models import (
     ValidatorTaskDownloadUrlRequest,
     ValidatorUpdateEvaluationRunRequest,
     ValidatorUpdateEvaluationRunResponse,
+    ValidatorUpdateEvaluationRunsRequest,
+    ValidatorUpdateEvaluationRunsResponse,
 )
-from execution.artifacts import _read_proxy_cost
+from execution.artifacts import _read_proxy_cost, live_log_paths
 from execution.engine import ExecutionEngine
 from execution.errors import EvaluationRunException
 from execution.types import TrialSnapshot
 from models.evaluation_run import EvaluationRunErrorCode, EvaluationRunStatus
+from models.harbor_task import HarborRemoteTaskExecutionSpec
 from models.openrouter import OpenRouterRuntimeConfig
 from models.problem import ProblemTestResultStatus
 from utils.docker import cleanup_harbor_docker_resources, prune_docker_disk_resources
 from utils.git import COMMIT_HASH, reset_local_repo
 from utils.logger import setup_logging
 from utils.system_metrics import get_system_metrics
-from validator.background_loops import cleanup_loop, send_heartbeat_loop, set_weights_loop
-from validator.http_utils import post_ridges_platform
+from utils.task_cache import (
+    DEFAULT_WORKSPACE_DIR,
+    get_cached_task,
+    get_or_download_task,
+    get_task_cache_stats,
+    hold_cached_task,
+    set_task_downloaded_hook,
+)
+from validator.artifact_upload import upload_job_artifacts
+from validator.background_loops import (
+    adaptive_concurrency_loop,
+    cleanup_loop,
+    evict_task_cache,
+    send_heartbeat_loop,
+    set_weights_loop,
+)
+from validator.concurrency import AdaptiveConcurrencyLimiter
+from validator.evaluation_run_updates import EvaluationRunUpdateBatcher, EvaluationRunUpdateRejected
+from validator.http_utils import (
+    close_ridges_platform_client,
+    get_ridges_platform_latency_stats,
+    post_ridges_platform,
+)
+from validator.log_shipper import EvaluationRunLogShipper
 from validator.retry_utils import retry_with_backoff
+from validator.scheduling import compare_policy_makespans, order_evaluation_runs
 
 logger = logging.getLogger("validator")
 
@@ -60,12 +90,18 @@ execution_engine = None
 STATUS_HOOK_TIMEOUT_SECONDS = 5
 _shutdown_requested = False
 _healthz_task: asyncio.Task | None = None
+# Shared by every evaluation, so the learned limit carries over (None: fixed semaphore per evaluation)
+evaluation_run_limiter: AdaptiveConcurrencyLimiter | None = None
 
 # Task-cache digests of in-flight evaluation runs. The cleanup loop excludes these
 # so it never deletes a cached task a live run is still reading (a task is read for
 # the whole run and reused across days, so its mtime can be old while in use).
 _active_task_digests: set[str] = set()
 
+# In-flight task archive prefetches for the current evaluation, keyed by task digest.
+# A run whose task is still being prefetched waits for it instead of downloading it again.
+_task_prefetches: dict[str, asyncio.Task] = {}
+
 
 # Disconnect from the Ridges platform (called when the program exits)
 async def disconnect(reason: str):
@@ -78,6 +114,8 @@ async def disconnect(reason: str):
             "/validator/disconnect", ValidatorDisconnectRequest(reason=reason), bearer_token=session_id
         )
         logger.info("Disconnected validator")
+        logger.info(f"Ridges platform latency: {json.dumps(get_ridges_platform_latency_stats())}")
+        await close_ridges_platform_client()
     except Exception as e:
         logger.error(f"Error in disconnect(): {type(e).__name__}: {e}", exc_info=True)
         os._exit(1)
@@ -150,7 +188,13 @@ async def _run_startup_tasks() -> None:
     elif config.RIDGES_ENVIRONMENT_TYPE == "kubernetes":
         import validator.healthz as healthz
 
-        _healthz_task = asyncio.create_task(healthz.serve(get_session_id=lambda: session_id))
+        _healthz_task = asyncio.create_task(
+            healthz.serve(
+                get_session_id=lambda: session_id,
+                get_platform_latency_stats=get_ridges_platform_latency_stats,
+                get_task_cache_stats=get_task_cache_stats,
+            )
+        )
         from utils.k8s import cleanup_harbor_k8s_resources
 
         await asyncio.to_thread(cleanup_harbor_k8s_resources)
@@ -161,9 +205,93 @@ async def _run_startup_tasks() -> None:
     )
 
 
-# Sends an update-evaluation-run request to the Ridges platform. The extra
-# parameter is for fields that are not sent in all requests, such as agent_logs
-# and eval_logs, which are only sent on some state transitions.
+def _platform_post_kwargs(timeout: float | None) -> dict[str, Any]:
+    post_kwargs: dict[str, Any] = {
+        "bearer_token": session_id,
+        "quiet": 2,
+    }
+    if timeout is not None:
+        post_kwargs["timeout"] = timeout
+    return post_kwargs
+
+
+async def _post_evaluation_run_updates(
+    groups: list[list[ValidatorUpdateEvaluationRunRequest]], timeout: float | None
+) -> list[list[ValidatorUpdateEvaluationRunResponse] | Exception]:
+    if not config.EVALUATION_RUN_UPDATE_BATCHING_ENABLED:
+        group_results: list[list[ValidatorUpdateEvaluationRunResponse] | Exception] = []
+        for group in groups:
+            responses = []
+            try:
+                for request in group:
+                    response_data = await retry_with_backoff(
+                        lambda: post_ridges_platform(
+                            "/validator/update-evaluation-run", request, **_platform_post_kwargs(timeout)
+                        ),
+                        max_attempts=3,
+                        base_delay=2.0,
+                    )
+                    responses.append(ValidatorUpdateEvaluationRunResponse(**(response_data or {})))
+            except Exception as e:
+                group_results.append(e)
+                continue
+            group_results.append(responses)
+        return group_results
+
+    response_data = await retry_with_backoff(
+        lambda: post_ridges_platform(
+            "/validator/update-evaluation-runs",
+            ValidatorUpdateEvaluationRunsRequest(
+                updates=[request for group in groups for request in group],
+                group_sizes=[len(group) for group in groups],
+            ),
+            **_platform_post_kwargs(timeout),
+        ),
+        max_attempts=3,
+        base_delay=2.0,
+    )
+    return [
+        result.results if result.results is not None else EvaluationRunUpdateRejected(result.status_code, result.error)
+        for result in ValidatorUpdateEvaluationRunsResponse(**response_data).results
+    ]
+
+
+# Status updates from concurrently running evaluation runs share requests to the Ridges platform
+evaluation_run_update_batcher = EvaluationRunUpdateBatcher(
+    _post_evaluation_run_updates, window_seconds=config.EVALUATION_RUN_UPDATE_BATCH_WINDOW_SECONDS
+)
+
+
+# Sends evaluation run status updates to the Ridges platform, in order. Each
+# transition is an (updated_status, extra) pair; the extra dict is for fields that
+# are not sent in all requests, such as agent_logs and eval_logs, which are only
+# sent on some state transitions. The transitions are sent together, so either all
+# of them are applied or none are (EvaluationRunUpdateRejected is raised if the
+# platform rejects them).
+async def update_evaluation_run_transitions(
+    evaluation_run_id: UUID,
+    problem_name: str,
+    transitions: list[tuple[EvaluationRunStatus, Dict[str, Any] | None]],
+    *,
+    timeout: int | None = None,
+) -> list[ValidatorUpdateEvaluationRunResponse]:
+    requests = []
+    for updated_status, extra in transitions:
+        logger.info(
+            f"Updating evaluation run {evaluation_run_id} for problem {problem_name} to {updated_status.value}..."
+        )
+        clean_extra = {k: v for k, v in (extra or {}).items() if v is not None}
+        requests.append(
+            ValidatorUpdateEvaluationRunRequest(
+                evaluation_run_id=evaluation_run_id, updated_status=updated_status, **clean_extra
+            )
+        )
+
+    return await evaluation_run_update_batcher.submit(requests, timeout=timeout)
+
+
+# Sends a single evaluation run status update to the Ridges platform. See
+# update_evaluation_run_transitions().
 async def update_evaluation_run(
     evaluation_run_id: UUID,
     problem_name: str,
@@ -172,25 +300,45 @@ async def update_evaluation_run(
     *,
     timeout: int | None = None,
 ) -> ValidatorUpdateEvaluationRunResponse:
-    logger.info(f"Updating evaluation run {evaluation_run_id} for problem {problem_name} to {updated_status.value}...")
-    clean_extra = {k: v for k, v in (extra or {}).items() if v is not None}
+    [response] = await update_evaluation_run_transitions(
+        evaluation_run_id, problem_name, [(updated_status, extra)], timeout=timeout
+    )
+    return response
 
-    post_kwargs: dict[str, Any] = {
-        "bearer_token": session_id,
-        "quiet": 2,
-    }
-    if timeout is not None:
-        post_kwargs["timeout"] = timeout
 
-    request = ValidatorUpdateEvaluationRunRequest(
-        evaluation_run_id=evaluation_run_id, updated_status=updated_status, **clean_extra
+async def _post_evaluation_run_log_chunks(chunks: list[ValidatorEvaluationRunLogChunk]) -> None:
+    await post_ridges_platform(
+        "/validator/append-evaluation-run-log-chunks",
+        ValidatorAppendEvaluationRunLogChunksRequest(chunks=chunks),
+        **_platform_post_kwargs(timeout=10),
     )
-    response_data = await retry_with_backoff(
-        lambda: post_ridges_platform("/validator/update-evaluation-run", request, **post_kwargs),
-        max_attempts=3,
-        base_delay=2.0,
+
+
+def _start_log_shipper(evaluation_run, attempt_number: int) -> EvaluationRunLogShipper | None:
+    """Start tailing an attempt's log files to the platform, if log shipping is enabled. Best-effort."""
+    if not config.EVALUATION_RUN_LOG_SHIPPING_ENABLED:
+        return None
+
+    try:
+        job_dir = execution_engine.job_dir_for(
+            problem_name=evaluation_run.problem_name,
+            evaluation_run_id=evaluation_run.evaluation_run_id,
+            attempt_number=attempt_number,
+        )
+    except Exception as e:
+        logger.warning(f"Not shipping logs for evaluation run {evaluation_run.evaluation_run_id}: {e}")
+        return None
+
+    shipper = EvaluationRunLogShipper(
+        _post_evaluation_run_log_chunks,
+        lambda: live_log_paths(job_dir),
+        evaluation_run_id=evaluation_run.evaluation_run_id,
+        attempt_number=attempt_number,
+        interval_seconds=config.EVALUATION_RUN_LOG_SHIPPING_INTERVAL_SECONDS,
+        max_source_bytes=max_evaluation_run_log_size_bytes,
     )
-    return ValidatorUpdateEvaluationRunResponse(**(response_data or {}))
+    shipper.start()
+    return shipper
 
 
 # Truncates a log if required
@@ -233,50 +381,54 @@ async def _fetch_task_download_url(task_digest: str) -> str:
 
 
 async def _upload_job_artifacts(job_dir: pathlib.Path, upload_url: str) -> None:
-    """Tar the job directory and PUT it to a presigned S3 URL. Best-effort."""
+    """Stream the compressed job directory to a presigned S3 URL. Best-effort."""
     # TODO(cleanup): a future iteration could eagerly delete `job_dir` here once the
     # upload succeeds, keeping the age-based cleanup_loop only as the fallback for
     # failed/never-uploaded runs. Kept decoupled for now (fail-safe + local debugging).
     try:
-        import io
-        import tarfile
-
-        buf = io.BytesIO()
-        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
-            tar.add(str(job_dir), arcname=job_dir.name)
-        buf.seek(0)
-        payload = buf.read()
-
-        async with httpx.AsyncClient(timeout=60) as client:
-            resp = await client.put(upload_url, content=payload)
-            resp.raise_for_status()
-
-        logger.info(f"Uploaded {len(payload)} bytes of job artifacts to S3")
+        await upload_job_artifacts(
+            job_dir,
+            upload_url,
+            max_file_bytes=config.ARTIFACT_UPLOAD_MAX_FILE_BYTES,
+            compresslevel=config.ARTIFACT_UPLOAD_COMPRESSION_LEVEL,
+        )
     except Exception as exc:
         logger.warning(f"Failed to upload job artifacts (best-effort): {exc}")
 
 
 async def _simulate_run_evaluation_run_with_semaphore(
-    evaluation_run_id: UUID, problem_name: str, semaphore: asyncio.Semaphore
+    evaluation_run_id: UUID,
+    problem_name: str,
+    semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter,
+    expected_duration_seconds: float | None = None,
 ):
     async with semaphore:
-        return await _simulate_run_evaluation_run(evaluation_run_id, problem_name)
+        return await _simulate_run_evaluation_run(evaluation_run_id, problem_name, expected_duration_seconds)
+
+
+def _simulated_stage_seconds(expected_duration_seconds: float | None) -> float:
+    # Five stages; problems with a known duration take it (scaled), so schedules can be compared
+    if expected_duration_seconds is None:
+        return random.random() * config.SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS
+    return expected_duration_seconds * config.SIMULATE_EVALUATION_RUN_TIME_SCALE / 5
 
 
 # Simulate a run of an evaluation run, useful for testing, set SIMULATE_EVALUATION_RUNS=True in .env
-async def _simulate_run_evaluation_run(evaluation_run_id: UUID, problem_name: str):
+async def _simulate_run_evaluation_run(
+    evaluation_run_id: UUID, problem_name: str, expected_duration_seconds: float | None = None
+):
     logger.info(f"Starting simulated evaluation run {evaluation_run_id} for problem {problem_name}...")
 
     # Move from pending -> initializing_agent
-    await asyncio.sleep(random.random() * config.SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS)
+    await asyncio.sleep(_simulated_stage_seconds(expected_duration_seconds))
     await update_evaluation_run(evaluation_run_id, problem_name, EvaluationRunStatus.initializing_agent)
 
     # Move from initializing_agent -> running_agent
-    await asyncio.sleep(random.random() * config.SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS)
+    await asyncio.sleep(_simulated_stage_seconds(expected_duration_seconds))
     await update_evaluation_run(evaluation_run_id, problem_name, EvaluationRunStatus.running_agent)
 
     # Move from running_agent -> initializing_eval
-    await asyncio.sleep(random.random() * config.SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS)
+    await asyncio.sleep(_simulated_stage_seconds(expected_duration_seconds))
     await update_evaluation_run(
         evaluation_run_id,
         problem_name,
@@ -285,11 +437,11 @@ async def _simulate_run_evaluation_run(evaluation_run_id: UUID, problem_name: st
     )
 
     # Move from initializing_eval -> running_eval
-    await asyncio.sleep(random.random() * config.SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS)
+    await asyncio.sleep(_simulated_stage_seconds(expected_duration_seconds))
     await update_evaluation_run(evaluation_run_id, problem_name, EvaluationRunStatus.running_eval)
 
     # Move from running_eval -> finished
-    await asyncio.sleep(random.random() * config.SIMULATE_EVALUATION_RUN_MAX_TIME_PER_STAGE_SECONDS)
+    await asyncio.sleep(_simulated_stage_seconds(expected_duration_seconds))
     await update_evaluation_run(
         evaluation_run_id,
         problem_name,
@@ -309,7 +461,7 @@ async def _simulate_run_evaluation_run(evaluation_run_id: UUID, problem_name: st
 async def _run_evaluation_run_with_semaphore(
     evaluation_run,
     agent_code: str,
-    semaphore: asyncio.Semaphore,
+    semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter,
     artifact_upload_url: str | None = None,
     openrouter_config: OpenRouterRuntimeConfig | None = None,
 ):
@@ -322,6 +474,12 @@ async def _run_evaluation_run_with_semaphore(
         )
 
 
+def _record_run_outcome(error_code: EvaluationRunErrorCode | None) -> None:
+    """Feed how an attempt ended to the adaptive concurrency limiter, if there is one."""
+    if evaluation_run_limiter is not None:
+        evaluation_run_limiter.record_outcome(error_code)
+
+
 async def _run_single_attempt(
     evaluation_run,
     agent_code: str,
@@ -341,6 +499,10 @@ async def _run_single_attempt(
     problem_name = evaluation_run.problem_name
     job_dir = None
     terminal_response = ValidatorUpdateEvaluationRunResponse()
+    # The platform keeps the first agent logs it receives for an attempt, so once the
+    # initializing_eval update has delivered them the finished update can leave them out
+    agent_logs_delivered = False
+    log_shipper = _start_log_shipper(evaluation_run, attempt_number)
 
     try:
         # Move from pending -> initializing_agent
@@ -355,23 +517,23 @@ async def _run_single_attempt(
             )
 
         async def _on_verification_started(snapshot: TrialSnapshot) -> None:
-            await update_evaluation_run(
+            nonlocal agent_logs_delivered
+            await update_evaluation_run_transitions(
                 evaluation_run_id,
                 problem_name,
-                EvaluationRunStatus.initializing_eval,
-                {
-                    "patch": snapshot.patch,
-                    "agent_logs": truncate_logs_if_required(snapshot.agent_logs),
-                },
-                timeout=STATUS_HOOK_TIMEOUT_SECONDS,
-            )
-
-            await update_evaluation_run(
-                evaluation_run_id,
-                problem_name,
-                EvaluationRunStatus.running_eval,
+                [
+                    (
+                        EvaluationRunStatus.initializing_eval,
+                        {
+                            "patch": snapshot.patch,
+                            "agent_logs": truncate_logs_if_required(snapshot.agent_logs),
+                        },
+                    ),
+                    (EvaluationRunStatus.running_eval, None),
+                ],
                 timeout=STATUS_HOOK_TIMEOUT_SECONDS,
             )
+            agent_logs_delivered = True
 
         result = await execution_engine.evaluate(
             evaluation_run_id=evaluation_run_id,
@@ -404,6 +566,10 @@ async def _run_single_attempt(
             f"{len(result.eval_logs.splitlines())} lines of eval logs"
         )
 
+        _record_run_outcome(None)
+        if log_shipper is not None:
+            await log_shipper.close()
+
         # Move from running_eval -> finished
         terminal_response = await update_evaluation_run(
             evaluation_run_id,
@@ -411,7 +577,7 @@ async def _run_single_attempt(
             EvaluationRunStatus.finished,
             {
                 "patch": result.patch,
-                "agent_logs": truncate_logs_if_required(result.agent_logs),
+                "agent_logs": None if agent_logs_delivered else truncate_logs_if_required(result.agent_logs),
                 "verifier_reward": result.verifier_reward,
                 "test_results": [
                     test.model_dump(exclude={"test_alias"}, exclude_none=True) for test in result.test_results
@@ -423,6 +589,7 @@ async def _run_single_attempt(
 
     except EvaluationRunException as e:
         logger.error(f"Evaluation run {evaluation_run_id} for problem {problem_name} errored: {e}")
+        _record_run_outcome(e.error_code)
         extra = dict(e.extra or {})
         job_dir = extra.pop("job_dir", None)
         for key in ("agent_logs", "eval_logs"):
@@ -448,6 +615,7 @@ async def _run_single_attempt(
             f"Evaluation run {evaluation_run_id} for problem {problem_name} errored: {EvaluationRunErrorCode.VALIDATOR_INTERNAL_ERROR.get_error_message()}: {e}",
             exc_info=True,
         )
+        _record_run_outcome(EvaluationRunErrorCode.VALIDATOR_INTERNAL_ERROR)
 
         terminal_response = await update_evaluation_run(
             evaluation_run_id,
@@ -462,6 +630,9 @@ async def _run_single_attempt(
             },
         )
 
+    if log_shipper is not None:
+        await log_shipper.close()
+
     # Upload artifacts for both success and error cases (per attempt; the run's
     # S3 key always holds the latest attempt's artifacts)
     if artifact_upload_url and job_dir:
@@ -484,23 +655,28 @@ async def _run_evaluation_run(
         _active_task_digests.add(task_digest)
 
     try:
-        logger.info(f"Starting evaluation run {evaluation_run_id} for problem {problem_name}...")
+        # Held across attempts, so no validator process sharing the task cache evicts the task mid-run
+        async with hold_cached_task(task_digest) if task_digest else nullcontext():
+            if task_digest:
+                await _wait_for_task_prefetch(task_digest)
 
-        attempt_number = 1
-        while True:
-            response = await _run_single_attempt(
-                evaluation_run, agent_code, attempt_number, artifact_upload_url, openrouter_config
-            )
-            if not response.retry:
-                break
-            attempt_number = response.attempt_number or attempt_number + 1
-            artifact_upload_url = response.artifact_upload_url or artifact_upload_url
-            logger.info(
-                f"Platform granted a retry for evaluation run {evaluation_run_id} "
-                f"(problem {problem_name}); starting attempt {attempt_number}"
-            )
+            logger.info(f"Starting evaluation run {evaluation_run_id} for problem {problem_name}...")
 
-        logger.info(f"Finished evaluation run {evaluation_run_id} for problem {problem_name}")
+            attempt_number = 1
+            while True:
+                response = await _run_single_attempt(
+                    evaluation_run, agent_code, attempt_number, artifact_upload_url, openrouter_config
+                )
+                if not response.retry:
+                    break
+                attempt_number = response.attempt_number or attempt_number + 1
+                artifact_upload_url = response.artifact_upload_url or artifact_upload_url
+                logger.info(
+                    f"Platform granted a retry for evaluation run {evaluation_run_id} "
+                    f"(problem {problem_name}); starting attempt {attempt_number}"
+                )
+
+            logger.info(f"Finished evaluation run {evaluation_run_id} for problem {problem_name}")
 
     except Exception as e:
         logger.error(f"Error in _run_evaluation_run(): {type(e).__name__}: {e}", exc_info=True)
@@ -510,6 +686,69 @@ async def _run_evaluation_run(
             _active_task_digests.discard(task_digest)
 
 
+async def _prefetch_task_archive(task_name: str, task_digest: str, semaphore: asyncio.Semaphore) -> None:
+    """Stage one task archive in the local task cache ahead of its evaluation run.
+
+    Best-effort: on failure the run falls back to downloading the task itself.
+    """
+    async with semaphore:
+        # Not the run's lookup: that happens when the run starts, and is counted then
+        if get_cached_task(task_name, task_digest, record_stats=False) is not None:
+            return
+        try:
+            presigned_url = await _fetch_task_download_url(task_digest)
+            await get_or_download_task(presigned_url, task_name, task_digest, prefetch=True)
+        except Exception as exc:
+            logger.warning(f"Prefetch of task {task_name} ({task_digest}) failed: {type(exc).__name__}: {exc}")
+
+
+def _start_task_prefetches(request_evaluation_response: ValidatorRequestEvaluationResponse) -> list[asyncio.Task]:
+    """Start staging the task archives of an evaluation's runs, in run order.
+
+    At most ``EVALUATION_PIPELINE_LOOKAHEAD`` archives download at once, so the
+    tasks of the first runs land first and queued runs find their task cached
+    by the time a concurrency slot frees up.
+
+    Args:
+        request_evaluation_response: Assignment returned by the platform.
+
+    Returns:
+        The prefetch tasks started for this evaluation.
+    """
+
+    if config.SIMULATE_EVALUATION_RUNS or not config.EVALUATION_PIPELINE_ENABLED:
+        return []
+
+    semaphore = asyncio.Semaphore(config.EVALUATION_PIPELINE_LOOKAHEAD)
+    prefetch_tasks = []
+    for evaluation_run in request_evaluation_response.evaluation_runs:
+        spec = evaluation_run.execution_spec
+        if not spec or spec.get("kind") != "harbor_remote_task":
+            continue
+        try:
+            parsed = HarborRemoteTaskExecutionSpec.model_validate(spec)
+        except Exception as exc:
+            logger.debug(f"Prefetch: skipping invalid execution spec for {evaluation_run.problem_name}: {exc}")
+            continue
+        if parsed.task_digest in _task_prefetches:
+            continue
+
+        task = asyncio.create_task(_prefetch_task_archive(parsed.task_name, parsed.task_digest, semaphore))
+        _task_prefetches[parsed.task_digest] = task
+        prefetch_tasks.append(task)
+
+    if prefetch_tasks:
+        logger.info(f"Prefetching {len(prefetch_tasks)} task archive(s) ahead of evaluation runs...")
+    return prefetch_tasks
+
+
+async def _wait_for_task_prefetch(task_digest: str) -> None:
+    """Wait for an in-flight prefetch of a task, without propagating its failure or cancellation."""
+    prefetch = _task_prefetches.get(task_digest)
+    if prefetch is not None and not prefetch.done():
+        await asyncio.wait({prefetch})
+
+
 async def _poll_evaluation_cancellation(
     evaluation_id: UUID,
     agent_id: UUID,
@@ -640,6 +879,35 @@ def _log_received_evaluation(request_evaluation_response: ValidatorRequestEvalua
         logger.info(f"    {evaluation_run.problem_name}")
 
 
+def _schedule_evaluation_runs(
+    request_evaluation_response: ValidatorRequestEvaluationResponse,
+) -> ValidatorRequestEvaluationResponse:
+    """Order an evaluation's runs by the configured scheduling policy.
+
+    When simulating, also logs the makespan every policy would have at the
+    current concurrency, so policies can be compared on real assignments.
+
+    Args:
+        request_evaluation_response: Assignment returned by the platform.
+
+    Returns:
+        The assignment, with its runs in the order they should start.
+    """
+
+    evaluation_runs = request_evaluation_response.evaluation_runs
+    if config.SIMULATE_EVALUATION_RUNS:
+        num_slots = evaluation_run_limiter.limit if evaluation_run_limiter else config.MAX_CONCURRENT_EVALUATION_RUNS
+        makespans = compare_policy_makespans(evaluation_runs, num_slots)
+        if makespans:
+            logger.info(
+                f"Simulated makespan at concurrency {num_slots}: "
+                + ", ".join(f"{policy}={seconds:.0f}s" for policy, seconds in makespans.items())
+            )
+
+    ordered_runs = order_evaluation_runs(evaluation_runs, config.EVALUATION_RUN_SCHEDULING_POLICY)
+    return request_evaluation_response.model_copy(update={"evaluation_runs": ordered_runs})
+
+
 def _create_evaluation_run_tasks(request_evaluation_response: ValidatorRequestEvaluationResponse) -> list[asyncio.Task]:
     """Create local problem-run tasks.
 
@@ -651,7 +919,7 @@ def _create_evaluation_run_tasks(request_evaluation_response: ValidatorRequestEv
     """
 
     tasks = []
-    semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_EVALUATION_RUNS)
+    semaphore = evaluation_run_limiter or asyncio.Semaphore(config.MAX_CONCURRENT_EVALUATION_RUNS)
 
     for evaluation_run in request_evaluation_response.evaluation_runs:
         evaluation_run_id = evaluation_run.evaluation_run_id
@@ -660,7 +928,9 @@ def _create_evaluation_run_tasks(request_evaluation_response: ValidatorRequestEv
         if config.SIMULATE_EVALUATION_RUNS:
             tasks.append(
                 asyncio.create_task(
-                    _simulate_run_evaluation_run_with_semaphore(evaluation_run_id, problem_name, semaphore)
+                    _simulate_run_evaluation_run_with_semaphore(
+                        evaluation_run_id, problem_name, semaphore, evaluation_run.expected_duration_seconds
+                    )
                 )
             )
         else:
@@ -781,7 +1051,12 @@ async def _run_evaluation(request_evaluation_response: ValidatorRequestEvaluatio
     run_tasks_task: asyncio.Task | None = None
 
     _log_received_evaluation(request_evaluation_response)
+    request_evaluation_response = _schedule_evaluation_runs(request_evaluation_response)
     logger.info("Starting evaluation...")
+    started_at = time.monotonic()
+
+    # Task archives download while images build and earlier runs execute
+    prefetch_tasks = _start_task_prefetches(request_evaluation_response)
 
     await _pre_build_missing_images(request_evaluation_response)
 
@@ -813,13 +1088,17 @@ async def _run_evaluation(request_evaluation_response: ValidatorRequestEvaluatio
 
         await run_tasks_task
 
-        logger.info("Finished evaluation")
+        logger.info(
+            f"Finished evaluation in {time.monotonic() - started_at:.1f}s "
+            f"({config.EVALUATION_RUN_SCHEDULING_POLICY} scheduling)"
+        )
 
         await post_ridges_platform(
             "/validator/finish-evaluation", ValidatorFinishEvaluationRequest(), bearer_token=session_id, quiet=1
         )
     finally:
-        await _cancel_background_tasks(cancellation_wait_task, poll_task)
+        await _cancel_background_tasks(cancellation_wait_task, poll_task, *prefetch_tasks)
+        _task_prefetches.clear()
         if config.RIDGES_ENVIRONMENT_TYPE == "docker":
             await asyncio.to_thread(prune_docker_disk_resources)
         elif config.RIDGES_ENVIRONMENT_TYPE == "kubernetes":
@@ -836,6 +1115,7 @@ async def main():
     global max_evaluation_run_log_size_bytes
     global environment_build_timeout_multiplier
     global execution_engine
+    global evaluation_run_limiter
 
     setup_logging()
     asyncio.get_running_loop().set_default_executor(
@@ -910,6 +1190,7 @@ async def main():
         max_eval_timeout_sec=running_eval_timeout_seconds,
         max_cost_usd=config.RIDGES_MAX_COST_USD,
         build_timeout_multiplier=environment_build_timeout_multiplier,
+        task_workspace_dir=DEFAULT_WORKSPACE_DIR if config.TASK_WORKSPACE_ISOLATION else None,
     )
 
     # Start the send heartbeat loop
@@ -922,6 +1203,18 @@ async def main():
     # Start the low-priority local-storage cleanup loop (validator and screener).
     if config.CLEANUP_ENABLED:
         asyncio.create_task(cleanup_loop(_active_task_digests))
+        # Downloads (including prefetches) can outgrow the budget between cleanup sweeps
+        set_task_downloaded_hook(lambda _task_digest: evict_task_cache(_active_task_digests))
+
+    if config.ADAPTIVE_CONCURRENCY_ENABLED:
+        evaluation_run_limiter = AdaptiveConcurrencyLimiter(
+            min_limit=config.ADAPTIVE_CONCURRENCY_MIN,
+            max_limit=config.MAX_CONCURRENT_EVALUATION_RUNS,
+            cpu_high_percent=config.ADAPTIVE_CONCURRENCY_CPU_PERCENT,
+            ram_high_percent=config.ADAPTIVE_CONCURRENCY_RAM_PERCENT,
+            disk_high_percent=config.ADAPTIVE_CONCURRENCY_DISK_PERCENT,
+        )
+        asyncio.create_task(adaptive_concurrency_loop(evaluation_run_limiter))
 
     # Loop forever, just keep requesting evaluations and running them
     while True:
@@ -945,6 +1238,9 @@ async def main():
             continue
 
         await _run_evaluation(ValidatorRequestEvaluationResponse(**request_evaluation_response_data))
+        if config.EVALUATION_PIPELINE_ENABLED:
+            logger.info("Evaluation complete. Requesting the next evaluation...")
+            continue
         logger.info(f"Evaluation complete. Waiting for {config.REQUEST_EVALUATION_INTERVAL_SECONDS} seconds...")
         await asyncio.sleep(config.REQUEST_EVALUATION_INTERVAL_SECONDS)
 
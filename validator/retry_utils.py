@@ -1,4 +1,5 @@
 import asyncio
+import random
 from collections.abc import Callable, Coroutine
 from typing import Any
 
@@ -9,6 +10,7 @@ TRANSIENT_HTTP_ERRORS = (
     httpx.ReadTimeout,
     httpx.ConnectError,
     httpx.RemoteProtocolError,
+    httpx.PoolTimeout,
 )
 
 
@@ -19,7 +21,10 @@ async def retry_with_backoff(
     base_delay: float = 2.0,
     max_delay: float = 10.0,
 ) -> Any:
-    """Call coro_fn(), retrying on transient HTTP errors with exponential backoff.
+    """Call coro_fn(), retrying on transient HTTP errors with jittered exponential backoff.
+
+    Each delay is drawn from [d/2, d] for the exponential delay d, so validators that
+    failed together (e.g. during a platform restart) don't all retry in lockstep.
 
     Raises the last exception if all attempts are exhausted.
     Non-transient exceptions (e.g. 4xx HTTPStatusError) propagate immediately.
@@ -30,4 +35,5 @@ async def retry_with_backoff(
         except TRANSIENT_HTTP_ERRORS:
             if attempt >= max_attempts - 1:
                 raise
-            await asyncio.sleep(min(base_delay * (2**attempt), max_delay))
+            delay = min(base_delay * (2**attempt), max_delay)
+            await asyncio.sleep(random.uniform(delay / 2, delay))
@@ -0,0 +1,64 @@
+# NOTE: Orders an evaluation's runs before they are started. Runs acquire concurrency
+#       slots in the order their tasks are created, so with the default
+#       longest_first policy (longest expected job first) the slow problems start
+#       early and the short ones fill in the gaps behind them, instead of a slow
+#       problem that happens to come last stretching the evaluation's makespan.
+#       Expected durations are the per-problem averages the platform sends with
+#       the assignment. Runs without one are treated as average length.
+#
+#       simulate_makespan() replays an order through a given number of slots, which
+#       is how SIMULATE_EVALUATION_RUNS compares the policies on real assignments.
+
+import heapq
+from statistics import mean
+from typing import Dict, List, Optional, Sequence, TypeVar
+
+from api.endpoints.validator_models import ValidatorRequestEvaluationResponseEvaluationRun
+
+SCHEDULING_POLICIES = ("platform", "longest_first", "shortest_first")
+
+EvaluationRun = TypeVar("EvaluationRun", bound=ValidatorRequestEvaluationResponseEvaluationRun)
+
+
+def expected_durations(evaluation_runs: Sequence[EvaluationRun]) -> List[Optional[float]]:
+    """Each run's expected duration, with unknown ones filled in with the average of the known ones."""
+    known = [run.expected_duration_seconds for run in evaluation_runs if run.expected_duration_seconds is not None]
+    fallback = mean(known) if known else None
+    return [
+        run.expected_duration_seconds if run.expected_duration_seconds is not None else fallback
+        for run in evaluation_runs
+    ]
+
+
+def order_evaluation_runs(evaluation_runs: Sequence[EvaluationRun], policy: str) -> List[EvaluationRun]:
+    """Return the runs in the order they should start under a scheduling policy.
+
+    The sort is stable, so runs with equal (or no) expected durations keep the platform's order.
+    """
+    if policy not in SCHEDULING_POLICIES:
+        raise ValueError(f"Unknown scheduling policy {policy!r}, expected one of {SCHEDULING_POLICIES}")
+
+    durations = expected_durations(evaluation_runs)
+    if policy == "platform" or durations.count(None) == len(durations):
+        return list(evaluation_runs)
+
+    indices = sorted(range(len(evaluation_runs)), key=lambda index: durations[index], reverse=policy == "longest_first")
+    return [evaluation_runs[index] for index in indices]
+
+
+def simulate_makespan(durations: Sequence[float], num_slots: int) -> float:
+    """Time until the last of ``durations`` finishes when started in order on ``num_slots`` slots."""
+    slots = [0.0] * max(1, num_slots)
+    for duration in durations:
+        heapq.heappush(slots, heapq.heappop(slots) + duration)
+    return max(slots)
+
+
+def compare_policy_makespans(evaluation_runs: Sequence[EvaluationRun], num_slots: int) -> Dict[str, float]:
+    """Simulated makespan of an evaluation under every scheduling policy, or {} without expected durations."""
+    if all(duration is None for duration in expected_durations(evaluation_runs)):
+        return {}
+    return {
+        policy: simulate_makespan(expected_durations(order_evaluation_runs(evaluation_runs, policy)), num_slots)
+        for policy in SCHEDULING_POLICIES
+    }